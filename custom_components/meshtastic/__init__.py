@@ -12,11 +12,13 @@ https://github.com/meshtastic/home-assistant
 from __future__ import annotations
 
 import asyncio
-import base64
 import datetime
+import time
 from collections import defaultdict
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING
 
 from homeassistant import config_entries
 from homeassistant.components.logbook import DOMAIN as LOGBOOK_DOMAIN
@@ -30,13 +32,15 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.device_registry import DeviceConnectionCollisionError
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.loader import async_get_loaded_integration
 
 from . import frontend, meshtastic_web, services
 from .api import (
+    ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID,
+    ATTR_EVENT_MESHTASTIC_API_NODE,
+    EVENT_MESHTASTIC_API_NODE_ADDED,
     MeshtasticApiClient,
 )
 from .const import (
@@ -58,21 +62,23 @@ from .const import (
 )
 from .coordinator import MeshtasticDataUpdateCoordinator
 from .data import DATA_COMPONENT, MeshtasticConfigEntry, MeshtasticData
+from .device_sync import MeshtasticDeviceSync
 from .entity import (
     GatewayChannelEntity,
     GatewayDirectMessageEntity,
     GatewayEntity,
     MeshtasticEntity,
 )
-from .helpers import fetch_meshtastic_hardware_names
+from .helpers import async_get_meshtastic_hardware_names
 from .logbook import async_setup_message_logger
 from .meshtastic_tcp import async_setup_tcp_proxy, async_unload_tcp_proxy
+from .outbox import MeshtasticOutbox
+from .websocket_api import async_setup_websocket_api
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping, MutableMapping
+    from collections.abc import Awaitable, Callable, Iterator, MutableMapping
 
-    from homeassistant.core import HomeAssistant
-    from homeassistant.helpers.device_registry import DeviceRegistry
+    from homeassistant.core import Event, HomeAssistant
     from homeassistant.helpers.entity import Entity
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.DEVICE_TRACKER, Platform.NOTIFY]
@@ -91,6 +97,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     await component.async_setup(config)
     await services.async_setup_services(hass)
+    async_setup_websocket_api(hass)
 
     return True
 
@@ -124,19 +131,48 @@ async def async_unload_meshtastic_web(hass: HomeAssistant) -> bool:
         return True
 
 
+@contextmanager
+def _log_setup_duration(entry: MeshtasticConfigEntry, phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        LOGGER.debug("Setup of %s: %s took %.3fs", entry.title, phase, time.perf_counter() - start)
+
+
+async def _timed_setup_step[T](entry: MeshtasticConfigEntry, phase: str, coro: Awaitable[T]) -> T:
+    with _log_setup_duration(entry, phase):
+        return await coro
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: MeshtasticConfigEntry,
+) -> bool:
+    with _log_setup_duration(entry, "total"):
+        return await _async_setup_entry(hass, entry)
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant,
+    entry: MeshtasticConfigEntry,
 ) -> bool:
     coordinator = MeshtasticDataUpdateCoordinator(hass=hass)
     if coordinator.config_entry is None:
         coordinator.config_entry = entry
 
-    client = MeshtasticApiClient(entry.data, hass=hass, config_entry_id=entry.entry_id)
+    client = MeshtasticApiClient(entry.data, hass=hass, config_entry_id=entry.entry_id, options=entry.options)
+
+    # hardware names don't depend on the radio, load them while connecting
+    hardware_names_task = asyncio.create_task(
+        _timed_setup_step(entry, "hardware names", async_get_meshtastic_hardware_names(hass)),
+        name="meshtastic-fetch-hardware-names",
+    )
 
     try:
-        await client.connect()
+        await _timed_setup_step(entry, "connect", client.connect())
     except Exception as e:
+        hardware_names_task.cancel()
         raise ConfigEntryNotReady from e
 
     gateway_node = await client.async_get_own_node()
@@ -147,151 +183,74 @@ async def async_setup_entry(
         gateway_node=gateway_node,
     )
 
-    if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
-        await coordinator.async_config_entry_first_refresh()
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    await _setup_meshtastic_devices(hass, entry, client)
-    await _setup_meshtastic_entities(hass, entry, client)
+    # nodes are streamed from radio after connect, nodes not known yet are set up when they are added
+    remove_node_added_listener = hass.bus.async_listen(EVENT_MESHTASTIC_API_NODE_ADDED, partial(_on_node_added, entry))
+    _remove_listeners[entry.entry_id].append(remove_node_added_listener)
+
+    async def first_refresh() -> None:
+        if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
+            await coordinator.async_config_entry_first_refresh()
+
+    async def setup_devices() -> None:
+        device_sync = MeshtasticDeviceSync(hass, entry, client, await hardware_names_task)
+        device_sync.async_sync_nodes(await client.async_get_all_nodes())
+        entry.runtime_data.device_sync = device_sync
+        _remove_listeners[entry.entry_id].append(device_sync.async_listen())
 
-    await services.async_register_gateway(hass, entry)
+    async def setup_message_logger() -> None:
+        cancel_message_logger = await async_setup_message_logger(hass, entry)
+        _remove_listeners[entry.entry_id].append(cancel_message_logger)
 
-    # listeners
-    cancel_message_logger = await async_setup_message_logger(hass, entry)
-    _remove_listeners[entry.entry_id].append(cancel_message_logger)
+    # devices need to exist before entities of platforms are attached to them
+    await asyncio.gather(
+        _timed_setup_step(entry, "first refresh", first_refresh()),
+        _timed_setup_step(entry, "devices", setup_devices()),
+    )
+
+    setup_steps = [
+        _timed_setup_step(entry, "platforms", hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)),
+        _timed_setup_step(entry, "gateway entities", _setup_meshtastic_entities(hass, entry, client)),
+        _timed_setup_step(entry, "services", services.async_register_gateway(hass, entry)),
+        _timed_setup_step(entry, "logbook", setup_message_logger()),
+    ]
 
     if entry.options.get(CONF_OPTION_WEB_CLIENT, {}).get(
         CONF_OPTION_WEB_CLIENT_ENABLE, CONF_OPTION_WEB_CLIENT_ENABLE_DEFAULT
     ):
-        await async_setup_meshtastic_web(hass)
+        setup_steps.append(_timed_setup_step(entry, "web client", async_setup_meshtastic_web(hass)))
 
     if entry.options.get(CONF_OPTION_TCP_PROXY, {}).get(
         CONF_OPTION_TCP_PROXY_ENABLE, CONF_OPTION_TCP_PROXY_ENABLE_DEFAULT
     ):
-        await async_setup_tcp_proxy(hass, entry)
-
-    return True
-
-
-async def _setup_meshtastic_devices(
-    hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
-) -> None:
-    gateway_node = await client.async_get_own_node()
-    nodes = await client.async_get_all_nodes()
-    device_registry = dr.async_get(hass)
-    filter_nodes = entry.options.get(CONF_OPTION_FILTER_NODES, [])
-    filter_node_nums = [el["id"] for el in filter_nodes]
-    device_hardware_names = await fetch_meshtastic_hardware_names(hass)
-    for node_id, node in nodes.items():
-        if node_id in filter_node_nums:
-            await _setup_meshtastic_device(
-                client, device_hardware_names, device_registry, entry, gateway_node, node, node_id
-            )
-
-        else:
-            await _remove_meshtastic_device(device_registry, entry, node_id)
-    return gateway_node
+        setup_steps.append(_timed_setup_step(entry, "tcp proxy", async_setup_tcp_proxy(hass, entry)))
 
+    await asyncio.gather(*setup_steps)
 
-async def _remove_meshtastic_device(
-    device_registry: DeviceRegistry, entry: MeshtasticConfigEntry, node_id: int
-) -> None:
-    device = device_registry.async_get_device(identifiers={(DOMAIN, str(node_id))})
-    # only clean up devices if they are exclusively from us
-    if device:
-        if device.config_entries == {entry.entry_id}:
-            device_registry.async_remove_device(device.id)
-        else:
-            device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
-
-
-async def _setup_meshtastic_device(  # noqa: PLR0913
-    client: MeshtasticApiClient,
-    device_hardware_names: Mapping[str, str],
-    device_registry: DeviceRegistry,
-    entry: MeshtasticConfigEntry,
-    gateway_node: Mapping[str, Any],
-    node: Mapping[str, Any],
-    node_id: int,
-) -> None:
-    gateway_node_id = cast("int", gateway_node["num"])
-    mac_address = base64.b64decode(node["user"]["macaddr"]).hex(":") if "macaddr" in node["user"] else None
-    connections = set()
-    if mac_address:
-        connections.add((dr.CONNECTION_NETWORK_MAC, mac_address))
-    hops_away = node.get("hopsAway", 99)
-    snr = node.get("snr", 0)
-    existing_device = device_registry.async_get_device(identifiers={(DOMAIN, str(node_id))})
-    via_device = None
-    if existing_device is not None and existing_device.config_entries != {entry.entry_id}:
-        # get other meshtastic connections
-
-        connection_parts = [
-            tuple(v.split("/"))
-            for k, v in existing_device.connections
-            if k == DOMAIN and not v.startswith(f"{gateway_node_id}/")
-        ]
-        meshtastic_connections = [
-            (int(source), int(target), int(hops), float(snr)) for source, target, hops, snr in connection_parts
-        ]
-        if node_id == gateway_node_id:
-            # add ourselves with highest prio so we don't get another via device
-            meshtastic_connections.append((gateway_node_id, node_id, -1, 999))
-        else:
-            meshtastic_connections.append((gateway_node_id, node_id, hops_away, snr))
-        try:
-            sorted_connections = sorted(meshtastic_connections, key=lambda x: (x[2], -x[3]))
-            closest_gateway = sorted_connections[0][0]
-            via_device = (DOMAIN, str(closest_gateway))
-        except Exception:  # noqa: BLE001
-            LOGGER.warning("Failed to find closest gateway", exc_info=True)
-    else:
-        via_device = (DOMAIN, str(gateway_node_id)) if gateway_node_id != node_id else None
+    return True
 
-    # remove via_device when it is set to ourself
-    if (via_device is not None and int(via_device[1]) == node_id) or (gateway_node_id == node_id):
-        via_device = None
 
-    if existing_device:
-        connections.update(existing_device.connections)
+async def _on_node_added(entry: MeshtasticConfigEntry, event: Event) -> None:
+    if event.data.get(ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID) != entry.entry_id:
+        return
 
-    # remove our own entry
-    connections = {
-        (k, v) for k, v in connections if k != DOMAIN or (k == DOMAIN and not v.startswith(f"{gateway_node_id}/"))
-    }
+    node_id = event.data.get(ATTR_EVENT_MESHTASTIC_API_NODE)
+    filter_node_nums = [el["id"] for el in entry.options.get(CONF_OPTION_FILTER_NODES, [])]
+    if node_id not in filter_node_nums:
+        return
 
-    # add our own entry with updated data
-    if gateway_node_id != node_id:
-        connections.add((DOMAIN, f"{gateway_node_id}/{node_id}/{hops_away}/{snr}"))
+    device_sync = entry.runtime_data.device_sync
+    node = entry.runtime_data.client.get_node(node_id)
+    if device_sync is None or node is None:
+        # devices are not set up yet, node will be picked up with all other nodes
+        return
 
-    d = device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, str(node_id))},
-        name=node["user"]["longName"],
-        model=device_hardware_names.get(node["user"]["hwModel"], None),
-        model_id=node["user"]["hwModel"],
-        serial_number=node["user"]["id"],
-        via_device=via_device,
-        sw_version=client.metadata.get("firmwareVersion")
-        if gateway_node["num"] == node_id and client.metadata
-        else None,
-    )
     try:
-        device_registry.async_update_device(
-            d.id,
-            new_connections=connections,
-            via_device_id=None if via_device is None else UNDEFINED,
-        )
-    except DeviceConnectionCollisionError as e:
-        LOGGER.debug("Conflict with other device connections, only using meshtastic connections. %s", e)
-        own_connections = {(k, v) for k, v in connections if k == DOMAIN}
-        device_registry.async_update_device(
-            d.id,
-            new_connections=own_connections,
-            via_device_id=None if via_device is None else UNDEFINED,
-        )
+        device_sync.async_sync_node(node_id, node)
+        await entry.runtime_data.coordinator.async_request_refresh()
+    except:  # noqa: E722
+        LOGGER.warning("Failed to setup added node %s", node_id, exc_info=True)
 
 
 async def _setup_meshtastic_entities(
@@ -376,6 +335,18 @@ async def async_unload_entry(
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: MeshtasticConfigEntry) -> None:
+    try:
+        await MeshtasticApiClient.async_remove_snapshot(hass, entry.entry_id)
+    except:  # noqa: E722
+        LOGGER.warning("Failed to remove snapshot of entry", exc_info=True)
+
+    try:
+        await MeshtasticOutbox.async_remove(hass, entry.entry_id)
+    except:  # noqa: E722
+        LOGGER.warning("Failed to remove outbox of entry", exc_info=True)
+
+
 _reload_lock = asyncio.Lock()
 
 
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import time
+from dataclasses import dataclass
+
+from .protobuf import config_pb2, mesh_pb2
+
+_LoRaConfig = config_pb2.Config.LoRaConfig
+
+# firmware defaults, see RadioInterface / RadioLibInterface
+PREAMBLE_LENGTH = 16
+PACKET_HEADER_LENGTH = 16
+LOW_DATA_RATE_OPTIMIZE_SYMBOL_TIME = 0.016
+
+AIRTIME_BUDGET_WINDOW = 600.0
+
+# (bandwidth kHz, coding rate denominator, spreading factor)
+_MODEM_PRESETS: dict[int, tuple[float, int, int]] = {
+    _LoRaConfig.ModemPreset.SHORT_TURBO: (500, 5, 7),
+    _LoRaConfig.ModemPreset.SHORT_FAST: (250, 5, 7),
+    _LoRaConfig.ModemPreset.SHORT_SLOW: (250, 5, 8),
+    _LoRaConfig.ModemPreset.MEDIUM_FAST: (250, 5, 9),
+    _LoRaConfig.ModemPreset.MEDIUM_SLOW: (250, 5, 10),
+    _LoRaConfig.ModemPreset.LONG_FAST: (250, 5, 11),
+    _LoRaConfig.ModemPreset.LONG_MODERATE: (125, 8, 11),
+    _LoRaConfig.ModemPreset.LONG_SLOW: (125, 8, 12),
+    _LoRaConfig.ModemPreset.VERY_LONG_SLOW: (62.5, 8, 12),
+}
+
+# bandwidth values that are shorthands for non-integer bandwidths
+_SPECIAL_BANDWIDTHS: dict[int, float] = {
+    31: 31.25,
+    62: 62.5,
+    200: 203.125,
+    400: 406.25,
+    800: 812.5,
+    1600: 1625.0,
+}
+
+# regulatory duty cycle limits enforced by the firmware, regions not listed are unlimited
+_REGION_DUTY_CYCLES: dict[int, float] = {
+    _LoRaConfig.RegionCode.EU_433: 0.1,
+    _LoRaConfig.RegionCode.EU_868: 0.1,
+    _LoRaConfig.RegionCode.UA_433: 0.1,
+    _LoRaConfig.RegionCode.UA_868: 0.01,
+}
+
+
+@dataclass(frozen=True)
+class LoRaModulation:
+    bandwidth_khz: float
+    coding_rate: int
+    spreading_factor: int
+
+    @classmethod
+    def from_lora_config(cls, lora: config_pb2.Config.LoRaConfig) -> "LoRaModulation":
+        preset = _MODEM_PRESETS.get(lora.modem_preset, _MODEM_PRESETS[_LoRaConfig.ModemPreset.LONG_FAST])
+        if lora.use_preset:
+            return cls(*preset)
+
+        # custom modem settings, unset values fall back to the preset like the firmware does
+        bandwidth, coding_rate, spreading_factor = preset
+        return cls(
+            bandwidth_khz=_SPECIAL_BANDWIDTHS.get(lora.bandwidth, lora.bandwidth) or bandwidth,
+            coding_rate=lora.coding_rate or coding_rate,
+            spreading_factor=lora.spread_factor or spreading_factor,
+        )
+
+    @property
+    def symbol_time(self) -> float:
+        return (1 << self.spreading_factor) / (self.bandwidth_khz * 1000)
+
+    def time_on_air(self, payload_length: int) -> float:
+        """Time on air in seconds of a LoRa frame (explicit header, CRC enabled) with the given payload length."""
+        symbol_time = self.symbol_time
+        low_data_rate_optimize = 1 if symbol_time > LOW_DATA_RATE_OPTIMIZE_SYMBOL_TIME else 0
+        payload_symbols = 8 + max(
+            math.ceil(
+                (8 * payload_length - 4 * self.spreading_factor + 28 + 16)
+                / (4 * (self.spreading_factor - 2 * low_data_rate_optimize))
+            )
+            * self.coding_rate,
+            0,
+        )
+        return (PREAMBLE_LENGTH + 4.25 + payload_symbols) * symbol_time
+
+    def packet_time_on_air(self, packet: mesh_pb2.MeshPacket) -> float:
+        if packet.WhichOneof("payload_variant") == "encrypted":
+            payload_length = len(packet.encrypted)
+        else:
+            # encryption does not change the payload length
+            payload_length = packet.decoded.ByteSize()
+        return self.time_on_air(PACKET_HEADER_LENGTH + payload_length)
+
+
+def regional_duty_cycle(lora: config_pb2.Config.LoRaConfig) -> float:
+    if lora.override_duty_cycle:
+        return 1.0
+    return _REGION_DUTY_CYCLES.get(lora.region, 1.0)
+
+
+@dataclass
+class AirtimeStatistics:
+    packets: int = 0
+    airtime: float = 0.0
+    throttled: int = 0
+    throttle_wait_time: float = 0.0
+    duty_cycle: float = 1.0
+    capacity: float = 0.0
+    available: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the airtime budget currently used."""
+        return 1 - self.available / self.capacity if self.capacity else 0.0
+
+
+class AirtimeBudget:
+    """
+    Token bucket limiting transmit airtime to a duty cycle.
+
+    The bucket holds up to duty cycle * window seconds of airtime and refills with duty cycle seconds per second, so
+    short bursts are possible while the airtime over the window stays within the duty cycle.
+    """
+
+    def __init__(self, duty_cycle: float = 1.0, window: float = AIRTIME_BUDGET_WINDOW) -> None:
+        self._window = window
+        self._duty_cycle = self._validate_duty_cycle(duty_cycle)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._statistics = AirtimeStatistics()
+
+    @staticmethod
+    def _validate_duty_cycle(duty_cycle: float) -> float:
+        if not 0 < duty_cycle <= 1:
+            msg = f"Duty cycle must be within (0, 1], got {duty_cycle}"
+            raise ValueError(msg)
+        return duty_cycle
+
+    @property
+    def duty_cycle(self) -> float:
+        return self._duty_cycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, duty_cycle: float) -> None:
+        self._refill()
+        self._duty_cycle = self._validate_duty_cycle(duty_cycle)
+        self._tokens = min(self._tokens, self.capacity)
+
+    @property
+    def capacity(self) -> float:
+        return self._duty_cycle * self._window
+
+    @property
+    def statistics(self) -> AirtimeStatistics:
+        self._refill()
+        self._statistics.duty_cycle = self._duty_cycle
+        self._statistics.capacity = self.capacity
+        self._statistics.available = max(self._tokens, 0.0)
+        return self._statistics
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._duty_cycle)
+        self._updated = now
+
+    def delay(self, airtime: float) -> float:
+        """Time until airtime can be consumed without exceeding the budget."""
+        if airtime <= 0:
+            return 0.0
+
+        self._refill()
+        # packets longer than the whole bucket are sent once it is full, the deficit delays the next ones
+        required = min(airtime, self.capacity)
+        return max(0.0, (required - self._tokens) / self._duty_cycle)
+
+    def record_throttled(self, wait_time: float) -> None:
+        self._statistics.throttled += 1
+        self._statistics.throttle_wait_time += wait_time
+
+    def consume(self, airtime: float) -> None:
+        if airtime <= 0:
+            return
+
+        self._refill()
+        self._tokens -= airtime
+        self._statistics.packets += 1
+        self._statistics.airtime += airtime
@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import enum
+import struct
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from google.protobuf import message
+
+from .protobuf import channel_pb2, config_pb2, lazy_import, mesh_pb2, module_config_pb2, portnums_pb2
+
+if TYPE_CHECKING:
+    from .protobuf import admin_pb2
+else:
+    admin_pb2 = lazy_import("admin_pb2")
+
+DEFAULT_CAPTURE_CAPACITY = 2000
+
+# file header: magic and format version, followed by records of timestamp, direction, payload length and payload
+CAPTURE_MAGIC = b"MTCAP"
+CAPTURE_VERSION = 1
+_FILE_HEADER = struct.Struct(f"<{len(CAPTURE_MAGIC)}sB")
+_RECORD_HEADER = struct.Struct("<dBI")
+
+
+class CaptureFormatError(ValueError):
+    pass
+
+
+class CaptureDirection(enum.IntEnum):
+    FROM_RADIO = 0
+    TO_RADIO = 1
+
+
+class CapturedFrame(NamedTuple):
+    timestamp: float
+    direction: CaptureDirection
+    payload: bytes
+
+
+class PacketCapture:
+    """
+    Last frames exchanged with the connected node, as serialized FromRadio / ToRadio messages.
+
+    Frames are kept as bytes and only decoded when a capture is replayed, so capturing is cheap enough to be always
+    enabled, unlike logging every packet.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPTURE_CAPACITY) -> None:
+        self._frames: deque[CapturedFrame] = deque(maxlen=capacity)
+
+    @property
+    def enabled(self) -> bool:
+        return self._frames.maxlen > 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def record(self, direction: CaptureDirection, payload: bytes) -> None:
+        if self._frames.maxlen:
+            self._frames.append(CapturedFrame(time.time(), direction, payload))
+
+    def frames(self) -> list[CapturedFrame]:
+        return list(self._frames)
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+
+def redact_secrets(frames: Iterable[CapturedFrame]) -> Iterator[CapturedFrame]:
+    """
+    Remove keys and passwords from captured frames, e.g. before writing them to a file.
+
+    Frames are captured verbatim, including the private key, channel keys and admin session passkeys exchanged with
+    the connected node. Frames without secrets are passed on unchanged.
+    """
+    for frame in frames:
+        radio_message = mesh_pb2.FromRadio() if frame.direction == CaptureDirection.FROM_RADIO else mesh_pb2.ToRadio()
+        try:
+            radio_message.ParseFromString(frame.payload)
+        except message.DecodeError:
+            # can't tell what is in there, better not keep it
+            yield frame._replace(payload=b"")
+            continue
+
+        if _redact_radio_message(radio_message):
+            yield frame._replace(payload=radio_message.SerializeToString())
+        else:
+            yield frame
+
+
+def _redact_radio_message(radio_message: "mesh_pb2.FromRadio | mesh_pb2.ToRadio") -> bool:
+    redacted = False
+    if isinstance(radio_message, mesh_pb2.FromRadio):
+        redacted = _redact_fields(
+            radio_message, {"config": _redact_config, "moduleConfig": _redact_module_config, "channel": _redact_channel}
+        )
+
+    if not radio_message.HasField("packet") or not radio_message.packet.HasField("decoded"):
+        return redacted
+    data = radio_message.packet.decoded
+    if data.portnum != portnums_pb2.PortNum.ADMIN_APP:
+        return redacted
+
+    admin_message = admin_pb2.AdminMessage()
+    try:
+        admin_message.ParseFromString(data.payload)
+    except message.DecodeError:
+        data.ClearField("payload")
+        return True
+
+    admin_redacted = bool(admin_message.session_passkey)
+    admin_message.ClearField("session_passkey")
+    admin_redacted |= _redact_fields(
+        admin_message,
+        {
+            "get_config_response": _redact_config,
+            "set_config": _redact_config,
+            "get_module_config_response": _redact_module_config,
+            "set_module_config": _redact_module_config,
+            "get_channel_response": _redact_channel,
+            "set_channel": _redact_channel,
+        },
+    )
+    if admin_redacted:
+        data.payload = admin_message.SerializeToString()
+    return redacted or admin_redacted
+
+
+def _redact_fields(msg: message.Message, redactors: Mapping[str, Callable[[message.Message], bool]]) -> bool:
+    redacted = False
+    for field, redact in redactors.items():
+        if msg.HasField(field):
+            redacted |= redact(getattr(msg, field))
+    return redacted
+
+
+def _redact_config(config: config_pb2.Config) -> bool:
+    if config.HasField("security") and config.security.private_key:
+        config.security.ClearField("private_key")
+        return True
+    if config.HasField("network") and config.network.wifi_psk:
+        config.network.ClearField("wifi_psk")
+        return True
+    return False
+
+
+def _redact_module_config(module_config: module_config_pb2.ModuleConfig) -> bool:
+    if module_config.HasField("mqtt") and module_config.mqtt.password:
+        module_config.mqtt.ClearField("password")
+        return True
+    return False
+
+
+def _redact_channel(channel: channel_pb2.Channel) -> bool:
+    if channel.settings.psk:
+        channel.settings.ClearField("psk")
+        return True
+    return False
+
+
+def write_capture(f: BinaryIO, frames: Iterable[CapturedFrame]) -> None:
+    f.write(_FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION))
+    for frame in frames:
+        f.write(_RECORD_HEADER.pack(frame.timestamp, frame.direction, len(frame.payload)))
+        f.write(frame.payload)
+
+
+def write_capture_file(path: Path, frames: Iterable[CapturedFrame]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        write_capture(f, frames)
+
+
+def read_capture(f: BinaryIO) -> Iterator[CapturedFrame]:
+    header = f.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size:
+        msg = "Not a capture file"
+        raise CaptureFormatError(msg)
+    magic, version = _FILE_HEADER.unpack(header)
+    if magic != CAPTURE_MAGIC:
+        msg = "Not a capture file"
+        raise CaptureFormatError(msg)
+    if version != CAPTURE_VERSION:
+        msg = f"Unsupported capture version {version}"
+        raise CaptureFormatError(msg)
+
+    while record_header := f.read(_RECORD_HEADER.size):
+        if len(record_header) != _RECORD_HEADER.size:
+            msg = "Truncated capture record"
+            raise CaptureFormatError(msg)
+        timestamp, direction, length = _RECORD_HEADER.unpack(record_header)
+        payload = f.read(length)
+        if len(payload) != length:
+            msg = "Truncated capture record"
+            raise CaptureFormatError(msg)
+        yield CapturedFrame(timestamp, CaptureDirection(direction), payload)
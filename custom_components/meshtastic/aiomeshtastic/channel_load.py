@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+CHANNEL_LOAD_WINDOW = 600.0
+CHANNEL_LOAD_BUCKET = 60.0
+PORT_ENCRYPTED = "ENCRYPTED"
+
+
+@dataclass
+class _ChannelLoadBucket:
+    start: float = 0.0
+    packets: int = 0
+    bytes: int = 0
+    airtime: float = 0.0
+    ports: Counter[str] = field(default_factory=Counter)
+    senders: Counter[int] = field(default_factory=Counter)
+
+    def reset(self, start: float) -> None:
+        self.start = start
+        self.packets = 0
+        self.bytes = 0
+        self.airtime = 0.0
+        self.ports.clear()
+        self.senders.clear()
+
+
+@dataclass(frozen=True)
+class ChannelLoadStatistics:
+    window: float
+    packets: int
+    bytes: int
+    airtime: float
+    packets_per_minute_by_port: dict[str, float]
+    airtime_share_by_sender: dict[int, float]
+
+    @property
+    def packets_per_minute(self) -> float:
+        return self.packets * 60 / self.window
+
+    @property
+    def utilization(self) -> float:
+        """Share of the window the channel was busy with observed packets."""
+        return min(self.airtime / self.window, 1.0)
+
+
+class ChannelLoadMonitor:
+    """
+    Load of the channel observed by the connected node over a rolling window.
+
+    Packets are counted in fixed time buckets that are reused once they fall out of the window, so memory only
+    depends on the number of ports and senders seen within the window.
+    """
+
+    def __init__(self, window: float = CHANNEL_LOAD_WINDOW, bucket: float = CHANNEL_LOAD_BUCKET) -> None:
+        self._bucket_duration = bucket
+        self._buckets = [_ChannelLoadBucket(start=-bucket) for _ in range(max(int(window // bucket), 1))]
+        self._first_start: float | None = None
+
+    @property
+    def window(self) -> float:
+        return self._bucket_duration * len(self._buckets)
+
+    def _bucket(self, now: float) -> _ChannelLoadBucket:
+        start = now - now % self._bucket_duration
+        bucket = self._buckets[int(start // self._bucket_duration) % len(self._buckets)]
+        if bucket.start != start:
+            bucket.reset(start)
+        if self._first_start is None:
+            self._first_start = start
+        return bucket
+
+    def record(self, sender: int, port: str, size: int, airtime: float, now: float | None = None) -> None:
+        bucket = self._bucket(time.time() if now is None else now)
+        bucket.packets += 1
+        bucket.bytes += size
+        bucket.airtime += airtime
+        bucket.ports[port] += 1
+        bucket.senders[sender] += airtime
+
+    def statistics(self, now: float | None = None) -> ChannelLoadStatistics:
+        now = time.time() if now is None else now
+        oldest_start = now - now % self._bucket_duration - (len(self._buckets) - 1) * self._bucket_duration
+        if self._first_start is not None:
+            oldest_start = max(oldest_start, self._first_start)
+        buckets = [bucket for bucket in self._buckets if bucket.start >= oldest_start]
+        # the current bucket is only partially elapsed, also right after start up
+        window = max(now - oldest_start, self._bucket_duration)
+
+        ports: Counter[str] = Counter()
+        senders: Counter[int] = Counter()
+        for bucket in buckets:
+            ports.update(bucket.ports)
+            senders.update(bucket.senders)
+        airtime = sum(bucket.airtime for bucket in buckets)
+
+        return ChannelLoadStatistics(
+            window=window,
+            packets=sum(bucket.packets for bucket in buckets),
+            bytes=sum(bucket.bytes for bucket in buckets),
+            airtime=airtime,
+            packets_per_minute_by_port={port: count * 60 / window for port, count in ports.most_common()},
+            airtime_share_by_sender={
+                sender: sender_airtime / airtime for sender, sender_airtime in senders.most_common() if airtime > 0
+            },
+        )
@@ -14,6 +14,8 @@ from types import TracebackType
 import google
 from google.protobuf.message import Message
 
+from ..airtime import AirtimeBudget  # noqa: TID252
+from ..capture import CaptureDirection, PacketCapture  # noqa: TID252
 from ..packet import Packet  # noqa: TID252
 from ..protobuf import mesh_pb2, portnums_pb2  # noqa: TID252
 from .errors import (
@@ -25,12 +27,15 @@ from .errors import (
     ClientApiNotConnectedError,
 )
 from .listener import ClientApiConnectionPacketStreamListener
+from .send_queue import ClientApiSendQueue, SendQueueStatistics
 
 LOGGER = logging.getLogger(__package__)
 
 
 class ClientApiConnection:
     _CONFIG_ID_MINIMAL = 69420
+    # firmware only sends node infos for this config id, older firmware treats it like any other config id
+    _CONFIG_ID_NODES_ONLY = 69421
 
     def __init__(self) -> None:
         self._packet_stream_listeners: list[ClientApiConnectionPacketStreamListener] = []
@@ -42,8 +47,9 @@ class ClientApiConnection:
         self._on_demand_streaming_processing_stop = asyncio.Event()
         self._current_packet_id: int | None = None
         self._queue_status: mesh_pb2.QueueStatus | None = None
-        self._queue_status_update = asyncio.Event()
         self._logger = LOGGER.getChild(self.__class__.__name__)
+        self._capture = PacketCapture()
+        self._send_queue = ClientApiSendQueue(self._send_captured_packet, self._logger.getChild("send_queue"))
         self._reconnect_lock = asyncio.Lock()
         self._reconnect_in_progress = asyncio.Event()
         self._reconnect_completed = asyncio.Event()
@@ -70,6 +76,7 @@ class ClientApiConnection:
             raise ClientApiDisconnectFailedError from e
 
         await self._stop_on_demand_steaming_task()
+        await self._send_queue.close()
 
     async def _stop_on_demand_steaming_task(self) -> None:
         async with self._on_demand_streaming_processing_lock:
@@ -165,9 +172,8 @@ class ClientApiConnection:
     async def _update_queue_status(self, packet: mesh_pb2.FromRadio) -> None:
         if packet.HasField("queueStatus"):
             self._queue_status = packet.queueStatus
-            self._queue_status_update.set()
-            self._queue_status_update.clear()
-            self._logger.debug("New Queue Status: %s", repr(self._queue_status).replace("\n", ""))
+            self._send_queue.update_credits(packet.queueStatus)
+            self._logger.debug("New Queue Status: %s", self._protobuf_log(self._queue_status))
 
     async def _notify_packet_stream_listeners(self, packet: mesh_pb2.FromRadio, *, sequential: bool = False) -> None:
         async def notify(listener: ClientApiConnectionPacketStreamListener, new_packet: mesh_pb2.FromRadio) -> None:
@@ -196,10 +202,18 @@ class ClientApiConnection:
     def _packet_stream(self) -> AsyncIterable[mesh_pb2.FromRadio]:
         pass
 
+    def _capture_from_radio(self, packet: bytes) -> None:
+        # called by transports with the frame as received, so it does not need to be serialized again for capturing
+        self._capture.record(CaptureDirection.FROM_RADIO, packet)
+
     @abstractmethod
     async def _send_packet(self, packet: bytes) -> bool:
         pass
 
+    async def _send_captured_packet(self, packet: bytes) -> bool:
+        self._capture.record(CaptureDirection.TO_RADIO, packet)
+        return await self._send_packet(packet)
+
     async def send_heartbeat(self) -> None:
         p = mesh_pb2.ToRadio()
         p.heartbeat.CopyFrom(mesh_pb2.Heartbeat())
@@ -207,15 +221,17 @@ class ClientApiConnection:
             msg = "Heartbeat failed"
             raise ClientApiConnectionInterruptedError(msg)
 
-    async def request_config(self, minimal: bool = False) -> bool:  # noqa: FBT001, FBT002
+    async def request_config(self, minimal: bool = False, *, nodes_only: bool = False) -> bool:  # noqa: FBT001, FBT002
         start_config_packet = mesh_pb2.ToRadio()
 
         if minimal:
             start_config_packet.want_config_id = self._CONFIG_ID_MINIMAL
+        elif nodes_only:
+            start_config_packet.want_config_id = self._CONFIG_ID_NODES_ONLY
         else:
             # not using 0 as config id as it is default for config_complete_id
             start_config_packet.want_config_id = random.randint(1, 0xFFFFFFFF)  # noqa: S311
-            if start_config_packet.want_config_id == self._CONFIG_ID_MINIMAL:
+            while start_config_packet.want_config_id in (self._CONFIG_ID_MINIMAL, self._CONFIG_ID_NODES_ONLY):
                 start_config_packet.want_config_id += 1
 
         async for packet in self.listen(on_start=self.send_packet(start_config_packet)):
@@ -340,28 +356,35 @@ class ClientApiConnection:
         self._current_packet_id = next_packet_id | random_part
         return self._current_packet_id
 
-    async def send_packet(self, to_radio: mesh_pb2.ToRadio) -> bool:
-        packet: bytes = to_radio.SerializeToString()
+    @property
+    def send_queue_statistics(self) -> SendQueueStatistics:
+        return self._send_queue.statistics
+
+    @property
+    def packet_capture(self) -> PacketCapture:
+        return self._capture
+
+    @packet_capture.setter
+    def packet_capture(self, capture: PacketCapture) -> None:
+        self._capture = capture
+
+    @property
+    def airtime_budget(self) -> AirtimeBudget:
+        return self._send_queue.airtime_budget
+
+    def set_airtime_estimator(self, estimator: Callable[[mesh_pb2.MeshPacket], float] | None) -> None:
+        self._send_queue.set_airtime_estimator(estimator)
 
+    async def send_packet(self, to_radio: mesh_pb2.ToRadio, *, source: str | None = None) -> bool:
         if not to_radio.HasField("packet"):
-            return await self._send_packet(packet)
+            return await self._send_captured_packet(to_radio.SerializeToString())
         self._logger.debug(
             "Sending packet (id=0x%x fr=0x%x to=0x%x)",
             to_radio.packet.id,
             getattr(to_radio.packet, "from"),
             to_radio.packet.to,
         )
-        if self._queue_status is None:
-            self._logger.debug("No queue state available, sending directly")
-            return await self._send_packet(packet)
-        while self._queue_status.free == 0:
-            self._logger.debug("Queue is full, waiting")
-            queue_status_update_task = asyncio.create_task(self._queue_status_update.wait())
-            sleep_task = asyncio.create_task(asyncio.sleep(1.0))
-            await asyncio.wait([queue_status_update_task, sleep_task], return_when=asyncio.FIRST_COMPLETED)
-
-        self._queue_status.free -= 1
-        return await self._send_packet(packet)
+        return await self._send_queue.send(to_radio, source=source)
 
     @asynccontextmanager
     async def _ensure_processing_packets(self) -> None:
@@ -484,5 +507,17 @@ class ClientApiConnection:
         await self.send_packet(m)
 
     @staticmethod
-    def _protobuf_log(message: Message) -> str:
-        return repr(message).replace("\n", "")
+    def _protobuf_log(message: Message) -> "_ProtobufLogMessage":
+        return _ProtobufLogMessage(message)
+
+
+class _ProtobufLogMessage:
+    """Single line representation of a message, only formatted if the log record is actually emitted."""
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message: Message) -> None:
+        self._message = message
+
+    def __str__(self) -> str:
+        return repr(self._message).replace("\n", "")
@@ -213,6 +213,7 @@ class BluetoothConnection(ClientApiConnection):
                         "Read returned packet after ble notify timeout, maybe notifications from device have stopped"
                     )
 
+                self._capture_from_radio(packet)
                 from_radio = mesh_pb2.FromRadio()
                 try:
                     from_radio.ParseFromString(packet)
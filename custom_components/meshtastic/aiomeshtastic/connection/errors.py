@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from custom_components.meshtastic.aiomeshtastic.errors import MeshtasticError
+from ..errors import MeshtasticError  # noqa: TID252
 
 
 class ClientApiConnectionError(MeshtasticError):
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import asyncio
+import contextlib
+import time
+from collections import Counter
+from collections.abc import AsyncIterable, Iterable
+from pathlib import Path
+
+from google.protobuf import message
+
+from ..capture import CapturedFrame, CaptureDirection, read_capture  # noqa: TID252
+from ..protobuf import mesh_pb2  # noqa: TID252
+from . import ClientApiConnection
+
+
+class ReplayConnection(ClientApiConnection):
+    """
+    Connection replaying the FromRadio frames of a packet capture instead of talking to a device.
+
+    Frames are replayed as fast as possible, or with their original timing divided by speed. Whenever the capture
+    contains a config request, replaying pauses until a config request is sent to this connection, and the config
+    complete frame of the capture is rewritten to the id of that request. This way a MeshInterface can be started on a
+    capture that includes its initial config exchange. Frames sent to the connection are kept in sent.
+    """
+
+    def __init__(
+        self,
+        frames: Iterable[CapturedFrame],
+        *,
+        speed: float | None = None,
+        wait_for_config_requests: bool = True,
+    ) -> None:
+        super().__init__()
+        self._frames = [
+            frame
+            for frame in frames
+            if frame.direction == CaptureDirection.FROM_RADIO
+            or (wait_for_config_requests and self._is_config_request(frame))
+        ]
+        self._speed = speed
+        self._position = 0
+        self._connected = False
+        self._disconnected = asyncio.Event()
+        self._config_requested = asyncio.Event()
+        self._want_config_id: int | None = None
+        self.sent: list[mesh_pb2.ToRadio] = []
+        self.replayed = 0
+        self.replay_complete = asyncio.Event()
+
+    @classmethod
+    def from_file(cls, path: Path, **kwargs: float | bool | None) -> "ReplayConnection":
+        with path.open("rb") as f:
+            return cls(list(read_capture(f)), **kwargs)
+
+    @staticmethod
+    def _is_config_request(frame: CapturedFrame) -> bool:
+        if frame.direction != CaptureDirection.TO_RADIO:
+            return False
+        to_radio = mesh_pb2.ToRadio()
+        with contextlib.suppress(message.DecodeError):
+            to_radio.ParseFromString(frame.payload)
+        return to_radio.HasField("want_config_id")
+
+    async def _connect(self) -> None:
+        self._connected = True
+        self._disconnected.clear()
+
+    async def _disconnect(self) -> None:
+        self._connected = False
+        self._disconnected.set()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def _send_packet(self, packet: bytes) -> bool:
+        to_radio = mesh_pb2.ToRadio()
+        to_radio.ParseFromString(packet)
+        self.sent.append(to_radio)
+        if to_radio.HasField("want_config_id"):
+            self._want_config_id = to_radio.want_config_id
+            self._config_requested.set()
+        return True
+
+    async def _packet_stream(self) -> AsyncIterable[mesh_pb2.FromRadio]:
+        previous_timestamp: float | None = None
+        while self._connected and self._position < len(self._frames):
+            frame = self._frames[self._position]
+            self._position += 1
+
+            if frame.direction == CaptureDirection.TO_RADIO:
+                await self._config_requested.wait()
+                self._config_requested.clear()
+                continue
+
+            if self._speed and previous_timestamp is not None:
+                await asyncio.sleep(max(frame.timestamp - previous_timestamp, 0.0) / self._speed)
+            else:
+                # give other tasks a chance to run, even when replaying as fast as possible
+                await asyncio.sleep(0)
+            previous_timestamp = frame.timestamp
+
+            self._capture_from_radio(frame.payload)
+            from_radio = mesh_pb2.FromRadio()
+            try:
+                from_radio.ParseFromString(frame.payload)
+            except message.DecodeError:
+                self._logger.warning("Error while parsing captured FromRadio bytes %s", frame.payload, exc_info=True)
+                continue
+            if from_radio.HasField("config_complete_id") and self._want_config_id is not None:
+                from_radio.config_complete_id = self._want_config_id
+            self.replayed += 1
+            yield from_radio
+
+        self.replay_complete.set()
+        # like an idle device, the stream stays open until disconnected
+        await self._disconnected.wait()
+
+
+async def _benchmark(path: Path, speed: float | None) -> None:
+    connection = ReplayConnection.from_file(path, speed=speed, wait_for_config_requests=False)
+    packet_types: Counter[str] = Counter()
+    drained = asyncio.Event()
+
+    async def consume() -> None:
+        async for packet in connection.listen():
+            packet_types[packet.WhichOneof("payload_variant") or "unknown"] += 1
+            if connection.replay_complete.is_set() and packet_types.total() >= connection.replayed:
+                drained.set()
+
+    async with connection:
+        start = time.perf_counter()
+        task = asyncio.create_task(consume())
+        await connection.replay_complete.wait()
+        if packet_types.total() < connection.replayed:
+            await drained.wait()
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    print(  # noqa: T201
+        f"Replayed {connection.replayed} frames in {elapsed:.3f} s ({connection.replayed / max(elapsed, 1e-9):.0f}/s)"
+    )
+    for packet_type, count in packet_types.most_common():
+        print(f"  {packet_type}: {count}")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a Meshtastic packet capture through a client connection")
+    parser.add_argument("capture", type=Path, help="capture file written by the dump_packet_capture service")
+    parser.add_argument("--speed", type=float, default=None, help="replay with original timing divided by speed")
+    args = parser.parse_args()
+    asyncio.run(_benchmark(args.capture, args.speed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ..airtime import AirtimeBudget  # noqa: TID252
+from ..protobuf import mesh_pb2  # noqa: TID252
+from .errors import ClientApiNotConnectedError
+
+
+@dataclass
+class SendQueueStatistics:
+    sent: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    credit_waits: int = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.sent if self.sent else 0.0
+
+
+@dataclass(eq=False)
+class _SendQueueEntry:
+    payload: bytes
+    enqueued_at: float
+    future: asyncio.Future[bool]
+    airtime: float = 0.0
+
+
+class ClientApiSendQueue:
+    """
+    Transmit scheduler for mesh packets.
+
+    Packets are sent in order of their MeshPacket priority. Within the same priority, callers (sources) are
+    served round-robin using start-time fair queueing, so a bulk sender can not starve others. Packets are only
+    handed to the radio while it has credits, i.e. free slots as reported by the last QueueStatus, and while the
+    airtime budget allows transmitting them. Packets without airtime, e.g. admin messages for the connected node, are
+    not held back by packets waiting for airtime.
+    """
+
+    CREDIT_WAIT_INTERVAL = 1.0
+
+    def __init__(self, send: Callable[[bytes], Awaitable[bool]], logger: logging.Logger) -> None:
+        self._send = send
+        self._logger = logger
+        # heap of (-priority, virtual start tag, sequence, entry)
+        self._queue: list[tuple[int, int, int, _SendQueueEntry]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0
+        self._source_tags: dict[str | None, int] = {}
+        self._credits: int | None = None
+        self._credits_update = asyncio.Event()
+        self._queue_update = asyncio.Event()
+        self._dispatch_task: asyncio.Task | None = None
+        self._statistics = SendQueueStatistics()
+        self._airtime_budget = AirtimeBudget()
+        self._airtime_estimator: Callable[[mesh_pb2.MeshPacket], float] | None = None
+
+    @property
+    def statistics(self) -> SendQueueStatistics:
+        return self._statistics
+
+    @property
+    def airtime_budget(self) -> AirtimeBudget:
+        return self._airtime_budget
+
+    def set_airtime_estimator(self, estimator: Callable[[mesh_pb2.MeshPacket], float] | None) -> None:
+        self._airtime_estimator = estimator
+
+    @property
+    def credits(self) -> int | None:
+        return self._credits
+
+    def update_credits(self, queue_status: mesh_pb2.QueueStatus) -> None:
+        # radio reported state wins over our local bookkeeping
+        self._credits = queue_status.free
+        self._credits_update.set()
+
+    async def send(self, to_radio: mesh_pb2.ToRadio, source: str | None = None) -> bool:
+        loop = asyncio.get_running_loop()
+        priority = to_radio.packet.priority or mesh_pb2.MeshPacket.Priority.DEFAULT
+        tag = max(self._virtual_time, self._source_tags.get(source, 0)) + 1
+        self._source_tags[source] = tag
+
+        entry = _SendQueueEntry(
+            payload=to_radio.SerializeToString(),
+            enqueued_at=loop.time(),
+            future=loop.create_future(),
+            airtime=self._airtime_estimator(to_radio.packet) if self._airtime_estimator is not None else 0.0,
+        )
+        heapq.heappush(self._queue, (-priority, tag, next(self._sequence), entry))
+        self._queue_update.set()
+        self._statistics.depth = len(self._queue)
+        self._statistics.max_depth = max(self._statistics.max_depth, self._statistics.depth)
+
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch(), name="send_queue_dispatch")
+
+        return await entry.future
+
+    async def _wait_for_credits(self) -> None:
+        self._statistics.credit_waits += 1
+        self._logger.debug("Queue is full, waiting (%d packets pending)", len(self._queue))
+        self._credits_update.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._credits_update.wait(), timeout=self.CREDIT_WAIT_INTERVAL)
+
+    def _pop_sendable(self) -> tuple[tuple[int, int, int, _SendQueueEntry] | None, float]:
+        """
+        Pop the first entry in queue order that the airtime budget allows to send now.
+
+        Once an entry has to wait for airtime, only entries without airtime may pass it, so it is not starved by
+        smaller packets. If nothing can be sent, returns the time until the first waiting entry fits the budget.
+        """
+        deferred = []
+        delay: float | None = None
+        try:
+            while self._queue:
+                item = heapq.heappop(self._queue)
+                entry = item[3]
+                if entry.future.done():
+                    # caller gave up waiting
+                    continue
+                if delay is not None and entry.airtime > 0:
+                    deferred.append(item)
+                    continue
+
+                entry_delay = self._airtime_budget.delay(entry.airtime)
+                if entry_delay <= 0:
+                    return item, 0.0
+                deferred.append(item)
+                delay = entry_delay
+        finally:
+            for item in deferred:
+                heapq.heappush(self._queue, item)
+            self._statistics.depth = len(self._queue)
+        return None, delay or 0.0
+
+    async def _wait_for_airtime(self, delay: float) -> None:
+        # newly queued packets may be sendable right away, e.g. higher priority or without airtime
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._queue_update.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._queue_update.wait(), timeout=delay)
+        self._airtime_budget.record_throttled(loop.time() - start)
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            if self._credits is not None and self._credits <= 0:
+                await self._wait_for_credits()
+                continue
+
+            item, delay = self._pop_sendable()
+            if item is None:
+                if self._queue:
+                    await self._wait_for_airtime(delay)
+                continue
+            _, tag, _, entry = item
+
+            self._virtual_time = tag
+            if self._credits is not None:
+                self._credits -= 1
+            self._airtime_budget.consume(entry.airtime)
+
+            wait_time = loop.time() - entry.enqueued_at
+            self._statistics.sent += 1
+            self._statistics.total_wait_time += wait_time
+            self._statistics.max_wait_time = max(self._statistics.max_wait_time, wait_time)
+
+            try:
+                result = await self._send(entry.payload)
+            except asyncio.CancelledError:
+                if not entry.future.done():
+                    entry.future.set_exception(ClientApiNotConnectedError())
+                raise
+            except Exception as e:  # noqa: BLE001
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+            else:
+                if not entry.future.done():
+                    entry.future.set_result(result)
+
+        self._source_tags.clear()
+        self._virtual_time = 0
+
+    async def close(self) -> None:
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatch_task
+            self._dispatch_task = None
+
+        while self._queue:
+            _, _, _, entry = heapq.heappop(self._queue)
+            if not entry.future.done():
+                entry.future.set_exception(ClientApiNotConnectedError())
+        self._statistics.depth = 0
+        self._credits = None
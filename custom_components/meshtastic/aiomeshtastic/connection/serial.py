@@ -6,26 +6,39 @@ import asyncio
 import contextlib
 import re
 from asyncio import StreamReader, StreamReaderProtocol, StreamWriter
+from collections import deque
+from dataclasses import dataclass
 from typing import cast
 
 import serial
 import serial_asyncio
 
-from custom_components.meshtastic.aiomeshtastic.connection import (
-    ClientApiConnectionError,
-)
-from custom_components.meshtastic.aiomeshtastic.connection.streaming import (
-    StreamingClientTransport,
-)
+from . import ClientApiConnectionError
+from .streaming import StreamingClientTransport
 
 
 class SerialConnectionError(ClientApiConnectionError):
     pass
 
 
+@dataclass
+class SerialWriteStatistics:
+    frames: int = 0
+    writes: int = 0
+    bytes: int = 0
+    drain_time: float = 0.0
+
+
 class SerialConnection(StreamingClientTransport, asyncio.Protocol):
+    # upper bound of bytes coalesced into a single write
+    WRITE_COALESCE_MAX_BYTES = 4096
+
     def __init__(self, device: str, baud_rate: int = 115200, *, debug_logs: bool = False) -> None:
         super().__init__()
+        self._write_buffer: deque[tuple[bytes, asyncio.Future[bool]]] = deque()
+        self._write_pending = asyncio.Event()
+        self._write_task: asyncio.Task | None = None
+        self._write_statistics = SerialWriteStatistics()
         self._log_reader_task: asyncio.Task | None = None
         self._log_reader: StreamReader | None = None
         self._writer: StreamWriter | None = None
@@ -48,6 +61,7 @@ class SerialConnection(StreamingClientTransport, asyncio.Protocol):
         writer = StreamWriter(transport, protocol, reader, loop)
         self._reader = reader
         self._writer = writer
+        self._write_task = asyncio.create_task(self._write_loop(writer), name="serial_writer")
 
         if self._debug_logs:
             self._log_reader = StreamReader(loop=loop)
@@ -84,6 +98,15 @@ class SerialConnection(StreamingClientTransport, asyncio.Protocol):
             self._log_reader_task = asyncio.create_task(read_log(self._log_reader), name="log")
 
     async def _disconnect(self) -> None:
+        if self._write_task is not None:
+            try:
+                with contextlib.suppress(asyncio.CancelledError):
+                    self._write_task.cancel()
+                    await self._write_task
+            finally:
+                self._write_task = None
+        self._fail_pending_writes()
+
         if self._writer:
             self._writer.close()
             cast("serial_asyncio.SerialTransport", self._writer.transport).serial.close()
@@ -128,7 +151,80 @@ class SerialConnection(StreamingClientTransport, asyncio.Protocol):
             raise SerialConnectionError from e
 
     async def _write_bytes(self, data: bytes) -> bool:
-        if self._writer is None:
+        if self._writer is None or self._write_task is None:
             return False
-        self._writer.write(data)
-        return True
+        future = asyncio.get_running_loop().create_future()
+        self._write_buffer.append((data, future))
+        self._write_pending.set()
+        return await future
+
+    @property
+    def write_statistics(self) -> SerialWriteStatistics:
+        return self._write_statistics
+
+    def _write_window(self) -> int:
+        # don't hand more frames to the radio in one go than its queue has room for
+        if self._queue_status is None or self._queue_status.maxlen == 0:
+            return len(self._write_buffer)
+        return max(1, self._queue_status.free)
+
+    def _take_write_chunk(self) -> tuple[bytearray, list[asyncio.Future[bool]]]:
+        window = self._write_window()
+        chunk = bytearray()
+        futures = []
+        while self._write_buffer and len(futures) < window:
+            data, future = self._write_buffer[0]
+            if chunk and len(chunk) + len(data) > self.WRITE_COALESCE_MAX_BYTES:
+                break
+            self._write_buffer.popleft()
+            if future.done():
+                # caller is no longer waiting for this frame
+                continue
+            chunk += data
+            futures.append(future)
+        return chunk, futures
+
+    @staticmethod
+    def _resolve_writes(futures: list[asyncio.Future[bool]], result: bool | BaseException) -> None:
+        for future in futures:
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _write_loop(self, writer: StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._write_buffer:
+                self._write_pending.clear()
+                await self._write_pending.wait()
+                continue
+
+            chunk, futures = self._take_write_chunk()
+            if not futures:
+                continue
+
+            try:
+                writer.write(chunk)
+                drain_start = loop.time()
+                await writer.drain()
+            except asyncio.CancelledError:
+                self._resolve_writes(futures, result=False)
+                raise
+            except Exception as e:  # noqa: BLE001
+                self._logger.debug("Failed to write %d frames", len(futures), exc_info=True)
+                self._resolve_writes(futures, SerialConnectionError(str(e)))
+                continue
+
+            self._write_statistics.drain_time += loop.time() - drain_start
+            self._write_statistics.frames += len(futures)
+            self._write_statistics.writes += 1
+            self._write_statistics.bytes += len(chunk)
+            self._resolve_writes(futures, result=True)
+
+    def _fail_pending_writes(self) -> None:
+        futures = [future for _, future in self._write_buffer]
+        self._write_buffer.clear()
+        self._resolve_writes(futures, result=False)
@@ -51,6 +51,27 @@ class StreamingClientTransport(ClientApiConnection):
         )
         return header + payload
 
+    @staticmethod
+    def split_frames(data: bytes) -> list[bytes]:
+        payloads = []
+        offset = 0
+        while offset + StreamingClientTransport.HEADER_LEN <= len(data):
+            if data[offset] != StreamingClientTransport.START1 or data[offset + 1] != StreamingClientTransport.START2:
+                # not at start of frame, resync on next byte
+                offset += 1
+                continue
+
+            payload_length = (data[offset + 2] << 8) + data[offset + 3]
+            payload_start = offset + StreamingClientTransport.HEADER_LEN
+            payload_end = payload_start + payload_length
+            if payload_end > len(data):
+                # incomplete frame
+                break
+
+            payloads.append(data[payload_start:payload_end])
+            offset = payload_end
+        return payloads
+
     async def _on_other_data(self, data: bytes) -> None:
         pass
 
@@ -78,6 +99,7 @@ class StreamingClientTransport(ClientApiConnection):
                     if packet is None:
                         continue
 
+                    self._capture_from_radio(packet)
                     from_radio = mesh_pb2.FromRadio()
                     try:
                         from_radio.ParseFromString(packet)
@@ -10,18 +10,19 @@ import enum
 import functools
 import itertools
 import random
+import ssl
+import time
 from collections import defaultdict, deque
-from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, MutableMapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from types import MappingProxyType, TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Self,
 )
 
-from homeassistant.util.ssl import get_default_context
-
 try:
     import aiomqtt
     from aiomqtt import MqttError
@@ -29,29 +30,45 @@ try:
     _has_aiomqtt = True
 except ImportError:
     _has_aiomqtt = False
-import google
+import google.protobuf.json_format
 from google.protobuf.message import Message
 
+from .airtime import AirtimeStatistics, LoRaModulation, regional_duty_cycle
+from .capture import DEFAULT_CAPTURE_CAPACITY, PacketCapture
+from .channel_load import PORT_ENCRYPTED, ChannelLoadMonitor, ChannelLoadStatistics
 from .connection import (
     ClientApiConnection,
     ClientApiConnectionPacketStreamListener,
     ClientApiNotConnectedError,
 )
+from .connection.send_queue import SendQueueStatistics
+from .connection.streaming import StreamingClientTransport
 from .const import LOGGER, UNDEFINED
 from .errors import MeshInterfaceRequestError, MeshRoutingError, MeshtasticError
+from .link_quality import LinkQualityTracker, LinkStatistics
 from .packet import DatabaseNodeInfoPacket, FullNodeInfoPacket, Packet
+from .polling import POLL_POSITION, MeshPollingScheduler, PollingStatistics
 from .protobuf import (
-    admin_pb2,
     channel_pb2,
     config_pb2,
-    connection_status_pb2,
-    localonly_pb2,
+    lazy_import,
     mesh_pb2,
     module_config_pb2,
     portnums_pb2,
     telemetry_pb2,
 )
 from .protobuf.mesh_pb2 import MeshPacket
+from .timeseries import DEFAULT_METRIC_CAPACITY, MetricAggregate, NodeMetric, NodeMetricsStore
+
+if TYPE_CHECKING:
+    from .protobuf import admin_pb2, connection_status_pb2, localonly_pb2
+else:
+    admin_pb2 = lazy_import("admin_pb2")
+    connection_status_pb2 = lazy_import("connection_status_pb2")
+    localonly_pb2 = lazy_import("localonly_pb2")
+
+# polls wait for the node database to be streamed from radio, but not longer than this
+POLLING_NODE_DATABASE_TIMEOUT = 120.0
 
 
 class MeshInterfaceError(MeshtasticError):
@@ -114,6 +131,11 @@ class TelemetryType(enum.StrEnum):
 
 class MeshInterface:
     PKC_CHANNEL_INDEX = 8
+    ADMIN_REQUEST_WINDOW = 4
+    # firmware accepts a session passkey for 300 seconds
+    ADMIN_SESSION_PASSKEY_VALIDITY = 240.0
+    _NON_LOCAL_CONFIG_TYPES = ("SESSIONKEY_CONFIG", "DEVICEUI_CONFIG")
+    _SNAPSHOT_CONNECTED_NODE_FIELDS = ("my_info", "metadata", "channel", "config", "moduleConfig")
 
     BROADCAST_NUM: int = 0xFFFFFFFF
     BROADCAST_ADDR = "^all"
@@ -129,6 +151,11 @@ class MeshInterface:
         acknowledgement_timeout: datetime.timedelta | None = None,
         response_timeout: datetime.timedelta | None = None,
         enable_mqtt_proxy: bool = True,
+        airtime_duty_cycle: float | None = None,
+        polling_interval: datetime.timedelta | None = None,
+        polling_concurrency: int = 2,
+        metrics_capacity: int = DEFAULT_METRIC_CAPACITY,
+        packet_capture_capacity: int = DEFAULT_CAPTURE_CAPACITY,
     ) -> None:
         self._logger = LOGGER.getChild(self.__class__.__name__)
         self._connection = connection
@@ -144,10 +171,18 @@ class MeshInterface:
         self._connected_node_metadata: mesh_pb2.DeviceMetadata | None = None
         self._connected_node_channels: list[channel_pb2.Channel] | None = None
         self._connected_node_queue_status: mesh_pb2.QueueStatus | None = None
-        self._connected_node_local_config = localonly_pb2.LocalConfig()
-        self._connected_node_module_config = localonly_pb2.LocalModuleConfig()
+
+        # duty cycle is further restricted by the regulatory limit of the region once the lora config is known
+        self._airtime_duty_cycle = 1.0 if airtime_duty_cycle is None else airtime_duty_cycle
+        # lora config defaults until the config is received
+        self._update_airtime_budget(config_pb2.Config.LoRaConfig())
+        self._connection.set_airtime_estimator(self._estimate_airtime)
+        self._connection.packet_capture = PacketCapture(packet_capture_capacity)
 
         self._connected_node_ready = asyncio.Event()
+        self._node_database_ready = asyncio.Event()
+        # set once requesting the node database finished, also when it failed
+        self._node_database_requested = asyncio.Event()
 
         self._heartbeat_interval_s = 600 if heartbeat_interval is None else heartbeat_interval.total_seconds()
 
@@ -155,6 +190,9 @@ class MeshInterface:
         self._response_timeout = 60.0 if response_timeout is None else response_timeout.total_seconds()
 
         self._node_database: dict[int, dict[str, Any]] = {}
+        self._snapshot_restored = False
+        # nodes restored from snapshot that have not been part of a node database received from radio yet
+        self._restored_node_ids: set[int] = set()
         self._queue: asyncio.Queue = asyncio.Queue()
 
         self._processing_tasks: set[asyncio.Task] = set()
@@ -168,7 +206,20 @@ class MeshInterface:
         self._app_listeners: dict[portnums_pb2.PortNum, list[Callable[[MeshNode, Packet], Awaitable[None]]]] = (
             defaultdict(list)
         )
+        self._node_added_listeners: list[Callable[[MeshNode], Awaitable[None]]] = []
         self._previous_reconnects = deque(maxlen=10)
+        self._admin_session_passkeys: dict[int, tuple[bytes, float]] = {}
+
+        self._poller = MeshPollingScheduler(
+            self._poll_node,
+            self._logger.getChild("poller"),
+            interval=3600.0 if polling_interval is None else polling_interval.total_seconds(),
+            max_concurrency=polling_concurrency,
+        )
+
+        self._node_metrics = NodeMetricsStore(metrics_capacity)
+        self._link_quality = LinkQualityTracker()
+        self._channel_load = ChannelLoadMonitor()
 
         # MQTT client for persistent connection
         self._mqtt_proxy_enabled = enable_mqtt_proxy
@@ -205,6 +256,10 @@ class MeshInterface:
         self._app_listeners[packet_type].append(wrapper)
         return lambda: self._app_listeners[packet_type].remove(wrapper)
 
+    def add_node_added_listener(self, callback: Callable[[MeshNode], Awaitable[None]]) -> Callable[[], None]:
+        self._node_added_listeners.append(callback)
+        return lambda: self._node_added_listeners.remove(callback)
+
     def nodes(self) -> Mapping[int, Mapping[str, Any]]:
         return MappingProxyType(self._node_database)
 
@@ -227,18 +282,46 @@ class MeshInterface:
 
         return self._connected_node_metadata
 
+    def send_queue_statistics(self) -> SendQueueStatistics:
+        return self._connection.send_queue_statistics
+
+    def packet_capture(self) -> PacketCapture:
+        return self._connection.packet_capture
+
+    def airtime_statistics(self) -> AirtimeStatistics:
+        return self._connection.airtime_budget.statistics
+
+    def _update_airtime_budget(self, lora: config_pb2.Config.LoRaConfig) -> None:
+        self._lora_modulation = LoRaModulation.from_lora_config(lora)
+        self._connection.airtime_budget.duty_cycle = min(self._airtime_duty_cycle, regional_duty_cycle(lora))
+
+    def _estimate_airtime(self, packet: MeshPacket) -> float:
+        if self._connected_node_info is not None and packet.to == self._connected_node_info.my_node_num:
+            # packets for the connected node itself are not transmitted
+            return 0.0
+        return self._lora_modulation.packet_time_on_air(packet)
+
     def connected_node_channels(self) -> list[channel_pb2.Channel] | None:
         if not self._connected_node_ready.is_set():
             return None
 
         return self._connected_node_channels
 
-    def connected_node_local_config(self) -> localonly_pb2.LocalConfig | None:
+    # built on first use, so localonly_pb2 is not imported when the interface is created
+    @functools.cached_property
+    def _connected_node_local_config(self) -> "localonly_pb2.LocalConfig":
+        return localonly_pb2.LocalConfig()
+
+    @functools.cached_property
+    def _connected_node_module_config(self) -> "localonly_pb2.LocalModuleConfig":
+        return localonly_pb2.LocalModuleConfig()
+
+    def connected_node_local_config(self) -> "localonly_pb2.LocalConfig | None":
         if not self._connected_node_ready.is_set():
             return None
         return self._connected_node_local_config
 
-    def connected_node_module_config(self) -> localonly_pb2.LocalModuleConfig | None:
+    def connected_node_module_config(self) -> "localonly_pb2.LocalModuleConfig | None":
         if not self._connected_node_ready.is_set():
             return None
         return self._connected_node_module_config
@@ -326,6 +409,7 @@ class MeshInterface:
 
         self._processing_tasks.clear()
         self._processing_tasks.add(asyncio.create_task(self._heartbeat_loop(), name="heartbeat"))
+        self._processing_tasks.add(asyncio.create_task(self._polling_loop(), name="polling"))
         self._processing_tasks.add(
             asyncio.create_task(self._process_from_radio_packets_loop(), name="process_from_radio_packets")
         )
@@ -344,6 +428,8 @@ class MeshInterface:
 
         self._is_running.clear()
         self._connected_node_ready.clear()
+        self._node_database_ready.clear()
+        self._node_database_requested.clear()
         self._is_stopped.set()
 
         await self._close_packet_streams()
@@ -399,6 +485,10 @@ class MeshInterface:
         await self._connected_node_ready.wait()
         return self._connected_node_ready.is_set()
 
+    async def node_database_ready(self) -> bool:
+        await self._node_database_ready.wait()
+        return self._node_database_ready.is_set()
+
     async def _init_mqtt_client(self) -> None:
         """Initialize the MQTT client if MQTT is enabled in the module config."""
         if not await self.connected_node_ready():
@@ -432,13 +522,22 @@ class MeshInterface:
             "port": port,
             "username": username or None,
             "password": password or None,
-            "tls_context": get_default_context() if use_tls else None,
+            "tls_context": self._mqtt_tls_context() if use_tls else None,
             "identifier": client_id,
         }
 
         # Start connection task
         self._mqtt_connection_task = self._add_background_task(self._maintain_mqtt_connection(), name="mqtt-connection")
 
+    @staticmethod
+    def _mqtt_tls_context() -> ssl.SSLContext:
+        # imported when needed, the library itself does not depend on home assistant
+        try:
+            from homeassistant.util.ssl import get_default_context
+        except ImportError:
+            return ssl.create_default_context()
+        return get_default_context()
+
     async def _maintain_mqtt_connection(self) -> None:
         """Maintains the MQTT connection and handles reconnections."""
         while self.is_running:
@@ -532,6 +631,15 @@ class MeshInterface:
             else:
                 self._logger.debug("Heartbeat success")
 
+    @process_while_running
+    async def _polling_loop(self) -> None:
+        await self._connected_node_ready.wait()
+        try:
+            await asyncio.wait_for(self._node_database_requested.wait(), timeout=POLLING_NODE_DATABASE_TIMEOUT)
+        except TimeoutError:
+            self._logger.debug("Node database not received yet, start polling anyway")
+        await self._poller.run()
+
     async def _process_connected_node_packets(self, packet: mesh_pb2.FromRadio) -> None:
         if packet.HasField("rebooted") and packet.rebooted:
 
@@ -545,7 +653,7 @@ class MeshInterface:
         elif packet.HasField("metadata"):
             self._connected_node_metadata = packet.metadata
         elif packet.HasField("channel"):
-            self._connected_node_channels.append(packet.channel)
+            self._process_connected_node_channel(packet.channel)
         elif packet.HasField("queueStatus"):
             self._connected_node_queue_status = packet.queueStatus
         elif packet.HasField("log_record"):
@@ -557,6 +665,19 @@ class MeshInterface:
         elif packet.HasField("mqttClientProxyMessage"):
             await self._handle_mqtt_client_proxy_message(packet.mqttClientProxyMessage)
 
+    def _process_connected_node_channel(self, channel: channel_pb2.Channel) -> None:
+        if self._connected_node_channels is None:
+            self._connected_node_channels = []
+
+        existing_index = next(
+            (i for i, c in enumerate(self._connected_node_channels) if c.index == channel.index),
+            None,
+        )
+        if existing_index is None:
+            self._connected_node_channels.append(channel)
+        else:
+            self._connected_node_channels[existing_index] = channel
+
     def _process_connected_node_config(self, config: config_pb2.Config) -> None:
         if config.HasField("device"):
             self._connected_node_local_config.device.CopyFrom(config.device)
@@ -570,6 +691,7 @@ class MeshInterface:
             self._connected_node_local_config.display.CopyFrom(config.display)
         if config.HasField("lora"):
             self._connected_node_local_config.lora.CopyFrom(config.lora)
+            self._update_airtime_budget(config.lora)
         if config.HasField("bluetooth"):
             self._connected_node_local_config.bluetooth.CopyFrom(config.bluetooth)
         if config.HasField("security"):
@@ -636,21 +758,26 @@ class MeshInterface:
         if packet.port_num == portnums_pb2.PortNum.TELEMETRY_APP:
             telemetry = packet.app_payload
             telemetry_info = google.protobuf.json_format.MessageToDict(telemetry)
+            self._poller.record_received(node_id, telemetry.WhichOneof("variant"))
+            if telemetry.HasField("device_metrics"):
+                self._record_device_metrics(node_id, telemetry.device_metrics)
             if node_id in self._node_database:
-                await self._node_database_update(node_id, **telemetry_info)
+                await self._node_database_update(node_id, mesh_packet=packet.mesh_packet, **telemetry_info)
         elif packet.port_num == portnums_pb2.PortNum.POSITION_APP:
             position = packet.app_payload
             position_info = google.protobuf.json_format.MessageToDict(position)
+            self._poller.record_received(node_id, POLL_POSITION)
             if node_id in self._node_database:
-                await self._node_database_update(node_id, position=position_info)
+                await self._node_database_update(node_id, mesh_packet=packet.mesh_packet, position=position_info)
         elif packet.port_num == portnums_pb2.PortNum.NODEINFO_APP:
             node_info = packet.app_payload
             node_info_dict = google.protobuf.json_format.MessageToDict(node_info)
             if node_id in self._node_database:
-                await self._node_database_update(node_id, **node_info_dict)
+                await self._node_database_update(node_id, mesh_packet=packet.mesh_packet, **node_info_dict)
             else:
                 self._create_db_node(node_info.num, node_info_dict)
-                await self._notify_node_update(node_id)
+                self._notify_node_added(node_id)
+                await self._notify_node_update(node_id, packet.mesh_packet)
         elif packet.port_num == portnums_pb2.PortNum.TRACEROUTE_APP:
             pass
 
@@ -662,23 +789,99 @@ class MeshInterface:
         if packet.HasField("node_info"):
             node_info = packet.node_info
             node_id = node_info.num
+            self._restored_node_ids.discard(node_id)
             try:
                 node_info_dict = google.protobuf.json_format.MessageToDict(node_info)
                 db_node = self._get_or_create_node(node_info.num)
-                db_node.update(node_info_dict)
-
-                node = self.find_node(node_id) or MeshNode.stub_node(node_id)
-                node_info_packet = FullNodeInfoPacket(packet)
-                for listener in self._app_listeners[portnums_pb2.PortNum.NODEINFO_APP]:
-                    self._add_background_task(
-                        listener(node, node_info_packet), name=f"app-listener-{portnums_pb2.PortNum.NODEINFO_APP}"
-                    )
+                # only notify about changes, e.g. nodes restored from snapshot are usually unchanged
+                if any(db_node.get(k) != v for k, v in node_info_dict.items()):
+                    db_node.update(node_info_dict)
+
+                    node = self.find_node(node_id) or MeshNode.stub_node(node_id)
+                    node_info_packet = FullNodeInfoPacket(packet)
+                    for listener in self._app_listeners[portnums_pb2.PortNum.NODEINFO_APP]:
+                        self._add_background_task(
+                            listener(node, node_info_packet), name=f"app-listener-{portnums_pb2.PortNum.NODEINFO_APP}"
+                        )
 
             except:  # noqa: E722
                 self._logger.warning("Failed to process node info", exc_info=True)
+        elif (
+            packet.HasField("config_complete_id")
+            and packet.config_complete_id == self._connection._CONFIG_ID_NODES_ONLY  # noqa: SLF001
+        ):
+            # processed in order with the node infos, every node known by radio has been seen at this point
+            self._prune_restored_nodes()
 
         if p.from_id:
-            await self._node_database_update(p.from_id, lastHeard=p.rx_time, snr=p.rx_snr)
+            self._record_packet_metrics(p.from_id, p.mesh_packet)
+            self._link_quality.record(p.from_id, p.mesh_packet)
+            self._record_channel_load(p.from_id, p.mesh_packet)
+            await self._node_database_update(p.from_id, mesh_packet=p.mesh_packet, lastHeard=p.rx_time, snr=p.rx_snr)
+
+    def _record_packet_metrics(self, node_id: int, packet: MeshPacket) -> None:
+        # clocks of radios can be off, a single timestamp in the future would pin all later samples of a buffer to it
+        timestamp = time.time()
+        if not packet.via_mqtt and (packet.rx_snr or packet.rx_rssi):
+            self._node_metrics.record(node_id, NodeMetric.SNR, timestamp, packet.rx_snr)
+            self._node_metrics.record(node_id, NodeMetric.RSSI, timestamp, packet.rx_rssi)
+        if packet.hop_start:
+            self._node_metrics.record(node_id, NodeMetric.HOPS_AWAY, timestamp, packet.hop_start - packet.hop_limit)
+
+    def _record_channel_load(self, node_id: int, packet: MeshPacket) -> None:
+        if packet.via_mqtt:
+            return
+        if packet.WhichOneof("payload_variant") == "encrypted":
+            port = PORT_ENCRYPTED
+            size = len(packet.encrypted)
+        else:
+            port_num = packet.decoded.portnum
+            # ports of newer firmware are not known by name
+            port = portnums_pb2.PortNum.Name(port_num) if port_num in portnums_pb2.PortNum.values() else str(port_num)
+            size = packet.decoded.ByteSize()
+        self._channel_load.record(node_id, port, size, self._lora_modulation.packet_time_on_air(packet))
+
+    def _record_device_metrics(self, node_id: int, device_metrics: telemetry_pb2.DeviceMetrics) -> None:
+        timestamp = time.time()
+        for metric in (
+            NodeMetric.BATTERY_LEVEL,
+            NodeMetric.VOLTAGE,
+            NodeMetric.CHANNEL_UTILIZATION,
+            NodeMetric.AIR_UTIL_TX,
+        ):
+            if device_metrics.HasField(metric):
+                self._node_metrics.record(node_id, metric, timestamp, getattr(device_metrics, metric))
+
+    def link_statistics(self, node: int | MeshNode) -> LinkStatistics | None:
+        return self._link_quality.node(node.id if isinstance(node, MeshNode) else node)
+
+    def gateway_link_statistics(self) -> LinkStatistics:
+        """Statistics of all packets received by the connected node."""
+        return self._link_quality.gateway
+
+    def channel_load_statistics(self) -> ChannelLoadStatistics:
+        """Load of the channel by packets the connected node heard (or sent) over a rolling window."""
+        return self._channel_load.statistics()
+
+    def node_metrics(self, node: int | MeshNode) -> list[NodeMetric]:
+        return self._node_metrics.metrics(node.id if isinstance(node, MeshNode) else node)
+
+    def query_node_metric(
+        self,
+        node: int | MeshNode,
+        metric: NodeMetric,
+        period: datetime.timedelta,
+        window: datetime.timedelta,
+    ) -> list[MetricAggregate]:
+        """Min, max and average of a metric of a node per window, for the given period up to now."""
+        end = time.time()
+        return self._node_metrics.aggregate(
+            node.id if isinstance(node, MeshNode) else node,
+            metric,
+            start=end - period.total_seconds(),
+            end=end + 1,
+            window=window.total_seconds(),
+        )
 
     def _get_or_create_node(self, node_num: int) -> MutableMapping[str, Any]:
         if node_num == self.BROADCAST_NUM:
@@ -688,7 +891,9 @@ class MeshInterface:
         if node_num in self._node_database:
             return self._node_database[node_num]
 
-        return self._create_db_node(node_num)
+        node = self._create_db_node(node_num)
+        self._notify_node_added(node_num)
+        return node
 
     def _create_db_node(self, node_num: int, node_info: Mapping[str, Any] | None = None) -> MutableMapping[str, Any]:
         if node_info is None:
@@ -710,6 +915,16 @@ class MeshInterface:
 
         return n
 
+    def _remove_db_node(self, node_num: int) -> None:
+        self._node_database.pop(node_num, None)
+        self._node_metrics.remove_node(node_num)
+        self._link_quality.remove_node(node_num)
+
+    def _notify_node_added(self, node_num: int) -> None:
+        node = self.find_node(node_num) or MeshNode.stub_node(node_num)
+        for listener in self._node_added_listeners:
+            self._add_background_task(listener(node), name="node-added-listener")
+
     async def node_info_stream(self) -> AsyncIterator[mesh_pb2.NodeInfo]:
         async for packet in self._listen():
             if packet.HasField("node_info"):
@@ -818,16 +1033,127 @@ class MeshInterface:
 
     async def _start_config(self) -> None:
         async with self._connected_node_config_lock:
-            self._connected_node_ready.clear()
-            self._connected_node_info: mesh_pb2.MyNodeInfo | None = None
-            self._connected_node_metadata: mesh_pb2.DeviceMetadata | None = None
-            self._connected_node_channels: list[channel_pb2.Channel] | None = []
+            self._node_database_ready.clear()
+            self._node_database_requested.clear()
+            if self._snapshot_restored:
+                # serve last known state while config is refreshed from radio
+                self._logger.debug("Using restored snapshot until config is received")
+                self._connected_node_ready.set()
+            else:
+                self._connected_node_ready.clear()
+                self._connected_node_info: mesh_pb2.MyNodeInfo | None = None
+                self._connected_node_metadata: mesh_pb2.DeviceMetadata | None = None
+                self._connected_node_channels: list[channel_pb2.Channel] | None = []
+                self._node_database = {}
             self._connected_node_queue_status: mesh_pb2.QueueStatus | None = None
-            self._node_database = {}
 
-            await self._connection.request_config(minimal=self.no_nodes)
+            # phase 1: only config of connected node, this is sufficient for the interface to be usable
+            await self._connection.request_config(minimal=True)
+            self._snapshot_restored = False
             self._connected_node_ready.set()
 
+            if self.no_nodes:
+                self._node_database_ready.set()
+                self._node_database_requested.set()
+                return
+
+        # phase 2: stream node database, nodes are added (and listeners notified) as they arrive
+        self._add_background_task(self._request_node_database(), name="request-node-database")
+
+    async def _request_node_database(self) -> None:
+        async with self._connected_node_config_lock:
+            try:
+                await self._connection.request_config(nodes_only=True)
+            except asyncio.CancelledError:
+                raise
+            except:  # noqa: E722
+                self._logger.warning("Failed to request node database", exc_info=True)
+            else:
+                self._logger.debug("Node database received, %d nodes", len(self._node_database))
+                self._node_database_ready.set()
+            finally:
+                self._node_database_requested.set()
+
+    def _prune_restored_nodes(self) -> None:
+        # radio has forgotten about these nodes, keeping them would carry them over from snapshot to snapshot
+        for node_id in self._restored_node_ids:
+            self._remove_db_node(node_id)
+        if self._restored_node_ids:
+            self._logger.debug("Removed %d restored nodes not known by radio anymore", len(self._restored_node_ids))
+        self._restored_node_ids.clear()
+
+    def export_snapshot(self) -> bytes | None:
+        """
+        Export connected node state and node database.
+
+        Snapshot is a sequence of framed FromRadio packets as the radio would send them during config.
+        """
+        if not self._connected_node_ready.is_set() or self._connected_node_info is None:
+            return None
+
+        packets = [mesh_pb2.FromRadio(my_info=self._connected_node_info)]
+        if self._connected_node_metadata is not None:
+            packets.append(mesh_pb2.FromRadio(metadata=self._connected_node_metadata))
+        packets.extend(mesh_pb2.FromRadio(channel=channel) for channel in self._connected_node_channels or [])
+
+        for field, value in self._connected_node_local_config.ListFields():
+            if field.name not in config_pb2.Config.DESCRIPTOR.fields_by_name:
+                continue
+            config = config_pb2.Config()
+            getattr(config, field.name).CopyFrom(value)
+            if config.HasField("security"):
+                # don't persist private key, it is part of the config received from radio anyway
+                config.security.ClearField("private_key")
+            packets.append(mesh_pb2.FromRadio(config=config))
+
+        for field, value in self._connected_node_module_config.ListFields():
+            if field.name not in module_config_pb2.ModuleConfig.DESCRIPTOR.fields_by_name:
+                continue
+            module_config = module_config_pb2.ModuleConfig()
+            getattr(module_config, field.name).CopyFrom(value)
+            packets.append(mesh_pb2.FromRadio(moduleConfig=module_config))
+
+        for node in self._node_database.values():
+            try:
+                node_info = google.protobuf.json_format.ParseDict(node, mesh_pb2.NodeInfo(), ignore_unknown_fields=True)
+            except google.protobuf.json_format.ParseError:
+                self._logger.debug("Failed to export node %s", node.get("num"), exc_info=True)
+                continue
+            packets.append(mesh_pb2.FromRadio(node_info=node_info))
+
+        return b"".join(StreamingClientTransport.build_frame(p.SerializeToString()) for p in packets)
+
+    async def import_snapshot(self, snapshot: bytes) -> bool:
+        """
+        Restore state from a snapshot created by export_snapshot.
+
+        Must be called before start, restored state is made available as soon as the interface is started and is
+        updated in place once the config has been received from the radio.
+        """
+        if self.is_running:
+            msg = "Snapshot can only be imported before interface is started"
+            raise MeshInterfaceError(msg)
+
+        self._connected_node_channels = []
+        for payload in StreamingClientTransport.split_frames(snapshot):
+            from_radio = mesh_pb2.FromRadio()
+            try:
+                from_radio.ParseFromString(payload)
+            except google.protobuf.message.DecodeError:
+                self._logger.debug("Failed to parse snapshot packet", exc_info=True)
+                continue
+
+            if from_radio.HasField("node_info"):
+                self._create_db_node(
+                    from_radio.node_info.num, google.protobuf.json_format.MessageToDict(from_radio.node_info)
+                )
+                self._restored_node_ids.add(from_radio.node_info.num)
+            elif from_radio.WhichOneof("payload_variant") in self._SNAPSHOT_CONNECTED_NODE_FIELDS:
+                await self._process_connected_node_packets(from_radio)
+
+        self._snapshot_restored = self._connected_node_info is not None
+        return self._snapshot_restored
+
     def _add_background_task(self, coro: Awaitable[None], name: str | None = None) -> asyncio.Task:
         task = asyncio.create_task(coro, name=name)
         self._background_tasks.add(task)
@@ -866,7 +1192,9 @@ class MeshInterface:
         except:  # noqa: E722
             return None
 
-    async def request_connection_status(self, node: int | None = None) -> connection_status_pb2.DeviceConnectionStatus:
+    async def request_connection_status(
+        self, node: int | None = None
+    ) -> "connection_status_pb2.DeviceConnectionStatus":
         admin_message = admin_pb2.AdminMessage()
         admin_message.get_device_connection_status_request = True
 
@@ -905,11 +1233,89 @@ class MeshInterface:
 
         await self.send_admin_message_await_response(node=node, message=admin_message, expect_response=False)
 
+    async def request_local_config(self, node: int | None = None) -> "localonly_pb2.LocalConfig":
+        messages = [
+            admin_pb2.AdminMessage(get_config_request=config_type)
+            for name, config_type in admin_pb2.AdminMessage.ConfigType.items()
+            if name not in self._NON_LOCAL_CONFIG_TYPES
+        ]
+
+        local_config = localonly_pb2.LocalConfig()
+        for response in await self._send_admin_messages_pipelined(node, messages):
+            self._copy_config_section(response.app_payload.get_config_response, local_config)
+        return local_config
+
+    async def request_local_module_config(self, node: int | None = None) -> "localonly_pb2.LocalModuleConfig":
+        messages = [
+            admin_pb2.AdminMessage(get_module_config_request=module_config_type)
+            for module_config_type in admin_pb2.AdminMessage.ModuleConfigType.values()
+        ]
+
+        local_module_config = localonly_pb2.LocalModuleConfig()
+        for response in await self._send_admin_messages_pipelined(node, messages):
+            self._copy_config_section(response.app_payload.get_module_config_response, local_module_config)
+        return local_module_config
+
+    @staticmethod
+    def _copy_config_section(config: Message, target: Message) -> None:
+        # config sections have the same field names in Config / ModuleConfig and LocalConfig / LocalModuleConfig
+        section = config.WhichOneof("payload_variant")
+        if section is not None and section in target.DESCRIPTOR.fields_by_name:
+            getattr(target, section).CopyFrom(getattr(config, section))
+
+    async def write_config(
+        self,
+        configs: Iterable[config_pb2.Config | module_config_pb2.ModuleConfig],
+        node: int | None = None,
+    ) -> None:
+        """
+        Write multiple config sections in one edit settings transaction.
+
+        The node saves the sections (and reboots if required) only once, when the transaction is committed. The
+        transaction is committed even if writing a section fails, with the sections the node accepted so far, and the
+        error is raised afterwards. Otherwise the node would keep the transaction open and not save any settings until
+        it is restarted.
+        """
+        messages = []
+        for config in configs:
+            message = admin_pb2.AdminMessage()
+            if isinstance(config, config_pb2.Config):
+                message.set_config.CopyFrom(config)
+            else:
+                message.set_module_config.CopyFrom(config)
+            messages.append(message)
+
+        if not messages:
+            return
+
+        if node is None:
+            await self._connected_node_ready.wait()
+            node = self._connected_node_info.my_node_num
+
+        if self._admin_session_passkey(node) is None:
+            # settings are only accepted with a recent session passkey, which is part of every admin response
+            await self.send_admin_message_await_response(
+                node=node,
+                message=admin_pb2.AdminMessage(get_config_request=admin_pb2.AdminMessage.ConfigType.SESSIONKEY_CONFIG),
+            )
+
+        await self.send_admin_message_await_response(
+            node=node, message=admin_pb2.AdminMessage(begin_edit_settings=True), expect_response=False
+        )
+        try:
+            await self._send_admin_messages_pipelined(node, messages, expect_response=False)
+        finally:
+            await self.send_admin_message_await_response(
+                node=node, message=admin_pb2.AdminMessage(commit_edit_settings=True), expect_response=False
+            )
+
     async def request_telemetry(
         self,
         node: int | MeshNode,
         telemetry_type: TelemetryType,
         timeout: float = UNDEFINED,  # noqa: ASYNC109
+        *,
+        priority: mesh_pb2.MeshPacket.Priority.ValueType = mesh_pb2.MeshPacket.Priority.RELIABLE,
     ) -> telemetry_pb2.Telemetry:
         telemetry = telemetry_pb2.Telemetry()
 
@@ -931,6 +1337,7 @@ class MeshInterface:
             port_num=portnums_pb2.PortNum.TELEMETRY_APP,
             want_response=True,
             timeout=timeout,
+            priority=priority,
         )
         return response.app_payload
 
@@ -938,6 +1345,8 @@ class MeshInterface:
         self,
         node: int | MeshNode,
         timeout: float = UNDEFINED,  # noqa: ASYNC109
+        *,
+        priority: mesh_pb2.MeshPacket.Priority.ValueType = mesh_pb2.MeshPacket.Priority.RELIABLE,
     ) -> telemetry_pb2.Telemetry:
         position = mesh_pb2.Position()
         response = await self._send_message_await_response(
@@ -946,9 +1355,35 @@ class MeshInterface:
             port_num=portnums_pb2.PortNum.POSITION_APP,
             want_response=True,
             timeout=timeout,
+            priority=priority,
         )
         return response.app_payload
 
+    def poll_node(
+        self,
+        node: int | MeshNode,
+        kinds: Iterable[TelemetryType | str] = (TelemetryType.DEVICE_METRICS,),
+        interval: datetime.timedelta | None = None,
+    ) -> None:
+        self._poller.add(
+            node.id if isinstance(node, MeshNode) else node,
+            kinds,
+            interval=None if interval is None else interval.total_seconds(),
+        )
+
+    def stop_polling_node(self, node: int | MeshNode, kinds: Iterable[TelemetryType | str] | None = None) -> None:
+        self._poller.remove(node.id if isinstance(node, MeshNode) else node, kinds)
+
+    def polling_statistics(self) -> PollingStatistics:
+        return self._poller.statistics
+
+    async def _poll_node(self, node_id: int, kind: str) -> None:
+        # polls yield to interactive requests in the send queue
+        if kind == POLL_POSITION:
+            await self.request_position(node_id, priority=mesh_pb2.MeshPacket.Priority.BACKGROUND)
+        else:
+            await self.request_telemetry(node_id, TelemetryType(kind), priority=mesh_pb2.MeshPacket.Priority.BACKGROUND)
+
     async def _send_message_await_response(  # noqa: PLR0913
         self,
         node: int,
@@ -959,6 +1394,7 @@ class MeshInterface:
         *,
         want_response: bool = False,
         timeout: float = UNDEFINED,  # noqa: ASYNC109
+        priority: mesh_pb2.MeshPacket.Priority.ValueType = mesh_pb2.MeshPacket.Priority.RELIABLE,
     ) -> Packet:
         actual_timeout = (
             timeout if timeout is not UNDEFINED else (self._response_timeout if want_response else self._ack_timeout)
@@ -977,7 +1413,7 @@ class MeshInterface:
                 to_node=node,
                 message=message,
                 port_num=port_num,
-                priority=mesh_pb2.MeshPacket.Priority.RELIABLE,
+                priority=priority,
                 ack=True,
                 want_response=want_response,
                 channel_index=channel_index,
@@ -1005,7 +1441,7 @@ class MeshInterface:
                 p.cancel()
 
     async def send_admin_message(
-        self, node: int, message: admin_pb2.AdminMessage, *, ack: bool = True
+        self, node: int, message: "admin_pb2.AdminMessage", *, ack: bool = True
     ) -> None | tuple[mesh_pb2.Data, mesh_pb2.FromRadio]:
         return await self._connection.send_mesh_packet(
             channel_index=self._get_admin_channel_index(node=node),
@@ -1020,15 +1456,24 @@ class MeshInterface:
     async def send_admin_message_await_response(
         self,
         node: int | None,
-        message: admin_pb2.AdminMessage,
+        message: "admin_pb2.AdminMessage",
         *,
         timeout: float = UNDEFINED,  # noqa: ASYNC109
         expect_response: bool = True,
-    ) -> Packet[admin_pb2.AdminMessage]:
+    ) -> "Packet[admin_pb2.AdminMessage]":
         if node is None:
             await self._connected_node_ready.wait()
             node = self._connected_node_info.my_node_num
-        return await self._send_message_await_response(
+
+        session_passkey = self._admin_session_passkey(node)
+        if session_passkey is not None and not message.session_passkey:
+            # copy, the message of the caller is left as is
+            message_with_passkey = admin_pb2.AdminMessage()
+            message_with_passkey.CopyFrom(message)
+            message_with_passkey.session_passkey = session_passkey
+            message = message_with_passkey
+
+        response = await self._send_message_await_response(
             node=node,
             message=message,
             port_num=portnums_pb2.PortNum.ADMIN_APP,
@@ -1036,6 +1481,46 @@ class MeshInterface:
             want_response=expect_response,
             timeout=timeout,
         )
+        if expect_response and response.app_payload.session_passkey:
+            self._admin_session_passkeys[node] = (
+                response.app_payload.session_passkey,
+                asyncio.get_running_loop().time(),
+            )
+        return response
+
+    def _admin_session_passkey(self, node: int) -> bytes | None:
+        session_passkey, received_at = self._admin_session_passkeys.get(node, (None, 0.0))
+        if asyncio.get_running_loop().time() - received_at > self.ADMIN_SESSION_PASSKEY_VALIDITY:
+            return None
+        return session_passkey
+
+    async def _send_admin_messages_pipelined(
+        self,
+        node: int | None,
+        messages: Sequence["admin_pb2.AdminMessage"],
+        *,
+        expect_response: bool = True,
+    ) -> list["Packet[admin_pb2.AdminMessage]"]:
+        """
+        Send admin messages with up to ADMIN_REQUEST_WINDOW of them in flight.
+
+        Responses are matched to their request by packet id and returned in order of the messages. Fails on the first
+        failed message, the ones still in flight are abandoned.
+        """
+        window = asyncio.Semaphore(self.ADMIN_REQUEST_WINDOW)
+
+        async def send(message: "admin_pb2.AdminMessage") -> "Packet[admin_pb2.AdminMessage]":
+            async with window:
+                return await self.send_admin_message_await_response(
+                    node=node, message=message, expect_response=expect_response
+                )
+
+        tasks = [asyncio.create_task(send(message), name="admin-request") for message in messages]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     def _get_admin_channel_index(self, node: int) -> int:
         if node == self._connected_node_info.my_node_num:
@@ -1104,20 +1589,22 @@ class MeshInterface:
             emoji=emoji,
         )
 
-    async def _notify_node_update(self, node_id: int) -> None:
+    async def _notify_node_update(self, node_id: int, mesh_packet: MeshPacket | None = None) -> None:
         node = self.find_node(node_id) or MeshNode.stub_node(node_id)
-        node_info_packet = DatabaseNodeInfoPacket(self._get_or_create_node(node.id))
+        node_info_packet = DatabaseNodeInfoPacket(self._get_or_create_node(node.id), mesh_packet)
         for listener in self._app_listeners[portnums_pb2.PortNum.NODEINFO_APP]:
             self._add_background_task(
                 listener(node, node_info_packet), name=f"app-listener-{portnums_pb2.PortNum.NODEINFO_APP}"
             )
 
-    async def _node_database_update(self, node_id: int, **kwargs: Any) -> bool:
+    async def _node_database_update(
+        self, node_id: int, *, mesh_packet: MeshPacket | None = None, **kwargs: Any
+    ) -> bool:
         if node_id not in self._node_database:
             return False
 
         self._node_database[node_id].update(**kwargs)
-        await self._notify_node_update(node_id)
+        await self._notify_node_update(node_id, mesh_packet)
         return True
 
     async def request_traceroute(self, node: int | MeshNode, timeout: float = UNDEFINED) -> mesh_pb2.RouteDiscovery:  # noqa: ASYNC109
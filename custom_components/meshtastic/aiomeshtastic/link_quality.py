@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import bisect
+import math
+import time
+from array import array
+from collections import deque
+
+from .protobuf import mesh_pb2
+
+MAX_HOPS = 7
+PACKET_RATE_TIME_CONSTANT = 3600.0
+# a rate is only reported once observed for this long or after this many packets, a single packet is no rate
+PACKET_RATE_MIN_OBSERVATION = 600.0
+PACKET_RATE_MIN_PACKETS = 10
+EWMA_ALPHA = 0.1
+DUPLICATE_WINDOW = 16
+
+
+class RunningStatistics:
+    """Mean, variance and range of a stream of values (Welford's algorithm)."""
+
+    __slots__ = ("_m2", "count", "maximum", "mean", "minimum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_deviation(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class Ewma:
+    __slots__ = ("_alpha", "value")
+
+    def __init__(self, alpha: float = EWMA_ALPHA) -> None:
+        self._alpha = alpha
+        self.value: float | None = None
+
+    def add(self, value: float) -> None:
+        self.value = value if self.value is None else self.value + self._alpha * (value - self.value)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of a quantile with five markers (P² algorithm by Jain and Chlamtac).
+
+    Memory is constant, the estimate converges to the true quantile without storing the observations.
+    """
+
+    __slots__ = ("_desired", "_heights", "_increments", "_positions", "_quantile")
+
+    def __init__(self, quantile: float) -> None:
+        self._quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5.0]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < len(self._positions):
+            bisect.insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect.bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # move inner markers towards their desired position, one step at a time
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = math.copysign(1.0, offset)
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: float) -> float:
+        h = self._heights
+        n = self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: float) -> float:
+        h = self._heights
+        n = self._positions
+        j = i + int(step)
+        return h[i] + step * (h[j] - h[i]) / (n[j] - n[i])
+
+    @property
+    def value(self) -> float | None:
+        if not self._heights:
+            return None
+        if len(self._heights) < len(self._positions):
+            return self._heights[round(self._quantile * (len(self._heights) - 1))]
+        return self._heights[2]
+
+
+class DecayingRate:
+    """Events per second, exponentially weighted with the given time constant."""
+
+    __slots__ = ("_count", "_first", "_last", "_min_observation", "_min_packets", "_packets", "_time_constant")
+
+    def __init__(
+        self,
+        time_constant: float = PACKET_RATE_TIME_CONSTANT,
+        min_observation: float = PACKET_RATE_MIN_OBSERVATION,
+        min_packets: int = PACKET_RATE_MIN_PACKETS,
+    ) -> None:
+        self._time_constant = time_constant
+        self._min_observation = min_observation
+        self._min_packets = min_packets
+        self._count = 0.0
+        self._packets = 0
+        self._first: float | None = None
+        self._last: float | None = None
+
+    def add(self, now: float) -> None:
+        if self._last is None:
+            self._first = now
+        else:
+            self._count *= math.exp(-max(now - self._last, 0.0) / self._time_constant)
+        self._count += 1
+        self._packets += 1
+        self._last = now
+
+    def rate(self, now: float) -> float | None:
+        if self._last is None:
+            return None
+        if now - self._first < self._min_observation and self._packets < self._min_packets:
+            return None
+        count = self._count * math.exp(-max(now - self._last, 0.0) / self._time_constant)
+        # correct bias while observed for less than the time constant
+        observed = self._time_constant * -math.expm1(-max(now - self._first, 1.0) / self._time_constant)
+        return count / observed
+
+
+class LinkStatistics:
+    """Statistics of packets received from one node (or from all nodes), constant memory."""
+
+    __slots__ = (
+        "_duplicate_rate",
+        "_hops",
+        "_packet_rate",
+        "_recent_packet_ids",
+        "last_relay_node",
+        "packets",
+        "rssi",
+        "rssi_ewma",
+        "rssi_median",
+        "rssi_p10",
+        "snr",
+        "snr_ewma",
+    )
+
+    def __init__(self, *, duplicate_window: int = DUPLICATE_WINDOW) -> None:
+        self.packets = 0
+        self.snr = RunningStatistics()
+        self.snr_ewma = Ewma()
+        self.rssi = RunningStatistics()
+        self.rssi_ewma = Ewma()
+        self.rssi_median = P2Quantile(0.5)
+        self.rssi_p10 = P2Quantile(0.1)
+        self.last_relay_node: int | None = None
+        self._hops = array("I", [0]) * (MAX_HOPS + 1)
+        self._packet_rate = DecayingRate()
+        self._duplicate_rate = Ewma()
+        self._recent_packet_ids: deque[tuple[int, int]] = deque(maxlen=duplicate_window)
+
+    def add(self, packet: mesh_pb2.MeshPacket, now: float, *, duplicate: bool | None = None) -> bool:
+        """Add a received packet, returns whether it is a duplicate. Pass duplicate if already known by the caller."""
+        packet_key = (getattr(packet, "from"), packet.id)
+        if duplicate is None:
+            duplicate = packet.id != 0 and packet_key in self._recent_packet_ids
+        self._duplicate_rate.add(1.0 if duplicate else 0.0)
+        if duplicate:
+            # same packet heard again, e.g. via mqtt and radio, does not say anything new about the link
+            return True
+        if packet.id != 0:
+            self._recent_packet_ids.append(packet_key)
+
+        self.packets += 1
+        self._packet_rate.add(now)
+        if packet.relay_node:
+            self.last_relay_node = packet.relay_node
+
+        if packet.hop_start:
+            self._hops[min(max(packet.hop_start - packet.hop_limit, 0), MAX_HOPS)] += 1
+
+        if not packet.via_mqtt and (packet.rx_snr or packet.rx_rssi):
+            self.snr.add(packet.rx_snr)
+            self.snr_ewma.add(packet.rx_snr)
+            self.rssi.add(packet.rx_rssi)
+            self.rssi_ewma.add(packet.rx_rssi)
+            self.rssi_median.add(packet.rx_rssi)
+            self.rssi_p10.add(packet.rx_rssi)
+        return False
+
+    def packet_rate(self, now: float | None = None) -> float | None:
+        """Packets per hour."""
+        rate = self._packet_rate.rate(time.time() if now is None else now)
+        return None if rate is None else rate * 3600
+
+    @property
+    def duplicate_rate(self) -> float | None:
+        return self._duplicate_rate.value
+
+    @property
+    def hops(self) -> dict[int, int]:
+        return {hops: count for hops, count in enumerate(self._hops) if count}
+
+    @property
+    def hops_mean(self) -> float | None:
+        total = sum(self._hops)
+        if total == 0:
+            return None
+        return sum(hops * count for hops, count in enumerate(self._hops)) / total
+
+
+class LinkQualityTracker:
+    """Link statistics per sending node and for all packets received by the gateway."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[int, LinkStatistics] = {}
+        # duplicates are detected per sending node, a window shared by all senders would be too short to catch them
+        self._gateway = LinkStatistics(duplicate_window=0)
+
+    @property
+    def gateway(self) -> LinkStatistics:
+        return self._gateway
+
+    def node(self, node_id: int) -> LinkStatistics | None:
+        return self._nodes.get(node_id)
+
+    def remove_node(self, node_id: int) -> None:
+        self._nodes.pop(node_id, None)
+
+    def record(self, node_id: int, packet: mesh_pb2.MeshPacket, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        statistics = self._nodes.get(node_id)
+        if statistics is None:
+            statistics = self._nodes[node_id] = LinkStatistics()
+        duplicate = statistics.add(packet, now)
+        self._gateway.add(packet, now, duplicate=duplicate)
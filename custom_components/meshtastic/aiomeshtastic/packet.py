@@ -4,14 +4,19 @@
 
 from collections.abc import Mapping
 from functools import cached_property
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
-import google
+import google.protobuf.json_format
 
 from .const import LOGGER
-from .protobuf import admin_pb2, mesh_pb2, portnums_pb2, telemetry_pb2
+from .protobuf import lazy_import, mesh_pb2, portnums_pb2, telemetry_pb2
 
-T = TypeVar("T", None, mesh_pb2.Routing, telemetry_pb2.Telemetry, admin_pb2.AdminMessage, str)
+if TYPE_CHECKING:
+    from .protobuf import admin_pb2
+else:
+    admin_pb2 = lazy_import("admin_pb2")
+
+T = TypeVar("T", None, mesh_pb2.Routing, telemetry_pb2.Telemetry, "admin_pb2.AdminMessage", str)
 
 
 class Packet[T]:
@@ -83,6 +88,10 @@ class Packet[T]:
             route_discovery = mesh_pb2.RouteDiscovery()
             route_discovery.ParseFromString(payload)
             return route_discovery
+        if port_num == portnums_pb2.PortNum.NEIGHBORINFO_APP:
+            neighbor_info = mesh_pb2.NeighborInfo()
+            neighbor_info.ParseFromString(payload)
+            return neighbor_info
         self._logger.debug("Unhandled portnum %s", port_num)
         return None
 
@@ -112,7 +121,7 @@ class FullNodeInfoPacket(Packet[mesh_pb2.NodeInfo]):
 
 
 class DatabaseNodeInfoPacket(FullNodeInfoPacket):
-    def __init__(self, database: Mapping[str, Any]) -> None:
+    def __init__(self, database: Mapping[str, Any], mesh_packet: mesh_pb2.MeshPacket | None = None) -> None:
         from_radio = mesh_pb2.FromRadio()
         try:
             google.protobuf.json_format.ParseDict(database, from_radio.node_info, ignore_unknown_fields=True)
@@ -121,3 +130,9 @@ class DatabaseNodeInfoPacket(FullNodeInfoPacket):
             google.protobuf.json_format.ParseDict(database["user"], from_radio.node_info.user)
 
         super().__init__(from_radio)
+        # packet that caused the update, e.g. to detect updates caused by a packet also heard by other gateways
+        self._mesh_packet = mesh_packet
+
+    @property
+    def mesh_packet(self) -> mesh_pb2.MeshPacket | None:
+        return self._mesh_packet
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+# poll intervals of unresponsive nodes grow up to 1 / MIN_RESPONSE_RATE times the configured interval
+MIN_RESPONSE_RATE = 0.125
+RESPONSE_RATE_SMOOTHING = 0.3
+# poll kinds are the telemetry variant names (values of TelemetryType), or this one for the position of a node
+POLL_POSITION = "position"
+
+
+@dataclass(eq=False)
+class _PollTarget:
+    node_id: int
+    kind: str
+    interval: float
+    next_poll: float
+    last_received: float | None = None
+    response_rate: float = 1.0
+    in_flight: bool = False
+
+    @property
+    def effective_interval(self) -> float:
+        return self.interval / max(self.response_rate, MIN_RESPONSE_RATE)
+
+
+@dataclass
+class PollingStatistics:
+    targets: int = 0
+    requests: int = 0
+    responses: int = 0
+    failures: int = 0
+    skipped: int = 0
+    in_flight: int = 0
+
+
+class MeshPollingScheduler:
+    """
+    Periodically requests telemetry and positions of remote nodes.
+
+    Polls are spread over time with jitter and only a limited number of requests is in flight at once. A poll is
+    skipped when the node sent the data on its own recently. Nodes that often do not respond are polled less
+    frequently, their interval recovers as soon as they respond again.
+    """
+
+    def __init__(
+        self,
+        request: Callable[[int, str], Awaitable[object]],
+        logger: logging.Logger,
+        *,
+        interval: float,
+        max_concurrency: int = 2,
+        jitter: float = 0.2,
+    ) -> None:
+        self._request = request
+        self._logger = logger
+        self._interval = interval
+        self._jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._targets: dict[tuple[int, str], _PollTarget] = {}
+        self._targets_changed = asyncio.Event()
+        self._poll_tasks: set[asyncio.Task] = set()
+        self._statistics = PollingStatistics()
+
+    @property
+    def statistics(self) -> PollingStatistics:
+        self._statistics.targets = len(self._targets)
+        self._statistics.in_flight = len(self._poll_tasks)
+        return self._statistics
+
+    def add(self, node_id: int, kinds: Iterable[str], interval: float | None = None) -> None:
+        now = asyncio.get_running_loop().time()
+        interval = self._interval if interval is None else interval
+        for kind in kinds:
+            target = self._targets.get((node_id, kind))
+            if target is not None:
+                target.interval = interval
+                continue
+            # spread first polls over the whole interval, so adding many nodes does not cause a burst
+            self._targets[(node_id, kind)] = _PollTarget(
+                node_id=node_id,
+                kind=kind,
+                interval=interval,
+                next_poll=now + random.uniform(0, interval),  # noqa: S311
+            )
+        self._targets_changed.set()
+
+    def remove(self, node_id: int, kinds: Iterable[str] | None = None) -> None:
+        if kinds is None:
+            kinds = [kind for target_node_id, kind in self._targets if target_node_id == node_id]
+        for kind in kinds:
+            self._targets.pop((node_id, kind), None)
+        self._targets_changed.set()
+
+    def record_received(self, node_id: int, kind: str | None) -> None:
+        target = self._targets.get((node_id, kind))
+        if target is not None:
+            target.last_received = asyncio.get_running_loop().time()
+
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - self._jitter, 1 + self._jitter)  # noqa: S311
+
+    def _next_due_target(self, now: float) -> _PollTarget | float | None:
+        """Get the target that is due the earliest, or the time until the next target is due."""
+        next_target = min(
+            (target for target in self._targets.values() if not target.in_flight),
+            key=lambda target: target.next_poll,
+            default=None,
+        )
+        if next_target is None:
+            return None
+        return next_target if next_target.next_poll <= now else next_target.next_poll - now
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._targets_changed.clear()
+                due = self._next_due_target(loop.time())
+                if not isinstance(due, _PollTarget):
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._targets_changed.wait(), timeout=due)
+                    continue
+
+                now = loop.time()
+                if due.last_received is not None and now - due.last_received < due.effective_interval:
+                    # node sent the data on its own, no need to ask for it
+                    self._statistics.skipped += 1
+                    # not before now, jitter could place it in the past and the target would be due again right away
+                    due.next_poll = max(now, due.last_received + self._jittered(due.effective_interval))
+                    continue
+
+                await self._semaphore.acquire()
+                if self._targets.get((due.node_id, due.kind)) is not due:
+                    # removed while waiting for a free slot
+                    self._semaphore.release()
+                    continue
+
+                due.in_flight = True
+                task = asyncio.create_task(self._poll(due), name=f"poll-{due.node_id:08x}-{due.kind}")
+                self._poll_tasks.add(task)
+                task.add_done_callback(self._poll_tasks.discard)
+        finally:
+            for task in self._poll_tasks:
+                task.cancel()
+
+    async def _poll(self, target: _PollTarget) -> None:
+        loop = asyncio.get_running_loop()
+        self._statistics.requests += 1
+        try:
+            await self._request(target.node_id, target.kind)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            self._logger.debug("Polling %s of node %08x failed", target.kind, target.node_id, exc_info=True)
+            self._statistics.failures += 1
+            target.response_rate -= RESPONSE_RATE_SMOOTHING * target.response_rate
+        else:
+            self._statistics.responses += 1
+            target.response_rate += RESPONSE_RATE_SMOOTHING * (1 - target.response_rate)
+            target.last_received = loop.time()
+        finally:
+            target.in_flight = False
+            target.next_poll = loop.time() + self._jittered(target.effective_interval)
+            self._semaphore.release()
+            self._targets_changed.set()
@@ -2,4 +2,25 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+from types import ModuleType
+from typing import Any
+
 __version__ = "2.5.19"
+
+
+class _LazyModule(ModuleType):
+    def __getattr__(self, name: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        # take over attributes, so the module is only looked up once
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import protobuf module on first attribute access.
+
+    Intended for modules that are only needed for requests to a node, not to set up a connection.
+    """
+    return _LazyModule(f"{__name__}.{name}")
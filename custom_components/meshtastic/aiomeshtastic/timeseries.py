@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+import bisect
+import enum
+from array import array
+from dataclasses import dataclass
+
+DEFAULT_METRIC_CAPACITY = 512
+
+
+class NodeMetric(enum.StrEnum):
+    SNR = "snr"
+    RSSI = "rssi"
+    HOPS_AWAY = "hops_away"
+    BATTERY_LEVEL = "battery_level"
+    VOLTAGE = "voltage"
+    CHANNEL_UTILIZATION = "channel_utilization"
+    AIR_UTIL_TX = "air_util_tx"
+
+
+# float32 for measured values, int32 for counts and levels
+_METRIC_TYPECODES = {
+    NodeMetric.SNR: "f",
+    NodeMetric.RSSI: "i",
+    NodeMetric.HOPS_AWAY: "i",
+    NodeMetric.BATTERY_LEVEL: "i",
+    NodeMetric.VOLTAGE: "f",
+    NodeMetric.CHANNEL_UTILIZATION: "f",
+    NodeMetric.AIR_UTIL_TX: "f",
+}
+
+
+@dataclass(frozen=True)
+class MetricAggregate:
+    start: int
+    end: int
+    count: int
+    minimum: float
+    maximum: float
+    average: float
+
+
+class MetricRingBuffer:
+    """
+    Fixed number of timestamped samples of a single metric, the oldest sample is overwritten when full.
+
+    Timestamps (in seconds) and values are stored in preallocated typed arrays, so a sample takes 8 bytes instead of a
+    couple of Python objects. Timestamps never decrease, which allows to find a time range by bisection.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_METRIC_CAPACITY, typecode: str = "f") -> None:
+        if capacity <= 0:
+            msg = "Capacity must be positive"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._timestamps = array("I", [0]) * capacity
+        self._values = array(typecode, [0]) * capacity
+        self._integral = typecode not in ("f", "d")
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _index(self, position: int) -> int:
+        return (self._start + position) % self._capacity
+
+    def _timestamp(self, position: int) -> int:
+        return self._timestamps[self._index(position)]
+
+    def append(self, timestamp: float, value: float) -> None:
+        timestamp = int(timestamp)
+        if self._size:
+            # samples of the same packet may be processed slightly out of order, keep timestamps sorted
+            timestamp = max(timestamp, self._timestamp(self._size - 1))
+
+        if self._size < self._capacity:
+            index = self._index(self._size)
+            self._size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._capacity
+
+        self._timestamps[index] = timestamp
+        self._values[index] = round(value) if self._integral else value
+
+    def _bisect(self, timestamp: float) -> int:
+        """Position of the first sample not older than timestamp."""
+        return bisect.bisect_left(range(self._size), timestamp, key=self._timestamp)
+
+    def samples(self, start: float | None = None, end: float | None = None) -> list[tuple[int, float]]:
+        first = 0 if start is None else self._bisect(start)
+        last = self._size if end is None else self._bisect(end)
+        return [(self._timestamps[index], self._values[index]) for index in map(self._index, range(first, last))]
+
+    def aggregate(self, start: float, end: float, window: float) -> list[MetricAggregate]:
+        """Downsample the samples between start (inclusive) and end (exclusive) to min/max/avg per window."""
+        if window <= 0:
+            msg = "Window must be positive"
+            raise ValueError(msg)
+
+        aggregates: list[MetricAggregate] = []
+        bucket: int | None = None
+        count = 0
+        minimum = maximum = total = 0.0
+        for timestamp, value in self.samples(start, end):
+            sample_bucket = int((timestamp - start) // window)
+            if sample_bucket != bucket:
+                if bucket is not None:
+                    aggregates.append(self._aggregate(start, window, bucket, count, minimum, maximum, total))
+                bucket = sample_bucket
+                count = 0
+                minimum = maximum = value
+                total = 0.0
+            count += 1
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+            total += value
+        if bucket is not None:
+            aggregates.append(self._aggregate(start, window, bucket, count, minimum, maximum, total))
+        return aggregates
+
+    @staticmethod
+    def _aggregate(  # noqa: PLR0913
+        start: float, window: float, bucket: int, count: int, minimum: float, maximum: float, total: float
+    ) -> MetricAggregate:
+        return MetricAggregate(
+            start=int(start + bucket * window),
+            end=int(start + (bucket + 1) * window),
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            average=total / count,
+        )
+
+
+class NodeMetricsStore:
+    """Ring buffers per node and metric, created on the first sample."""
+
+    def __init__(self, capacity: int = DEFAULT_METRIC_CAPACITY) -> None:
+        self._capacity = capacity
+        self._buffers: dict[tuple[int, NodeMetric], MetricRingBuffer] = {}
+
+    def record(self, node_id: int, metric: NodeMetric, timestamp: float, value: float) -> None:
+        buffer = self._buffers.get((node_id, metric))
+        if buffer is None:
+            buffer = self._buffers[(node_id, metric)] = MetricRingBuffer(self._capacity, _METRIC_TYPECODES[metric])
+        buffer.append(timestamp, value)
+
+    def buffer(self, node_id: int, metric: NodeMetric) -> MetricRingBuffer | None:
+        return self._buffers.get((node_id, metric))
+
+    def metrics(self, node_id: int) -> list[NodeMetric]:
+        return [metric for (buffer_node_id, metric) in self._buffers if buffer_node_id == node_id]
+
+    def aggregate(
+        self, node_id: int, metric: NodeMetric, start: float, end: float, window: float
+    ) -> list[MetricAggregate]:
+        buffer = self._buffers.get((node_id, metric))
+        return [] if buffer is None else buffer.aggregate(start, end, window)
+
+    def remove_node(self, node_id: int) -> None:
+        for key in [key for key in self._buffers if key[0] == node_id]:
+            del self._buffers[key]
@@ -5,7 +5,9 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import contextlib
+import time
 from copy import deepcopy
 from datetime import timedelta
 from enum import StrEnum
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING, Any, Self
 import google
 from google.protobuf.json_format import MessageToDict
 from homeassistant.exceptions import IntegrationError
+from homeassistant.helpers.storage import Store
 
 from .aiomeshtastic import (
     BluetoothConnection as AioBluetoothConnection,
@@ -30,44 +33,85 @@ from .aiomeshtastic import (
 from .aiomeshtastic import (
     TcpConnection as AioTcpConnection,
 )
+from .aiomeshtastic.capture import redact_secrets, write_capture_file
 from .aiomeshtastic.errors import MeshRoutingError, MeshtasticError
-from .aiomeshtastic.protobuf import portnums_pb2
+from .aiomeshtastic.interface import TelemetryType
+from .aiomeshtastic.polling import POLL_POSITION
+from .aiomeshtastic.protobuf import mesh_pb2, portnums_pb2
 from .const import (
     CONF_CONNECTION_BLUETOOTH_ADDRESS,
     CONF_CONNECTION_SERIAL_PORT,
     CONF_CONNECTION_TCP_HOST,
     CONF_CONNECTION_TCP_PORT,
     CONF_CONNECTION_TYPE,
+    CONF_OPTION_FILTER_NODES,
+    CONF_OPTION_POLLING,
+    CONF_OPTION_POLLING_ENABLE,
+    CONF_OPTION_POLLING_ENABLE_DEFAULT,
+    CONF_OPTION_POLLING_INTERVAL,
+    CONF_OPTION_POLLING_INTERVAL_DEFAULT,
+    CONF_OPTION_POLLING_KINDS,
+    CONF_OPTION_POLLING_KINDS_DEFAULT,
+    CONF_OPTION_TRANSMIT,
+    CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE,
+    CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE_DEFAULT,
+    CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE,
+    CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE_DEFAULT,
     DOMAIN,
     LOGGER,
     ConnectionType,
 )
+from .dedup import async_get_packet_deduplicator
+from .outbox import MeshtasticOutbox, MeshtasticOutboxMessage
+from .response_cache import (
+    RESPONSE_CACHE_TTL_POSITION,
+    RESPONSE_CACHE_TTL_TELEMETRY,
+    RESPONSE_CACHE_TTL_TRACEROUTE,
+    MeshtasticResponseCache,
+)
+from .routing import async_get_routing_table
+from .topology import MeshtasticLinkSource, async_get_topology
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine, Mapping, MutableMapping
+    from pathlib import Path
     from types import MappingProxyType, TracebackType
 
     from google.protobuf.message import Message
     from homeassistant.core import HomeAssistant
 
-    from .aiomeshtastic.interface import MeshNode, TelemetryType
+    from .aiomeshtastic.airtime import AirtimeStatistics
+    from .aiomeshtastic.channel_load import ChannelLoadStatistics
+    from .aiomeshtastic.connection.send_queue import SendQueueStatistics
+    from .aiomeshtastic.interface import MeshNode
+    from .aiomeshtastic.link_quality import LinkStatistics
     from .aiomeshtastic.packet import Packet
+    from .aiomeshtastic.timeseries import NodeMetric
 
 _LOGGER = LOGGER.getChild(__name__)
 
 
 EVENT_MESHTASTIC_API_BASE = f"{DOMAIN}_api"
 EVENT_MESHTASTIC_API_NODE_UPDATED = EVENT_MESHTASTIC_API_BASE + "_node_updated"
+EVENT_MESHTASTIC_API_NODE_ADDED = EVENT_MESHTASTIC_API_BASE + "_node_added"
 EVENT_MESHTASTIC_API_TELEMETRY = EVENT_MESHTASTIC_API_BASE + "_telemetry"
 EVENT_MESHTASTIC_API_PACKET = EVENT_MESHTASTIC_API_BASE + "_packet"
 EVENT_MESHTASTIC_API_TEXT_MESSAGE = EVENT_MESHTASTIC_API_BASE + "_text_message"
 EVENT_MESHTASTIC_API_POSITION = EVENT_MESHTASTIC_API_BASE + "_position"
+EVENT_MESHTASTIC_API_MESSAGE_STATUS = EVENT_MESHTASTIC_API_BASE + "_message_status"
 
 ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_EVENT_MESHTASTIC_API_NODE = "node"
 ATTR_EVENT_MESHTASTIC_API_DATA = "data"
 ATTR_EVENT_MESHTASTIC_API_TELEMETRY_TYPE = "telemetry_type"
 ATTR_EVENT_MESHTASTIC_API_NODE_INFO = "node_info"
+ATTR_EVENT_MESHTASTIC_API_DUPLICATE = "duplicate"
+ATTR_EVENT_MESHTASTIC_API_RECEPTIONS = "receptions"
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+# sensors read the statistics several times per update, merging the buckets once is enough
+CHANNEL_LOAD_STATISTICS_MAX_AGE = 1.0
 
 
 class EventMeshtasticApiTelemetryType(StrEnum):
@@ -95,6 +139,7 @@ class MeshtasticApiClient:
         config_entry_id: str | None,
         *,
         no_nodes: bool = False,
+        options: Mapping[str, Any] | None = None,
     ) -> None:
         self._logger = LOGGER.getChild(self.__class__.__name__)
         self._connected = asyncio.Event()
@@ -113,26 +158,84 @@ class MeshtasticApiClient:
             msg = f"Unsupported connection type {connection_type}"
             raise ValueError(msg)
 
+        options = options or {}
+        transmit_options = options.get(CONF_OPTION_TRANSMIT, {})
+        airtime_duty_cycle = (
+            transmit_options.get(
+                CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE, CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE_DEFAULT
+            )
+            / 100
+        )
+
+        # tracked nodes are polled for the selected data, gateway node is excluded once connected
+        polling_options = options.get(CONF_OPTION_POLLING, {})
+        if polling_options.get(CONF_OPTION_POLLING_ENABLE, CONF_OPTION_POLLING_ENABLE_DEFAULT):
+            self._polled_node_ids = [el["id"] for el in options.get(CONF_OPTION_FILTER_NODES, [])]
+        else:
+            self._polled_node_ids = []
+        self._poll_kinds = [
+            kind if kind == POLL_POSITION else TelemetryType(kind)
+            for kind in polling_options.get(CONF_OPTION_POLLING_KINDS, CONF_OPTION_POLLING_KINDS_DEFAULT)
+        ]
+
         self._interface = AioMeshInterface(
-            connection=connection, no_nodes=no_nodes, heartbeat_interval=timedelta(minutes=5)
+            connection=connection,
+            no_nodes=no_nodes,
+            heartbeat_interval=timedelta(minutes=5),
+            airtime_duty_cycle=airtime_duty_cycle,
+            polling_interval=timedelta(
+                minutes=polling_options.get(CONF_OPTION_POLLING_INTERVAL, CONF_OPTION_POLLING_INTERVAL_DEFAULT)
+            ),
         )
         self._packet_processor: asyncio.Task | None = None
         self._background_tasks: set[asyncio.Task] = set()
+        self._snapshot_store = self._get_snapshot_store(hass, config_entry_id) if config_entry_id is not None else None
+        self._snapshot_data: dict[str, str] | None = None
+        self._snapshot_save_pending = False
+        self._channel_load_statistics: tuple[float, ChannelLoadStatistics] | None = None
+        self._routing_table = async_get_routing_table(hass) if config_entry_id is not None else None
+        self._packet_deduplicator = async_get_packet_deduplicator(hass) if config_entry_id is not None else None
+        self._response_cache = MeshtasticResponseCache()
+        self._topology = async_get_topology(hass) if config_entry_id is not None else None
+        self._outbox = (
+            MeshtasticOutbox(
+                hass,
+                config_entry_id,
+                self._send_outbox_message,
+                self._on_outbox_message_status,
+                max_age=timedelta(
+                    minutes=transmit_options.get(
+                        CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE, CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE_DEFAULT
+                    )
+                ),
+            )
+            if config_entry_id is not None
+            else None
+        )
 
+        self._interface.add_node_added_listener(self._on_node_added)
         self._interface.add_packet_app_listener(
-            packet_type=portnums_pb2.PortNum.NODEINFO_APP, callback=self._on_node_info, as_dict=True
+            packet_type=portnums_pb2.PortNum.NODEINFO_APP, callback=self._on_node_info, as_packet=True
         )
         self._interface.add_packet_app_listener(
             packet_type=portnums_pb2.PortNum.TEXT_MESSAGE_APP, callback=self._on_text_message, as_packet=True
         )
         self._interface.add_packet_app_listener(
-            packet_type=portnums_pb2.PortNum.TELEMETRY_APP, callback=self._on_telemetry, as_dict=True
+            packet_type=portnums_pb2.PortNum.TELEMETRY_APP, callback=self._on_telemetry, as_packet=True
+        )
+        self._interface.add_packet_app_listener(
+            packet_type=portnums_pb2.PortNum.POSITION_APP, callback=self._on_position, as_packet=True
         )
         self._interface.add_packet_app_listener(
-            packet_type=portnums_pb2.PortNum.POSITION_APP, callback=self._on_position, as_dict=True
+            packet_type=portnums_pb2.PortNum.TRACEROUTE_APP, callback=self._on_traceroute, as_packet=True
+        )
+        self._interface.add_packet_app_listener(
+            packet_type=portnums_pb2.PortNum.NEIGHBORINFO_APP, callback=self._on_neighbor_info, as_packet=True
         )
 
     async def connect(self) -> None:
+        await self._restore_snapshot()
+
         try:
             await asyncio.wait_for(self._interface.start(), timeout=30)
         except Exception as e:
@@ -152,7 +255,12 @@ class MeshtasticApiClient:
                 raise MeshtasticApiClientCommunicationError from exception
             raise MeshtasticApiClientCommunicationError
 
+        self._register_routes()
         self._packet_processor = asyncio.create_task(self._process_meshtastic_packet())
+        self._schedule_snapshot_save()
+        if self._outbox is not None:
+            await self._outbox.async_start()
+        self._start_polling()
 
         async def send_time() -> None:
             await asyncio.sleep(1)
@@ -164,13 +272,154 @@ class MeshtasticApiClient:
 
         self._add_background_task(send_time())
 
+    def _start_polling(self) -> None:
+        own_node_num = self.get_own_node().get("num")
+        for node_id in self._polled_node_ids:
+            if node_id != own_node_num and self._poll_kinds:
+                self._interface.poll_node(node_id, self._poll_kinds)
+
     async def disconnect(self) -> None:
+        await self._save_snapshot()
+        if self._outbox is not None:
+            try:
+                await self._outbox.async_stop()
+            except:  # noqa: E722
+                self._logger.warning("Failed to stop outbox", exc_info=True)
+        if self._routing_table is not None:
+            self._routing_table.async_unregister_gateway(self._config_entry_id)
+
         try:
             self._packet_processor.cancel()
             await self._interface.stop()
         except Exception as e:
             raise MeshtasticApiClientCommunicationError from e
 
+    @staticmethod
+    def _get_snapshot_store(hass: HomeAssistant, config_entry_id: str) -> Store[dict[str, str]]:
+        return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{config_entry_id}.snapshot", private=True)
+
+    @classmethod
+    async def async_remove_snapshot(cls, hass: HomeAssistant, config_entry_id: str) -> None:
+        await cls._get_snapshot_store(hass, config_entry_id).async_remove()
+
+    async def _restore_snapshot(self) -> None:
+        if self._snapshot_store is None:
+            return
+
+        try:
+            self._snapshot_data = await self._snapshot_store.async_load()
+            if self._snapshot_data is None:
+                return
+            restored = await self._interface.import_snapshot(base64.b64decode(self._snapshot_data["snapshot"]))
+            self._logger.debug("Restored snapshot: %s", restored)
+        except:  # noqa: E722
+            self._logger.warning("Failed to restore snapshot", exc_info=True)
+
+    def _get_snapshot_data(self) -> dict[str, str] | None:
+        self._snapshot_save_pending = False
+        snapshot = self._interface.export_snapshot()
+        if snapshot is not None:
+            self._snapshot_data = {"snapshot": base64.b64encode(snapshot).decode("ascii")}
+        return self._snapshot_data
+
+    def _schedule_snapshot_save(self) -> None:
+        # delayed save restarts its timer on every call, with frequent node updates it would never be written
+        if self._snapshot_store is not None and not self._snapshot_save_pending:
+            self._snapshot_save_pending = True
+            self._snapshot_store.async_delay_save(self._get_snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    async def _save_snapshot(self) -> None:
+        if self._snapshot_store is None:
+            return
+
+        try:
+            snapshot_data = self._get_snapshot_data()
+            if snapshot_data is not None:
+                await self._snapshot_store.async_save(snapshot_data)
+        except:  # noqa: E722
+            self._logger.warning("Failed to save snapshot", exc_info=True)
+
+    def _register_routes(self) -> None:
+        if self._routing_table is None:
+            return
+
+        gateway_node_id = self.get_own_node().get("num")
+        if gateway_node_id is None:
+            return
+
+        self._routing_table.async_register_gateway(self._config_entry_id, gateway_node_id)
+        for node_id, node_info in self._interface.nodes().items():
+            self._update_route_from_node_info(node_id, node_info)
+
+    def _update_route_from_node_info(self, node_id: int, node_info: Mapping[str, Any]) -> None:
+        if self._routing_table is None or node_info.get("viaMqtt", False):
+            return
+
+        self._routing_table.async_update_route(
+            self._config_entry_id,
+            node_id,
+            hops_away=node_info.get("hopsAway"),
+            snr=node_info.get("snr", 0),
+            # radio clock, must not be ahead of routes stamped with the host clock when packets are received
+            last_heard=min(node_info.get("lastHeard", 0), time.time()),
+        )
+
+    def _update_route_from_packet(self, packet: mesh_pb2.MeshPacket) -> None:
+        if self._routing_table is None or packet.via_mqtt:
+            return
+
+        node_id = getattr(packet, "from")
+        if node_id == self.get_own_node().get("num"):
+            return
+
+        # hop start is only set by recent firmware
+        hops_away = packet.hop_start - packet.hop_limit if packet.hop_start else None
+        self._routing_table.async_update_route(
+            self._config_entry_id,
+            node_id,
+            hops_away=hops_away,
+            snr=packet.rx_snr,
+            last_heard=time.time(),
+        )
+
+    def _update_topology_from_packet(self, packet: mesh_pb2.MeshPacket) -> None:
+        # only packets that were not relayed tell about a link, hop start is only set by recent firmware
+        if self._topology is None or packet.via_mqtt or not packet.hop_start or packet.hop_start != packet.hop_limit:
+            return
+
+        gateway_node_id = self.get_own_node().get("num")
+        if gateway_node_id is None:
+            return
+
+        self._topology.async_add_link(
+            getattr(packet, "from"),
+            gateway_node_id,
+            snr=packet.rx_snr,
+            source=MeshtasticLinkSource.PACKET,
+        )
+
+    def _add_reception_event_data(
+        self, event_data: MutableMapping[str, Any], packet: mesh_pb2.MeshPacket | None
+    ) -> MutableMapping[str, Any]:
+        """
+        Mark packets heard by another gateway first, which handles them for state shared between gateways.
+
+        Gateways that heard the packet so far are listed with their reception metadata.
+        """
+        received = (
+            self._packet_deduplicator.async_receive(self._config_entry_id, packet)
+            if self._packet_deduplicator is not None and packet is not None
+            else None
+        )
+        event_data[ATTR_EVENT_MESHTASTIC_API_DUPLICATE] = (
+            received is not None and received.primary_config_entry_id != self._config_entry_id
+        )
+        if received is not None:
+            event_data[ATTR_EVENT_MESHTASTIC_API_RECEPTIONS] = [
+                reception.as_event_data() for reception in received.receptions.values()
+            ]
+        return event_data
+
     async def async_get_channels(self) -> list[Mapping[str, Any]]:
         if not await self._interface.connected_node_ready():
             return []
@@ -197,6 +446,10 @@ class MeshtasticApiClient:
     def get_node_info(self, node_id: int) -> MeshNode | None:
         return self._interface.find_node(node_id=node_id)
 
+    def get_node(self, node_id: int) -> Mapping[str, Any] | None:
+        node_info = self._interface.nodes().get(node_id)
+        return self._transform_node_info(node_info) if node_info is not None else None
+
     async def async_get_all_nodes(self) -> Mapping[int, Mapping[str, Any]]:
         await self._interface.connected_node_ready()
         return {node_id: self._transform_node_info(node_info) for node_id, node_info in self._interface.nodes().items()}
@@ -237,6 +490,91 @@ class MeshtasticApiClient:
         else:
             return True
 
+    def enqueue_text(  # noqa: PLR0913
+        self,
+        text: str,
+        destination_id: int | str = MeshInterface.BROADCAST_ADDR,
+        *,
+        want_ack: bool = False,
+        channel_index: int | None = None,
+        reply_id: int = 0,
+        emoji: int = 0,
+    ) -> str:
+        """Queue text message for sending with retries, returns message id used in message status events."""
+        if self._outbox is None:
+            msg = "Queueing messages requires a config entry"
+            raise MeshtasticApiClientError(msg)
+
+        message = self._outbox.enqueue(
+            text, destination_id, channel_index=channel_index, want_ack=want_ack, reply_id=reply_id, emoji=emoji
+        )
+        return message.id
+
+    async def _send_outbox_message(self, message: MeshtasticOutboxMessage) -> bool:
+        """Send queued message, returns whether it was acknowledged, or handed to the radio if no ack is wanted."""
+        try:
+            ack = await asyncio.wait_for(
+                self._interface.send_text_message(
+                    message.text,
+                    destination=message.destination,
+                    want_ack=message.want_ack,
+                    channel_index=message.channel_index,
+                    reply_id=message.reply_id,
+                    emoji=message.emoji,
+                ),
+                timeout=30,
+            )
+        except TimeoutError:
+            return False
+        except Exception as e:
+            raise MeshtasticApiClientError from e
+
+        if not message.want_ack:
+            return True
+        # a routing packet is also sent for failures, e.g. when no node acknowledged after all retransmissions
+        return ack is not None and ack.app_payload.error_reason == mesh_pb2.Routing.Error.NONE
+
+    def _on_outbox_message_status(self, message: MeshtasticOutboxMessage) -> None:
+        self._hass.bus.async_fire(
+            EVENT_MESHTASTIC_API_MESSAGE_STATUS, self._build_event_data(message.destination, message.as_dict())
+        )
+
+    @property
+    def send_queue_statistics(self) -> SendQueueStatistics:
+        return self._interface.send_queue_statistics()
+
+    @property
+    def airtime_statistics(self) -> AirtimeStatistics:
+        return self._interface.airtime_statistics()
+
+    def link_statistics(self, node_id: int) -> LinkStatistics | None:
+        return self._interface.link_statistics(node_id)
+
+    @property
+    def gateway_link_statistics(self) -> LinkStatistics:
+        return self._interface.gateway_link_statistics()
+
+    @property
+    def channel_load_statistics(self) -> ChannelLoadStatistics:
+        now = time.monotonic()
+        if (
+            self._channel_load_statistics is None
+            or now - self._channel_load_statistics[0] >= CHANNEL_LOAD_STATISTICS_MAX_AGE
+        ):
+            self._channel_load_statistics = (now, self._interface.channel_load_statistics())
+        return self._channel_load_statistics[1]
+
+    async def dump_packet_capture(self, path: Path) -> int:
+        """
+        Write the frames recently exchanged with the gateway to a capture file, returns the number of frames.
+
+        Keys and passwords are removed from the frames before writing.
+        """
+        # copy in the event loop, the capture is appended to while writing
+        frames = self._interface.packet_capture().frames()
+        await self._hass.async_add_executor_job(write_capture_file, path, redact_secrets(frames))
+        return len(frames)
+
     @property
     def metadata(self) -> Mapping[str, Any]:
         metadata = self._interface.connected_node_metadata()
@@ -258,13 +596,24 @@ class MeshtasticApiClient:
             ATTR_EVENT_MESHTASTIC_API_DATA: data,
         }
 
-    async def _on_node_info(self, node: MeshNode, info: dict[str, Any]) -> None:
-        event_data = self._build_event_data(node.id, info)
+    async def _on_node_added(self, node: MeshNode) -> None:
+        node_info = self.get_node(node.id)
+        if node_info is None:
+            return
+
+        self._update_route_from_node_info(node.id, node_info)
+        self._hass.bus.async_fire(EVENT_MESHTASTIC_API_NODE_ADDED, self._build_event_data(node.id, node_info))
+        self._schedule_snapshot_save()
+
+    async def _on_node_info(self, node: MeshNode, packet: Packet) -> None:
+        info = MessageToDict(packet.app_payload)
+        event_data = self._add_reception_event_data(self._build_event_data(node.id, info), packet.mesh_packet)
         position = event_data.get(ATTR_EVENT_MESHTASTIC_API_DATA, {}).get("position", {})
         if position:
             self._modify_position(position)
 
         self._hass.bus.async_fire(EVENT_MESHTASTIC_API_NODE_UPDATED, event_data)
+        self._schedule_snapshot_save()
 
     async def _on_text_message(self, node: MeshNode, packet: Packet) -> None:
         if packet.to_id == MeshInterface.BROADCAST_NUM:
@@ -303,47 +652,85 @@ class MeshtasticApiClient:
         )
 
         event_data["message_id"] = packet.mesh_packet.id
+        self._add_reception_event_data(event_data, mesh_packet)
         self._hass.bus.async_fire(EVENT_MESHTASTIC_API_TEXT_MESSAGE, event_data)
 
-    async def _on_telemetry(self, node: MeshNode, telemetry: dict[str, Any]) -> None:
+    async def _on_telemetry(self, node: MeshNode, packet: Packet) -> None:
+        telemetry = MessageToDict(packet.app_payload)
         device_metrics = telemetry.get("deviceMetrics")
         local_stats = telemetry.get("localStats")
         environment_metrics = telemetry.get("environmentMetrics")
         power_metrics = telemetry.get("powerMetrics")
 
+        # cached like a response to a request, so answers look the same whether they were requested or not
+        cached_telemetry = None
+        for telemetry_type, metrics in (
+            (EventMeshtasticApiTelemetryType.DEVICE_METRICS, device_metrics),
+            (EventMeshtasticApiTelemetryType.ENVIRONMENT_METRICS, environment_metrics),
+            (EventMeshtasticApiTelemetryType.POWER_METRICS, power_metrics),
+        ):
+            if metrics:
+                cached_telemetry = cached_telemetry or self._message_to_dict(packet.app_payload)
+                self._response_cache.update(("telemetry", node.id, telemetry_type), cached_telemetry)
+
         node_info = {"name": node.long_name}
         if device_metrics:
             event_data = self._build_event_data(node.id, device_metrics)
             event_data[ATTR_EVENT_MESHTASTIC_API_NODE_INFO] = node_info
             event_data[ATTR_EVENT_MESHTASTIC_API_TELEMETRY_TYPE] = EventMeshtasticApiTelemetryType.DEVICE_METRICS
+            self._add_reception_event_data(event_data, packet.mesh_packet)
             self._hass.bus.async_fire(EVENT_MESHTASTIC_API_TELEMETRY, event_data)
 
         if local_stats:
             event_data = self._build_event_data(node.id, local_stats)
             event_data[ATTR_EVENT_MESHTASTIC_API_NODE_INFO] = node_info
             event_data[ATTR_EVENT_MESHTASTIC_API_TELEMETRY_TYPE] = EventMeshtasticApiTelemetryType.LOCAL_STATS
+            self._add_reception_event_data(event_data, packet.mesh_packet)
             self._hass.bus.async_fire(EVENT_MESHTASTIC_API_TELEMETRY, event_data)
 
         if environment_metrics:
             event_data = self._build_event_data(node.id, environment_metrics)
             event_data[ATTR_EVENT_MESHTASTIC_API_NODE_INFO] = node_info
             event_data[ATTR_EVENT_MESHTASTIC_API_TELEMETRY_TYPE] = EventMeshtasticApiTelemetryType.ENVIRONMENT_METRICS
+            self._add_reception_event_data(event_data, packet.mesh_packet)
             self._hass.bus.async_fire(EVENT_MESHTASTIC_API_TELEMETRY, event_data)
 
         if power_metrics:
             event_data = self._build_event_data(node.id, power_metrics)
             event_data[ATTR_EVENT_MESHTASTIC_API_NODE_INFO] = node_info
             event_data[ATTR_EVENT_MESHTASTIC_API_TELEMETRY_TYPE] = EventMeshtasticApiTelemetryType.POWER_METRICS
+            self._add_reception_event_data(event_data, packet.mesh_packet)
             self._hass.bus.async_fire(EVENT_MESHTASTIC_API_TELEMETRY, event_data)
 
-    async def _on_position(self, node: MeshNode, position: dict[str, Any]) -> None:
+    async def _on_position(self, node: MeshNode, packet: Packet) -> None:
+        position = MessageToDict(packet.app_payload)
+        self._response_cache.update(("position", node.id), self._message_to_dict(packet.app_payload))
         self._modify_position(position)
 
         event_data = self._build_event_data(node.id, position)
         node_info = {"name": node.long_name}
         event_data[ATTR_EVENT_MESHTASTIC_API_NODE_INFO] = node_info
+        self._add_reception_event_data(event_data, packet.mesh_packet)
         self._hass.bus.async_fire(EVENT_MESHTASTIC_API_POSITION, event_data)
 
+    async def _on_traceroute(self, node: MeshNode, packet: Packet) -> None:  # noqa: ARG002
+        if self._topology is None:
+            return
+
+        mesh_packet = packet.mesh_packet
+        self._topology.async_add_traceroute(
+            getattr(mesh_packet, "from"),
+            mesh_packet.to,
+            packet.app_payload,
+            is_response=packet.data.request_id != 0,
+        )
+
+    async def _on_neighbor_info(self, node: MeshNode, packet: Packet) -> None:  # noqa: ARG002
+        if self._topology is None:
+            return
+
+        self._topology.async_add_neighbor_info(packet.app_payload)
+
     def _modify_position(self, position: dict[str, Any]) -> None:
         if "latitudeI" in position:
             position["latitude"] = float(position["latitudeI"] * 10**-7)
@@ -353,9 +740,12 @@ class MeshtasticApiClient:
     async def _process_meshtastic_packet(self) -> None:
         async for packet in self._interface.packet_stream():
             try:
+                self._update_route_from_packet(packet)
+                self._update_topology_from_packet(packet)
                 packet_clone = google.protobuf.json_format.MessageToDict(packet)
                 node_id = packet_clone["from"]
-                self._hass.bus.async_fire(EVENT_MESHTASTIC_API_PACKET, self._build_event_data(node_id, packet_clone))
+                event_data = self._add_reception_event_data(self._build_event_data(node_id, packet_clone), packet)
+                self._hass.bus.async_fire(EVENT_MESHTASTIC_API_PACKET, event_data)
             except:  # noqa: E722
                 self._logger.warning("Failed to process packet %s", packet, exc_info=True)
 
@@ -372,26 +762,81 @@ class MeshtasticApiClient:
             # older protobuf version
             return MessageToDict(message, including_default_value_fields=True)
 
-    async def request_telemetry(self, node: int, telemetry_type: TelemetryType) -> Mapping[str, Any]:
-        try:
-            response = await self._interface.request_telemetry(node, telemetry_type=telemetry_type)
-            return self._message_to_dict(response)
-        except MeshRoutingError as e:
-            msg = f"No response for {telemetry_type}"
-            raise MeshtasticApiClientError(msg) from e
-        except MeshtasticError as e:
-            raise MeshtasticApiClientError(str(e)) from e
-
-    async def request_position(self, node: int) -> Mapping[str, Any]:
-        try:
-            response = await self._interface.request_position(node)
-            return self._message_to_dict(response)
-        except MeshtasticError as e:
-            raise MeshtasticApiClientError(str(e)) from e
+    async def request_telemetry(
+        self, node: int | str, telemetry_type: TelemetryType, max_age: timedelta | None = None
+    ) -> Mapping[str, Any]:
+        # keyed like packets cached passively, also requests addressed by user id share the cache
+        node = self._node_id(node)
 
-    async def request_traceroute(self, node: int) -> Mapping[str, Any]:
-        try:
-            response = await self._interface.request_traceroute(node)
-            return self._message_to_dict(response)
-        except MeshtasticError as e:
-            raise MeshtasticApiClientError(str(e)) from e
+        async def request() -> Mapping[str, Any]:
+            try:
+                response = await self._interface.request_telemetry(node, telemetry_type=telemetry_type)
+                return self._message_to_dict(response)
+            except MeshRoutingError as e:
+                msg = f"No response for {telemetry_type}"
+                raise MeshtasticApiClientError(msg) from e
+            except MeshtasticError as e:
+                raise MeshtasticApiClientError(str(e)) from e
+
+        return await self._response_cache.async_request(
+            ("telemetry", node, telemetry_type), self._cache_ttl(RESPONSE_CACHE_TTL_TELEMETRY, max_age), request
+        )
+
+    async def request_position(self, node: int | str, max_age: timedelta | None = None) -> Mapping[str, Any]:
+        node = self._node_id(node)
+
+        async def request() -> Mapping[str, Any]:
+            try:
+                response = await self._interface.request_position(node)
+                return self._message_to_dict(response)
+            except MeshtasticError as e:
+                raise MeshtasticApiClientError(str(e)) from e
+
+        return await self._response_cache.async_request(
+            ("position", node), self._cache_ttl(RESPONSE_CACHE_TTL_POSITION, max_age), request
+        )
+
+    async def request_traceroute(self, node: int | str, max_age: timedelta | None = None) -> Mapping[str, Any]:
+        node = self._node_id(node)
+
+        async def request() -> Mapping[str, Any]:
+            try:
+                response = await self._interface.request_traceroute(node)
+                return self._message_to_dict(response)
+            except MeshtasticError as e:
+                raise MeshtasticApiClientError(str(e)) from e
+
+        return await self._response_cache.async_request(
+            ("traceroute", node), self._cache_ttl(RESPONSE_CACHE_TTL_TRACEROUTE, max_age), request
+        )
+
+    @staticmethod
+    def _cache_ttl(default_ttl: float, max_age: timedelta | None) -> float:
+        # a max age of zero always sends a new request
+        return default_ttl if max_age is None else max_age.total_seconds()
+
+    @staticmethod
+    def _node_id(node: int | str) -> int:
+        return int(node[1:], 16) if isinstance(node, str) else node
+
+    def query_node_metric(
+        self, node: int | str, metric: NodeMetric, period: timedelta, window: timedelta
+    ) -> Mapping[str, Any]:
+        """Downsampled history of a node metric, recorded in memory from received packets."""
+        node_id = self._node_id(node)
+        aggregates = self._interface.query_node_metric(node_id, metric, period=period, window=window)
+        return {
+            "metric": str(metric),
+            "window": window.total_seconds(),
+            "values": [
+                {
+                    "start": aggregate.start,
+                    "end": aggregate.end,
+                    "count": aggregate.count,
+                    "min": round(aggregate.minimum, 3),
+                    "max": round(aggregate.maximum, 3),
+                    "avg": round(aggregate.average, 3),
+                }
+                for aggregate in aggregates
+            ],
+        }
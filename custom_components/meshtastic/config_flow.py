@@ -14,13 +14,17 @@ from homeassistant import config_entries, data_entry_flow
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, IntegrationError
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
 )
 
-from . import CONF_OPTION_WEB_CLIENT, CURRENT_CONFIG_VERSION_MINOR
 from .aiomeshtastic import TcpConnection
+from .aiomeshtastic.interface import TelemetryType
+from .aiomeshtastic.polling import POLL_POSITION
 from .api import (
     MeshtasticApiClient,
 )
@@ -36,16 +40,39 @@ from .const import (
     CONF_OPTION_NOTIFY_PLATFORM,
     CONF_OPTION_NOTIFY_PLATFORM_CHANNELS,
     CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_DEFAULT,
+    CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE,
+    CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE_DEFAULT,
     CONF_OPTION_NOTIFY_PLATFORM_NODES,
     CONF_OPTION_NOTIFY_PLATFORM_NODES_DEFAULT,
+    CONF_OPTION_POLLING,
+    CONF_OPTION_POLLING_ENABLE,
+    CONF_OPTION_POLLING_ENABLE_DEFAULT,
+    CONF_OPTION_POLLING_INTERVAL,
+    CONF_OPTION_POLLING_INTERVAL_DEFAULT,
+    CONF_OPTION_POLLING_KINDS,
+    CONF_OPTION_POLLING_KINDS_DEFAULT,
+    CONF_OPTION_STATE_THROTTLE,
+    CONF_OPTION_STATE_THROTTLE_ENABLE,
+    CONF_OPTION_STATE_THROTTLE_ENABLE_DEFAULT,
+    CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL,
+    CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL_DEFAULT,
+    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL,
+    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL_DEFAULT,
     CONF_OPTION_TCP_PROXY,
     CONF_OPTION_TCP_PROXY_ENABLE,
     CONF_OPTION_TCP_PROXY_ENABLE_DEFAULT,
     CONF_OPTION_TCP_PROXY_PORT,
     CONF_OPTION_TCP_PROXY_PORT_DEFAULT,
+    CONF_OPTION_TRANSMIT,
+    CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE,
+    CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE_DEFAULT,
+    CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE,
+    CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE_DEFAULT,
+    CONF_OPTION_WEB_CLIENT,
     CONF_OPTION_WEB_CLIENT_ENABLE,
     CONF_OPTION_WEB_CLIENT_ENABLE_DEFAULT,
     CURRENT_CONFIG_VERSION_MAJOR,
+    CURRENT_CONFIG_VERSION_MINOR,
     DOMAIN,
     LOGGER,
     ConfigOptionNotifyPlatformNodes,
@@ -151,6 +178,12 @@ def _build_notify_platform_schema(
                 CONF_OPTION_NOTIFY_PLATFORM_CHANNELS,
                 default=options.get(CONF_OPTION_NOTIFY_PLATFORM_CHANNELS, CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_DEFAULT),
             ): cv.boolean,
+            vol.Required(
+                CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE,
+                default=options.get(
+                    CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE, CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE_DEFAULT
+                ),
+            ): cv.boolean,
             vol.Required(
                 CONF_OPTION_NOTIFY_PLATFORM_NODES,
                 default=options.get(CONF_OPTION_NOTIFY_PLATFORM_NODES, CONF_OPTION_NOTIFY_PLATFORM_NODES_DEFAULT),
@@ -189,6 +222,87 @@ def _build_meshtastic_tcp_schema(
     )
 
 
+def _build_transmit_schema(
+    options: dict[str, Any],
+) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE,
+                default=options.get(
+                    CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE, CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE_DEFAULT
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(min=1, max=100, step=1, unit_of_measurement="%", mode=NumberSelectorMode.BOX)
+            ),
+            vol.Required(
+                CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE,
+                default=options.get(CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE, CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE_DEFAULT),
+            ): NumberSelector(
+                NumberSelectorConfig(min=1, max=10080, step=1, unit_of_measurement="min", mode=NumberSelectorMode.BOX)
+            ),
+        }
+    )
+
+
+def _build_polling_schema(
+    options: dict[str, Any],
+) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_OPTION_POLLING_ENABLE,
+                default=options.get(CONF_OPTION_POLLING_ENABLE, CONF_OPTION_POLLING_ENABLE_DEFAULT),
+            ): cv.boolean,
+            vol.Required(
+                CONF_OPTION_POLLING_INTERVAL,
+                default=options.get(CONF_OPTION_POLLING_INTERVAL, CONF_OPTION_POLLING_INTERVAL_DEFAULT),
+            ): NumberSelector(
+                NumberSelectorConfig(min=15, max=1440, step=1, unit_of_measurement="min", mode=NumberSelectorMode.BOX)
+            ),
+            vol.Required(
+                CONF_OPTION_POLLING_KINDS,
+                default=options.get(CONF_OPTION_POLLING_KINDS, CONF_OPTION_POLLING_KINDS_DEFAULT),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[*(str(v) for v in TelemetryType), POLL_POSITION],
+                    multiple=True,
+                    translation_key="option_polling_kind_selector",
+                )
+            ),
+        }
+    )
+
+
+def _build_state_throttle_schema(
+    options: dict[str, Any],
+) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_OPTION_STATE_THROTTLE_ENABLE,
+                default=options.get(CONF_OPTION_STATE_THROTTLE_ENABLE, CONF_OPTION_STATE_THROTTLE_ENABLE_DEFAULT),
+            ): cv.boolean,
+            vol.Required(
+                CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL,
+                default=options.get(
+                    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL, CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL_DEFAULT
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(min=0, max=3600, step=1, unit_of_measurement="s", mode=NumberSelectorMode.BOX)
+            ),
+            vol.Required(
+                CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL,
+                default=options.get(
+                    CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL, CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL_DEFAULT
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(min=0, max=86400, step=1, unit_of_measurement="s", mode=NumberSelectorMode.BOX)
+            ),
+        }
+    )
+
+
 async def validate_input_for_connection(
     hass: HomeAssistant, data: dict[str, Any], *, no_nodes: bool = False
 ) -> tuple[Mapping[str, Any], Mapping[int, Mapping[str, Any]]]:
@@ -651,11 +765,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_init()
             new_data[CONF_OPTION_FILTER_NODES] = updated_filter_node_option
 
-            if CONF_OPTION_NOTIFY_PLATFORM in user_input:
-                new_data[CONF_OPTION_NOTIFY_PLATFORM] = user_input[CONF_OPTION_NOTIFY_PLATFORM]
-
-            if CONF_OPTION_WEB_CLIENT in user_input:
-                new_data[CONF_OPTION_WEB_CLIENT] = user_input[CONF_OPTION_WEB_CLIENT]
+            # sections without further validation are stored as entered
+            for section in (
+                CONF_OPTION_NOTIFY_PLATFORM,
+                CONF_OPTION_WEB_CLIENT,
+                CONF_OPTION_TRANSMIT,
+                CONF_OPTION_POLLING,
+                CONF_OPTION_STATE_THROTTLE,
+            ):
+                if section in user_input:
+                    new_data[section] = user_input[section]
 
             if CONF_OPTION_TCP_PROXY in user_input:
                 if not await validate_tcp_proxy_port(self.hass, self.config_entry, user_input):
@@ -690,6 +809,21 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             if CONF_OPTION_TCP_PROXY in self.options
             else self.config_entry.options.get(CONF_OPTION_TCP_PROXY, {})
         )
+        transmit_options = (
+            self.options[CONF_OPTION_TRANSMIT]
+            if CONF_OPTION_TRANSMIT in self.options
+            else self.config_entry.options.get(CONF_OPTION_TRANSMIT, {})
+        )
+        polling_options = (
+            self.options[CONF_OPTION_POLLING]
+            if CONF_OPTION_POLLING in self.options
+            else self.config_entry.options.get(CONF_OPTION_POLLING, {})
+        )
+        state_throttle_options = (
+            self.options[CONF_OPTION_STATE_THROTTLE]
+            if CONF_OPTION_STATE_THROTTLE in self.options
+            else self.config_entry.options.get(CONF_OPTION_STATE_THROTTLE, {})
+        )
         options_schema = vol.Schema(
             {
                 vol.Required(CONF_OPTION_FILTER_NODES, default=list(selected_nodes.keys())): cv.multi_select(
@@ -709,6 +843,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(CONF_OPTION_TCP_PROXY): data_entry_flow.section(
                     _build_meshtastic_tcp_schema(tcp_proxy_options), {"collapsed": "tcp_proxy" in errors}
                 ),
+                vol.Required(CONF_OPTION_TRANSMIT): data_entry_flow.section(
+                    _build_transmit_schema(transmit_options), {"collapsed": True}
+                ),
+                vol.Required(CONF_OPTION_POLLING): data_entry_flow.section(
+                    _build_polling_schema(polling_options), {"collapsed": True}
+                ),
+                vol.Required(CONF_OPTION_STATE_THROTTLE): data_entry_flow.section(
+                    _build_state_throttle_schema(state_throttle_options), {"collapsed": True}
+                ),
             }
         )
         return self.async_show_form(step_id="init", data_schema=options_schema, errors=errors)
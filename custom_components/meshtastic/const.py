@@ -29,6 +29,7 @@ CONF_OPTION_ADD_ANOTHER_NODE = "add_another_node"
 
 CONF_OPTION_NOTIFY_PLATFORM = "notify_platform"
 CONF_OPTION_NOTIFY_PLATFORM_CHANNELS = "channels"
+CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE = "channels_hedge"
 CONF_OPTION_NOTIFY_PLATFORM_NODES = "nodes"
 
 
@@ -39,6 +40,7 @@ class ConfigOptionNotifyPlatformNodes(enum.StrEnum):
 
 
 CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_DEFAULT = True
+CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE_DEFAULT = False
 CONF_OPTION_NOTIFY_PLATFORM_NODES_DEFAULT = ConfigOptionNotifyPlatformNodes.ALL
 
 CONF_OPTION_WEB_CLIENT = "web_client"
@@ -53,6 +55,32 @@ CONF_OPTION_TCP_PROXY_ENABLE_DEFAULT = False
 CONF_OPTION_TCP_PROXY_PORT = "port"
 CONF_OPTION_TCP_PROXY_PORT_DEFAULT = 4403
 
+CONF_OPTION_TRANSMIT = "transmit"
+# upper bound in percent of airtime used by our own transmissions, regional limits apply on top
+CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE = "airtime_duty_cycle"
+CONF_OPTION_TRANSMIT_AIRTIME_DUTY_CYCLE_DEFAULT = 10
+# minutes after which queued messages that could not be delivered are given up
+CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE = "message_max_age"
+CONF_OPTION_TRANSMIT_MESSAGE_MAX_AGE_DEFAULT = 60
+
+CONF_OPTION_POLLING = "polling"
+CONF_OPTION_POLLING_ENABLE = "enable"
+CONF_OPTION_POLLING_ENABLE_DEFAULT = False
+# minutes between polls of the same node and data kind
+CONF_OPTION_POLLING_INTERVAL = "interval"
+CONF_OPTION_POLLING_INTERVAL_DEFAULT = 60
+CONF_OPTION_POLLING_KINDS = "kinds"
+CONF_OPTION_POLLING_KINDS_DEFAULT = ["device_metrics"]
+
+# overrides of the time based limits of entities whose state changes with almost every packet
+CONF_OPTION_STATE_THROTTLE = "state_throttle"
+CONF_OPTION_STATE_THROTTLE_ENABLE = "enable"
+CONF_OPTION_STATE_THROTTLE_ENABLE_DEFAULT = True
+CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL = "min_interval"
+CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL_DEFAULT = 60
+CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL = "max_interval"
+CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL_DEFAULT = 900
+
 
 SERVICE_SEND_TEXT = "send_text"
 SERVICE_SEND_DIRECT_MESSAGE = "send_direct_message"
@@ -60,6 +88,8 @@ SERVICE_BROADCAST_CHANNEL_MESSAGE = "broadcast_channel_message"
 SERVICE_REQUEST_TELEMETRY = "request_telemetry"
 SERVICE_REQUEST_POSITION = "request_position"
 SERVICE_REQUEST_TRACEROUTE = "request_traceroute"
+SERVICE_QUERY_METRICS = "query_metrics"
+SERVICE_DUMP_PACKET_CAPTURE = "dump_packet_capture"
 
 ATTR_SERVICE_DATA_TO = "to"
 ATTR_SERVICE_DATA_CHANNEL = "channel"
@@ -67,6 +97,8 @@ ATTR_SERVICE_DATA_FROM = "from"
 ATTR_SERVICE_DATA_ACK = "ack"
 ATTR_SERVICE_DATA_REPLY_ID = "reply_id"
 ATTR_SERVICE_DATA_EMOJI = "emoji"
+ATTR_SERVICE_DATA_QUEUE = "queue"
+ATTR_SERVICE_DATA_MAX_AGE = "max_age"
 
 
 ATTR_SERVICE_SEND_TEXT_DATA_TEXT = "text"
@@ -76,6 +108,12 @@ ATTR_SERVICE_BROADCAST_CHANNEL_MESSAGE_DATA_CHANNEL = "channel"
 
 ATTR_SERVICE_REQUEST_TELEMETRY_DATA_TYPE = "type"
 
+ATTR_SERVICE_QUERY_METRICS_DATA_METRIC = "metric"
+ATTR_SERVICE_QUERY_METRICS_DATA_PERIOD = "period"
+ATTR_SERVICE_QUERY_METRICS_DATA_WINDOW = "window"
+
+ATTR_SERVICE_DUMP_PACKET_CAPTURE_DATA_FILENAME = "filename"
+
 STATE_ATTRIBUTE_CHANNEL_INDEX = "index"
 STATE_ATTRIBUTE_CHANNEL_NODE = "node"
 
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
     from .api import MeshtasticApiClient
     from .coordinator import MeshtasticDataUpdateCoordinator
+    from .device_sync import MeshtasticDeviceSync
     from .entity import MeshtasticEntity
 
 
@@ -30,6 +31,7 @@ class MeshtasticData:
     coordinator: MeshtasticDataUpdateCoordinator
     integration: Integration
     gateway_node: dict
+    device_sync: MeshtasticDeviceSync | None = None
 
 
 DATA_COMPONENT: HassKey[EntityComponent[MeshtasticEntity]] = HassKey(DOMAIN)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .aiomeshtastic.protobuf import mesh_pb2
+
+DEDUP_MAX_AGE = 600
+DEDUP_MAX_PACKETS = 1024
+
+
+@dataclass(frozen=True)
+class MeshtasticPacketReception:
+    config_entry_id: str
+    snr: float
+    rssi: int
+    hops_away: int | None
+    received_at: float
+
+    def as_event_data(self) -> dict[str, Any]:
+        return {
+            "config_entry_id": self.config_entry_id,
+            "snr": self.snr,
+            "rssi": self.rssi,
+            "hops_away": self.hops_away,
+        }
+
+
+@dataclass
+class MeshtasticReceivedPacket:
+    first_seen: float
+    receptions: dict[str, MeshtasticPacketReception] = field(default_factory=dict)
+
+    @property
+    def primary_config_entry_id(self) -> str:
+        # the gateway that heard the packet first processes it for shared state
+        return next(iter(self.receptions))
+
+
+class MeshtasticPacketDeduplicator:
+    """
+    Recognizes mesh packets heard by more than one gateway.
+
+    Packets are identified by sender and packet id and remembered for a limited time in a bounded cache. Every gateway
+    hearing a packet is recorded with its reception metadata.
+    """
+
+    def __init__(self, max_age: float = DEDUP_MAX_AGE, max_packets: int = DEDUP_MAX_PACKETS) -> None:
+        self._max_age = max_age
+        self._max_packets = max_packets
+        self._packets: OrderedDict[tuple[int, int], MeshtasticReceivedPacket] = OrderedDict()
+
+    @callback
+    def async_receive(self, config_entry_id: str, packet: mesh_pb2.MeshPacket) -> MeshtasticReceivedPacket | None:
+        """Record reception of packet by the gateway of the config entry, returns None if packet can't be tracked."""
+        if packet.id == 0:
+            return None
+
+        now = time.monotonic()
+        self._expire(now)
+
+        key = (getattr(packet, "from"), packet.id)
+        received = self._packets.get(key)
+        if received is None:
+            received = self._packets[key] = MeshtasticReceivedPacket(first_seen=now)
+            if len(self._packets) > self._max_packets:
+                self._packets.popitem(last=False)
+
+        if config_entry_id not in received.receptions:
+            received.receptions[config_entry_id] = MeshtasticPacketReception(
+                config_entry_id=config_entry_id,
+                snr=packet.rx_snr,
+                rssi=packet.rx_rssi,
+                hops_away=packet.hop_start - packet.hop_limit if packet.hop_start else None,
+                received_at=now,
+            )
+        return received
+
+    def _expire(self, now: float) -> None:
+        # entries are ordered by first reception, stop at the first one that is still fresh
+        while self._packets:
+            oldest = next(iter(self._packets.values()))
+            if now - oldest.first_seen <= self._max_age:
+                break
+            self._packets.popitem(last=False)
+
+
+_DATA_PACKET_DEDUPLICATOR: HassKey[MeshtasticPacketDeduplicator] = HassKey(f"{DOMAIN}_packet_deduplicator")
+
+
+@callback
+def async_get_packet_deduplicator(hass: HomeAssistant) -> MeshtasticPacketDeduplicator:
+    deduplicator = hass.data.get(_DATA_PACKET_DEDUPLICATOR)
+    if deduplicator is None:
+        deduplicator = hass.data[_DATA_PACKET_DEDUPLICATOR] = MeshtasticPacketDeduplicator()
+    return deduplicator
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceConnectionCollisionError
+from homeassistant.helpers.typing import UNDEFINED
+
+from .api import (
+    ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID,
+    ATTR_EVENT_MESHTASTIC_API_DUPLICATE,
+    ATTR_EVENT_MESHTASTIC_API_NODE,
+    EVENT_MESHTASTIC_API_NODE_UPDATED,
+)
+from .const import CONF_OPTION_FILTER_NODES, DOMAIN, LOGGER
+from .routing import async_get_routing_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
+
+    from .api import MeshtasticApiClient
+    from .data import MeshtasticConfigEntry
+
+
+class MeshtasticDeviceSync:
+    """
+    Keeps device registry entries of mesh nodes in sync with the node database of a gateway.
+
+    For every node a digest of the intended device state is kept, the registry is only written when it changed.
+    Devices are attached (via_device) to the gateway with the best route according to the shared routing table.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: MeshtasticConfigEntry,
+        client: MeshtasticApiClient,
+        device_hardware_names: Mapping[str, str],
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._device_hardware_names = device_hardware_names
+        self._device_registry = dr.async_get(hass)
+        self._routing_table = async_get_routing_table(hass)
+        self._digests: dict[int, Hashable] = {}
+        self._logger = LOGGER.getChild(self.__class__.__name__)
+
+    @property
+    def _filter_node_nums(self) -> set[int]:
+        return {el["id"] for el in self._entry.options.get(CONF_OPTION_FILTER_NODES, [])}
+
+    @callback
+    def async_listen(self) -> Callable[[], None]:
+        remove_listeners = [
+            self._hass.bus.async_listen(EVENT_MESHTASTIC_API_NODE_UPDATED, self._on_node_updated),
+            self._routing_table.async_add_listener(self._on_best_route_changed),
+        ]
+
+        def remove() -> None:
+            for remove_listener in remove_listeners:
+                remove_listener()
+
+        return remove
+
+    @callback
+    def async_sync_nodes(self, nodes: Mapping[int, Mapping[str, Any]]) -> None:
+        filter_node_nums = self._filter_node_nums
+        # registry updates are synchronous, process all nodes in one go without yielding to the event loop
+        for node_id, node in nodes.items():
+            if node_id in filter_node_nums:
+                self.async_sync_node(node_id, node)
+            else:
+                self.async_remove_node(node_id)
+
+    @callback
+    def async_sync_node(self, node_id: int, node: Mapping[str, Any]) -> bool:
+        gateway_node = self._client.get_own_node()
+        existing_device = self._device_registry.async_get_device(identifiers={(DOMAIN, str(node_id))})
+        digest = self._digest(gateway_node, node_id, node, existing_device)
+        if self._digests.get(node_id) == digest:
+            return False
+
+        device = self._update_device(gateway_node, node_id, node, existing_device)
+        # digest is based on the device after our update, so it is stable until the node or another gateway changes
+        self._digests[node_id] = self._digest(gateway_node, node_id, node, device)
+        return True
+
+    @callback
+    def async_remove_node(self, node_id: int) -> None:
+        self._digests.pop(node_id, None)
+        device = self._device_registry.async_get_device(identifiers={(DOMAIN, str(node_id))})
+        # only clean up devices if they are exclusively from us
+        if device:
+            if device.config_entries == {self._entry.entry_id}:
+                self._device_registry.async_remove_device(device.id)
+            else:
+                self._device_registry.async_update_device(device.id, remove_config_entry_id=self._entry.entry_id)
+
+    async def _on_node_updated(self, event: Event) -> None:
+        if event.data.get(ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID) != self._entry.entry_id:
+            return
+        # devices are shared between gateways, the gateway that heard the packet first updates them
+        if event.data.get(ATTR_EVENT_MESHTASTIC_API_DUPLICATE, False):
+            return
+
+        node_id = event.data.get(ATTR_EVENT_MESHTASTIC_API_NODE)
+        if node_id not in self._filter_node_nums:
+            return
+
+        self._sync_known_node(node_id)
+
+    @callback
+    def _on_best_route_changed(self, node_id: int) -> None:
+        if node_id in self._filter_node_nums:
+            self._sync_known_node(node_id)
+
+    def _sync_known_node(self, node_id: int) -> None:
+        node = self._client.get_node(node_id)
+        if node is None or "user" not in node:
+            return
+
+        try:
+            if self.async_sync_node(node_id, node):
+                self._logger.debug("Updated device of node %s", node_id)
+        except:  # noqa: E722
+            self._logger.warning("Failed to update device of node %s", node_id, exc_info=True)
+
+    def _own_connection_prefix(self, gateway_node: Mapping[str, Any]) -> str:
+        return f"{gateway_node['num']}/"
+
+    def _digest(
+        self,
+        gateway_node: Mapping[str, Any],
+        node_id: int,
+        node: Mapping[str, Any],
+        device: DeviceEntry | None,
+    ) -> Hashable:
+        user = node["user"]
+        best_route = self._routing_table.best_route(node_id)
+        # snr changes with every packet, it is not part of the device, so it must not cause registry updates
+        return (
+            gateway_node["num"],
+            user["longName"],
+            user["hwModel"],
+            user["id"],
+            user.get("macaddr"),
+            node.get("hopsAway", 99),
+            self._client.metadata.get("firmwareVersion") if gateway_node["num"] == node_id else None,
+            device.id if device is not None else None,
+            frozenset(device.config_entries) if device is not None else None,
+            best_route.gateway_node_id if best_route is not None else None,
+        )
+
+    def _update_device(
+        self,
+        gateway_node: Mapping[str, Any],
+        node_id: int,
+        node: Mapping[str, Any],
+        existing_device: DeviceEntry | None,
+    ) -> DeviceEntry | None:
+        gateway_node_id = cast("int", gateway_node["num"])
+        own_prefix = self._own_connection_prefix(gateway_node)
+        mac_address = base64.b64decode(node["user"]["macaddr"]).hex(":") if "macaddr" in node["user"] else None
+        connections = set()
+        if mac_address:
+            connections.add((dr.CONNECTION_NETWORK_MAC, mac_address))
+        hops_away = node.get("hopsAway", 99)
+        best_route = self._routing_table.best_route(node_id)
+        via_gateway_node_id = best_route.gateway_node_id if best_route is not None else gateway_node_id
+        # gateways are not attached to any other device
+        via_device = None if node_id in (via_gateway_node_id, gateway_node_id) else (DOMAIN, str(via_gateway_node_id))
+
+        if existing_device:
+            connections.update(existing_device.connections)
+
+        # remove our own entry
+        connections = {(k, v) for k, v in connections if k != DOMAIN or not v.startswith(own_prefix)}
+
+        # add our own entry with updated data
+        if gateway_node_id != node_id:
+            connections.add((DOMAIN, f"{gateway_node_id}/{node_id}/{hops_away}"))
+
+        d = self._device_registry.async_get_or_create(
+            config_entry_id=self._entry.entry_id,
+            identifiers={(DOMAIN, str(node_id))},
+            name=node["user"]["longName"],
+            model=self._device_hardware_names.get(node["user"]["hwModel"], None),
+            model_id=node["user"]["hwModel"],
+            serial_number=node["user"]["id"],
+            via_device=via_device,
+            sw_version=self._client.metadata.get("firmwareVersion")
+            if gateway_node_id == node_id and self._client.metadata
+            else None,
+        )
+        try:
+            return self._device_registry.async_update_device(
+                d.id,
+                new_connections=connections,
+                via_device_id=None if via_device is None else UNDEFINED,
+            )
+        except DeviceConnectionCollisionError as e:
+            self._logger.debug("Conflict with other device connections, only using meshtastic connections. %s", e)
+            own_connections = {(k, v) for k, v in connections if k == DOMAIN}
+            return self._device_registry.async_update_device(
+                d.id,
+                new_connections=own_connections,
+                via_device_id=None if via_device is None else UNDEFINED,
+            )
@@ -4,20 +4,37 @@
 
 from __future__ import annotations
 
+import dataclasses
+import datetime
+import time
 import typing
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import StrEnum
 
 import voluptuous as vol
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, STATE_ATTRIBUTE_CHANNEL_INDEX, STATE_ATTRIBUTE_CHANNEL_NODE
+from .const import (
+    CONF_OPTION_STATE_THROTTLE,
+    CONF_OPTION_STATE_THROTTLE_ENABLE,
+    CONF_OPTION_STATE_THROTTLE_ENABLE_DEFAULT,
+    CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL,
+    CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL_DEFAULT,
+    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL,
+    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL_DEFAULT,
+    DOMAIN,
+    STATE_ATTRIBUTE_CHANNEL_INDEX,
+    STATE_ATTRIBUTE_CHANNEL_NODE,
+)
 from .coordinator import MeshtasticDataUpdateCoordinator
 
 if typing.TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE
     from homeassistant.helpers.entity import EntityDescription
     from homeassistant.helpers.typing import UndefinedType
 
@@ -238,7 +255,65 @@ class MeshtasticCoordinatorEntity(CoordinatorEntity[MeshtasticDataUpdateCoordina
         return super()._name_internal(device_class_name, platform_translations)
 
 
+@dataclass(frozen=True, kw_only=True)
+class StateThrottle:
+    """
+    Limits state writes of an entity whose value changes on almost every packet.
+
+    A changed value is only written if the change exceeds one of the deadbands, and not more often than every
+    min_interval seconds. Insignificant changes are still written once max_interval passed since the last write.
+    Without any deadband, every change is significant. Changes of availability are always written.
+    """
+
+    min_interval: float = 0.0
+    max_interval: float | None = None
+    absolute_deadband: float | None = None
+    relative_deadband: float | None = None
+    # e.g. counters, where a decrease is a reset and always significant
+    monotonic: bool = False
+
+    def is_significant(self, previous: typing.Any, value: typing.Any) -> bool:
+        previous_number = _throttle_number(previous)
+        number = _throttle_number(value)
+        if previous_number is None or number is None:
+            return previous != value
+        if self.monotonic and number < previous_number:
+            return True
+        if self.absolute_deadband is None and self.relative_deadband is None:
+            return number != previous_number
+
+        delta = abs(number - previous_number)
+        if self.absolute_deadband is not None and delta >= self.absolute_deadband:
+            return True
+        return self.relative_deadband is not None and delta >= self.relative_deadband * abs(previous_number)
+
+
+def _throttle_number(value: typing.Any) -> float | None:
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+# keyed by entity description key
+STATE_THROTTLES: typing.Mapping[str, StateThrottle] = {
+    "node_snr": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=1.0),
+    "node_last_heard": StateThrottle(absolute_deadband=300),
+    "device_uptime": StateThrottle(absolute_deadband=3600, monotonic=True),
+    "link_packet_rate": StateThrottle(min_interval=60, max_interval=900, relative_deadband=0.1),
+    "link_rssi": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=2.0),
+    "link_hops": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=0.25),
+    "link_duplicate_rate": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=2.0),
+    "channel_load_utilization": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=1.0),
+    "channel_load_packet_rate": StateThrottle(min_interval=60, max_interval=900, relative_deadband=0.1),
+    "channel_load_busiest_sender": StateThrottle(min_interval=60, max_interval=900, absolute_deadband=5.0),
+}
+
+
 class MeshtasticNodeEntity(MeshtasticCoordinatorEntity, ABC):
+    _state_throttles: typing.ClassVar[typing.Mapping[str, StateThrottle]] = STATE_THROTTLES
+
     def __init__(
         self,
         coordinator: MeshtasticDataUpdateCoordinator,
@@ -264,10 +339,102 @@ class MeshtasticNodeEntity(MeshtasticCoordinatorEntity, ABC):
         )
         self._attr_has_entity_name = True
 
+        self._state_throttle = self._build_state_throttle(coordinator.config_entry.options)
+        self._throttle_written: tuple[float, bool, typing.Any] | None = None
+        self._cancel_throttle_flush: CALLBACK_TYPE | None = None
+
     @property
     def node_id(self) -> int:
         return self._node_id
 
+    def _build_state_throttle(self, options: typing.Mapping[str, typing.Any]) -> StateThrottle | None:
+        throttle = self._state_throttles.get(self.entity_description.key)
+        throttle_options = options.get(CONF_OPTION_STATE_THROTTLE, {})
+        if throttle is None or not throttle_options.get(
+            CONF_OPTION_STATE_THROTTLE_ENABLE, CONF_OPTION_STATE_THROTTLE_ENABLE_DEFAULT
+        ):
+            return None
+
+        # deadbands are specific to the entity, only the time based limits are configurable
+        if throttle.min_interval:
+            throttle = dataclasses.replace(
+                throttle,
+                min_interval=throttle_options.get(
+                    CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL, CONF_OPTION_STATE_THROTTLE_MIN_INTERVAL_DEFAULT
+                ),
+            )
+        if throttle.max_interval is not None:
+            max_interval = throttle_options.get(
+                CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL, CONF_OPTION_STATE_THROTTLE_MAX_INTERVAL_DEFAULT
+            )
+            throttle = dataclasses.replace(throttle, max_interval=max_interval or None)
+        return throttle
+
+    def _throttled_value(self) -> typing.Any:
+        return self.state
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        self._async_write_throttled_state()
+
+    @callback
+    def _async_write_throttled_state(self, _now: datetime.datetime | None = None) -> None:
+        if self._cancel_throttle_flush is not None:
+            self._cancel_throttle_flush()
+            self._cancel_throttle_flush = None
+
+        if self._state_throttle is None or self._should_write_throttled_state():
+            self.async_write_ha_state()
+            return
+
+        # latest value is kept in the attributes, written once the throttle allows it even without further updates
+        delay = self._throttle_flush_delay()
+        if delay is not None:
+            self._cancel_throttle_flush = async_call_later(self.hass, delay, self._async_write_throttled_state)
+
+    def _throttle_flush_delay(self) -> float | None:
+        written_at, _, written_value = self._throttle_written
+        if self._throttled_value() == written_value:
+            return None
+        elapsed = time.monotonic() - written_at
+        throttle = self._state_throttle
+        if elapsed < throttle.min_interval:
+            return throttle.min_interval - elapsed
+        if throttle.max_interval is not None:
+            return max(throttle.max_interval - elapsed, 0.0)
+        return None
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._cancel_throttle_flush is not None:
+            self._cancel_throttle_flush()
+            self._cancel_throttle_flush = None
+        await super().async_will_remove_from_hass()
+
+    def _should_write_throttled_state(self) -> bool:
+        now = time.monotonic()
+        available = self.available
+        value = self._throttled_value()
+        if self._throttle_written is None:
+            self._throttle_written = (now, available, value)
+            return True
+
+        written_at, written_available, written_value = self._throttle_written
+        elapsed = now - written_at
+        throttle = self._state_throttle
+        if available != written_available:
+            significant = True
+        elif value == written_value or elapsed < throttle.min_interval:
+            significant = False
+        else:
+            significant = throttle.is_significant(written_value, value) or (
+                throttle.max_interval is not None and elapsed >= throttle.max_interval
+            )
+
+        if significant:
+            self._throttle_written = (now, available, value)
+        return significant
+
     @property
     def available(self) -> bool:
         return super().available and self.node_id in self.coordinator.data
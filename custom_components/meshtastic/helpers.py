@@ -4,13 +4,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import datetime
 import typing
 from collections import defaultdict
 
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
-from .const import CONF_OPTION_FILTER_NODES, LOGGER
+from .aiomeshtastic.protobuf import mesh_pb2
+from .const import CONF_OPTION_FILTER_NODES, DOMAIN, LOGGER
 
 if typing.TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -69,6 +75,87 @@ async def async_unload_entry(
     return True
 
 
+HARDWARE_NAMES_STORAGE_VERSION = 1
+HARDWARE_NAMES_TTL = datetime.timedelta(days=7)
+HARDWARE_NAMES_RETRY_INTERVAL = datetime.timedelta(hours=1)
+
+
+class _HardwareNamesCache:
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, HARDWARE_NAMES_STORAGE_VERSION, f"{DOMAIN}.hardware_names")
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._names: dict[str, str] = bundled_meshtastic_hardware_names()
+        self._next_refresh: datetime.datetime | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    async def async_get(self) -> typing.Mapping[str, str]:
+        async with self._load_lock:
+            if not self._loaded:
+                await self._async_load()
+                self._loaded = True
+
+        if (self._next_refresh is None or self._next_refresh <= dt_util.utcnow()) and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = self._hass.async_create_background_task(
+                self._async_refresh(), name="meshtastic-refresh-hardware-names"
+            )
+
+        return self._names
+
+    async def _async_load(self) -> None:
+        try:
+            stored = await self._store.async_load()
+        except Exception:  # noqa: BLE001
+            LOGGER.debug("Failed to load cached meshtastic hardware names", exc_info=True)
+            return
+
+        if not stored:
+            return
+
+        self._names = {**self._names, **stored["names"]}
+        fetched_at = dt_util.parse_datetime(stored["fetched_at"])
+        if fetched_at is not None:
+            self._next_refresh = fetched_at + HARDWARE_NAMES_TTL
+
+    async def _async_refresh(self) -> None:
+        names = await fetch_meshtastic_hardware_names(self._hass)
+        now = dt_util.utcnow()
+        if not names:
+            self._next_refresh = now + HARDWARE_NAMES_RETRY_INTERVAL
+            return
+
+        self._names = {**self._names, **names}
+        self._next_refresh = now + HARDWARE_NAMES_TTL
+        await self._store.async_save({"fetched_at": now.isoformat(), "names": names})
+
+
+_DATA_HARDWARE_NAMES: HassKey[_HardwareNamesCache] = HassKey(f"{DOMAIN}_hardware_names")
+
+
+def bundled_meshtastic_hardware_names() -> dict[str, str]:
+    # fallback names derived from protobuf enum, slugs of the meshtastic api are the enum value names
+    return {
+        name: name.replace("_", " ")
+        for name in mesh_pb2.HardwareModel.keys()  # noqa: SIM118
+        if name != mesh_pb2.HardwareModel.Name(mesh_pb2.HardwareModel.UNSET)
+    }
+
+
+async def async_get_meshtastic_hardware_names(hass: HomeAssistant) -> typing.Mapping[str, str]:
+    """
+    Get display names of meshtastic hardware models.
+
+    Never waits for the network, names from the meshtastic api are cached on disk and refreshed in the background.
+    """
+    cache = hass.data.get(_DATA_HARDWARE_NAMES)
+    if cache is None:
+        cache = hass.data[_DATA_HARDWARE_NAMES] = _HardwareNamesCache(hass)
+    return await cache.async_get()
+
+
 async def fetch_meshtastic_hardware_names(hass: HomeAssistant) -> typing.Mapping[str, str]:
     try:
         session = async_get_clientsession(hass)
@@ -23,6 +23,7 @@ from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from .api import (
     ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID,
     ATTR_EVENT_MESHTASTIC_API_DATA,
+    ATTR_EVENT_MESHTASTIC_API_DUPLICATE,
     EVENT_MESHTASTIC_API_TEXT_MESSAGE,
 )
 from .const import (
@@ -149,7 +150,8 @@ async def async_setup_message_logger(hass: HomeAssistant, entry: MeshtasticConfi
         )
         message = data["message"]
 
-        if from_device:
+        # sender is shared by all gateways, only trigger once if the message was heard by multiple gateways
+        if from_device and not event_data.get(ATTR_EVENT_MESHTASTIC_API_DUPLICATE, False):
             domain_event_data = _build_domain_event_data(MeshtasticDomainEventType.MESSAGE_SENT, from_device.id, data)
             if to_channel_entity_id:
                 domain_event_data[CONF_ENTITY_ID] = to_channel_entity_id
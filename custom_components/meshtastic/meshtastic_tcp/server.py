@@ -139,7 +139,7 @@ class MeshtasticTcpProxy:
                         ClientApiConnection._protobuf_log(packet[1]),  # noqa: SLF001
                     )
 
-                    await self._interface._connection._send_packet(packet[0])  # noqa: SLF001
+                    await self._interface._connection.send_packet(to_radio, source="tcp_proxy")  # noqa: SLF001
 
             async def forward_from_radio() -> None:
                 while client_connection.is_connected:
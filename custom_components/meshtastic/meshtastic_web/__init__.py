@@ -5,19 +5,23 @@
 import asyncio
 import contextlib
 import datetime
+import heapq
+import itertools
 from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 from urllib.parse import urlencode
 
 import homeassistant.helpers.entity_registry as er
-from aiohttp import web
+from aiohttp import WSMsgType, web
 from google.protobuf import message
 from homeassistant.components.http import HomeAssistantRequest, HomeAssistantView, StaticPathConfig
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 
 from ..aiomeshtastic.connection import ClientApiConnection  # noqa: TID252
+from ..aiomeshtastic.connection.streaming import StreamingClientTransport  # noqa: TID252
 from ..aiomeshtastic.protobuf import mesh_pb2  # noqa: TID252
 from ..api import MeshtasticApiClient  # noqa: TID252
 from ..const import (  # noqa: TID252
@@ -34,29 +38,70 @@ if TYPE_CHECKING:
 
 _LOGGER = LOGGER.getChild(__name__)
 
+_FROM_RADIO_MAX_BATCH_SIZE = 256
+
+
+@dataclass(eq=False)
+class _MeshtasticWebSession:
+    config_entry_id: str
+    remote: str
+    config_id: str
+    queue: asyncio.Queue[mesh_pb2.FromRadio]
+    last_active: float
+    consumer: asyncio.Task | None = None
+    removed: bool = False
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.remote, self.config_id
+
 
 class MeshtasticWebApiContext:
+    SESSION_TIMEOUT = datetime.timedelta(minutes=1)
+
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
         self._clients: dict[str, MeshtasticApiClient] = {}
-        self._meshtastic_queues: dict[str, dict[tuple[str, str], asyncio.Queue[mesh_pb2.FromRadio]]] = defaultdict(dict)
-        self._meshtastic_radio_stream_consumer: dict[tuple[str, str], asyncio.Task] = {}
-        self._session_last_active: dict[tuple[str, str], datetime.datetime] = {}
-
-        async def expire_sessions() -> None:
-            while True:
-                await asyncio.sleep(30)
-                now = datetime.datetime.now(tz=datetime.UTC)
-                expired_session_keys = [
-                    session
-                    for session, last_active in self._session_last_active.items()
-                    if (now - last_active > datetime.timedelta(minutes=1))
-                ]
-                for session_key in expired_session_keys:
-                    _LOGGER.debug("Removing session %s", session_key)
-                    self._remove_session(session_key)
-
-        self._expire_sessions_task = asyncio.create_task(expire_sessions(), name="meshtastic_web_expire_sessions")
+        # sessions of config entry, indexed by (remote, config_id), config_id and remote (all sessions of a remote)
+        self._sessions: dict[str, dict[tuple[str, str], _MeshtasticWebSession]] = defaultdict(dict)
+        self._sessions_by_config_id: dict[str, dict[str, _MeshtasticWebSession]] = defaultdict(dict)
+        self._sessions_by_remote: dict[str, dict[str, dict[str, _MeshtasticWebSession]]] = defaultdict(dict)
+        # heap of (expiry time, sequence, session), entries are re-scheduled lazily when session was active meanwhile
+        self._session_expiry: list[tuple[float, int, _MeshtasticWebSession]] = []
+        self._session_expiry_sequence = itertools.count()
+        self._session_expiry_scheduled = asyncio.Event()
+
+        self._expire_sessions_task = asyncio.create_task(self._expire_sessions(), name="meshtastic_web_expire_sessions")
+
+    async def _expire_sessions(self) -> None:
+        loop = asyncio.get_running_loop()
+        timeout = self.SESSION_TIMEOUT.total_seconds()
+        while True:
+            if not self._session_expiry:
+                self._session_expiry_scheduled.clear()
+                await self._session_expiry_scheduled.wait()
+                continue
+
+            expires_at, _, session = self._session_expiry[0]
+            now = loop.time()
+            if expires_at > now:
+                await asyncio.sleep(expires_at - now)
+                continue
+
+            heapq.heappop(self._session_expiry)
+            if session.removed:
+                continue
+
+            if session.last_active + timeout > now:
+                self._schedule_session_expiry(session, session.last_active + timeout)
+                continue
+
+            _LOGGER.debug("Removing session %s", session.key)
+            self._remove_session(session)
+
+    def _schedule_session_expiry(self, session: _MeshtasticWebSession, expires_at: float) -> None:
+        heapq.heappush(self._session_expiry, (expires_at, next(self._session_expiry_sequence), session))
+        self._session_expiry_scheduled.set()
 
     def close(self) -> None:
         with contextlib.suppress(asyncio.CancelledError):
@@ -98,14 +143,26 @@ class MeshtasticWebApiContext:
 
         return client._interface._connection  # noqa: SLF001
 
-    def add_session(
-        self, request: HomeAssistantRequest, meshtastic_config_id: str
-    ) -> asyncio.Queue[mesh_pb2.FromRadio]:
+    def add_session(self, request: HomeAssistantRequest, meshtastic_config_id: str) -> _MeshtasticWebSession:
         config_entry_id = self._get_config_entry_id(request)
         session_key = (request.remote, meshtastic_config_id)
 
-        session_queue = asyncio.Queue()
-        self._meshtastic_queues[config_entry_id][session_key] = session_queue
+        existing_session = self._sessions[config_entry_id].get(session_key)
+        if existing_session is not None:
+            self._remove_session(existing_session)
+
+        loop = asyncio.get_running_loop()
+        session = _MeshtasticWebSession(
+            config_entry_id=config_entry_id,
+            remote=request.remote,
+            config_id=meshtastic_config_id,
+            queue=asyncio.Queue(),
+            last_active=loop.time(),
+        )
+        self._sessions[config_entry_id][session_key] = session
+        self._sessions_by_config_id[config_entry_id][meshtastic_config_id] = session
+        self._sessions_by_remote[config_entry_id].setdefault(request.remote, {})[meshtastic_config_id] = session
+        self._schedule_session_expiry(session, session.last_active + self.SESSION_TIMEOUT.total_seconds())
 
         async def consume(queue: asyncio.Queue[mesh_pb2.FromRadio]) -> None:
             try:
@@ -125,84 +182,70 @@ class MeshtasticWebApiContext:
             else:
                 _LOGGER.info("Consume from_radio for session %s stopped", session_key)
 
-        self._meshtastic_radio_stream_consumer[session_key] = asyncio.create_task(
-            consume(session_queue), name="meshtasic-web-consume"
-        )
+        session.consumer = asyncio.create_task(consume(session.queue), name="meshtasic-web-consume")
 
-        return self._meshtastic_queues[config_entry_id][session_key]
+        return session
 
-    def _get_existing_session_key(
+    def _get_existing_session(
         self, request: HomeAssistantRequest, meshtastic_config_id: str
-    ) -> tuple[str, str] | None:
+    ) -> _MeshtasticWebSession | None:
         config_entry_id = self._get_config_entry_id(request)
-        session_key = (request.remote, meshtastic_config_id)
-
-        config_entry_queues = self._meshtastic_queues.get(config_entry_id, {})
-        if session_key not in config_entry_queues:
-            session_key = None
-
-        if session_key is None:
-            session_key = next(
-                (
-                    (remote, config_id)
-                    for (remote, config_id), q in config_entry_queues.items()
-                    if config_id == meshtastic_config_id
-                ),
-                None,
-            )
 
-        if session_key is not None and session_key not in config_entry_queues:
-            session_key = None
-
-        if session_key is None:
-            session_key = next(
-                (
-                    (remote, config_id)
-                    for (remote, config_id), q in config_entry_queues.items()
-                    if remote == request.remote
-                ),
-                None,
-            )
+        session = self._sessions.get(config_entry_id, {}).get((request.remote, meshtastic_config_id))
+        if session is None:
+            session = self._sessions_by_config_id.get(config_entry_id, {}).get(meshtastic_config_id)
+        if session is None:
+            # most recently active session of the remote, other sessions of the remote are still found once it is gone
+            remote_sessions = self._sessions_by_remote.get(config_entry_id, {}).get(request.remote, {})
+            session = max(remote_sessions.values(), key=lambda s: s.last_active, default=None)
 
-        if session_key is not None and session_key not in config_entry_queues:
-            session_key = None
+        return session
 
-        return session_key
+    def remove_session(self, session: _MeshtasticWebSession) -> bool:
+        return self._remove_session(session)
 
-    def remove_session(self, request: HomeAssistantRequest, meshtastic_config_id: str) -> bool:
-        config_entry_id = self._get_config_entry_id(request)
-        session_key = self._get_existing_session_key(request, meshtastic_config_id)
-        if session_key is None:
+    def _remove_session(self, session: _MeshtasticWebSession) -> bool:
+        if session.removed:
             return False
-        return self._remove_session(session_key, config_entry_id)
+        session.removed = True
+
+        config_entry_id = session.config_entry_id
+        remote_sessions = self._sessions_by_remote.get(config_entry_id, {}).get(session.remote, {})
+        for sessions, key in (
+            (self._sessions.get(config_entry_id, {}), session.key),
+            (self._sessions_by_config_id.get(config_entry_id, {}), session.config_id),
+            (remote_sessions, session.config_id),
+        ):
+            # config id index could point to a newer session with same config id from another remote
+            if sessions.get(key) is session:
+                del sessions[key]
+        if not remote_sessions:
+            self._sessions_by_remote.get(config_entry_id, {}).pop(session.remote, None)
 
-    def _remove_session(self, session_key: tuple[str, str], config_entry_id: str | None = None) -> bool:
-        if config_entry_id is not None:
-            sessions = self._meshtastic_queues.get(config_entry_id, {})
-            sessions.pop(session_key, None)
-        else:
-            for sessions in self._meshtastic_queues.values():
-                sessions.pop(session_key, None)
-        self._session_last_active.pop(session_key, None)
-        consumer = self._meshtastic_radio_stream_consumer.pop(session_key, None)
-        if consumer is not None:
+        if session.consumer is not None:
             with contextlib.suppress(asyncio.CancelledError):
-                consumer.cancel()
+                session.consumer.cancel()
+            session.consumer = None
 
         return True
 
+    def get_session(self, request: HomeAssistantRequest, meshtastic_config_id: str) -> _MeshtasticWebSession | None:
+        session = self._get_existing_session(request, meshtastic_config_id)
+        if session is None:
+            return None
+
+        session.last_active = asyncio.get_running_loop().time()
+        return session
+
     def get_session_queue(
         self, request: HomeAssistantRequest, meshtastic_config_id: str
-    ) -> asyncio.Queue[mesh_pb2.FromRadio]:
-        config_entry_id = self._get_config_entry_id(request)
-        session_key = self._get_existing_session_key(request, meshtastic_config_id)
-
-        self._session_last_active[session_key] = datetime.datetime.now(tz=datetime.UTC)
-        return self._meshtastic_queues.get(config_entry_id, {}).get(session_key, None)
+    ) -> asyncio.Queue[mesh_pb2.FromRadio] | None:
+        session = self.get_session(request, meshtastic_config_id)
+        return None if session is None else session.queue
 
     def get_config_entry_session_queues(self, request: HomeAssistantRequest) -> list[asyncio.Queue[mesh_pb2.FromRadio]]:
         config_entry_id = self._get_config_entry_id(request)
-        return list(self._meshtastic_queues[config_entry_id].values())
+        return [session.queue for session in self._sessions.get(config_entry_id, {}).values()]
 
 
 async def async_setup(hass: HomeAssistant) -> bool:
@@ -213,6 +256,7 @@ async def async_setup(hass: HomeAssistant) -> bool:
         hass.http.register_view(MeshtasticWebApiHotspot())
         hass.http.register_view(MeshtasticWebApiV1FromRadioView(hass, _api_context))
         hass.http.register_view(MeshtasticWebApiV1ToRadioView(hass, _api_context))
+        hass.http.register_view(MeshtasticWebApiV1WebSocketView(hass, _api_context))
         hass.http.register_view(MeshtasticWebJsonReportView(hass, _api_context))
         await hass.http.async_register_static_paths(
             [StaticPathConfig(f"{URL_BASE}/web", str(Path(__file__).parent / "static"))]
@@ -224,6 +268,64 @@ async def async_setup(hass: HomeAssistant) -> bool:
         return True
 
 
+async def _get_from_radio_packets(
+    queue: asyncio.Queue[mesh_pb2.FromRadio], batch_size: int, session: tuple[str, str, str]
+) -> list[mesh_pb2.FromRadio]:
+    try:
+        from_radio = await asyncio.wait_for(queue.get(), timeout=10.0)
+    except TimeoutError:
+        return []
+
+    from_radio_packets = [from_radio]
+    # drain whatever is already queued, without waiting for further packets
+    while len(from_radio_packets) < batch_size and not queue.empty():
+        from_radio_packets.append(queue.get_nowait())
+
+    for from_radio in from_radio_packets:
+        _LOGGER.debug(
+            "Forwarding: %s to %s",
+            session,
+            ClientApiConnection._protobuf_log(from_radio),  # noqa: SLF001
+        )
+    return from_radio_packets
+
+
+async def _get_from_radio_packets_until(
+    queue: asyncio.Queue[mesh_pb2.FromRadio],
+    interrupt: asyncio.Event,
+    batch_size: int,
+    session: tuple[str, str, str],
+) -> list[mesh_pb2.FromRadio]:
+    get_packets = asyncio.create_task(_get_from_radio_packets(queue, batch_size=batch_size, session=session))
+    wait_interrupt = asyncio.create_task(interrupt.wait())
+    try:
+        await asyncio.wait([get_packets, wait_interrupt], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        wait_interrupt.cancel()
+        if not get_packets.done():
+            # interrupted when the session changes, packets still queued for the previous session are dropped with it
+            get_packets.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await get_packets
+
+    return [] if get_packets.cancelled() else get_packets.result()
+
+
+async def _cancel_tasks(*tasks: asyncio.Task) -> None:
+    for task in tasks:
+        task.cancel()
+    # retrieve results, otherwise exceptions of the tasks are reported as never retrieved
+    for task, result in zip(tasks, await asyncio.gather(*tasks, return_exceptions=True), strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.debug("Task %s failed", task.get_name(), exc_info=result)
+
+
+def _build_from_radio_frames(from_radio_packets: list[mesh_pb2.FromRadio]) -> bytes:
+    return b"".join(
+        StreamingClientTransport.build_frame(from_radio.SerializeToString()) for from_radio in from_radio_packets
+    )
+
+
 class MeshtasticWebConfigEntryView(HomeAssistantView):
     url = URL_BASE + "/web/{entity_id}"
     name = "meshtastic:web_api_index"
@@ -343,7 +445,7 @@ class MeshtasticWebApiV1ToRadioView(MeshtasticWebApiV1View):
             self._context.add_session(request, config_id)
             response.set_cookie("config_id", config_id)
 
-        await connection._send_packet(body)  # noqa: SLF001
+        await connection.send_packet(to_radio, source="web")
         self._add_protobuf_headers(response)
         return response
 
@@ -368,22 +470,122 @@ class MeshtasticWebApiV1FromRadioView(MeshtasticWebApiV1View):
             response.headers.add("Cache-Control", "no-cache")
             return response
 
-        try:
-            from_radio = await asyncio.wait_for(queue.get(), timeout=10.0)
-            _LOGGER.debug(
-                "Forwarding: %s to %s",
-                (config_entry_id, request.remote, config_id),
-                ClientApiConnection._protobuf_log(from_radio),  # noqa: SLF001
-            )
-            binary = from_radio.SerializeToString()
-        except TimeoutError:
-            binary = b""
+        batch_size = self._get_batch_size(request)
+        from_radio_packets = await _get_from_radio_packets(
+            queue, batch_size=batch_size or 1, session=(config_entry_id, request.remote, config_id)
+        )
+
+        if batch_size is None:
+            binary = from_radio_packets[0].SerializeToString() if from_radio_packets else b""
+        else:
+            binary = _build_from_radio_frames(from_radio_packets)
 
         response = web.Response(body=binary)
         response.headers.add("Cache-Control", "no-cache")
         self._add_protobuf_headers(response)
+        if batch_size is not None:
+            response.headers.add("X-Meshtastic-Batch-Count", str(len(from_radio_packets)))
         return response
 
+    @staticmethod
+    def _get_batch_size(request: HomeAssistantRequest) -> int | None:
+        """
+        Get requested batch size.
+
+        When the client requests a batch, the response body contains multiple FromRadio packets, each framed like on
+        the streaming (serial/tcp) api. Without batch, the response body is a single serialized FromRadio packet.
+        """
+        batch = request.query.get("batch")
+        if batch is None:
+            return None
+        try:
+            return max(1, min(int(batch), _FROM_RADIO_MAX_BATCH_SIZE))
+        except ValueError:
+            raise web.HTTPBadRequest(reason="Invalid batch size") from None
+
+
+class MeshtasticWebApiV1WebSocketView(MeshtasticWebApiV1View):
+    """
+    Bidirectional alternative to the fromradio / toradio endpoints.
+
+    Binary messages in both directions contain one or more packets, each framed like on the streaming (serial/tcp)
+    api. Messages from the client contain ToRadio packets, messages to the client FromRadio packets.
+    """
+
+    url = URL_BASE + "/web/{config_entry_id}/api/v1/ws"
+    name = "meshtastic:web_v1_ws"
+
+    async def get(self, request: HomeAssistantRequest, config_entry_id: str) -> web.WebSocketResponse:
+        self._check_webclient_enabled(config_entry_id)
+        connection = self.get_connection(request)
+        if connection is None:
+            await asyncio.sleep(1)
+            raise web.HTTPNotFound(reason="No connection")
+
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+
+        # existing session from http api can be continued, otherwise session is created by want_config_id
+        config_id = request.cookies.get("config_id")
+        session = self._context.get_session(request, config_id) if config_id is not None else None
+        # only sessions created by this websocket are removed when it closes, a continued or looked up session could
+        # belong to another client
+        owned_session: _MeshtasticWebSession | None = None
+        session_changed = asyncio.Event()
+
+        async def forward_to_radio() -> None:
+            nonlocal session, owned_session
+            async for ws_message in ws:
+                if ws_message.type != WSMsgType.BINARY:
+                    continue
+
+                for packet in StreamingClientTransport.split_frames(ws_message.data):
+                    to_radio = mesh_pb2.ToRadio()
+                    try:
+                        to_radio.ParseFromString(packet)
+                    except message.DecodeError:
+                        _LOGGER.debug("Error while parsing ToRadio bytes %s", packet, exc_info=True)
+                        continue
+
+                    if to_radio.HasField("want_config_id"):
+                        if owned_session is not None:
+                            self._context.remove_session(owned_session)
+                        session = owned_session = self._context.add_session(request, str(to_radio.want_config_id))
+                        session_changed.set()
+
+                    await connection.send_packet(to_radio, source="web")
+
+        async def forward_from_radio() -> None:
+            while not ws.closed:
+                session_changed.clear()
+                if session is None or session.removed:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(session_changed.wait(), timeout=10.0)
+                    continue
+
+                session.last_active = asyncio.get_running_loop().time()
+                # stop waiting on the queue of the previous session as soon as new config is requested
+                from_radio_packets = await _get_from_radio_packets_until(
+                    session.queue,
+                    session_changed,
+                    batch_size=_FROM_RADIO_MAX_BATCH_SIZE,
+                    session=(config_entry_id, request.remote, session.config_id),
+                )
+                if from_radio_packets and not ws.closed:
+                    await ws.send_bytes(_build_from_radio_frames(from_radio_packets))
+
+        task_read = asyncio.create_task(forward_to_radio(), name="meshtastic-web-ws-read")
+        task_write = asyncio.create_task(forward_from_radio(), name="meshtastic-web-ws-write")
+        try:
+            await asyncio.wait([task_read, task_write], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            await _cancel_tasks(task_read, task_write)
+            if owned_session is not None:
+                self._context.remove_session(owned_session)
+            await ws.close()
+
+        return ws
+
 
 class MeshtasticWebJsonReportView(MeshtasticWebApiV1View):
     url = URL_BASE + "/web/{config_entry_id}/json/report"
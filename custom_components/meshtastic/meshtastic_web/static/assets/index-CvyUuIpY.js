@@ -505,4 +505,4 @@ Public Key:
 
 === END OF KEYS ===`].join(""),S=new Blob([N],{type:"text/plain"}),R=URL.createObjectURL(S),I=document.createElement("a");I.href=R,I.download="meshtastic_keys.txt",I.style.display="none",document.body.appendChild(I),I.click(),document.body.removeChild(I),d(),URL.revokeObjectURL(R)},[u,l,o,d]);return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Backup Keys"}),m.jsx($n,{children:"Its important to backup your public and private keys and store your backup securely!"}),m.jsx($n,{children:m.jsx("span",{className:"font-bold break-before-auto",children:"If you lose your keys, you will need to reset your device."})})]}),m.jsxs(Pr,{className:"mt-6",children:[m.jsxs(pt,{variant:"default",onClick:()=>p(),className:"",children:[m.jsx(NV,{size:20,className:"mr-2"}),"Download"]}),m.jsxs(pt,{variant:"default",onClick:()=>f(),children:[m.jsx(hO,{size:20,className:"mr-2"}),"Print"]})]})]})})};var Ir={},hc={exports:{}};hc.exports;var Dx;function bG(){return Dx||(Dx=1,function(e,t){var a=200,s="__lodash_hash_undefined__",l=1,o=2,u=9007199254740991,d="[object Arguments]",f="[object Array]",p="[object AsyncFunction]",b="[object Boolean]",v="[object Date]",A="[object Error]",x="[object Function]",N="[object GeneratorFunction]",S="[object Map]",R="[object Number]",I="[object Null]",T="[object Object]",_="[object Promise]",j="[object Proxy]",C="[object RegExp]",V="[object Set]",L="[object String]",X="[object Symbol]",M="[object Undefined]",Z="[object WeakMap]",U="[object ArrayBuffer]",D="[object DataView]",J="[object Float32Array]",O="[object Float64Array]",K="[object Int8Array]",P="[object Int16Array]",q="[object Int32Array]",le="[object Uint8Array]",me="[object Uint8ClampedArray]",F="[object Uint16Array]",fe="[object Uint32Array]",Y=/[\\^$.*+?()[\]{}|]/g,ae=/^\[object .+?Constructor\]$/,ue=/^(?:0|[1-9]\d*)$/,de={};de[J]=de[O]=de[K]=de[P]=de[q]=de[le]=de[me]=de[F]=de[fe]=!0,de[d]=de[f]=de[U]=de[b]=de[D]=de[v]=de[A]=de[x]=de[S]=de[R]=de[T]=de[C]=de[V]=de[L]=de[Z]=!1;var Se=typeof ed=="object"&&ed&&ed.Object===Object&&ed,Ne=typeof self=="object"&&self&&self.Object===Object&&self,W=Se||Ne||Function("return this")(),ee=t&&!t.nodeType&&t,Q=ee&&!0&&e&&!e.nodeType&&e,se=Q&&Q.exports===ee,ce=se&&Se.process,Re=function(){try{return ce&&ce.binding&&ce.binding("util")}catch{}}(),Oe=Re&&Re.isTypedArray;function Ue(k,z){for(var ve=-1,Be=k==null?0:k.length,ht=0,et=[];++ve<Be;){var St=k[ve];z(St,ve,k)&&(et[ht++]=St)}return et}function $e(k,z){for(var ve=-1,Be=z.length,ht=k.length;++ve<Be;)k[ht+ve]=z[ve];return k}function it(k,z){for(var ve=-1,Be=k==null?0:k.length;++ve<Be;)if(z(k[ve],ve,k))return!0;return!1}function B(k,z){for(var ve=-1,Be=Array(k);++ve<k;)Be[ve]=z(ve);return Be}function te(k){return function(z){return k(z)}}function oe(k,z){return k.has(z)}function ke(k,z){return k==null?void 0:k[z]}function Ie(k){var z=-1,ve=Array(k.size);return k.forEach(function(Be,ht){ve[++z]=[ht,Be]}),ve}function we(k,z){return function(ve){return k(z(ve))}}function Me(k){var z=-1,ve=Array(k.size);return k.forEach(function(Be){ve[++z]=Be}),ve}var Je=Array.prototype,Ct=Function.prototype,xt=Object.prototype,sn=W["__core-js_shared__"],xi=Ct.toString,ln=xt.hasOwnProperty,Zr=function(){var k=/[^.]+$/.exec(sn&&sn.keys&&sn.keys.IE_PROTO||"");return k?"Symbol(src)_1."+k:""}(),Si=xt.toString,La=RegExp("^"+xi.call(ln).replace(Y,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),Ht=se?W.Buffer:void 0,sr=W.Symbol,va=W.Uint8Array,mn=xt.propertyIsEnumerable,Mf=Je.splice,ir=sr?sr.toStringTag:void 0,Kc=Object.getOwnPropertySymbols,Ni=Ht?Ht.isBuffer:void 0,Ri=we(Object.keys,Object),ya=Ln(W,"DataView"),Pa=Ln(W,"Map"),lr=Ln(W,"Promise"),Yl=Ln(W,"Set"),Ti=Ln(W,"WeakMap"),Yr=Ln(Object,"create"),Kl=Na(ya),ks=Na(Pa),Gf=Na(lr),Xc=Na(Yl),Wc=Na(Ti),Xl=sr?sr.prototype:void 0,wi=Xl?Xl.valueOf:void 0;function or(k){var z=-1,ve=k==null?0:k.length;for(this.clear();++z<ve;){var Be=k[z];this.set(Be[0],Be[1])}}function ja(){this.__data__=Yr?Yr(null):{},this.size=0}function Jt(k){var z=this.has(k)&&delete this.__data__[k];return this.size-=z?1:0,z}function gn(k){var z=this.__data__;if(Yr){var ve=z[k];return ve===s?void 0:ve}return ln.call(z,k)?z[k]:void 0}function Kr(k){var z=this.__data__;return Yr?z[k]!==void 0:ln.call(z,k)}function Wl(k,z){var ve=this.__data__;return this.size+=this.has(k)?0:1,ve[k]=Yr&&z===void 0?s:z,this}or.prototype.clear=ja,or.prototype.delete=Jt,or.prototype.get=gn,or.prototype.has=Kr,or.prototype.set=Wl;function Ea(k){var z=-1,ve=k==null?0:k.length;for(this.clear();++z<ve;){var Be=k[z];this.set(Be[0],Be[1])}}function Ff(){this.__data__=[],this.size=0}function zc(k){var z=this.__data__,ve=on(z,k);if(ve<0)return!1;var Be=z.length-1;return ve==Be?z.pop():Mf.call(z,ve,1),--this.size,!0}function Vs(k){var z=this.__data__,ve=on(z,k);return ve<0?void 0:z[ve][1]}function zl(k){return on(this.__data__,k)>-1}function cr(k,z){var ve=this.__data__,Be=on(ve,k);return Be<0?(++this.size,ve.push([k,z])):ve[Be][1]=z,this}Ea.prototype.clear=Ff,Ea.prototype.delete=zc,Ea.prototype.get=Vs,Ea.prototype.has=zl,Ea.prototype.set=cr;function _n(k){var z=-1,ve=k==null?0:k.length;for(this.clear();++z<ve;){var Be=k[z];this.set(Be[0],Be[1])}}function Os(){this.size=0,this.__data__={hash:new or,map:new(Pa||Ea),string:new or}}function Xr(k){var z=Ms(this,k).delete(k);return this.size-=z?1:0,z}function jt(k){return Ms(this,k).get(k)}function Qc(k){return Ms(this,k).has(k)}function Hc(k,z){var ve=Ms(this,k),Be=ve.size;return ve.set(k,z),this.size+=ve.size==Be?0:1,this}_n.prototype.clear=Os,_n.prototype.delete=Xr,_n.prototype.get=jt,_n.prototype.has=Qc,_n.prototype.set=Hc;function qn(k){var z=-1,ve=k==null?0:k.length;for(this.__data__=new _n;++z<ve;)this.add(k[z])}function Wr(k){return this.__data__.set(k,s),this}function Aa(k){return this.__data__.has(k)}qn.prototype.add=qn.prototype.push=Wr,qn.prototype.has=Aa;function Za(k){var z=this.__data__=new Ea(k);this.size=z.size}function Jc(){this.__data__=new Ea,this.size=0}function $c(k){var z=this.__data__,ve=z.delete(k);return this.size=z.size,ve}function Lf(k){return this.__data__.get(k)}function Ci(k){return this.__data__.has(k)}function Di(k,z){var ve=this.__data__;if(ve instanceof Ea){var Be=ve.__data__;if(!Pa||Be.length<a-1)return Be.push([k,z]),this.size=++ve.size,this;ve=this.__data__=new _n(Be)}return ve.set(k,z),this.size=ve.size,this}Za.prototype.clear=Jc,Za.prototype.delete=$c,Za.prototype.get=Lf,Za.prototype.has=Ci,Za.prototype.set=Di;function xa(k,z){var ve=Gs(k),Be=!ve&&Qr(k),ht=!ve&&!Be&&ki(k),et=!ve&&!Be&&!ht&&Ls(k),St=ve||Be||ht||et,kt=St?B(k.length,String):[],Dt=kt.length;for(var bt in k)ln.call(k,bt)&&!(St&&(bt=="length"||ht&&(bt=="offset"||bt=="parent")||et&&(bt=="buffer"||bt=="byteLength"||bt=="byteOffset")||eo(bt,Dt)))&&kt.push(bt);return kt}function on(k,z){for(var ve=k.length;ve--;)if(ur(k[ve][0],z))return ve;return-1}function qc(k,z,ve){var Be=z(k);return Gs(k)?Be:$e(Be,ve(k))}function Bs(k){return k==null?k===void 0?M:I:ir&&ir in Object(k)?jf(k):to(k)}function Us(k){return dr(k)&&Bs(k)==d}function Ql(k,z,ve,Be,ht){return k===z?!0:k==null||z==null||!dr(k)&&!dr(z)?k!==k&&z!==z:Ii(k,z,ve,Be,Ql,ht)}function Ii(k,z,ve,Be,ht,et){var St=Gs(k),kt=Gs(z),Dt=St?f:Sa(k),bt=kt?f:Sa(z);Dt=Dt==d?T:Dt,bt=bt==d?T:bt;var bn=Dt==T,Pn=bt==T,$t=Dt==bt;if($t&&ki(k)){if(!ki(z))return!1;St=!0,bn=!1}if($t&&!bn)return et||(et=new Za),St||Ls(k)?Jl(k,z,ve,Be,ht,et):$l(k,z,Dt,ve,Be,ht,et);if(!(ve&l)){var Vn=bn&&ln.call(k,"__wrapped__"),vn=Pn&&ln.call(z,"__wrapped__");if(Vn||vn){var Ya=Vn?k.value():k,Ta=vn?z.value():z;return et||(et=new Za),ht(Ya,Ta,ve,Be,et)}}return $t?(et||(et=new Za),zr(k,z,ve,Be,ht,et)):!1}function Pf(k){if(!Ra(k)||Yf(k))return!1;var z=Vi(k)?La:ae;return z.test(Na(k))}function kn(k){return dr(k)&&Hr(k.length)&&!!de[Bs(k)]}function Hl(k){if(!_i(k))return Ri(k);var z=[];for(var ve in Object(k))ln.call(k,ve)&&ve!="constructor"&&z.push(ve);return z}function Jl(k,z,ve,Be,ht,et){var St=ve&l,kt=k.length,Dt=z.length;if(kt!=Dt&&!(St&&Dt>kt))return!1;var bt=et.get(k);if(bt&&et.get(z))return bt==z;var bn=-1,Pn=!0,$t=ve&o?new qn:void 0;for(et.set(k,z),et.set(z,k);++bn<kt;){var Vn=k[bn],vn=z[bn];if(Be)var Ya=St?Be(vn,Vn,bn,z,k,et):Be(Vn,vn,bn,k,z,et);if(Ya!==void 0){if(Ya)continue;Pn=!1;break}if($t){if(!it(z,function(Ta,fr){if(!oe($t,fr)&&(Vn===Ta||ht(Vn,Ta,ve,Be,et)))return $t.push(fr)})){Pn=!1;break}}else if(!(Vn===vn||ht(Vn,vn,ve,Be,et))){Pn=!1;break}}return et.delete(k),et.delete(z),Pn}function $l(k,z,ve,Be,ht,et,St){switch(ve){case D:if(k.byteLength!=z.byteLength||k.byteOffset!=z.byteOffset)return!1;k=k.buffer,z=z.buffer;case U:return!(k.byteLength!=z.byteLength||!et(new va(k),new va(z)));case b:case v:case R:return ur(+k,+z);case A:return k.name==z.name&&k.message==z.message;case C:case L:return k==z+"";case S:var kt=Ie;case V:var Dt=Be&l;if(kt||(kt=Me),k.size!=z.size&&!Dt)return!1;var bt=St.get(k);if(bt)return bt==z;Be|=o,St.set(k,z);var bn=Jl(kt(k),kt(z),Be,ht,et,St);return St.delete(k),bn;case X:if(wi)return wi.call(k)==wi.call(z)}return!1}function zr(k,z,ve,Be,ht,et){var St=ve&l,kt=ql(k),Dt=kt.length,bt=ql(z),bn=bt.length;if(Dt!=bn&&!St)return!1;for(var Pn=Dt;Pn--;){var $t=kt[Pn];if(!(St?$t in z:ln.call(z,$t)))return!1}var Vn=et.get(k);if(Vn&&et.get(z))return Vn==z;var vn=!0;et.set(k,z),et.set(z,k);for(var Ya=St;++Pn<Dt;){$t=kt[Pn];var Ta=k[$t],fr=z[$t];if(Be)var nu=St?Be(fr,Ta,$t,z,k,et):Be(Ta,fr,$t,k,z,et);if(!(nu===void 0?Ta===fr||ht(Ta,fr,ve,Be,et):nu)){vn=!1;break}Ya||(Ya=$t=="constructor")}if(vn&&!Ya){var Ui=k.constructor,Ps=z.constructor;Ui!=Ps&&"constructor"in k&&"constructor"in z&&!(typeof Ui=="function"&&Ui instanceof Ui&&typeof Ps=="function"&&Ps instanceof Ps)&&(vn=!1)}return et.delete(k),et.delete(z),vn}function ql(k){return qc(k,tu,eu)}function Ms(k,z){var ve=k.__data__;return Zf(z)?ve[typeof z=="string"?"string":"hash"]:ve.map}function Ln(k,z){var ve=ke(k,z);return Pf(ve)?ve:void 0}function jf(k){var z=ln.call(k,ir),ve=k[ir];try{k[ir]=void 0;var Be=!0}catch{}var ht=Si.call(k);return Be&&(z?k[ir]=ve:delete k[ir]),ht}var eu=Kc?function(k){return k==null?[]:(k=Object(k),Ue(Kc(k),function(z){return mn.call(k,z)}))}:Oi,Sa=Bs;(ya&&Sa(new ya(new ArrayBuffer(1)))!=D||Pa&&Sa(new Pa)!=S||lr&&Sa(lr.resolve())!=_||Yl&&Sa(new Yl)!=V||Ti&&Sa(new Ti)!=Z)&&(Sa=function(k){var z=Bs(k),ve=z==T?k.constructor:void 0,Be=ve?Na(ve):"";if(Be)switch(Be){case Kl:return D;case ks:return S;case Gf:return _;case Xc:return V;case Wc:return Z}return z});function eo(k,z){return z=z??u,!!z&&(typeof k=="number"||ue.test(k))&&k>-1&&k%1==0&&k<z}function Zf(k){var z=typeof k;return z=="string"||z=="number"||z=="symbol"||z=="boolean"?k!=="__proto__":k===null}function Yf(k){return!!Zr&&Zr in k}function _i(k){var z=k&&k.constructor,ve=typeof z=="function"&&z.prototype||xt;return k===ve}function to(k){return Si.call(k)}function Na(k){if(k!=null){try{return xi.call(k)}catch{}try{return k+""}catch{}}return""}function ur(k,z){return k===z||k!==k&&z!==z}var Qr=Us(function(){return arguments}())?Us:function(k){return dr(k)&&ln.call(k,"callee")&&!mn.call(k,"callee")},Gs=Array.isArray;function no(k){return k!=null&&Hr(k.length)&&!Vi(k)}var ki=Ni||Bi;function Fs(k,z){return Ql(k,z)}function Vi(k){if(!Ra(k))return!1;var z=Bs(k);return z==x||z==N||z==p||z==j}function Hr(k){return typeof k=="number"&&k>-1&&k%1==0&&k<=u}function Ra(k){var z=typeof k;return k!=null&&(z=="object"||z=="function")}function dr(k){return k!=null&&typeof k=="object"}var Ls=Oe?te(Oe):kn;function tu(k){return no(k)?xa(k):Hl(k)}function Oi(){return[]}function Bi(){return!1}e.exports=Fs}(hc,hc.exports)),hc.exports}var Nm={exports:{}},Ix;function vG(){return Ix||(Ix=1,function(e,t){var a=function(){var s=function(C,V){var L=236,X=17,M=C,Z=o[V],U=null,D=0,J=null,O=[],K={},P=function(W,ee){D=M*4+17,U=function(Q){for(var se=new Array(Q),ce=0;ce<Q;ce+=1){se[ce]=new Array(Q);for(var Re=0;Re<Q;Re+=1)se[ce][Re]=null}return se}(D),q(0,0),q(D-7,0),q(0,D-7),F(),me(),Y(W,ee),M>=7&&fe(W),J==null&&(J=de(M,Z,O)),ae(J,ee)},q=function(W,ee){for(var Q=-1;Q<=7;Q+=1)if(!(W+Q<=-1||D<=W+Q))for(var se=-1;se<=7;se+=1)ee+se<=-1||D<=ee+se||(0<=Q&&Q<=6&&(se==0||se==6)||0<=se&&se<=6&&(Q==0||Q==6)||2<=Q&&Q<=4&&2<=se&&se<=4?U[W+Q][ee+se]=!0:U[W+Q][ee+se]=!1)},le=function(){for(var W=0,ee=0,Q=0;Q<8;Q+=1){P(!0,Q);var se=d.getLostPoint(K);(Q==0||W>se)&&(W=se,ee=Q)}return ee},me=function(){for(var W=8;W<D-8;W+=1)U[W][6]==null&&(U[W][6]=W%2==0);for(var ee=8;ee<D-8;ee+=1)U[6][ee]==null&&(U[6][ee]=ee%2==0)},F=function(){for(var W=d.getPatternPosition(M),ee=0;ee<W.length;ee+=1)for(var Q=0;Q<W.length;Q+=1){var se=W[ee],ce=W[Q];if(U[se][ce]==null)for(var Re=-2;Re<=2;Re+=1)for(var Oe=-2;Oe<=2;Oe+=1)Re==-2||Re==2||Oe==-2||Oe==2||Re==0&&Oe==0?U[se+Re][ce+Oe]=!0:U[se+Re][ce+Oe]=!1}},fe=function(W){for(var ee=d.getBCHTypeNumber(M),Q=0;Q<18;Q+=1){var se=!W&&(ee>>Q&1)==1;U[Math.floor(Q/3)][Q%3+D-8-3]=se}for(var Q=0;Q<18;Q+=1){var se=!W&&(ee>>Q&1)==1;U[Q%3+D-8-3][Math.floor(Q/3)]=se}},Y=function(W,ee){for(var Q=Z<<3|ee,se=d.getBCHTypeInfo(Q),ce=0;ce<15;ce+=1){var Re=!W&&(se>>ce&1)==1;ce<6?U[ce][8]=Re:ce<8?U[ce+1][8]=Re:U[D-15+ce][8]=Re}for(var ce=0;ce<15;ce+=1){var Re=!W&&(se>>ce&1)==1;ce<8?U[8][D-ce-1]=Re:ce<9?U[8][15-ce-1+1]=Re:U[8][15-ce-1]=Re}U[D-8][8]=!W},ae=function(W,ee){for(var Q=-1,se=D-1,ce=7,Re=0,Oe=d.getMaskFunction(ee),Ue=D-1;Ue>0;Ue-=2)for(Ue==6&&(Ue-=1);;){for(var $e=0;$e<2;$e+=1)if(U[se][Ue-$e]==null){var it=!1;Re<W.length&&(it=(W[Re]>>>ce&1)==1);var B=Oe(se,Ue-$e);B&&(it=!it),U[se][Ue-$e]=it,ce-=1,ce==-1&&(Re+=1,ce=7)}if(se+=Q,se<0||D<=se){se-=Q,Q=-Q;break}}},ue=function(W,ee){for(var Q=0,se=0,ce=0,Re=new Array(ee.length),Oe=new Array(ee.length),Ue=0;Ue<ee.length;Ue+=1){var $e=ee[Ue].dataCount,it=ee[Ue].totalCount-$e;se=Math.max(se,$e),ce=Math.max(ce,it),Re[Ue]=new Array($e);for(var B=0;B<Re[Ue].length;B+=1)Re[Ue][B]=255&W.getBuffer()[B+Q];Q+=$e;var te=d.getErrorCorrectPolynomial(it),oe=p(Re[Ue],te.getLength()-1),ke=oe.mod(te);Oe[Ue]=new Array(te.getLength()-1);for(var B=0;B<Oe[Ue].length;B+=1){var Ie=B+ke.getLength()-Oe[Ue].length;Oe[Ue][B]=Ie>=0?ke.getAt(Ie):0}}for(var we=0,B=0;B<ee.length;B+=1)we+=ee[B].totalCount;for(var Me=new Array(we),Je=0,B=0;B<se;B+=1)for(var Ue=0;Ue<ee.length;Ue+=1)B<Re[Ue].length&&(Me[Je]=Re[Ue][B],Je+=1);for(var B=0;B<ce;B+=1)for(var Ue=0;Ue<ee.length;Ue+=1)B<Oe[Ue].length&&(Me[Je]=Oe[Ue][B],Je+=1);return Me},de=function(W,ee,Q){for(var se=b.getRSBlocks(W,ee),ce=v(),Re=0;Re<Q.length;Re+=1){var Oe=Q[Re];ce.put(Oe.getMode(),4),ce.put(Oe.getLength(),d.getLengthInBits(Oe.getMode(),W)),Oe.write(ce)}for(var Ue=0,Re=0;Re<se.length;Re+=1)Ue+=se[Re].dataCount;if(ce.getLengthInBits()>Ue*8)throw"code length overflow. ("+ce.getLengthInBits()+">"+Ue*8+")";for(ce.getLengthInBits()+4<=Ue*8&&ce.put(0,4);ce.getLengthInBits()%8!=0;)ce.putBit(!1);for(;!(ce.getLengthInBits()>=Ue*8||(ce.put(L,8),ce.getLengthInBits()>=Ue*8));)ce.put(X,8);return ue(ce,se)};K.addData=function(W,ee){ee=ee||"Byte";var Q=null;switch(ee){case"Numeric":Q=A(W);break;case"Alphanumeric":Q=x(W);break;case"Byte":Q=N(W);break;case"Kanji":Q=S(W);break;default:throw"mode:"+ee}O.push(Q),J=null},K.isDark=function(W,ee){if(W<0||D<=W||ee<0||D<=ee)throw W+","+ee;return U[W][ee]},K.getModuleCount=function(){return D},K.make=function(){if(M<1){for(var W=1;W<40;W++){for(var ee=b.getRSBlocks(W,Z),Q=v(),se=0;se<O.length;se++){var ce=O[se];Q.put(ce.getMode(),4),Q.put(ce.getLength(),d.getLengthInBits(ce.getMode(),W)),ce.write(Q)}for(var Re=0,se=0;se<ee.length;se++)Re+=ee[se].dataCount;if(Q.getLengthInBits()<=Re*8)break}M=W}P(!1,le())},K.createTableTag=function(W,ee){W=W||2,ee=typeof ee>"u"?W*4:ee;var Q="";Q+='<table style="',Q+=" border-width: 0px; border-style: none;",Q+=" border-collapse: collapse;",Q+=" padding: 0px; margin: "+ee+"px;",Q+='">',Q+="<tbody>";for(var se=0;se<K.getModuleCount();se+=1){Q+="<tr>";for(var ce=0;ce<K.getModuleCount();ce+=1)Q+='<td style="',Q+=" border-width: 0px; border-style: none;",Q+=" border-collapse: collapse;",Q+=" padding: 0px; margin: 0px;",Q+=" width: "+W+"px;",Q+=" height: "+W+"px;",Q+=" background-color: ",Q+=K.isDark(se,ce)?"#000000":"#ffffff",Q+=";",Q+='"/>';Q+="</tr>"}return Q+="</tbody>",Q+="</table>",Q},K.createSvgTag=function(W,ee,Q,se){var ce={};typeof arguments[0]=="object"&&(ce=arguments[0],W=ce.cellSize,ee=ce.margin,Q=ce.alt,se=ce.title),W=W||2,ee=typeof ee>"u"?W*4:ee,Q=typeof Q=="string"?{text:Q}:Q||{},Q.text=Q.text||null,Q.id=Q.text?Q.id||"qrcode-description":null,se=typeof se=="string"?{text:se}:se||{},se.text=se.text||null,se.id=se.text?se.id||"qrcode-title":null;var Re=K.getModuleCount()*W+ee*2,Oe,Ue,$e,it,B="",te;for(te="l"+W+",0 0,"+W+" -"+W+",0 0,-"+W+"z ",B+='<svg version="1.1" xmlns="http://www.w3.org/2000/svg"',B+=ce.scalable?"":' width="'+Re+'px" height="'+Re+'px"',B+=' viewBox="0 0 '+Re+" "+Re+'" ',B+=' preserveAspectRatio="xMinYMin meet"',B+=se.text||Q.text?' role="img" aria-labelledby="'+Se([se.id,Q.id].join(" ").trim())+'"':"",B+=">",B+=se.text?'<title id="'+Se(se.id)+'">'+Se(se.text)+"</title>":"",B+=Q.text?'<description id="'+Se(Q.id)+'">'+Se(Q.text)+"</description>":"",B+='<rect width="100%" height="100%" fill="white" cx="0" cy="0"/>',B+='<path d="',$e=0;$e<K.getModuleCount();$e+=1)for(it=$e*W+ee,Oe=0;Oe<K.getModuleCount();Oe+=1)K.isDark($e,Oe)&&(Ue=Oe*W+ee,B+="M"+Ue+","+it+te);return B+='" stroke="transparent" fill="black"/>',B+="</svg>",B},K.createDataURL=function(W,ee){W=W||2,ee=typeof ee>"u"?W*4:ee;var Q=K.getModuleCount()*W+ee*2,se=ee,ce=Q-ee;return j(Q,Q,function(Re,Oe){if(se<=Re&&Re<ce&&se<=Oe&&Oe<ce){var Ue=Math.floor((Re-se)/W),$e=Math.floor((Oe-se)/W);return K.isDark($e,Ue)?0:1}else return 1})},K.createImgTag=function(W,ee,Q){W=W||2,ee=typeof ee>"u"?W*4:ee;var se=K.getModuleCount()*W+ee*2,ce="";return ce+="<img",ce+=' src="',ce+=K.createDataURL(W,ee),ce+='"',ce+=' width="',ce+=se,ce+='"',ce+=' height="',ce+=se,ce+='"',Q&&(ce+=' alt="',ce+=Se(Q),ce+='"'),ce+="/>",ce};var Se=function(W){for(var ee="",Q=0;Q<W.length;Q+=1){var se=W.charAt(Q);switch(se){case"<":ee+="&lt;";break;case">":ee+="&gt;";break;case"&":ee+="&amp;";break;case'"':ee+="&quot;";break;default:ee+=se;break}}return ee},Ne=function(W){var ee=1;W=typeof W>"u"?ee*2:W;var Q=K.getModuleCount()*ee+W*2,se=W,ce=Q-W,Re,Oe,Ue,$e,it,B={"██":"█","█ ":"▀"," █":"▄","  ":" "},te={"██":"▀","█ ":"▀"," █":" ","  ":" "},oe="";for(Re=0;Re<Q;Re+=2){for(Ue=Math.floor((Re-se)/ee),$e=Math.floor((Re+1-se)/ee),Oe=0;Oe<Q;Oe+=1)it="█",se<=Oe&&Oe<ce&&se<=Re&&Re<ce&&K.isDark(Ue,Math.floor((Oe-se)/ee))&&(it=" "),se<=Oe&&Oe<ce&&se<=Re+1&&Re+1<ce&&K.isDark($e,Math.floor((Oe-se)/ee))?it+=" ":it+="█",oe+=W<1&&Re+1>=ce?te[it]:B[it];oe+=`
 `}return Q%2&&W>0?oe.substring(0,oe.length-Q-1)+Array(Q+1).join("▀"):oe.substring(0,oe.length-1)};return K.createASCII=function(W,ee){if(W=W||1,W<2)return Ne(ee);W-=1,ee=typeof ee>"u"?W*2:ee;var Q=K.getModuleCount()*W+ee*2,se=ee,ce=Q-ee,Re,Oe,Ue,$e,it=Array(W+1).join("██"),B=Array(W+1).join("  "),te="",oe="";for(Re=0;Re<Q;Re+=1){for(Ue=Math.floor((Re-se)/W),oe="",Oe=0;Oe<Q;Oe+=1)$e=1,se<=Oe&&Oe<ce&&se<=Re&&Re<ce&&K.isDark(Ue,Math.floor((Oe-se)/W))&&($e=0),oe+=$e?it:B;for(Ue=0;Ue<W;Ue+=1)te+=oe+`
-`}return te.substring(0,te.length-1)},K.renderTo2dContext=function(W,ee){ee=ee||2;for(var Q=K.getModuleCount(),se=0;se<Q;se++)for(var ce=0;ce<Q;ce++)W.fillStyle=K.isDark(se,ce)?"black":"white",W.fillRect(se*ee,ce*ee,ee,ee)},K};s.stringToBytesFuncs={default:function(C){for(var V=[],L=0;L<C.length;L+=1){var X=C.charCodeAt(L);V.push(X&255)}return V}},s.stringToBytes=s.stringToBytesFuncs.default,s.createStringToBytes=function(C,V){var L=function(){for(var M=T(C),Z=function(){var me=M.read();if(me==-1)throw"eof";return me},U=0,D={};;){var J=M.read();if(J==-1)break;var O=Z(),K=Z(),P=Z(),q=String.fromCharCode(J<<8|O),le=K<<8|P;D[q]=le,U+=1}if(U!=V)throw U+" != "+V;return D}(),X=63;return function(M){for(var Z=[],U=0;U<M.length;U+=1){var D=M.charCodeAt(U);if(D<128)Z.push(D);else{var J=L[M.charAt(U)];typeof J=="number"?(J&255)==J?Z.push(J):(Z.push(J>>>8),Z.push(J&255)):Z.push(X)}}return Z}};var l={MODE_NUMBER:1,MODE_ALPHA_NUM:2,MODE_8BIT_BYTE:4,MODE_KANJI:8},o={L:1,M:0,Q:3,H:2},u={PATTERN000:0,PATTERN001:1,PATTERN010:2,PATTERN011:3,PATTERN100:4,PATTERN101:5,PATTERN110:6,PATTERN111:7},d=function(){var C=[[],[6,18],[6,22],[6,26],[6,30],[6,34],[6,22,38],[6,24,42],[6,26,46],[6,28,50],[6,30,54],[6,32,58],[6,34,62],[6,26,46,66],[6,26,48,70],[6,26,50,74],[6,30,54,78],[6,30,56,82],[6,30,58,86],[6,34,62,90],[6,28,50,72,94],[6,26,50,74,98],[6,30,54,78,102],[6,28,54,80,106],[6,32,58,84,110],[6,30,58,86,114],[6,34,62,90,118],[6,26,50,74,98,122],[6,30,54,78,102,126],[6,26,52,78,104,130],[6,30,56,82,108,134],[6,34,60,86,112,138],[6,30,58,86,114,142],[6,34,62,90,118,146],[6,30,54,78,102,126,150],[6,24,50,76,102,128,154],[6,28,54,80,106,132,158],[6,32,58,84,110,136,162],[6,26,54,82,110,138,166],[6,30,58,86,114,142,170]],V=1335,L=7973,X=21522,M={},Z=function(U){for(var D=0;U!=0;)D+=1,U>>>=1;return D};return M.getBCHTypeInfo=function(U){for(var D=U<<10;Z(D)-Z(V)>=0;)D^=V<<Z(D)-Z(V);return(U<<10|D)^X},M.getBCHTypeNumber=function(U){for(var D=U<<12;Z(D)-Z(L)>=0;)D^=L<<Z(D)-Z(L);return U<<12|D},M.getPatternPosition=function(U){return C[U-1]},M.getMaskFunction=function(U){switch(U){case u.PATTERN000:return function(D,J){return(D+J)%2==0};case u.PATTERN001:return function(D,J){return D%2==0};case u.PATTERN010:return function(D,J){return J%3==0};case u.PATTERN011:return function(D,J){return(D+J)%3==0};case u.PATTERN100:return function(D,J){return(Math.floor(D/2)+Math.floor(J/3))%2==0};case u.PATTERN101:return function(D,J){return D*J%2+D*J%3==0};case u.PATTERN110:return function(D,J){return(D*J%2+D*J%3)%2==0};case u.PATTERN111:return function(D,J){return(D*J%3+(D+J)%2)%2==0};default:throw"bad maskPattern:"+U}},M.getErrorCorrectPolynomial=function(U){for(var D=p([1],0),J=0;J<U;J+=1)D=D.multiply(p([1,f.gexp(J)],0));return D},M.getLengthInBits=function(U,D){if(1<=D&&D<10)switch(U){case l.MODE_NUMBER:return 10;case l.MODE_ALPHA_NUM:return 9;case l.MODE_8BIT_BYTE:return 8;case l.MODE_KANJI:return 8;default:throw"mode:"+U}else if(D<27)switch(U){case l.MODE_NUMBER:return 12;case l.MODE_ALPHA_NUM:return 11;case l.MODE_8BIT_BYTE:return 16;case l.MODE_KANJI:return 10;default:throw"mode:"+U}else if(D<41)switch(U){case l.MODE_NUMBER:return 14;case l.MODE_ALPHA_NUM:return 13;case l.MODE_8BIT_BYTE:return 16;case l.MODE_KANJI:return 12;default:throw"mode:"+U}else throw"type:"+D},M.getLostPoint=function(U){for(var D=U.getModuleCount(),J=0,O=0;O<D;O+=1)for(var K=0;K<D;K+=1){for(var P=0,q=U.isDark(O,K),le=-1;le<=1;le+=1)if(!(O+le<0||D<=O+le))for(var me=-1;me<=1;me+=1)K+me<0||D<=K+me||le==0&&me==0||q==U.isDark(O+le,K+me)&&(P+=1);P>5&&(J+=3+P-5)}for(var O=0;O<D-1;O+=1)for(var K=0;K<D-1;K+=1){var F=0;U.isDark(O,K)&&(F+=1),U.isDark(O+1,K)&&(F+=1),U.isDark(O,K+1)&&(F+=1),U.isDark(O+1,K+1)&&(F+=1),(F==0||F==4)&&(J+=3)}for(var O=0;O<D;O+=1)for(var K=0;K<D-6;K+=1)U.isDark(O,K)&&!U.isDark(O,K+1)&&U.isDark(O,K+2)&&U.isDark(O,K+3)&&U.isDark(O,K+4)&&!U.isDark(O,K+5)&&U.isDark(O,K+6)&&(J+=40);for(var K=0;K<D;K+=1)for(var O=0;O<D-6;O+=1)U.isDark(O,K)&&!U.isDark(O+1,K)&&U.isDark(O+2,K)&&U.isDark(O+3,K)&&U.isDark(O+4,K)&&!U.isDark(O+5,K)&&U.isDark(O+6,K)&&(J+=40);for(var fe=0,K=0;K<D;K+=1)for(var O=0;O<D;O+=1)U.isDark(O,K)&&(fe+=1);var Y=Math.abs(100*fe/D/D-50)/5;return J+=Y*10,J},M}(),f=function(){for(var C=new Array(256),V=new Array(256),L=0;L<8;L+=1)C[L]=1<<L;for(var L=8;L<256;L+=1)C[L]=C[L-4]^C[L-5]^C[L-6]^C[L-8];for(var L=0;L<255;L+=1)V[C[L]]=L;var X={};return X.glog=function(M){if(M<1)throw"glog("+M+")";return V[M]},X.gexp=function(M){for(;M<0;)M+=255;for(;M>=256;)M-=255;return C[M]},X}();function p(C,V){if(typeof C.length>"u")throw C.length+"/"+V;var L=function(){for(var M=0;M<C.length&&C[M]==0;)M+=1;for(var Z=new Array(C.length-M+V),U=0;U<C.length-M;U+=1)Z[U]=C[U+M];return Z}(),X={};return X.getAt=function(M){return L[M]},X.getLength=function(){return L.length},X.multiply=function(M){for(var Z=new Array(X.getLength()+M.getLength()-1),U=0;U<X.getLength();U+=1)for(var D=0;D<M.getLength();D+=1)Z[U+D]^=f.gexp(f.glog(X.getAt(U))+f.glog(M.getAt(D)));return p(Z,0)},X.mod=function(M){if(X.getLength()-M.getLength()<0)return X;for(var Z=f.glog(X.getAt(0))-f.glog(M.getAt(0)),U=new Array(X.getLength()),D=0;D<X.getLength();D+=1)U[D]=X.getAt(D);for(var D=0;D<M.getLength();D+=1)U[D]^=f.gexp(f.glog(M.getAt(D))+Z);return p(U,0).mod(M)},X}var b=function(){var C=[[1,26,19],[1,26,16],[1,26,13],[1,26,9],[1,44,34],[1,44,28],[1,44,22],[1,44,16],[1,70,55],[1,70,44],[2,35,17],[2,35,13],[1,100,80],[2,50,32],[2,50,24],[4,25,9],[1,134,108],[2,67,43],[2,33,15,2,34,16],[2,33,11,2,34,12],[2,86,68],[4,43,27],[4,43,19],[4,43,15],[2,98,78],[4,49,31],[2,32,14,4,33,15],[4,39,13,1,40,14],[2,121,97],[2,60,38,2,61,39],[4,40,18,2,41,19],[4,40,14,2,41,15],[2,146,116],[3,58,36,2,59,37],[4,36,16,4,37,17],[4,36,12,4,37,13],[2,86,68,2,87,69],[4,69,43,1,70,44],[6,43,19,2,44,20],[6,43,15,2,44,16],[4,101,81],[1,80,50,4,81,51],[4,50,22,4,51,23],[3,36,12,8,37,13],[2,116,92,2,117,93],[6,58,36,2,59,37],[4,46,20,6,47,21],[7,42,14,4,43,15],[4,133,107],[8,59,37,1,60,38],[8,44,20,4,45,21],[12,33,11,4,34,12],[3,145,115,1,146,116],[4,64,40,5,65,41],[11,36,16,5,37,17],[11,36,12,5,37,13],[5,109,87,1,110,88],[5,65,41,5,66,42],[5,54,24,7,55,25],[11,36,12,7,37,13],[5,122,98,1,123,99],[7,73,45,3,74,46],[15,43,19,2,44,20],[3,45,15,13,46,16],[1,135,107,5,136,108],[10,74,46,1,75,47],[1,50,22,15,51,23],[2,42,14,17,43,15],[5,150,120,1,151,121],[9,69,43,4,70,44],[17,50,22,1,51,23],[2,42,14,19,43,15],[3,141,113,4,142,114],[3,70,44,11,71,45],[17,47,21,4,48,22],[9,39,13,16,40,14],[3,135,107,5,136,108],[3,67,41,13,68,42],[15,54,24,5,55,25],[15,43,15,10,44,16],[4,144,116,4,145,117],[17,68,42],[17,50,22,6,51,23],[19,46,16,6,47,17],[2,139,111,7,140,112],[17,74,46],[7,54,24,16,55,25],[34,37,13],[4,151,121,5,152,122],[4,75,47,14,76,48],[11,54,24,14,55,25],[16,45,15,14,46,16],[6,147,117,4,148,118],[6,73,45,14,74,46],[11,54,24,16,55,25],[30,46,16,2,47,17],[8,132,106,4,133,107],[8,75,47,13,76,48],[7,54,24,22,55,25],[22,45,15,13,46,16],[10,142,114,2,143,115],[19,74,46,4,75,47],[28,50,22,6,51,23],[33,46,16,4,47,17],[8,152,122,4,153,123],[22,73,45,3,74,46],[8,53,23,26,54,24],[12,45,15,28,46,16],[3,147,117,10,148,118],[3,73,45,23,74,46],[4,54,24,31,55,25],[11,45,15,31,46,16],[7,146,116,7,147,117],[21,73,45,7,74,46],[1,53,23,37,54,24],[19,45,15,26,46,16],[5,145,115,10,146,116],[19,75,47,10,76,48],[15,54,24,25,55,25],[23,45,15,25,46,16],[13,145,115,3,146,116],[2,74,46,29,75,47],[42,54,24,1,55,25],[23,45,15,28,46,16],[17,145,115],[10,74,46,23,75,47],[10,54,24,35,55,25],[19,45,15,35,46,16],[17,145,115,1,146,116],[14,74,46,21,75,47],[29,54,24,19,55,25],[11,45,15,46,46,16],[13,145,115,6,146,116],[14,74,46,23,75,47],[44,54,24,7,55,25],[59,46,16,1,47,17],[12,151,121,7,152,122],[12,75,47,26,76,48],[39,54,24,14,55,25],[22,45,15,41,46,16],[6,151,121,14,152,122],[6,75,47,34,76,48],[46,54,24,10,55,25],[2,45,15,64,46,16],[17,152,122,4,153,123],[29,74,46,14,75,47],[49,54,24,10,55,25],[24,45,15,46,46,16],[4,152,122,18,153,123],[13,74,46,32,75,47],[48,54,24,14,55,25],[42,45,15,32,46,16],[20,147,117,4,148,118],[40,75,47,7,76,48],[43,54,24,22,55,25],[10,45,15,67,46,16],[19,148,118,6,149,119],[18,75,47,31,76,48],[34,54,24,34,55,25],[20,45,15,61,46,16]],V=function(M,Z){var U={};return U.totalCount=M,U.dataCount=Z,U},L={},X=function(M,Z){switch(Z){case o.L:return C[(M-1)*4+0];case o.M:return C[(M-1)*4+1];case o.Q:return C[(M-1)*4+2];case o.H:return C[(M-1)*4+3];default:return}};return L.getRSBlocks=function(M,Z){var U=X(M,Z);if(typeof U>"u")throw"bad rs block @ typeNumber:"+M+"/errorCorrectionLevel:"+Z;for(var D=U.length/3,J=[],O=0;O<D;O+=1)for(var K=U[O*3+0],P=U[O*3+1],q=U[O*3+2],le=0;le<K;le+=1)J.push(V(P,q));return J},L}(),v=function(){var C=[],V=0,L={};return L.getBuffer=function(){return C},L.getAt=function(X){var M=Math.floor(X/8);return(C[M]>>>7-X%8&1)==1},L.put=function(X,M){for(var Z=0;Z<M;Z+=1)L.putBit((X>>>M-Z-1&1)==1)},L.getLengthInBits=function(){return V},L.putBit=function(X){var M=Math.floor(V/8);C.length<=M&&C.push(0),X&&(C[M]|=128>>>V%8),V+=1},L},A=function(C){var V=l.MODE_NUMBER,L=C,X={};X.getMode=function(){return V},X.getLength=function(U){return L.length},X.write=function(U){for(var D=L,J=0;J+2<D.length;)U.put(M(D.substring(J,J+3)),10),J+=3;J<D.length&&(D.length-J==1?U.put(M(D.substring(J,J+1)),4):D.length-J==2&&U.put(M(D.substring(J,J+2)),7))};var M=function(U){for(var D=0,J=0;J<U.length;J+=1)D=D*10+Z(U.charAt(J));return D},Z=function(U){if("0"<=U&&U<="9")return U.charCodeAt(0)-48;throw"illegal char :"+U};return X},x=function(C){var V=l.MODE_ALPHA_NUM,L=C,X={};X.getMode=function(){return V},X.getLength=function(Z){return L.length},X.write=function(Z){for(var U=L,D=0;D+1<U.length;)Z.put(M(U.charAt(D))*45+M(U.charAt(D+1)),11),D+=2;D<U.length&&Z.put(M(U.charAt(D)),6)};var M=function(Z){if("0"<=Z&&Z<="9")return Z.charCodeAt(0)-48;if("A"<=Z&&Z<="Z")return Z.charCodeAt(0)-65+10;switch(Z){case" ":return 36;case"$":return 37;case"%":return 38;case"*":return 39;case"+":return 40;case"-":return 41;case".":return 42;case"/":return 43;case":":return 44;default:throw"illegal char :"+Z}};return X},N=function(C){var V=l.MODE_8BIT_BYTE,L=s.stringToBytes(C),X={};return X.getMode=function(){return V},X.getLength=function(M){return L.length},X.write=function(M){for(var Z=0;Z<L.length;Z+=1)M.put(L[Z],8)},X},S=function(C){var V=l.MODE_KANJI,L=s.stringToBytesFuncs.SJIS;if(!L)throw"sjis not supported.";(function(Z,U){var D=L(Z);if(D.length!=2||(D[0]<<8|D[1])!=U)throw"sjis not supported."})("友",38726);var X=L(C),M={};return M.getMode=function(){return V},M.getLength=function(Z){return~~(X.length/2)},M.write=function(Z){for(var U=X,D=0;D+1<U.length;){var J=(255&U[D])<<8|255&U[D+1];if(33088<=J&&J<=40956)J-=33088;else if(57408<=J&&J<=60351)J-=49472;else throw"illegal char at "+(D+1)+"/"+J;J=(J>>>8&255)*192+(J&255),Z.put(J,13),D+=2}if(D<U.length)throw"illegal char at "+(D+1)},M},R=function(){var C=[],V={};return V.writeByte=function(L){C.push(L&255)},V.writeShort=function(L){V.writeByte(L),V.writeByte(L>>>8)},V.writeBytes=function(L,X,M){X=X||0,M=M||L.length;for(var Z=0;Z<M;Z+=1)V.writeByte(L[Z+X])},V.writeString=function(L){for(var X=0;X<L.length;X+=1)V.writeByte(L.charCodeAt(X))},V.toByteArray=function(){return C},V.toString=function(){var L="";L+="[";for(var X=0;X<C.length;X+=1)X>0&&(L+=","),L+=C[X];return L+="]",L},V},I=function(){var C=0,V=0,L=0,X="",M={},Z=function(D){X+=String.fromCharCode(U(D&63))},U=function(D){if(!(D<0)){if(D<26)return 65+D;if(D<52)return 97+(D-26);if(D<62)return 48+(D-52);if(D==62)return 43;if(D==63)return 47}throw"n:"+D};return M.writeByte=function(D){for(C=C<<8|D&255,V+=8,L+=1;V>=6;)Z(C>>>V-6),V-=6},M.flush=function(){if(V>0&&(Z(C<<6-V),C=0,V=0),L%3!=0)for(var D=3-L%3,J=0;J<D;J+=1)X+="="},M.toString=function(){return X},M},T=function(C){var V=C,L=0,X=0,M=0,Z={};Z.read=function(){for(;M<8;){if(L>=V.length){if(M==0)return-1;throw"unexpected end of file./"+M}var D=V.charAt(L);if(L+=1,D=="=")return M=0,-1;if(D.match(/^\s$/))continue;X=X<<6|U(D.charCodeAt(0)),M+=6}var J=X>>>M-8&255;return M-=8,J};var U=function(D){if(65<=D&&D<=90)return D-65;if(97<=D&&D<=122)return D-97+26;if(48<=D&&D<=57)return D-48+52;if(D==43)return 62;if(D==47)return 63;throw"c:"+D};return Z},_=function(C,V){var L=C,X=V,M=new Array(C*V),Z={};Z.setPixel=function(O,K,P){M[K*L+O]=P},Z.write=function(O){O.writeString("GIF87a"),O.writeShort(L),O.writeShort(X),O.writeByte(128),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(255),O.writeByte(255),O.writeByte(255),O.writeString(","),O.writeShort(0),O.writeShort(0),O.writeShort(L),O.writeShort(X),O.writeByte(0);var K=2,P=D(K);O.writeByte(K);for(var q=0;P.length-q>255;)O.writeByte(255),O.writeBytes(P,q,255),q+=255;O.writeByte(P.length-q),O.writeBytes(P,q,P.length-q),O.writeByte(0),O.writeString(";")};var U=function(O){var K=O,P=0,q=0,le={};return le.write=function(me,F){if(me>>>F)throw"length over";for(;P+F>=8;)K.writeByte(255&(me<<P|q)),F-=8-P,me>>>=8-P,q=0,P=0;q=me<<P|q,P=P+F},le.flush=function(){P>0&&K.writeByte(q)},le},D=function(O){for(var K=1<<O,P=(1<<O)+1,q=O+1,le=J(),me=0;me<K;me+=1)le.add(String.fromCharCode(me));le.add(String.fromCharCode(K)),le.add(String.fromCharCode(P));var F=R(),fe=U(F);fe.write(K,q);var Y=0,ae=String.fromCharCode(M[Y]);for(Y+=1;Y<M.length;){var ue=String.fromCharCode(M[Y]);Y+=1,le.contains(ae+ue)?ae=ae+ue:(fe.write(le.indexOf(ae),q),le.size()<4095&&(le.size()==1<<q&&(q+=1),le.add(ae+ue)),ae=ue)}return fe.write(le.indexOf(ae),q),fe.write(P,q),fe.flush(),F.toByteArray()},J=function(){var O={},K=0,P={};return P.add=function(q){if(P.contains(q))throw"dup key:"+q;O[q]=K,K+=1},P.size=function(){return K},P.indexOf=function(q){return O[q]},P.contains=function(q){return typeof O[q]<"u"},P};return Z},j=function(C,V,L){for(var X=_(C,V),M=0;M<V;M+=1)for(var Z=0;Z<C;Z+=1)X.setPixel(Z,M,L(Z,M));var U=R();X.write(U);for(var D=I(),J=U.toByteArray(),O=0;O<J.length;O+=1)D.writeByte(J[O]);return D.flush(),"data:image/gif;base64,"+D};return s}();(function(){a.stringToBytesFuncs["UTF-8"]=function(s){function l(o){for(var u=[],d=0;d<o.length;d++){var f=o.charCodeAt(d);f<128?u.push(f):f<2048?u.push(192|f>>6,128|f&63):f<55296||f>=57344?u.push(224|f>>12,128|f>>6&63,128|f&63):(d++,f=65536+((f&1023)<<10|o.charCodeAt(d)&1023),u.push(240|f>>18,128|f>>12&63,128|f>>6&63,128|f&63))}return u}return l(s)}})(),function(s){e.exports=s()}(function(){return a})}(Nm)),Nm.exports}var _x;function yG(){if(_x)return Ir;_x=1;var e=Ir&&Ir.__extends||function(){var u=function(d,f){return u=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(p,b){p.__proto__=b}||function(p,b){for(var v in b)Object.prototype.hasOwnProperty.call(b,v)&&(p[v]=b[v])},u(d,f)};return function(d,f){if(typeof f!="function"&&f!==null)throw new TypeError("Class extends value "+String(f)+" is not a constructor or null");u(d,f);function p(){this.constructor=d}d.prototype=f===null?Object.create(f):(p.prototype=f.prototype,new p)}}(),t=Ir&&Ir.__assign||function(){return t=Object.assign||function(u){for(var d,f=1,p=arguments.length;f<p;f++){d=arguments[f];for(var b in d)Object.prototype.hasOwnProperty.call(d,b)&&(u[b]=d[b])}return u},t.apply(this,arguments)};Object.defineProperty(Ir,"__esModule",{value:!0}),Ir.QRCode=void 0;var a=bG(),s=vG(),l=of(),o=function(u){e(d,u);function d(f){var p=u.call(this,f)||this;return p.canvasRef=l.createRef(),p}return d.prototype.download=function(f,p){if(this.canvasRef.current){var b=void 0;switch(f){case"jpg":b="image/jpeg";break;case"webp":b="image/webp";break;case"png":default:b="image/png";break}var v=this.canvasRef.current.toDataURL(b,1),A=document.createElement("a");A.download=p??"react-qrcode-logo",A.href=v,A.click()}},d.prototype.utf16to8=function(f){var p="",b,v,A=f.length;for(b=0;b<A;b++)v=f.charCodeAt(b),v>=1&&v<=127?p+=f.charAt(b):v>2047?(p+=String.fromCharCode(224|v>>12&15),p+=String.fromCharCode(128|v>>6&63),p+=String.fromCharCode(128|v>>0&63)):(p+=String.fromCharCode(192|v>>6&31),p+=String.fromCharCode(128|v>>0&63));return p},d.prototype.drawRoundedSquare=function(f,p,b,v,A,x,N,S){S.lineWidth=f,S.fillStyle=A,S.strokeStyle=A,b+=f/2,p+=f/2,v-=f,Array.isArray(x)||(x=[x,x,x,x]),x=x.map(function(j){return j=Math.min(j,v/2),j<0?0:j});var R=x[0]||0,I=x[1]||0,T=x[2]||0,_=x[3]||0;S.beginPath(),S.moveTo(p+R,b),S.lineTo(p+v-I,b),I&&S.quadraticCurveTo(p+v,b,p+v,b+I),S.lineTo(p+v,b+v-T),T&&S.quadraticCurveTo(p+v,b+v,p+v-T,b+v),S.lineTo(p+_,b+v),_&&S.quadraticCurveTo(p,b+v,p,b+v-_),S.lineTo(p,b+R),R&&S.quadraticCurveTo(p,b,p+R,b),S.closePath(),S.stroke(),N&&S.fill()},d.prototype.drawPositioningPattern=function(f,p,b,v,A,x,N){N===void 0&&(N=[0,0,0,0]);var S=Math.ceil(p),R,I;typeof N!="number"&&!Array.isArray(N)?(R=N.outer||0,I=N.inner||0):(R=N,I=R);var T,_;typeof x!="string"?(T=x.outer,_=x.inner):(T=x,_=x);var j=v*p+b,C=A*p+b,V=p*7;this.drawRoundedSquare(S,C,j,V,T,R,!1,f),V=p*3,j+=p*2,C+=p*2,this.drawRoundedSquare(S,C,j,V,_,I,!0,f)},d.prototype.isInPositioninZone=function(f,p,b){return b.some(function(v){return p>=v.row&&p<=v.row+7&&f>=v.col&&f<=v.col+7})},d.prototype.transformPixelLengthIntoNumberOfCells=function(f,p){return f/p},d.prototype.isCoordinateInImage=function(f,p,b,v,A,x,N,S){if(S){var R=2,I=this.transformPixelLengthIntoNumberOfCells(A,N),T=this.transformPixelLengthIntoNumberOfCells(x,N),_=this.transformPixelLengthIntoNumberOfCells(b,N)-1,j=this.transformPixelLengthIntoNumberOfCells(v,N)-1;return p>=I-R&&p<=I+_+R&&f>=T-R&&f<=T+j+R}else return!1},d.prototype.shouldComponentUpdate=function(f){return!a(this.props,f)},d.prototype.componentDidMount=function(){this.update()},d.prototype.componentDidUpdate=function(){this.update()},d.prototype.update=function(){var f,p=this.props,b=p.value,v=p.ecLevel,A=p.enableCORS,x=p.bgColor,N=p.fgColor,S=p.logoImage,R=p.logoOpacity,I=p.logoOnLoad,T=p.removeQrCodeBehindLogo,_=p.qrStyle,j=p.eyeRadius,C=p.eyeColor,V=p.logoPaddingStyle,L=+this.props.size,X=+this.props.quietZone,M=this.props.logoWidth?+this.props.logoWidth:0,Z=this.props.logoHeight?+this.props.logoHeight:0,U=this.props.logoPadding?+this.props.logoPadding:0,D=s(0,v);D.addData(this.utf16to8(b)),D.make();var J=(f=this.canvasRef)===null||f===void 0?void 0:f.current,O=J.getContext("2d"),K=L+2*X,P=D.getModuleCount(),q=L/P,le=window.devicePixelRatio||1;J.height=J.width=K*le,O.scale(le,le),O.fillStyle=x,O.fillRect(0,0,K,K);var me=X,F=[{row:0,col:0},{row:0,col:P-7},{row:P-7,col:0}];if(O.strokeStyle=N,_==="dots"){O.fillStyle=N;for(var fe=q/2,Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)&&(O.beginPath(),O.arc(Math.round(ae*q)+fe+me,Math.round(Y*q)+fe+me,fe/100*75,0,2*Math.PI,!1),O.closePath(),O.fill())}else if(_==="fluid"){for(var fe=Math.ceil(q/2),Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)if(D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)){var ue=[!1,!1,!1,!1];Y>0&&!D.isDark(Y-1,ae)&&ae>0&&!D.isDark(Y,ae-1)&&(ue[0]=!0),Y>0&&!D.isDark(Y-1,ae)&&ae<P-1&&!D.isDark(Y,ae+1)&&(ue[1]=!0),Y<P-1&&!D.isDark(Y+1,ae)&&ae<P-1&&!D.isDark(Y,ae+1)&&(ue[2]=!0),Y<P-1&&!D.isDark(Y+1,ae)&&ae>0&&!D.isDark(Y,ae-1)&&(ue[3]=!0);var de=Math.ceil((ae+1)*q)-Math.floor(ae*q),Se=Math.ceil((Y+1)*q)-Math.floor(Y*q);O.fillStyle=N,O.beginPath(),O.arc(Math.round(ae*q)+fe+me,Math.round(Y*q)+fe+me,fe,0,2*Math.PI,!1),O.closePath(),O.fill(),ue[0]||O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me,de/2,Se/2),ue[1]||O.fillRect(Math.round(ae*q)+me+Math.floor(de/2),Math.round(Y*q)+me,de/2,Se/2),ue[2]||O.fillRect(Math.round(ae*q)+me+Math.floor(de/2),Math.round(Y*q)+me+Math.floor(Se/2),de/2,Se/2),ue[3]||O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me+Math.floor(Se/2),de/2,Se/2)}}else for(var Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)if(D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)){O.fillStyle=N;var de=Math.ceil((ae+1)*q)-Math.floor(ae*q),Se=Math.ceil((Y+1)*q)-Math.floor(Y*q);O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me,de,Se)}for(var Ne=0;Ne<3;Ne++){var W=F[Ne],Y=W.row,ae=W.col,ee=j,Q=void 0;Array.isArray(ee)&&(ee=ee[Ne]),typeof ee=="number"&&(ee=[ee,ee,ee,ee]),C?Array.isArray(C)?Q=C[Ne]:Q=C:Q=N,this.drawPositioningPattern(O,q,me,Y,ae,Q,ee)}if(S){var se=new Image;A&&(se.crossOrigin="Anonymous"),se.onload=function(ce){O.save();var Re=M||L*.2,Oe=Z||Re,Ue=(L-Re)/2,$e=(L-Oe)/2;if(T||U){O.beginPath(),O.strokeStyle=x,O.fillStyle=x;var it=Re+2*U,B=Oe+2*U,te=Ue+me-U,oe=$e+me-U;if(V==="circle"){var ke=te+it/2,Ie=oe+B/2;O.ellipse(ke,Ie,it/2,B/2,0,0,2*Math.PI),O.stroke(),O.fill()}else O.fillRect(te,oe,it,B)}O.globalAlpha=R,O.drawImage(se,Ue+me,$e+me,Re,Oe),O.restore(),I&&I(ce)},se.src=S}},d.prototype.render=function(){var f,p=+this.props.size+2*+this.props.quietZone;return l.createElement("canvas",{id:(f=this.props.id)!==null&&f!==void 0?f:"react-qrcode-logo",height:p,width:p,style:t({height:p+"px",width:p+"px"},this.props.style),ref:this.canvasRef})},d.defaultProps={value:"https://reactjs.org/",ecLevel:"M",enableCORS:!1,size:150,quietZone:10,bgColor:"#FFFFFF",fgColor:"#000000",logoOpacity:1,qrStyle:"squares",eyeRadius:[0,0,0],logoPaddingStyle:"square"},d}(l.Component);return Ir.QRCode=o,Ir}var EG=yG();const AG=({open:e,onOpenChange:t,loraConfig:a,channels:s})=>{const[l,o]=y.useState([0]),[u,d]=y.useState(""),[f,p]=y.useState(),b=y.useMemo(()=>Array.from(s.values()),[s]);return y.useEffect(()=>{const v=b.filter(N=>l.includes(N.index)).map(N=>N.settings).filter(N=>!!N),A=Te(yd,Te(yd,{loraConfig:a,settings:v})),x=Qt.fromByteArray(Ze(yd,A)).replace(/=/g,"").replace(/\+/g,"-").replace(/\//g,"_");d(`https://meshtastic.org/e/${f?"?add=true":""}#${x}`)},[b,l,f,a]),m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Generate QR Code"}),m.jsx($n,{children:"The current LoRa configuration will also be shared."})]}),m.jsxs("div",{className:"grid gap-4 py-4",children:[m.jsxs("div",{className:"flex gap-3 px-4 py-5 sm:p-6",children:[m.jsx("div",{className:"flex w-40 flex-col gap-2",children:b.map(v=>{var A;return m.jsxs("div",{className:"flex justify-between",children:[m.jsx(Hn,{children:(A=v.settings)!=null&&A.name.length?v.settings.name:v.role===Ns.PRIMARY?"Primary":`Channel: ${v.index}`}),m.jsx(rb,{checked:l.includes(v.index),onCheckedChange:()=>{l.includes(v.index)?o(l.filter(x=>x!==v.index)):o([...l,v.index])}},v.index)]},v.index)})}),m.jsx(EG.QRCode,{value:u,size:200,qrStyle:"dots"})]}),m.jsxs("div",{className:"flex justify-center",children:[m.jsx("button",{type:"button",className:`border-slate-900 border-t border-l border-b rounded-l h-10 px-7 py-2 text-sm font-medium focus:outline-hidden focus:ring-2 focus:ring-offset-2 ${f?"focus:ring-green-800 bg-green-800 text-white":"focus:ring-slate-400 bg-slate-400 hover:bg-green-600"}`,onClick:()=>p(!0),children:"Add Channels"}),m.jsx("button",{type:"button",className:`border-slate-900 border-t border-r border-b rounded-r h-10 px-4 py-2 text-sm font-medium focus:outline-hidden focus:ring-2 focus:ring-offset-2 ${f?"focus:ring-slate-400 bg-slate-400 hover:bg-green-600":"focus:ring-green-800 bg-green-800 text-white"}`,onClick:()=>p(!1),children:"Replace Channels"})]})]}),m.jsxs(Pr,{children:[m.jsx(Hn,{children:"Sharable URL"}),m.jsx(Ga,{value:u,disabled:!0,className:"dark:text-slate-900",action:{icon:vV,onClick(){navigator.clipboard.writeText(u)}}})]})]})})},xG=({open:e,onOpenChange:t})=>{const{connection:a}=He(),[s,l]=y.useState(5);return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Schedule Reboot"}),m.jsx($n,{children:"Reboot the connected node after x minutes."})]}),m.jsxs("div",{className:"flex gap-2 p-4",children:[m.jsx(Ga,{type:"number",className:"dark:text-slate-900",value:s,onChange:o=>l(Number.parseInt(o.target.value)),action:{icon:N2,onClick(){a==null||a.reboot(s*60).then(()=>t(!1))}}}),m.jsxs(pt,{className:"w-24",onClick:()=>{a==null||a.reboot(2).then(()=>t(!1))},children:[m.jsx(tg,{className:"mr-2",size:16}),"Now"]})]})]})})},SG=({open:e,onOpenChange:t})=>{const{connection:a}=He(),[s,l]=y.useState(5);return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Schedule Shutdown"}),m.jsx($n,{children:"Turn off the connected node after x minutes."})]}),m.jsxs("div",{className:"flex gap-2 p-4",children:[m.jsx(Ga,{type:"number",value:s,onChange:o=>l(Number.parseInt(o.target.value)),className:"dark:text-slate-900",suffix:"Minutes"}),m.jsx(pt,{className:"w-24",onClick:()=>{a==null||a.shutdown(s*60).then(()=>t(!1))},children:m.jsx(N2,{size:16})}),m.jsxs(pt,{className:"w-24",onClick:()=>{a==null||a.shutdown(2).then(()=>()=>t(!1))},children:[m.jsx(D2,{className:"mr-2",size:16}),"Now"]})]})]})})};var sb="Collapsible",[NG,BT]=ba(sb),[RG,ib]=NG(sb),UT=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,open:s,defaultOpen:l,disabled:o,onOpenChange:u,...d}=e,[f=!1,p]=pa({prop:s,defaultProp:l,onChange:u});return m.jsx(RG,{scope:a,disabled:o,contentId:fn(),open:f,onOpenToggle:y.useCallback(()=>p(b=>!b),[p]),children:m.jsx(Ye.div,{"data-state":ob(f),"data-disabled":o?"":void 0,...d,ref:t})})});UT.displayName=sb;var MT="CollapsibleTrigger",GT=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,...s}=e,l=ib(MT,a);return m.jsx(Ye.button,{type:"button","aria-controls":l.contentId,"aria-expanded":l.open||!1,"data-state":ob(l.open),"data-disabled":l.disabled?"":void 0,disabled:l.disabled,...s,ref:t,onClick:We(e.onClick,l.onOpenToggle)})});GT.displayName=MT;var lb="CollapsibleContent",FT=y.forwardRef((e,t)=>{const{forceMount:a,...s}=e,l=ib(lb,e.__scopeCollapsible);return m.jsx(rr,{present:a||l.open,children:({present:o})=>m.jsx(TG,{...s,ref:t,present:o})})});FT.displayName=lb;var TG=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,present:s,children:l,...o}=e,u=ib(lb,a),[d,f]=y.useState(s),p=y.useRef(null),b=gt(t,p),v=y.useRef(0),A=v.current,x=y.useRef(0),N=x.current,S=u.open||d,R=y.useRef(S),I=y.useRef(void 0);return y.useEffect(()=>{const T=requestAnimationFrame(()=>R.current=!1);return()=>cancelAnimationFrame(T)},[]),hn(()=>{const T=p.current;if(T){I.current=I.current||{transitionDuration:T.style.transitionDuration,animationName:T.style.animationName},T.style.transitionDuration="0s",T.style.animationName="none";const _=T.getBoundingClientRect();v.current=_.height,x.current=_.width,R.current||(T.style.transitionDuration=I.current.transitionDuration,T.style.animationName=I.current.animationName),f(s)}},[u.open,s]),m.jsx(Ye.div,{"data-state":ob(u.open),"data-disabled":u.disabled?"":void 0,id:u.contentId,hidden:!S,...o,ref:b,style:{"--radix-collapsible-content-height":A?`${A}px`:void 0,"--radix-collapsible-content-width":N?`${N}px`:void 0,...e.style},children:S&&l})});function ob(e){return e?"open":"closed"}var wG=UT,CG=GT,DG=FT,jr="Accordion",IG=["Home","End","ArrowDown","ArrowUp","ArrowLeft","ArrowRight"],[cb,_G,kG]=xf(jr),[Vf,xL]=ba(jr,[kG,BT]),ub=BT(),LT=ze.forwardRef((e,t)=>{const{type:a,...s}=e,l=s,o=s;return m.jsx(cb.Provider,{scope:e.__scopeAccordion,children:a==="multiple"?m.jsx(UG,{...o,ref:t}):m.jsx(BG,{...l,ref:t})})});LT.displayName=jr;var[PT,VG]=Vf(jr),[jT,OG]=Vf(jr,{collapsible:!1}),BG=ze.forwardRef((e,t)=>{const{value:a,defaultValue:s,onValueChange:l=()=>{},collapsible:o=!1,...u}=e,[d,f]=pa({prop:a,defaultProp:s,onChange:l});return m.jsx(PT,{scope:e.__scopeAccordion,value:d?[d]:[],onItemOpen:f,onItemClose:ze.useCallback(()=>o&&f(""),[o,f]),children:m.jsx(jT,{scope:e.__scopeAccordion,collapsible:o,children:m.jsx(ZT,{...u,ref:t})})})}),UG=ze.forwardRef((e,t)=>{const{value:a,defaultValue:s,onValueChange:l=()=>{},...o}=e,[u=[],d]=pa({prop:a,defaultProp:s,onChange:l}),f=ze.useCallback(b=>d((v=[])=>[...v,b]),[d]),p=ze.useCallback(b=>d((v=[])=>v.filter(A=>A!==b)),[d]);return m.jsx(PT,{scope:e.__scopeAccordion,value:u,onItemOpen:f,onItemClose:p,children:m.jsx(jT,{scope:e.__scopeAccordion,collapsible:!0,children:m.jsx(ZT,{...o,ref:t})})})}),[MG,Of]=Vf(jr),ZT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,disabled:s,dir:l,orientation:o="vertical",...u}=e,d=ze.useRef(null),f=gt(d,t),p=_G(a),v=Sf(l)==="ltr",A=We(e.onKeyDown,x=>{var X;if(!IG.includes(x.key))return;const N=x.target,S=p().filter(M=>{var Z;return!((Z=M.ref.current)!=null&&Z.disabled)}),R=S.findIndex(M=>M.ref.current===N),I=S.length;if(R===-1)return;x.preventDefault();let T=R;const _=0,j=I-1,C=()=>{T=R+1,T>j&&(T=_)},V=()=>{T=R-1,T<_&&(T=j)};switch(x.key){case"Home":T=_;break;case"End":T=j;break;case"ArrowRight":o==="horizontal"&&(v?C():V());break;case"ArrowDown":o==="vertical"&&C();break;case"ArrowLeft":o==="horizontal"&&(v?V():C());break;case"ArrowUp":o==="vertical"&&V();break}const L=T%I;(X=S[L].ref.current)==null||X.focus()});return m.jsx(MG,{scope:a,disabled:s,direction:l,orientation:o,children:m.jsx(cb.Slot,{scope:a,children:m.jsx(Ye.div,{...u,"data-orientation":o,ref:f,onKeyDown:s?void 0:A})})})}),tf="AccordionItem",[GG,db]=Vf(tf),YT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,value:s,...l}=e,o=Of(tf,a),u=VG(tf,a),d=ub(a),f=fn(),p=s&&u.value.includes(s)||!1,b=o.disabled||e.disabled;return m.jsx(GG,{scope:a,open:p,disabled:b,triggerId:f,children:m.jsx(wG,{"data-orientation":o.orientation,"data-state":QT(p),...d,...l,ref:t,disabled:b,open:p,onOpenChange:v=>{v?u.onItemOpen(s):u.onItemClose(s)}})})});YT.displayName=tf;var KT="AccordionHeader",FG=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(KT,a);return m.jsx(Ye.h3,{"data-orientation":l.orientation,"data-state":QT(o.open),"data-disabled":o.disabled?"":void 0,...s,ref:t})});FG.displayName=KT;var Ag="AccordionTrigger",XT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(Ag,a),u=OG(Ag,a),d=ub(a);return m.jsx(cb.ItemSlot,{scope:a,children:m.jsx(CG,{"aria-disabled":o.open&&!u.collapsible||void 0,"data-orientation":l.orientation,id:o.triggerId,...d,...s,ref:t})})});XT.displayName=Ag;var WT="AccordionContent",zT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(WT,a),u=ub(a);return m.jsx(DG,{role:"region","aria-labelledby":o.triggerId,"data-orientation":l.orientation,...u,...s,ref:t,style:{"--radix-accordion-content-height":"var(--radix-collapsible-content-height)","--radix-accordion-content-width":"var(--radix-collapsible-content-width)",...e.style}})});zT.displayName=WT;function QT(e){return e?"open":"closed"}var LG=LT,PG=YT,jG=XT,ZG=zT;const YG=LG,KG=PG,XG=y.forwardRef(({className:e,...t},a)=>m.jsxs(jG,{ref:a,className:Xe("flex justify-between items-center w-full p-4 border-b border-slat-200 dark:border-slat-800 group",e),...t,children:[t.children,m.jsx(t0,{className:"h-5 w-5 transition-transform duration-300 group-data-[state=open]:rotate-180","aria-hidden":!0})]})),WG=y.forwardRef(({className:e,...t},a)=>m.jsx(ZG,{ref:a,className:Xe("p-4 border-b border-slat-200 dark:border-slat-800",e),...t})),zG={DIY_V1:"diy.svg",NANO_G2_ULTRA:"nano-g2-ultra.svg",TBEAM:"tbeam.svg",HELTEC_HT62:"heltec-ht62-esp32c3-sx1262.svg",RPI_PICO:"pico.svg",T_DECK:"t-deck.svg",HELTEC_MESH_NODE_T114:"heltec-mesh-node-t114.svg",HELTEC_MESH_NODE_T114_CASE:"heltec-mesh-node-t114-case.svg",HELTEC_V3:"heltec-v3.svg",HELTEC_V3_CASE:"heltec-v3-case.svg",HELTEC_VISION_MASTER_E213:"heltec-vision-master-e213.svg",HELTEC_VISION_MASTER_E290:"heltec-vision-master-e290.svg",HELTEC_VISION_MASTER_T190:"heltec-vision-master-t190.svg",HELTEC_WIRELESS_PAPER:"heltec-wireless-paper.svg",HELTEC_WIRELESS_PAPER_V1_0:"heltec-wireless-paper-V1_0.svg",HELTEC_WIRELESS_TRACKER:"heltec-wireless-tracker.svg",HELTEC_WIRELESS_TRACKER_V1_0:"heltec-wireless-tracker-V1-0.svg",HELTEC_WSL_V3:"heltec-wsl-v3.svg",TLORA_C6:"tlora-c6.svg",TLORA_T3_S3:"tlora-t3s3-v1.svg",TLORA_T3_S3_EPAPER:"tlora-t3s3-epaper.svg",TLORA_V2:"tlora-v2-1-1_6.svg",TLORA_V2_1_1P6:"tlora-v2-1-1_6.svg",TLORA_V2_1_1P8:"tlora-v2-1-1_8.svg",RAK11310:"rak11310.svg",RAK2560:"rak2560.svg",RAK4631:"rak4631.svg",RAK4631_CASE:"rak4631_case.svg",WIO_WM1110:"wio-tracker-wm1110.svg",WM1110_DEV_KIT:"wm1110_dev_kit.svg",STATION_G2:"station-g2.svg",TBEAM_V0P7:"tbeam-s3-core.svg",T_ECHO:"t-echo.svg",TRACKER_T1000_E:"tracker-t1000-e.svg",T_WATCH_S3:"t-watch-s3.svg",SEEED_XIAO_S3:"seeed-xiao-s3.svg",SENSECAP_INDICATOR:"seeed-sensecap-indicator.svg",PROMICRO:"promicro.svg",RPIPICOW:"rpipicow.svg",UNKNOWN:"unknown.svg"},QG=({deviceType:e,className:t})=>{const a=l=>`/devices/${l}`,s=zG[e]||"unknown.svg";return m.jsx("img",{className:t,src:a(s),alt:s})},HG=e=>{const t=Math.floor(e/86400),a=Math.floor(e%86400/3600),s=Math.floor(e%86400%3600/60),l=Math.floor(e%86400%3600%60);return`${t}d ${a}h ${s}m ${l}s`},JG=({seconds:e})=>m.jsx("span",{children:HG(e)}),$G=({open:e,onOpenChange:t})=>{var u,d,f,p,b,v,A,x,N;const{nodes:a}=He(),{nodeNumDetails:s}=In(),l=a.get(s);if(!l)return null;const o=[{key:"airUtilTx",label:"Air TX utilization",value:(u=l.deviceMetrics)==null?void 0:u.airUtilTx,format:S=>`${S.toFixed(2)}%`},{key:"channelUtilization",label:"Channel utilization",value:(d=l.deviceMetrics)==null?void 0:d.channelUtilization,format:S=>`${S.toFixed(2)}%`},{key:"batteryLevel",label:"Battery level",value:(f=l.deviceMetrics)==null?void 0:f.batteryLevel,format:S=>`${S.toFixed(2)}%`},{key:"voltage",label:"Voltage",value:(p=l.deviceMetrics)==null?void 0:p.voltage,format:S=>`${S.toFixed(2)}V`}];return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsx(Sn,{children:m.jsxs(Nn,{children:["Node Details for ",((b=l.user)==null?void 0:b.longName)??"UNKNOWN"," (",((v=l.user)==null?void 0:v.shortName)??"UNK",")"]})}),m.jsx(Pr,{children:m.jsxs("div",{className:"w-full",children:[m.jsxs("div",{className:"flex flex-col",children:[m.jsx(QG,{className:"w-32 h-32 mx-auto rounded-lg border-4 border-slate-200 dark:border-slate-800",deviceType:_l[((A=l.user)==null?void 0:A.hwModel)??0]}),m.jsxs("div",{className:"bg-slate-100 text-slate-900 dark:text-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold",children:"Details:"}),m.jsxs("p",{children:["Hardware:"," ",_l[((x=l.user)==null?void 0:x.hwModel)??0]]}),m.jsxs("p",{children:["Node Number: ",l.num]}),m.jsxs("p",{children:["Node Hex: !",Cn(l.num)]}),m.jsxs("p",{children:["Role:"," ",Gd[((N=l.user)==null?void 0:N.role)??0]]}),m.jsxs("p",{children:["Last Heard:"," ",l.lastHeard===0?"Never":m.jsx(A0,{timestamp:l.lastHeard*1e3})]})]}),l.position&&m.jsxs("div",{className:"text-slate-900 dark:text-slate-100 bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold",children:"Position:"}),l.position.latitudeI&&l.position.longitudeI&&m.jsxs("p",{children:["Coordinates:"," ",m.jsxs("a",{className:"text-blue-500 dark:text-blue-400",href:`https://www.openstreetmap.org/?mlat=${l.position.latitudeI/1e7}&mlon=${l.position.longitudeI/1e7}&layers=N`,target:"_blank",rel:"noreferrer",children:[l.position.latitudeI/1e7,","," ",l.position.longitudeI/1e7]})]}),l.position.altitude&&m.jsxs("p",{children:["Altitude: ",l.position.altitude,"m"]})]}),l.deviceMetrics&&m.jsxs("div",{className:"text-slate-900 dark:text-slate-100 bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold text-slate-900 dark:text-slate-50",children:"Device Metrics:"}),o.map(S=>S.value!==void 0&&m.jsxs("p",{children:[S.label,": ",S.format(S.value)]},S.key)),l.deviceMetrics.uptimeSeconds&&m.jsxs("p",{children:["Uptime:"," ",m.jsx(JG,{seconds:l.deviceMetrics.uptimeSeconds})]})]})]}),m.jsx("div",{className:"text-slate-900 dark:text-slate-100 w-full max-w-[464px] bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:m.jsx(YG,{className:"AccordionRoot",type:"single",collapsible:!0,children:m.jsxs(KG,{className:"AccordionItem",value:"item-1",children:[m.jsx(XG,{children:m.jsx("p",{className:"text-lg font-semibold text-slate-900 dark:text-slate-50",children:"All Raw Metrics:"})}),m.jsx(WG,{className:"overflow-x-scroll",children:m.jsx("pre",{className:"text-xs w-full",children:JSON.stringify(l,null,2)})})]})})})]})})]})})},qG=({open:e,onOpenChange:t})=>{const[a,s]=y.useState(!1),{setDialogOpen:l}=He(),o="https://meshtastic.org/docs/configuration/radio/device/",u="https://meshtastic.org/blog/choosing-the-right-device-role/",d=f=>{l("unsafeRoles",!1),s(!1),gg.emit("dialog:unsafeRoles",{action:f})};return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{className:"max-w-8 flex flex-col",children:[m.jsx(Dn,{onClick:()=>d("dismiss")}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Are you sure?"})}),m.jsxs($n,{className:"text-md",children:["I have read the ",m.jsx(Ul,{href:o,className:"",children:"Device Role Documentation"})," ","and the blog post about ",m.jsx(Ul,{href:u,children:"Choosing The Right Device Role"})," and understand the implications of changing the role."]}),m.jsx("div",{className:"flex items-center gap-2",children:m.jsx(rb,{id:"routerRole",checked:a,onChange:()=>s(!a),children:"Yes, I know what I'm doing"})}),m.jsxs(Pr,{className:"mt-6",children:[m.jsx(pt,{variant:"default",name:"dismiss",onClick:()=>d("dismiss"),children:" Dismiss"}),m.jsx(pt,{variant:"default",name:"confirm",disabled:!a,onClick:()=>d("confirm"),children:" Confirm"})]})]})})};function eF(){const{removeNode:e,setDialogOpen:t,clearNodeError:a,getNodeError:s}=He(),{activeChat:l}=In(),o=y.useCallback(()=>{const d=s(l);if(d)return a(l),u(),e(d==null?void 0:d.node)},[l,a,t,e]),u=y.useCallback(()=>{t("refreshKeys",!1)},[t]);return{handleCloseDialog:u,handleNodeRemove:o}}const tF=({open:e,onOpenChange:t})=>{const{handleCloseDialog:a,handleNodeRemove:s}=eF();return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{className:"max-w-8 flex flex-col gap-2",children:[m.jsx(Dn,{onClick:a}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Keys Mismatch"})}),"Your node is unable to send a direct message to this node. This is due to the remote node's current public key not matching the previously stored key for this node.",m.jsx("ul",{className:"mt-2",children:m.jsxs("li",{className:"flex place-items-center gap-2 items-start",children:[m.jsx("div",{className:"p-2 bg-slate-500 rounded-lg mt-1",children:m.jsx(T2,{size:30,className:"text-white justify-center"})}),m.jsxs("div",{className:"flex flex-col gap-2",children:[m.jsxs("div",{children:[m.jsx("p",{className:"font-bold mb-0.5",children:"Accept New Keys"}),m.jsx("p",{children:"This will remove the node from device and request new keys."})]}),m.jsx(pt,{variant:"default",onClick:s,className:"",children:"Request New Keys"}),m.jsx(pt,{variant:"outline",onClick:a,className:"",children:"Dismiss"})]})]})})]})})},nF=()=>{const{channels:e,config:t,dialog:a,setDialogOpen:s}=He();return m.jsxs(m.Fragment,{children:[m.jsx(AG,{open:a.QR,onOpenChange:l=>{s("QR",l)},channels:e,loraConfig:t.lora}),m.jsx(mG,{open:a.import,onOpenChange:l=>{s("import",l)},loraConfig:t.lora}),m.jsx(SG,{open:a.shutdown,onOpenChange:()=>{s("shutdown",!1)}}),m.jsx(xG,{open:a.reboot,onOpenChange:()=>{s("reboot",!1)}}),m.jsx(pG,{open:a.deviceName,onOpenChange:l=>{s("deviceName",l)}}),m.jsx(hG,{open:a.nodeRemoval,onOpenChange:l=>{s("nodeRemoval",l)}}),m.jsx(gG,{open:a.pkiBackup,onOpenChange:l=>{s("pkiBackup",l)}}),m.jsx($G,{open:a.nodeDetails,onOpenChange:l=>{s("nodeDetails",l)}}),m.jsx(qG,{open:a.unsafeRoles,onOpenChange:l=>{s("unsafeRoles",l)}}),m.jsx(tF,{open:a.refreshKeys,onOpenChange:l=>{s("refreshKeys",l)}})]})};function aF(){return y.useMemo(()=>[["Web Bluetooth",!!(navigator!=null&&navigator.bluetooth)],["Web Serial",!!(navigator!=null&&navigator.serial)],["Secure Context",globalThis.location.protocol==="https:"||globalThis.location.hostname==="localhost"]].reduce((a,[s,l])=>((l?a.supported:a.unsupported).push(s),a),{supported:[],unsupported:[]}),[])}const fb=(e,t)=>{let a=0;t.events.onDeviceMetadataPacket.subscribe(s=>{e.addMetadata(s.from,s.data)}),t.events.onRoutingPacket.subscribe(s=>{switch(s.data.variant.case){case"errorReason":{if(s.data.variant.value===zn.NONE)return;console.info(`Routing Error: ${s.data.variant.value}`);break}case"routeReply":{console.info(`Route Reply: ${s.data.variant.value}`);break}case"routeRequest":{console.info(`Route Request: ${s.data.variant.value}`);break}}}),t.events.onTelemetryPacket.subscribe(()=>{}),t.events.onDeviceStatus.subscribe(s=>{e.setStatus(s)}),t.events.onWaypointPacket.subscribe(s=>{const{data:l}=s;e.addWaypoint(l)}),t.events.onMyNodeInfo.subscribe(s=>{e.setHardware(s),a=s.myNodeNum}),t.events.onUserPacket.subscribe(s=>{e.addUser(s)}),t.events.onPositionPacket.subscribe(s=>{e.addPosition(s)}),t.events.onNodeInfoPacket.subscribe(s=>{e.addNodeInfo(s)}),t.events.onChannelPacket.subscribe(s=>{e.addChannel(s)}),t.events.onConfigPacket.subscribe(s=>{e.setConfig(s)}),t.events.onModuleConfigPacket.subscribe(s=>{e.setModuleConfig(s)}),t.events.onMessagePacket.subscribe(s=>{e.addMessage({...s,state:s.from!==a?"ack":"waiting"})}),t.events.onTraceRoutePacket.subscribe(s=>{e.addTraceRoute({...s})}),t.events.onPendingSettingsChange.subscribe(s=>{e.setPendingSettingsChanges(s)}),t.events.onMeshPacket.subscribe(s=>{e.processPacket({from:s.from,snr:s.rxSnr,time:s.rxTime})}),t.events.onQueueStatus.subscribe(s=>{e.setQueueStatus(s)}),t.events.onRoutingPacket.subscribe(s=>{var l,o,u,d;if(s.data.variant.case==="errorReason")switch(s.data.variant.value){case zn.NO_CHANNEL:console.error(`Routing Error: ${s.data.variant.value}`),e.setNodeError(s.from,zn[(o=(l=s==null?void 0:s.data)==null?void 0:l.variant)==null?void 0:o.value]),e.setDialogOpen("refreshKeys",!0);break;case zn.PKI_UNKNOWN_PUBKEY:console.error(`Routing Error: ${s.data.variant.value}`),e.setNodeError(s.from,zn[(d=(u=s==null?void 0:s.data)==null?void 0:u.variant)==null?void 0:d.value]),e.setDialogOpen("refreshKeys",!0);break}})},hb=()=>Math.floor(Math.random()*1e9),kx="f75c76d2-129e-4dad-a1dd-7866124401e7",Vx="2c55e69e-4993-11ed-b878-0242ac120002",Ox="ed9da18c-a800-4f66-a670-aa7547e34453",xg="6ba1b218-15a8-461f-9fa8-5dcae273eafd",Bx=4294967295,Ux=2.2;var ha;(function(e){e[e.DeviceRestarting=1]="DeviceRestarting",e[e.DeviceDisconnected=2]="DeviceDisconnected",e[e.DeviceConnecting=3]="DeviceConnecting",e[e.DeviceReconnecting=4]="DeviceReconnecting",e[e.DeviceConnected=5]="DeviceConnected",e[e.DeviceConfiguring=6]="DeviceConfiguring",e[e.DeviceConfigured=7]="DeviceConfigured"})(ha||(ha={}));var Mx;(function(e){e[e.MeshDevice=1]="MeshDevice",e[e.SerialConnection=2]="SerialConnection",e[e.NodeSerialConnection=3]="NodeSerialConnection",e[e.BleConnection=4]="BleConnection",e[e.HttpConnection=5]="HttpConnection"})(Mx||(Mx={}));var Ae;(function(e){e[e.Constructor=0]="Constructor",e[e.SendText=1]="SendText",e[e.SendWaypoint=2]="SendWaypoint",e[e.SendPacket=3]="SendPacket",e[e.SendRaw=4]="SendRaw",e[e.SetConfig=5]="SetConfig",e[e.SetModuleConfig=6]="SetModuleConfig",e[e.ConfirmSetConfig=7]="ConfirmSetConfig",e[e.SetOwner=8]="SetOwner",e[e.SetChannel=9]="SetChannel",e[e.ConfirmSetChannel=10]="ConfirmSetChannel",e[e.ClearChannel=11]="ClearChannel",e[e.GetChannel=12]="GetChannel",e[e.GetAllChannels=13]="GetAllChannels",e[e.GetConfig=14]="GetConfig",e[e.GetModuleConfig=15]="GetModuleConfig",e[e.GetOwner=16]="GetOwner",e[e.Configure=17]="Configure",e[e.HandleFromRadio=18]="HandleFromRadio",e[e.HandleMeshPacket=19]="HandleMeshPacket",e[e.Connect=20]="Connect",e[e.Ping=21]="Ping",e[e.ReadFromRadio=22]="ReadFromRadio",e[e.WriteToRadio=23]="WriteToRadio",e[e.SetDebugMode=24]="SetDebugMode",e[e.GetMetadata=25]="GetMetadata",e[e.ResetNodes=26]="ResetNodes",e[e.Shutdown=27]="Shutdown",e[e.Reboot=28]="Reboot",e[e.RebootOta=29]="RebootOta",e[e.FactoryReset=30]="FactoryReset",e[e.EnterDfuMode=31]="EnterDfuMode",e[e.RemoveNodeByNum=32]="RemoveNodeByNum",e[e.SetCannedMessages=33]="SetCannedMessages"})(Ae||(Ae={}));var fi;(function(e){e[e.Primary=0]="Primary",e[e.Channel1=1]="Channel1",e[e.Channel2=2]="Channel2",e[e.Channel3=3]="Channel3",e[e.Channel4=4]="Channel4",e[e.Channel5=5]="Channel5",e[e.Channel6=6]="Channel6",e[e.Admin=7]="Admin"})(fi||(fi={}));class rF{constructor(){pe(this,"onLogEvent",new _e.SimpleEventDispatcher);pe(this,"onFromRadio",new _e.SimpleEventDispatcher);pe(this,"onMeshPacket",new _e.SimpleEventDispatcher);pe(this,"onMyNodeInfo",new _e.SimpleEventDispatcher);pe(this,"onNodeInfoPacket",new _e.SimpleEventDispatcher);pe(this,"onChannelPacket",new _e.SimpleEventDispatcher);pe(this,"onConfigPacket",new _e.SimpleEventDispatcher);pe(this,"onModuleConfigPacket",new _e.SimpleEventDispatcher);pe(this,"onAtakPacket",new _e.SimpleEventDispatcher);pe(this,"onMessagePacket",new _e.SimpleEventDispatcher);pe(this,"onRemoteHardwarePacket",new _e.SimpleEventDispatcher);pe(this,"onPositionPacket",new _e.SimpleEventDispatcher);pe(this,"onUserPacket",new _e.SimpleEventDispatcher);pe(this,"onRoutingPacket",new _e.SimpleEventDispatcher);pe(this,"onDeviceMetadataPacket",new _e.SimpleEventDispatcher);pe(this,"onWaypointPacket",new _e.SimpleEventDispatcher);pe(this,"onAudioPacket",new _e.SimpleEventDispatcher);pe(this,"onDetectionSensorPacket",new _e.SimpleEventDispatcher);pe(this,"onPingPacket",new _e.SimpleEventDispatcher);pe(this,"onIpTunnelPacket",new _e.SimpleEventDispatcher);pe(this,"onPaxcounterPacket",new _e.SimpleEventDispatcher);pe(this,"onSerialPacket",new _e.SimpleEventDispatcher);pe(this,"onStoreForwardPacket",new _e.SimpleEventDispatcher);pe(this,"onRangeTestPacket",new _e.SimpleEventDispatcher);pe(this,"onTelemetryPacket",new _e.SimpleEventDispatcher);pe(this,"onZpsPacket",new _e.SimpleEventDispatcher);pe(this,"onSimulatorPacket",new _e.SimpleEventDispatcher);pe(this,"onTraceRoutePacket",new _e.SimpleEventDispatcher);pe(this,"onNeighborInfoPacket",new _e.SimpleEventDispatcher);pe(this,"onAtakPluginPacket",new _e.SimpleEventDispatcher);pe(this,"onMapReportPacket",new _e.SimpleEventDispatcher);pe(this,"onPrivatePacket",new _e.SimpleEventDispatcher);pe(this,"onAtakForwarderPacket",new _e.SimpleEventDispatcher);pe(this,"onDeviceStatus",new _e.SimpleEventDispatcher);pe(this,"onLogRecord",new _e.SimpleEventDispatcher);pe(this,"onMeshHeartbeat",new _e.SimpleEventDispatcher);pe(this,"onDeviceDebugLog",new _e.SimpleEventDispatcher);pe(this,"onPendingSettingsChange",new _e.SimpleEventDispatcher);pe(this,"onQueueStatus",new _e.SimpleEventDispatcher)}}const sF=e=>{if(!(e instanceof Uint8Array))throw new TypeError("Input must be a Uint8Array");if(e.byteLength===0)return new ArrayBuffer(0);if(e.buffer instanceof SharedArrayBuffer){const t=new ArrayBuffer(e.byteLength);return new Uint8Array(t).set(e),t}return e.byteOffset===0&&e.byteLength===e.buffer.byteLength?e.buffer:e.buffer.slice(e.byteOffset,e.byteOffset+e.byteLength)};class iF{constructor(){pe(this,"queue",[]);pe(this,"lock",!1);pe(this,"ackNotifier",new _e.SimpleEventDispatcher);pe(this,"errorNotifier",new _e.SimpleEventDispatcher);pe(this,"timeout");this.timeout=6e4}getState(){return this.queue}clear(){this.queue=[]}push(t){const a={...t,sent:!1,added:new Date,promise:new Promise((s,l)=>{this.ackNotifier.subscribe(o=>{t.id===o&&(this.remove(t.id),s(o))}),this.errorNotifier.subscribe(o=>{t.id===o.id&&(this.remove(t.id),l(o))}),setTimeout(()=>{if(this.queue.findIndex(o=>o.id===t.id)!==-1){this.remove(t.id);const o=Tt(rn,t.data);console.warn(`Packet ${t.id} of type ${o.payloadVariant.case} timed out`),l({id:t.id,error:zn.TIMEOUT})}},this.timeout)})};this.queue.push(a)}remove(t){if(this.lock){setTimeout(()=>this.remove(t),100);return}this.queue=this.queue.filter(a=>a.id!==t)}processAck(t){this.ackNotifier.dispatch(t)}processError(t){console.error(`Error received for packet ${t.id}: ${zn[t.error]}`),this.errorNotifier.dispatch(t)}wait(t){const a=this.queue.find(s=>s.id===t);if(!a)throw new Error("Packet does not exist");return a.promise}async processQueue(t){if(!this.lock){for(this.lock=!0;this.queue.filter(a=>!a.sent).length>0;){const a=this.queue.filter(s=>!s.sent)[0];if(a){await new Promise(s=>setTimeout(s,200));try{await t(a.data),a.sent=!0}catch(s){console.error(`Error sending packet ${a.id}`,s)}}}this.lock=!1}}}class lF{constructor(t){pe(this,"sendRaw");pe(this,"rxBuffer");pe(this,"txBuffer");pe(this,"textEncoder");pe(this,"counter");this.sendRaw=t,this.rxBuffer=[],this.txBuffer=[],this.textEncoder=new TextEncoder,this.counter=0}async downloadFile(t){return await this.sendCommand(ft.STX,this.textEncoder.encode(t),0)}async uploadFile(t,a){for(let s=0;s<a.length;s+=128)this.txBuffer.push(a.slice(s,s+128));return await this.sendCommand(ft.SOH,this.textEncoder.encode(t),0)}async sendCommand(t,a,s,l){const o=Te(rn,{payloadVariant:{case:"xmodemPacket",value:{buffer:a,control:t,seq:s,crc16:l}}});return await this.sendRaw(Ze(rn,o))}async handlePacket(t){switch(await new Promise(a=>setTimeout(a,100)),t.control){case ft.NUL:break;case ft.SOH:return this.counter=t.seq,this.validateCrc16(t)?(this.rxBuffer[this.counter]=t.buffer,this.sendCommand(ft.ACK)):await this.sendCommand(ft.NAK,void 0,t.seq);case ft.STX:break;case ft.EOT:break;case ft.ACK:{if(this.counter++,this.txBuffer[this.counter-1])return this.sendCommand(ft.SOH,this.txBuffer[this.counter-1],this.counter,Sl(this.txBuffer[this.counter-1]??new Uint8Array));if(this.counter===this.txBuffer.length+1)return this.sendCommand(ft.EOT);this.clear();break}case ft.NAK:return this.sendCommand(ft.SOH,this.txBuffer[this.counter],this.counter,Sl(this.txBuffer[this.counter-1]??new Uint8Array));case ft.CAN:{this.clear();break}case ft.CTRLZ:break}return Promise.resolve(0)}validateCrc16(t){return Sl(t.buffer)===t.crc16}clear(){this.counter=0,this.rxBuffer=[],this.txBuffer=[]}}class oF{constructor(t){pe(this,"log");pe(this,"deviceStatus");pe(this,"isConfigured");pe(this,"pendingSettingsChanges");pe(this,"myNodeInfo");pe(this,"configId");pe(this,"queue");pe(this,"events");pe(this,"xModem");this.log=new jS({name:"iMeshDevice",prettyLogTemplate:"{{hh}}:{{MM}}:{{ss}}:{{ms}}	{{logLevelName}}	[{{name}}]	"}),this.deviceStatus=ha.DeviceDisconnected,this.isConfigured=!1,this.pendingSettingsChanges=!1,this.myNodeInfo=Te(zg),this.configId=t??this.generateRandId(),this.queue=new iF,this.events=new rF,this.xModem=new lF(this.sendRaw.bind(this)),this.events.onDeviceStatus.subscribe(a=>{this.deviceStatus=a,a===ha.DeviceConfigured?this.isConfigured=!0:a===ha.DeviceConfiguring&&(this.isConfigured=!1)}),this.events.onMyNodeInfo.subscribe(a=>{this.myNodeInfo=a}),this.events.onPendingSettingsChange.subscribe(a=>{this.pendingSettingsChanges=a})}async sendText(t,a,s,l){this.log.debug(Ae[Ae.SendText],`📤 Sending message to ${a??"broadcast"} on channel ${(l==null?void 0:l.toString())??0}`);const o=new TextEncoder;return await this.sendPacket(o.encode(t),Ee.TEXT_MESSAGE_APP,a??"broadcast",l,s,!1,!0)}sendWaypoint(t,a,s){return this.log.debug(Ae[Ae.SendWaypoint],`📤 Sending waypoint to ${a} on channel ${(s==null?void 0:s.toString())??0}`),t.id=this.generateRandId(),this.sendPacket(Ze(Pd,t),Ee.WAYPOINT_APP,a,s,!0,!1)}async sendPacket(t,a,s,l=fi.Primary,o=!0,u=!0,d=!1,f,p){this.log.trace(Ae[Ae.SendPacket],`📤 Sending ${Ee[a]} to ${s}`);const b=Te(XS,{payloadVariant:{case:"decoded",value:{payload:t,portnum:a,wantResponse:u,emoji:p,replyId:f,dest:0,requestId:0,source:0}},from:this.myNodeInfo.myNodeNum,to:s==="broadcast"?Bx:s==="self"?this.myNodeInfo.myNodeNum:s,id:this.generateRandId(),wantAck:o,channel:l}),v=Te(rn,{payloadVariant:{case:"packet",value:b}});return d&&(b.rxTime=Math.trunc(new Date().getTime()/1e3),this.handleMeshPacket(b)),await this.sendRaw(Ze(rn,v),b.id)}async sendRaw(t,a=this.generateRandId()){if(t.length>512)throw new Error("Message longer than 512 bytes, it will not be sent!");return this.queue.push({id:a,data:t}),await this.queue.processQueue(async s=>{await this.writeToRadio(s)}),this.queue.wait(a)}async setConfig(t){this.log.debug(Ae[Ae.SetConfig],`⚙️ Setting config, Variant: ${t.payloadVariant.case??"Unknown"}`),this.pendingSettingsChanges||await this.beginEditSettings();const a=Te(De,{payloadVariant:{case:"setConfig",value:t}});return this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setModuleConfig(t){this.log.debug(Ae[Ae.SetModuleConfig],"⚙️ Setting module config");const a=Te(De,{payloadVariant:{case:"setModuleConfig",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setCannedMessages(t){this.log.debug(Ae[Ae.SetCannedMessages],"⚙️ Setting CannedMessages");const a=Te(De,{payloadVariant:{case:"setCannedMessageModuleMessages",value:t.messages}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setOwner(t){this.log.debug(Ae[Ae.SetOwner],"👤 Setting owner");const a=Te(De,{payloadVariant:{case:"setOwner",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setChannel(t){this.log.debug(Ae[Ae.SetChannel],`📻 Setting Channel: ${t.index}`);const a=Te(De,{payloadVariant:{case:"setChannel",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async enterDfuMode(){this.log.debug(Ae[Ae.EnterDfuMode],"🔌 Entering DFU mode");const t=Te(De,{payloadVariant:{case:"enterDfuModeRequest",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async setPosition(t){return await this.sendPacket(Ze(Ld,t),Ee.POSITION_APP,"self")}async getChannel(t){this.log.debug(Ae[Ae.GetChannel],`📻 Requesting Channel: ${t}`);const a=Te(De,{payloadVariant:{case:"getChannelRequest",value:t+1}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getConfig(t){this.log.debug(Ae[Ae.GetConfig],"⚙️ Requesting config");const a=Te(De,{payloadVariant:{case:"getConfigRequest",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getModuleConfig(t){this.log.debug(Ae[Ae.GetModuleConfig],"⚙️ Requesting module config");const a=Te(De,{payloadVariant:{case:"getModuleConfigRequest",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getOwner(){this.log.debug(Ae[Ae.GetOwner],"👤 Requesting owner");const t=Te(De,{payloadVariant:{case:"getOwnerRequest",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async getMetadata(t){this.log.debug(Ae[Ae.GetMetadata],`🏷️ Requesting metadata from ${t}`);const a=Te(De,{payloadVariant:{case:"getDeviceMetadataRequest",value:!0}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,t,fi.Admin)}async clearChannel(t){this.log.debug(Ae[Ae.ClearChannel],`📻 Clearing Channel ${t}`);const a=Te(hf,{index:t,role:Ns.DISABLED}),s=Te(De,{payloadVariant:{case:"setChannel",value:a}});return await this.sendPacket(Ze(De,s),Ee.ADMIN_APP,"self")}async beginEditSettings(){this.events.onPendingSettingsChange.dispatch(!0);const t=Te(De,{payloadVariant:{case:"beginEditSettings",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async commitEditSettings(){this.events.onPendingSettingsChange.dispatch(!1);const t=Te(De,{payloadVariant:{case:"commitEditSettings",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async resetNodes(){this.log.debug(Ae[Ae.ResetNodes],"📻 Resetting NodeDB");const t=Te(De,{payloadVariant:{case:"nodedbReset",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async removeNodeByNum(t){this.log.debug(Ae[Ae.RemoveNodeByNum],`📻 Removing Node ${t} from NodeDB`);const a=Te(De,{payloadVariant:{case:"removeByNodenum",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async shutdown(t){this.log.debug(Ae[Ae.Shutdown],`🔌 Shutting down ${t>2?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"shutdownSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async reboot(t){this.log.debug(Ae[Ae.Reboot],`🔌 Rebooting node ${t>0?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"rebootSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async rebootOta(t){this.log.debug(Ae[Ae.RebootOta],`🔌 Rebooting into OTA mode ${t>0?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"rebootOtaSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async factoryResetDevice(){this.log.debug(Ae[Ae.FactoryReset],"♻️ Factory resetting device");const t=Te(De,{payloadVariant:{case:"factoryResetDevice",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async factoryResetConfig(){this.log.debug(Ae[Ae.FactoryReset],"♻️ Factory resetting config");const t=Te(De,{payloadVariant:{case:"factoryResetConfig",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}configure(){this.log.debug(Ae[Ae.Configure],"⚙️ Requesting device configuration"),this.updateDeviceStatus(ha.DeviceConfiguring);const t=Te(rn,{payloadVariant:{case:"wantConfigId",value:this.configId}});return this.sendRaw(Ze(rn,t))}heartbeat(){this.log.debug(Ae[Ae.Ping],"❤️ Send heartbeat ping to radio");const t=Te(rn,{payloadVariant:{case:"heartbeat",value:{}}});return this.sendRaw(Ze(rn,t))}async traceRoute(t){const a=Te(xl,{route:[]});return await this.sendPacket(Ze(xl,a),Ee.TRACEROUTE_APP,t)}async requestPosition(t){return await this.sendPacket(new Uint8Array,Ee.POSITION_APP,t)}updateDeviceStatus(t){t!==this.deviceStatus&&this.events.onDeviceStatus.dispatch(t)}generateRandId(){const t=crypto.getRandomValues(new Uint32Array(1));if(!t[0])throw new Error("Cannot generate CSPRN");return Math.floor(t[0]*2**-32*1e9)}handleFromRadio(t){const a=Tt(WS,t);switch(this.events.onFromRadio.dispatch(a),a.payloadVariant.case){case"packet":{this.handleMeshPacket(a.payloadVariant.value);break}case"myInfo":{this.events.onMyNodeInfo.dispatch(a.payloadVariant.value),this.log.info(Ae[Ae.HandleFromRadio],"📱 Received Node info for this device");break}case"nodeInfo":{this.log.info(Ae[Ae.HandleFromRadio],`📱 Received Node Info packet for node: ${a.payloadVariant.value.num}`),this.events.onNodeInfoPacket.dispatch(a.payloadVariant.value),a.payloadVariant.value.position&&this.events.onPositionPacket.dispatch({id:a.id,rxTime:new Date,from:a.payloadVariant.value.num,to:a.payloadVariant.value.num,type:"direct",channel:fi.Primary,data:a.payloadVariant.value.position}),a.payloadVariant.value.user&&this.events.onUserPacket.dispatch({id:a.id,rxTime:new Date,from:a.payloadVariant.value.num,to:a.payloadVariant.value.num,type:"direct",channel:fi.Primary,data:a.payloadVariant.value.user});break}case"config":{a.payloadVariant.value.payloadVariant.case?this.log.trace(Ae[Ae.HandleFromRadio],`💾 Received Config packet of variant: ${a.payloadVariant.value.payloadVariant.case}`):this.log.warn(Ae[Ae.HandleFromRadio],"⚠️ Received Config packet of variant: UNK"),this.events.onConfigPacket.dispatch(a.payloadVariant.value);break}case"logRecord":{this.log.trace(Ae[Ae.HandleFromRadio],"Received onLogRecord"),this.events.onLogRecord.dispatch(a.payloadVariant.value);break}case"configCompleteId":{a.payloadVariant.value!==this.configId&&this.log.error(Ae[Ae.HandleFromRadio],`❌ Invalid config id received from device, expected ${this.configId} but received ${a.payloadVariant.value}`),this.log.info(Ae[Ae.HandleFromRadio],`⚙️ Valid config id received from device: ${this.configId}`),this.updateDeviceStatus(ha.DeviceConfigured);break}case"rebooted":{this.configure().catch(()=>{});break}case"moduleConfig":{a.payloadVariant.value.payloadVariant.case?this.log.trace(Ae[Ae.HandleFromRadio],`💾 Received Module Config packet of variant: ${a.payloadVariant.value.payloadVariant.case}`):this.log.warn(Ae[Ae.HandleFromRadio],"⚠️ Received Module Config packet of variant: UNK"),this.events.onModuleConfigPacket.dispatch(a.payloadVariant.value);break}case"channel":{this.log.trace(Ae[Ae.HandleFromRadio],`🔐 Received Channel: ${a.payloadVariant.value.index}`),this.events.onChannelPacket.dispatch(a.payloadVariant.value);break}case"queueStatus":{this.log.trace(Ae[Ae.HandleFromRadio],`🚧 Received Queue Status: ${a.payloadVariant.value}`),this.events.onQueueStatus.dispatch(a.payloadVariant.value);break}case"xmodemPacket":{this.xModem.handlePacket(a.payloadVariant.value);break}case"metadata":{Number.parseFloat(a.payloadVariant.value.firmwareVersion)<Ux&&this.log.fatal(Ae[Ae.HandleFromRadio],`Device firmware outdated. Min supported: ${Ux} got : ${a.payloadVariant.value.firmwareVersion}`),this.log.debug(Ae[Ae.GetMetadata],"🏷️ Received metadata packet"),this.events.onDeviceMetadataPacket.dispatch({id:a.id,rxTime:new Date,from:0,to:0,type:"direct",channel:fi.Primary,data:a.payloadVariant.value});break}case"mqttClientProxyMessage":break;default:this.log.warn(Ae[Ae.HandleFromRadio],`⚠️ Unhandled payload variant: ${a.payloadVariant.case}`)}}complete(){this.queue.clear()}handleMeshPacket(t){switch(this.events.onMeshPacket.dispatch(t),t.from!==this.myNodeInfo.myNodeNum&&this.events.onMeshHeartbeat.dispatch(new Date),t.payloadVariant.case){case"decoded":{this.handleDecodedPacket(t.payloadVariant.value,t);break}case"encrypted":{this.log.debug(Ae[Ae.HandleMeshPacket],"🔐 Device received encrypted data packet, ignoring.");break}default:throw new Error(`Unhandled case ${t.payloadVariant.case}`)}}handleDecodedPacket(t,a){let s,l;const o={id:a.id,rxTime:new Date(a.rxTime*1e3),type:a.to===Bx?"broadcast":"direct",from:a.from,to:a.to,channel:a.channel};switch(this.log.trace(Ae[Ae.HandleMeshPacket],`📦 Received ${Ee[t.portnum]} packet`),t.portnum){case Ee.TEXT_MESSAGE_APP:{this.events.onMessagePacket.dispatch({...o,data:new TextDecoder().decode(t.payload)});break}case Ee.REMOTE_HARDWARE_APP:{this.events.onRemoteHardwarePacket.dispatch({...o,data:Tt(JS,t.payload)});break}case Ee.POSITION_APP:{this.events.onPositionPacket.dispatch({...o,data:Tt(Ld,t.payload)});break}case Ee.NODEINFO_APP:{this.events.onUserPacket.dispatch({...o,data:Tt(Wg,t.payload)});break}case Ee.ROUTING_APP:{switch(l=Tt(KS,t.payload),this.events.onRoutingPacket.dispatch({...o,data:l}),l.variant.case){case"errorReason":{l.variant.value===zn.NONE?this.queue.processAck(t.requestId):this.queue.processError({id:t.requestId,error:l.variant.value});break}case"routeReply":break;case"routeRequest":break;default:throw new Error(`Unhandled case ${l.variant.case}`)}break}case Ee.ADMIN_APP:{switch(s=Tt(De,t.payload),s.payloadVariant.case){case"getChannelResponse":{this.events.onChannelPacket.dispatch(s.payloadVariant.value);break}case"getOwnerResponse":{this.events.onUserPacket.dispatch({...o,data:s.payloadVariant.value});break}case"getConfigResponse":{this.events.onConfigPacket.dispatch(s.payloadVariant.value);break}case"getModuleConfigResponse":{this.events.onModuleConfigPacket.dispatch(s.payloadVariant.value);break}case"getDeviceMetadataResponse":{this.log.debug(Ae[Ae.GetMetadata],`🏷️ Received metadata packet from ${t.source}`),this.events.onDeviceMetadataPacket.dispatch({...o,data:s.payloadVariant.value});break}default:this.log.error(Ae[Ae.HandleMeshPacket],`⚠️ Received unhandled AdminMessage, type ${s.payloadVariant.case??"undefined"}`,t.payload)}break}case Ee.WAYPOINT_APP:{this.events.onWaypointPacket.dispatch({...o,data:Tt(Pd,t.payload)});break}case Ee.AUDIO_APP:{this.events.onAudioPacket.dispatch({...o,data:t.payload});break}case Ee.DETECTION_SENSOR_APP:{this.events.onDetectionSensorPacket.dispatch({...o,data:t.payload});break}case Ee.REPLY_APP:{this.events.onPingPacket.dispatch({...o,data:t.payload});break}case Ee.IP_TUNNEL_APP:{this.events.onIpTunnelPacket.dispatch({...o,data:t.payload});break}case Ee.PAXCOUNTER_APP:{this.events.onPaxcounterPacket.dispatch({...o,data:Tt(HS,t.payload)});break}case Ee.SERIAL_APP:{this.events.onSerialPacket.dispatch({...o,data:t.payload});break}case Ee.STORE_FORWARD_APP:{this.events.onStoreForwardPacket.dispatch({...o,data:t.payload});break}case Ee.RANGE_TEST_APP:{this.events.onRangeTestPacket.dispatch({...o,data:t.payload});break}case Ee.TELEMETRY_APP:{this.events.onTelemetryPacket.dispatch({...o,data:Tt(YS,t.payload)});break}case Ee.ZPS_APP:{this.events.onZpsPacket.dispatch({...o,data:t.payload});break}case Ee.SIMULATOR_APP:{this.events.onSimulatorPacket.dispatch({...o,data:t.payload});break}case Ee.TRACEROUTE_APP:{this.events.onTraceRoutePacket.dispatch({...o,data:Tt(xl,t.payload)});break}case Ee.NEIGHBORINFO_APP:{this.events.onNeighborInfoPacket.dispatch({...o,data:Tt(zS,t.payload)});break}case Ee.ATAK_PLUGIN:{this.events.onAtakPluginPacket.dispatch({...o,data:t.payload});break}case Ee.MAP_REPORT_APP:{this.events.onMapReportPacket.dispatch({...o,data:t.payload});break}case Ee.PRIVATE_APP:{this.events.onPrivatePacket.dispatch({...o,data:t.payload});break}case Ee.ATAK_FORWARDER:{this.events.onAtakForwarderPacket.dispatch({...o,data:t.payload});break}default:throw new Error(`Unhandled case ${t.portnum}`)}}}class cF extends oF{constructor(a){super(a);pe(this,"connType");pe(this,"portId");pe(this,"device");pe(this,"gattServer");pe(this,"service");pe(this,"toRadioCharacteristic");pe(this,"fromRadioCharacteristic");pe(this,"fromNumCharacteristic");pe(this,"timerUpdateFromRadio");this.log=this.log.getSubLogger({name:"HttpConnection"}),this.connType="ble",this.portId="",this.device=void 0,this.service=void 0,this.gattServer=void 0,this.toRadioCharacteristic=void 0,this.fromRadioCharacteristic=void 0,this.fromNumCharacteristic=void 0,this.log.debug(Ae[Ae.Constructor],"🔷 BleConnection instantiated")}supported(){return navigator.bluetooth.getAvailability()}getDevices(){return navigator.bluetooth.getDevices()}getDevice(a){return navigator.bluetooth.requestDevice(a??{filters:[{services:[xg]}]})}async connect({device:a,deviceFilter:s}){var l,o,u,d;this.updateDeviceStatus(ha.DeviceConnecting),this.device=a??await this.getDevice(s),this.portId=this.device.id,this.device.addEventListener("gattserverdisconnected",()=>{this.log.info(Ae[Ae.Connect],"Device disconnected"),this.updateDeviceStatus(ha.DeviceDisconnected),this.complete()}),await((l=this.device.gatt)==null?void 0:l.connect().then(f=>{this.log.info(Ae[Ae.Connect],`✅ Got GATT Server for device: ${f.device.id}`),this.gattServer=f}).catch(f=>{this.log.error(Ae[Ae.Connect],`❌ Failed to connect: ${f.message}`)})),await((o=this.gattServer)==null?void 0:o.getPrimaryService(xg).then(f=>{this.log.info(Ae[Ae.Connect],`✅ Got GATT Service for device: ${f.device.id}`),this.service=f}).catch(f=>{this.log.error(Ae[Ae.Connect],`❌ Failed to get primary service: q${f.message}`)})),[kx,Vx,Ox].map(async f=>{var p;await((p=this.service)==null?void 0:p.getCharacteristic(f).then(b=>{switch(this.log.info(Ae[Ae.Connect],`✅ Got Characteristic ${b.uuid} for device: ${b.uuid}`),f){case kx:{this.toRadioCharacteristic=b;break}case Vx:{this.fromRadioCharacteristic=b;break}case Ox:{this.fromNumCharacteristic=b;break}}}).catch(b=>{this.log.error(Ae[Ae.Connect],`❌ Failed to get toRadio characteristic: q${b.message}`)}))}),await((u=this.fromNumCharacteristic)==null?void 0:u.startNotifications()),(d=this.fromNumCharacteristic)==null||d.addEventListener("characteristicvaluechanged",()=>{this.readFromRadio()}),this.updateDeviceStatus(ha.DeviceConnected),this.configure().catch(()=>{}),this.timerUpdateFromRadio=setInterval(()=>this.readFromRadio(),1e3)}disconnect(){var a,s;(s=(a=this.device)==null?void 0:a.gatt)==null||s.disconnect(),this.updateDeviceStatus(ha.DeviceDisconnected),this.complete(),this.timerUpdateFromRadio&&clearInterval(this.timerUpdateFromRadio),this.timerUpdateFromRadio=void 0}async ping(){return await Promise.resolve(!0)}async readFromRadio(){try{let a=!0;for(;a&&this.fromRadioCharacteristic;){const s=await this.fromRadioCharacteristic.readValue();if(s.byteLength===0){a=!1;continue}await this.handleFromRadio(new Uint8Array(s.buffer)),this.updateDeviceStatus(ha.DeviceConnected)}}catch(a){throw this.log.error(Ae[Ae.ReadFromRadio],`❌ ${a instanceof Error?a.message:"Unknown error"}`),a}finally{}}async writeToRadio(a){var s;await((s=this.toRadioCharacteristic)==null?void 0:s.writeValue(sF(a))),await this.readFromRadio()}}const uF=({closeDialog:e})=>{const[t,a]=y.useState([]),{addDevice:s}=Cs(),{setSelectedDevice:l}=In(),o=y.useCallback(async()=>{a(await navigator.bluetooth.getDevices())},[]);y.useEffect(()=>{o()},[o]);const u=async d=>{const f=hb(),p=s(f);l(f);const b=new cF(f);await b.connect({device:d}),p.addConnection(b),fb(p,b),e()};return m.jsxs("div",{className:"flex w-full flex-col gap-2 p-4",children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2 overflow-y-auto",children:[t.map(d=>m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:()=>{u(d)},children:d.name},d.id)),t.length===0&&m.jsx(Oa,{className:"m-auto select-none",children:"No devices paired yet."})]}),m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await navigator.bluetooth.requestDevice({filters:[{services:[xg]}]}).then(d=>{t.findIndex(p=>p.id===d.id)===-1&&a(t.concat(d))})},children:m.jsx("span",{children:"New device"})})]})};class pb{constructor(t){pe(this,"_toDevice");pe(this,"_fromDevice");pe(this,"url");pe(this,"receiveBatchRequests");pe(this,"fetchInterval");this.url=t,this.receiveBatchRequests=!1,this.fetchInterval=3e3,this._toDevice=new WritableStream({write:async s=>{await this.writeToRadio(s)}});let a;this._fromDevice=new ReadableStream({start:s=>{a=s}}),setInterval(async()=>{await this.readFromRadio(a)},this.fetchInterval)}static async create(t,a){const s=`${a?"https":"http"}://${t}`;return await fetch(`${s}/json/report`),await Promise.resolve(),new pb(s)}async readFromRadio(t){let a=new ArrayBuffer(1);for(;a.byteLength>0;)a=await(await fetch(`${this.url}/api/v1/fromradio?all=${this.receiveBatchRequests?"true":"false"}`,{method:"GET",headers:{Accept:"application/x-protobuf"}})).arrayBuffer(),a.byteLength>0&&t.enqueue({type:"packet",data:new Uint8Array(a)})}async writeToRadio(t){await fetch(`${this.url}/api/v1/toradio`,{method:"PUT",headers:{"Content-Type":"application/x-protobuf"},body:t})}get toDevice(){return this._toDevice}get fromDevice(){return this._fromDevice}}const dF=({closeDialog:e})=>{const t=location.protocol==="https:",{addDevice:a}=Cs(),{setSelectedDevice:s}=In(),{control:l,handleSubmit:o,register:u}=L0({defaultValues:{ip:window.location.host+(new URLSearchParams(window.location.search).get("path")||"/meshtastic/web"),tls:!!t}}),{field:{value:d,onChange:f}}=U0({name:"tls",control:l}),[p,b]=y.useState(!1),v=o(async A=>{b(!0);const x=hb(),N=a(x),S=await pb.create(A.ip,A.tls),R=new r2(S,x);R.configure(),s(x),N.addConnection(R),fb(N,R),e()});return m.jsxs("form",{className:"flex w-full flex-col gap-2 p-4",onSubmit:v,children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2",children:[m.jsxs("div",{children:[m.jsx(Hn,{children:"IP Address/Hostname"}),m.jsx(Ga,{prefix:d?"https://":"http://",placeholder:"000.000.000.000 / meshtastic.local",className:"text-slate-900 dark:text-slate-900",disabled:p,...u("ip")})]}),m.jsxs("div",{className:"flex items-center gap-2 mt-2",children:[m.jsx(_f,{onCheckedChange:f,disabled:t||p,checked:t||d,...u("tls")}),m.jsx(Hn,{children:"Use HTTPS"})]})]}),m.jsx(pt,{type:"submit",disabled:p,className:"dark:bg-slate-900 dark:text-white",children:m.jsx("span",{children:p?"Connecting...":"Connect"})})]})},Gx=new TransformStream({transform(e,t){const a=e.length,s=new Uint8Array([148,195,a>>8&255,a&255]);t.enqueue(new Uint8Array([...s,...e]))}}),fF=()=>{let e=new Uint8Array([]);const t=new TextDecoder;return new TransformStream({transform(a,s){e=new Uint8Array([...e,...a]);let l=!1;for(;e.length!==0&&!l;){const o=e.findIndex(d=>d===148);if(e[o+1]===195){e.subarray(0,o).length&&(s.enqueue({type:"debug",data:t.decode(e.subarray(0,o))}),e=e.subarray(o));const d=e[2],f=e[3];if(d!==void 0&&f!==void 0&&e.length>=4+(d<<8)+f){const p=e.subarray(4,4+(d<<8)+f),b=p.findIndex(v=>v===148);b!==-1&&p[b+1]===195?(console.warn(`⚠️ Malformed packet found, discarding: ${e.subarray(0,b-1).toString()}`),e=e.subarray(b)):(e=e.subarray(3+(d<<8)+f+1),s.enqueue({type:"packet",data:p}))}else l=!0}else l=!0}}})};var Fx;(function(e){e[e.DeviceRestarting=1]="DeviceRestarting",e[e.DeviceDisconnected=2]="DeviceDisconnected",e[e.DeviceConnecting=3]="DeviceConnecting",e[e.DeviceReconnecting=4]="DeviceReconnecting",e[e.DeviceConnected=5]="DeviceConnected",e[e.DeviceConfiguring=6]="DeviceConfiguring",e[e.DeviceConfigured=7]="DeviceConfigured"})(Fx||(Fx={}));var Lx;(function(e){e[e.MeshDevice=1]="MeshDevice",e[e.SerialConnection=2]="SerialConnection",e[e.NodeSerialConnection=3]="NodeSerialConnection",e[e.BleConnection=4]="BleConnection",e[e.HttpConnection=5]="HttpConnection"})(Lx||(Lx={}));var Px;(function(e){e[e.Constructor=0]="Constructor",e[e.SendText=1]="SendText",e[e.SendWaypoint=2]="SendWaypoint",e[e.SendPacket=3]="SendPacket",e[e.SendRaw=4]="SendRaw",e[e.SetConfig=5]="SetConfig",e[e.SetModuleConfig=6]="SetModuleConfig",e[e.ConfirmSetConfig=7]="ConfirmSetConfig",e[e.SetOwner=8]="SetOwner",e[e.SetChannel=9]="SetChannel",e[e.ConfirmSetChannel=10]="ConfirmSetChannel",e[e.ClearChannel=11]="ClearChannel",e[e.GetChannel=12]="GetChannel",e[e.GetAllChannels=13]="GetAllChannels",e[e.GetConfig=14]="GetConfig",e[e.GetModuleConfig=15]="GetModuleConfig",e[e.GetOwner=16]="GetOwner",e[e.Configure=17]="Configure",e[e.HandleFromRadio=18]="HandleFromRadio",e[e.HandleMeshPacket=19]="HandleMeshPacket",e[e.Connect=20]="Connect",e[e.Ping=21]="Ping",e[e.ReadFromRadio=22]="ReadFromRadio",e[e.WriteToRadio=23]="WriteToRadio",e[e.SetDebugMode=24]="SetDebugMode",e[e.GetMetadata=25]="GetMetadata",e[e.ResetNodes=26]="ResetNodes",e[e.Shutdown=27]="Shutdown",e[e.Reboot=28]="Reboot",e[e.RebootOta=29]="RebootOta",e[e.FactoryReset=30]="FactoryReset",e[e.EnterDfuMode=31]="EnterDfuMode",e[e.RemoveNodeByNum=32]="RemoveNodeByNum",e[e.SetCannedMessages=33]="SetCannedMessages"})(Px||(Px={}));var jx;(function(e){e[e.Primary=0]="Primary",e[e.Channel1=1]="Channel1",e[e.Channel2=2]="Channel2",e[e.Channel3=3]="Channel3",e[e.Channel4=4]="Channel4",e[e.Channel5=5]="Channel5",e[e.Channel6=6]="Channel6",e[e.Admin=7]="Admin"})(jx||(jx={}));class nf{constructor(t){pe(this,"_toDevice");pe(this,"_fromDevice");if(!t.readable||!t.writable)throw new Error("Stream not accessible");Gx.readable.pipeTo(t.writable),this._toDevice=Gx.writable,this._fromDevice=t.readable.pipeThrough(fF())}static async create(t){const a=await navigator.serial.requestPort();return await a.open({baudRate:t||115200}),new nf(a)}static async createFromPort(t,a){return await t.open({baudRate:a||115200}),new nf(t)}get toDevice(){return this._toDevice}get fromDevice(){return this._fromDevice}}const hF=({closeDialog:e})=>{var d,f;const[t,a]=y.useState([]),{addDevice:s}=Cs(),{setSelectedDevice:l}=In(),o=y.useCallback(async()=>{a(await(navigator==null?void 0:navigator.serial.getPorts()))},[]);(d=navigator==null?void 0:navigator.serial)==null||d.addEventListener("connect",()=>{o()}),(f=navigator==null?void 0:navigator.serial)==null||f.addEventListener("disconnect",()=>{o()}),y.useEffect(()=>{o()},[o]);const u=async p=>{const b=hb(),v=s(b);l(b);const A=await nf.createFromPort(p),x=new r2(A,b);x.configure(),v.addConnection(x),fb(v,x),e()};return m.jsxs("div",{className:"flex w-full flex-col gap-2 p-4",children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2 overflow-y-auto",children:[t.map((p,b)=>{const{usbProductId:v,usbVendorId:A}=p.getInfo();return m.jsx(pt,{disabled:p.readable!==null,className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await u(p)},children:`# ${b} - ${A??"UNK"} - ${v??"UNK"}`},`${A??"UNK"}-${v??"UNK"}-${b}`)}),t.length===0&&m.jsx(Oa,{className:"m-auto select-none",children:"No devices paired yet."})]}),m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await navigator.serial.requestPort().then(p=>{a(t.concat(p))})},children:m.jsx("span",{children:"New device"})})]})},Zx={"Web Bluetooth":"https://developer.mozilla.org/en-US/docs/Web/API/Web_Bluetooth_API#browser_compatibility","Web Serial":"https://developer.mozilla.org/en-US/docs/Web/API/Web_Serial_API#browser_compatibility","Secure Context":"https://developer.mozilla.org/en-US/docs/Web/Security/Secure_Contexts"},pF=new Intl.ListFormat("en",{style:"long",type:"disjunction"}),mF=({missingFeatures:e})=>{if(e.length===0)return null;const t=e.filter(l=>l!=="Secure Context"),a=e.includes("Secure Context"),s=l=>pF.formatToParts(l).map(u=>u.type==="element"?m.jsx(Ul,{href:Zx[u.value],children:u.value},u.value):m.jsx(m.Fragment,{children:u.value},u.value));return m.jsx(Ua,{className:"flex flex-col items-start gap-2 bg-red-500 p-4 rounded-md",children:m.jsxs("div",{className:"flex items-center gap-2 w-full",children:[m.jsx(S2,{size:40,className:"mr-2 shrink-0 text-white"}),m.jsx("div",{className:"flex flex-col gap-3",children:m.jsxs("p",{className:"text-sm text-white",children:[t.length>0&&m.jsxs(m.Fragment,{children:["This connection type requires"," ",s(t),". Please use a supported browser, like Chrome or Edge."]}),a&&m.jsxs(m.Fragment,{children:[t.length>0&&" Additionally, it",t.length===0&&"This application"," requires a"," ",m.jsx(Ul,{href:Zx["Secure Context"],children:"secure context"}),". Please connect using HTTPS or localhost."]})]})})]})})},gF=({open:e,onOpenChange:t})=>{const{unsupported:a}=aF(),s=[{label:"HTTP",element:dF,isDisabled:!1},{label:"Bluetooth",element:uF,isDisabled:a.includes("Web Bluetooth")||a.includes("Secure Context")},{label:"Serial",element:hF,isDisabled:a.includes("Web Serial")||a.includes("Secure Context")}];return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Connect New Device"})}),m.jsxs(Rf,{defaultValue:"HTTP",children:[m.jsx(Gc,{children:s.map(l=>m.jsx(Fc,{value:l.label,children:l.label},l.label))}),s.map(l=>m.jsx(Lc,{value:l.label,children:m.jsxs("fieldset",{disabled:l.isDisabled,children:[l.isDisabled?m.jsx(mF,{missingFeatures:a}):null,m.jsx(l.element,{closeDialog:()=>t(!1)})]})},l.label))]})]})})};/*! js-cookie v3.0.5 | MIT */function md(e){for(var t=1;t<arguments.length;t++){var a=arguments[t];for(var s in a)e[s]=a[s]}return e}var bF={read:function(e){return e[0]==='"'&&(e=e.slice(1,-1)),e.replace(/(%[\dA-F]{2})+/gi,decodeURIComponent)},write:function(e){return encodeURIComponent(e).replace(/%(2[346BF]|3[AC-F]|40|5[BDE]|60|7[BCD])/g,decodeURIComponent)}};function Sg(e,t){function a(l,o,u){if(!(typeof document>"u")){u=md({},t,u),typeof u.expires=="number"&&(u.expires=new Date(Date.now()+u.expires*864e5)),u.expires&&(u.expires=u.expires.toUTCString()),l=encodeURIComponent(l).replace(/%(2[346B]|5E|60|7C)/g,decodeURIComponent).replace(/[()]/g,escape);var d="";for(var f in u)u[f]&&(d+="; "+f,u[f]!==!0&&(d+="="+u[f].split(";")[0]));return document.cookie=l+"="+e.write(o,l)+d}}function s(l){if(!(typeof document>"u"||arguments.length&&!l)){for(var o=document.cookie?document.cookie.split("; "):[],u={},d=0;d<o.length;d++){var f=o[d].split("="),p=f.slice(1).join("=");try{var b=decodeURIComponent(f[0]);if(u[b]=e.read(p,b),l===b)break}catch{}}return l?u[l]:u}}return Object.create({set:a,get:s,remove:function(l,o){a(l,"",md({},o,{expires:-1}))},withAttributes:function(l){return Sg(this.converter,md({},this.attributes,l))},withConverter:function(l){return Sg(md({},this.converter,l),this.attributes)}},{attributes:{value:Object.freeze(t)},converter:{value:Object.freeze(e)}})}var Rm=Sg(bF,{path:"/"});function vF(e,t){const[a,s]=y.useState(()=>{try{const u=Rm.get(e);return u?JSON.parse(u):t}catch(u){return console.error(`Error parsing cookie ${e}:`,u),t}}),l=y.useCallback((u,d)=>{try{Rm.set(e,JSON.stringify(u),d),s(u)}catch(f){console.error(`Error setting cookie ${e}:`,f)}},[e]),o=y.useCallback(()=>{try{Rm.remove(e),s(void 0)}catch(u){console.error(`Error removing cookie ${e}:`,u)}},[e]);return{value:a,setCookie:l,removeCookie:o}}const yF=1e4,EF=3e4,AF=365;function xF(e){const t=new Date(e);return(new Date().getTime()-t.getTime())/(1e3*60*60*24)>=7}function SF({reminderInDays:e=7,enabled:t,message:a,onAccept:s=()=>{},cookieOptions:l}){const{toast:o}=Zc(),u=y.useRef(!1),{value:d,setCookie:f}=vF("key_backup_reminder"),p=y.useCallback(b=>{const v=new Date;v.setDate(v.getDate()+b),f({suppressed:!0,lastShown:new Date().toISOString()},{...l,expires:v})},[f,l]);y.useEffect(()=>{if(u.current||!(!(d!=null&&d.suppressed)||xF(d.lastShown)))return;u.current=!0;const{dismiss:v}=o({title:"Backup Reminder",duration:EF,delay:yF,description:a,action:m.jsxs("div",{className:"flex gap-2",children:[m.jsx(pt,{type:"button",variant:"default",onClick:()=>{s(),v(),p(AF)},children:"Back up now"}),m.jsxs(pt,{type:"button",variant:"outline",onClick:()=>{v(),p(e)},children:["Remind me in ",e," days"]})]})});return()=>{u.current||v()}},[t,a,s,e,p,o,d])}const NF=()=>{const{setDialogOpen:e}=He();return SF({reminderInDays:7,message:"We recommend backing up your key data regularly. Would you like to back up now?",onAccept:()=>e("pkiBackup",!0),enabled:!0,cookieOptions:{secure:!0,sameSite:"strict"}}),m.jsx(m.Fragment,{})};var mb="ToastProvider",[gb,RF,TF]=xf("Toast"),[HT,SL]=ba("Toast",[TF]),[wF,Bf]=HT(mb),JT=e=>{const{__scopeToast:t,label:a="Notification",duration:s=5e3,swipeDirection:l="right",swipeThreshold:o=50,children:u}=e,[d,f]=y.useState(null),[p,b]=y.useState(0),v=y.useRef(!1),A=y.useRef(!1);return a.trim()||console.error(`Invalid prop \`label\` supplied to \`${mb}\`. Expected non-empty \`string\`.`),m.jsx(gb.Provider,{scope:t,children:m.jsx(wF,{scope:t,label:a,duration:s,swipeDirection:l,swipeThreshold:o,toastCount:p,viewport:d,onViewportChange:f,onToastAdd:y.useCallback(()=>b(x=>x+1),[]),onToastRemove:y.useCallback(()=>b(x=>x-1),[]),isFocusedToastEscapeKeyDownRef:v,isClosePausedRef:A,children:u})})};JT.displayName=mb;var $T="ToastViewport",CF=["F8"],Ng="toast.viewportPause",Rg="toast.viewportResume",qT=y.forwardRef((e,t)=>{const{__scopeToast:a,hotkey:s=CF,label:l="Notifications ({hotkey})",...o}=e,u=Bf($T,a),d=RF(a),f=y.useRef(null),p=y.useRef(null),b=y.useRef(null),v=y.useRef(null),A=gt(t,v,u.onViewportChange),x=s.join("+").replace(/Key/g,"").replace(/Digit/g,""),N=u.toastCount>0;y.useEffect(()=>{const R=I=>{var _;s.length!==0&&s.every(j=>I[j]||I.code===j)&&((_=v.current)==null||_.focus())};return document.addEventListener("keydown",R),()=>document.removeEventListener("keydown",R)},[s]),y.useEffect(()=>{const R=f.current,I=v.current;if(N&&R&&I){const T=()=>{if(!u.isClosePausedRef.current){const V=new CustomEvent(Ng);I.dispatchEvent(V),u.isClosePausedRef.current=!0}},_=()=>{if(u.isClosePausedRef.current){const V=new CustomEvent(Rg);I.dispatchEvent(V),u.isClosePausedRef.current=!1}},j=V=>{!R.contains(V.relatedTarget)&&_()},C=()=>{R.contains(document.activeElement)||_()};return R.addEventListener("focusin",T),R.addEventListener("focusout",j),R.addEventListener("pointermove",T),R.addEventListener("pointerleave",C),window.addEventListener("blur",T),window.addEventListener("focus",_),()=>{R.removeEventListener("focusin",T),R.removeEventListener("focusout",j),R.removeEventListener("pointermove",T),R.removeEventListener("pointerleave",C),window.removeEventListener("blur",T),window.removeEventListener("focus",_)}}},[N,u.isClosePausedRef]);const S=y.useCallback(({tabbingDirection:R})=>{const T=d().map(_=>{const j=_.ref.current,C=[j,...PF(j)];return R==="forwards"?C:C.reverse()});return(R==="forwards"?T.reverse():T).flat()},[d]);return y.useEffect(()=>{const R=v.current;if(R){const I=T=>{var C,V,L;const _=T.altKey||T.ctrlKey||T.metaKey;if(T.key==="Tab"&&!_){const X=document.activeElement,M=T.shiftKey;if(T.target===R&&M){(C=p.current)==null||C.focus();return}const D=S({tabbingDirection:M?"backwards":"forwards"}),J=D.findIndex(O=>O===X);Tm(D.slice(J+1))?T.preventDefault():M?(V=p.current)==null||V.focus():(L=b.current)==null||L.focus()}};return R.addEventListener("keydown",I),()=>R.removeEventListener("keydown",I)}},[d,S]),m.jsxs($O,{ref:f,role:"region","aria-label":l.replace("{hotkey}",x),tabIndex:-1,style:{pointerEvents:N?void 0:"none"},children:[N&&m.jsx(Tg,{ref:p,onFocusFromOutsideViewport:()=>{const R=S({tabbingDirection:"forwards"});Tm(R)}}),m.jsx(gb.Slot,{scope:a,children:m.jsx(Ye.ol,{tabIndex:-1,...o,ref:A})}),N&&m.jsx(Tg,{ref:b,onFocusFromOutsideViewport:()=>{const R=S({tabbingDirection:"backwards"});Tm(R)}})]})});qT.displayName=$T;var ew="ToastFocusProxy",Tg=y.forwardRef((e,t)=>{const{__scopeToast:a,onFocusFromOutsideViewport:s,...l}=e,o=Bf(ew,a);return m.jsx(Oc,{"aria-hidden":!0,tabIndex:0,...l,ref:t,style:{position:"fixed"},onFocus:u=>{var p;const d=u.relatedTarget;!((p=o.viewport)!=null&&p.contains(d))&&s()}})});Tg.displayName=ew;var Uf="Toast",DF="toast.swipeStart",IF="toast.swipeMove",_F="toast.swipeCancel",kF="toast.swipeEnd",tw=y.forwardRef((e,t)=>{const{forceMount:a,open:s,defaultOpen:l,onOpenChange:o,...u}=e,[d=!0,f]=pa({prop:s,defaultProp:l,onChange:o});return m.jsx(rr,{present:a||d,children:m.jsx(BF,{open:d,...u,ref:t,onClose:()=>f(!1),onPause:Mn(e.onPause),onResume:Mn(e.onResume),onSwipeStart:We(e.onSwipeStart,p=>{p.currentTarget.setAttribute("data-swipe","start")}),onSwipeMove:We(e.onSwipeMove,p=>{const{x:b,y:v}=p.detail.delta;p.currentTarget.setAttribute("data-swipe","move"),p.currentTarget.style.setProperty("--radix-toast-swipe-move-x",`${b}px`),p.currentTarget.style.setProperty("--radix-toast-swipe-move-y",`${v}px`)}),onSwipeCancel:We(e.onSwipeCancel,p=>{p.currentTarget.setAttribute("data-swipe","cancel"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),p.currentTarget.style.removeProperty("--radix-toast-swipe-end-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-end-y")}),onSwipeEnd:We(e.onSwipeEnd,p=>{const{x:b,y:v}=p.detail.delta;p.currentTarget.setAttribute("data-swipe","end"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),p.currentTarget.style.setProperty("--radix-toast-swipe-end-x",`${b}px`),p.currentTarget.style.setProperty("--radix-toast-swipe-end-y",`${v}px`),f(!1)})})})});tw.displayName=Uf;var[VF,OF]=HT(Uf,{onClose(){}}),BF=y.forwardRef((e,t)=>{const{__scopeToast:a,type:s="foreground",duration:l,open:o,onClose:u,onEscapeKeyDown:d,onPause:f,onResume:p,onSwipeStart:b,onSwipeMove:v,onSwipeCancel:A,onSwipeEnd:x,...N}=e,S=Bf(Uf,a),[R,I]=y.useState(null),T=gt(t,O=>I(O)),_=y.useRef(null),j=y.useRef(null),C=l||S.duration,V=y.useRef(0),L=y.useRef(C),X=y.useRef(0),{onToastAdd:M,onToastRemove:Z}=S,U=Mn(()=>{var K;(R==null?void 0:R.contains(document.activeElement))&&((K=S.viewport)==null||K.focus()),u()}),D=y.useCallback(O=>{!O||O===1/0||(window.clearTimeout(X.current),V.current=new Date().getTime(),X.current=window.setTimeout(U,O))},[U]);y.useEffect(()=>{const O=S.viewport;if(O){const K=()=>{D(L.current),p==null||p()},P=()=>{const q=new Date().getTime()-V.current;L.current=L.current-q,window.clearTimeout(X.current),f==null||f()};return O.addEventListener(Ng,P),O.addEventListener(Rg,K),()=>{O.removeEventListener(Ng,P),O.removeEventListener(Rg,K)}}},[S.viewport,C,f,p,D]),y.useEffect(()=>{o&&!S.isClosePausedRef.current&&D(C)},[o,C,S.isClosePausedRef,D]),y.useEffect(()=>(M(),()=>Z()),[M,Z]);const J=y.useMemo(()=>R?ow(R):null,[R]);return S.viewport?m.jsxs(m.Fragment,{children:[J&&m.jsx(UF,{__scopeToast:a,role:"status","aria-live":s==="foreground"?"assertive":"polite","aria-atomic":!0,children:J}),m.jsx(VF,{scope:a,onClose:U,children:Ds.createPortal(m.jsx(gb.ItemSlot,{scope:a,children:m.jsx(JO,{asChild:!0,onEscapeKeyDown:We(d,()=>{S.isFocusedToastEscapeKeyDownRef.current||U(),S.isFocusedToastEscapeKeyDownRef.current=!1}),children:m.jsx(Ye.li,{role:"status","aria-live":"off","aria-atomic":!0,tabIndex:0,"data-state":o?"open":"closed","data-swipe-direction":S.swipeDirection,...N,ref:T,style:{userSelect:"none",touchAction:"none",...e.style},onKeyDown:We(e.onKeyDown,O=>{O.key==="Escape"&&(d==null||d(O.nativeEvent),O.nativeEvent.defaultPrevented||(S.isFocusedToastEscapeKeyDownRef.current=!0,U()))}),onPointerDown:We(e.onPointerDown,O=>{O.button===0&&(_.current={x:O.clientX,y:O.clientY})}),onPointerMove:We(e.onPointerMove,O=>{if(!_.current)return;const K=O.clientX-_.current.x,P=O.clientY-_.current.y,q=!!j.current,le=["left","right"].includes(S.swipeDirection),me=["left","up"].includes(S.swipeDirection)?Math.min:Math.max,F=le?me(0,K):0,fe=le?0:me(0,P),Y=O.pointerType==="touch"?10:2,ae={x:F,y:fe},ue={originalEvent:O,delta:ae};q?(j.current=ae,gd(IF,v,ue,{discrete:!1})):Yx(ae,S.swipeDirection,Y)?(j.current=ae,gd(DF,b,ue,{discrete:!1}),O.target.setPointerCapture(O.pointerId)):(Math.abs(K)>Y||Math.abs(P)>Y)&&(_.current=null)}),onPointerUp:We(e.onPointerUp,O=>{const K=j.current,P=O.target;if(P.hasPointerCapture(O.pointerId)&&P.releasePointerCapture(O.pointerId),j.current=null,_.current=null,K){const q=O.currentTarget,le={originalEvent:O,delta:K};Yx(K,S.swipeDirection,S.swipeThreshold)?gd(kF,x,le,{discrete:!0}):gd(_F,A,le,{discrete:!0}),q.addEventListener("click",me=>me.preventDefault(),{once:!0})}})})})}),S.viewport)})]}):null}),UF=e=>{const{__scopeToast:t,children:a,...s}=e,l=Bf(Uf,t),[o,u]=y.useState(!1),[d,f]=y.useState(!1);return FF(()=>u(!0)),y.useEffect(()=>{const p=window.setTimeout(()=>f(!0),1e3);return()=>window.clearTimeout(p)},[]),d?null:m.jsx(Vc,{asChild:!0,children:m.jsx(Oc,{...s,children:o&&m.jsxs(m.Fragment,{children:[l.label," ",a]})})})},MF="ToastTitle",nw=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e;return m.jsx(Ye.div,{...s,ref:t})});nw.displayName=MF;var GF="ToastDescription",aw=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e;return m.jsx(Ye.div,{...s,ref:t})});aw.displayName=GF;var rw="ToastAction",sw=y.forwardRef((e,t)=>{const{altText:a,...s}=e;return a.trim()?m.jsx(lw,{altText:a,asChild:!0,children:m.jsx(bb,{...s,ref:t})}):(console.error(`Invalid prop \`altText\` supplied to \`${rw}\`. Expected non-empty \`string\`.`),null)});sw.displayName=rw;var iw="ToastClose",bb=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e,l=OF(iw,a);return m.jsx(lw,{asChild:!0,children:m.jsx(Ye.button,{type:"button",...s,ref:t,onClick:We(e.onClick,l.onClose)})})});bb.displayName=iw;var lw=y.forwardRef((e,t)=>{const{__scopeToast:a,altText:s,...l}=e;return m.jsx(Ye.div,{"data-radix-toast-announce-exclude":"","data-radix-toast-announce-alt":s||void 0,...l,ref:t})});function ow(e){const t=[];return Array.from(e.childNodes).forEach(s=>{if(s.nodeType===s.TEXT_NODE&&s.textContent&&t.push(s.textContent),LF(s)){const l=s.ariaHidden||s.hidden||s.style.display==="none",o=s.dataset.radixToastAnnounceExclude==="";if(!l)if(o){const u=s.dataset.radixToastAnnounceAlt;u&&t.push(u)}else t.push(...ow(s))}}),t}function gd(e,t,a,{discrete:s}){const l=a.originalEvent.currentTarget,o=new CustomEvent(e,{bubbles:!0,cancelable:!0,detail:a});t&&l.addEventListener(e,t,{once:!0}),s?o2(l,o):l.dispatchEvent(o)}var Yx=(e,t,a=0)=>{const s=Math.abs(e.x),l=Math.abs(e.y),o=s>l;return t==="left"||t==="right"?o&&s>a:!o&&l>a};function FF(e=()=>{}){const t=Mn(e);hn(()=>{let a=0,s=0;return a=window.requestAnimationFrame(()=>s=window.requestAnimationFrame(t)),()=>{window.cancelAnimationFrame(a),window.cancelAnimationFrame(s)}},[t])}function LF(e){return e.nodeType===e.ELEMENT_NODE}function PF(e){const t=[],a=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:s=>{const l=s.tagName==="INPUT"&&s.type==="hidden";return s.disabled||s.hidden||l?NodeFilter.FILTER_SKIP:s.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;a.nextNode();)t.push(a.currentNode);return t}function Tm(e){const t=document.activeElement;return e.some(a=>a===t?!0:(a.focus(),document.activeElement!==t))}var jF=JT,cw=qT,uw=tw,dw=nw,fw=aw,hw=sw,pw=bb;const ZF=jF,mw=y.forwardRef(({className:e,...t},a)=>m.jsx(cw,{ref:a,className:Xe("fixed top-0 z-100 flex max-h-screen w-full flex-col-reverse p-4 sm:bottom-24 sm:right-6 sm:top-auto sm:flex-col md:max-w-[420px]",e),...t}));mw.displayName=cw.displayName;const YF=T0("group pointer-events-auto relative flex w-full items-center justify-between space-x-4 overflow-hidden rounded-md border p-6 pr-8 shadow-lg transition-all data-[swipe=cancel]:translate-x-0 data-[swipe=end]:translate-x-[var(--radix-toast-swipe-end-x)] data-[swipe=move]:translate-x-[var(--radix-toast-swipe-move-x)] data-[swipe=move]:transition-none data-[state=open]:animate-in data-[state=closed]:animate-out data-[swipe=end]:animate-out data-[state=closed]:fade-out-80 data-[state=closed]:slide-out-to-right-full data-[state=open]:slide-in-from-top-full sm:data-[state=open]:slide-in-from-bottom-full",{variants:{variant:{default:"border bg-backgound-primary text-foreground dark:bg-white dark:border-slate-600 dark:text-slate-900",destructive:"group destructive bg-red-600 text-white dark:border-red-900 dark:bg-red-900 dark:text-red-50"}},defaultVariants:{variant:"default"}}),gw=y.forwardRef(({className:e,variant:t,...a},s)=>m.jsx(uw,{ref:s,className:Xe(YF({variant:t}),e),...a}));gw.displayName=uw.displayName;const KF=y.forwardRef(({className:e,...t},a)=>m.jsx(hw,{ref:a,className:Xe("inline-flex h-8 shrink-0 items-center justify-center rounded-md border bg-transparent px-3 text-sm font-medium ring-offset-background transition-colors hover:bg-secondary focus:outline-hidden focus:ring-2 focus:ring-ring focus:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 group-[.destructive]:border-muted/40 hover:group-[.destructive]:border-destructive/30 hover:group-[.destructive]:bg-destructive hover:group-[.destructive]:text-destructive-foreground focus:group-[.destructive]:ring-destructive",e),...t}));KF.displayName=hw.displayName;const bw=y.forwardRef(({className:e,...t},a)=>m.jsx(pw,{ref:a,className:Xe("absolute right-2 top-2 rounded-md p-1 text-foreground/50 opacity-0 transition-opacity hover:text-foreground focus:opacity-100 focus:outline-hidden focus:ring-2 group-hover:opacity-100 group-[.destructive]:text-red-300 hover:group-[.destructive]:text-red-50 focus:group-[.destructive]:ring-red-400 focus:group-[.destructive]:ring-offset-red-600 text-black",e),"toast-close":"",...t,children:m.jsx(k2,{className:"h-4 w-4"})}));bw.displayName=pw.displayName;const vw=y.forwardRef(({className:e,...t},a)=>m.jsx(dw,{ref:a,className:Xe("text-sm font-semibold",e),...t}));vw.displayName=dw.displayName;const yw=y.forwardRef(({className:e,...t},a)=>m.jsx(fw,{ref:a,className:Xe("text-sm opacity-90",e),...t}));yw.displayName=fw.displayName;function XF(){const{toasts:e}=Zc();return m.jsxs(ZF,{children:[e.map(({id:t,title:a,description:s,action:l,duration:o,...u})=>m.jsxs(gw,{...u,duration:o,className:"flex flex-col gap-4",children:[m.jsxs("div",{className:"grid gap-1",children:[a&&m.jsx(vw,{children:a}),s&&m.jsx(yw,{children:s})]}),l,m.jsx(bw,{})]},t)),m.jsx(mw,{})]})}const WF=()=>{const{setConnectDialogOpen:e,setSelectedDevice:t}=In(),{getDevices:a}=Cs(),s=y.useMemo(()=>a(),[a]);return m.jsx(m.Fragment,{children:m.jsxs("div",{className:"flex flex-col gap-3 p-3",children:[m.jsx("div",{className:"flex items-center justify-between",children:m.jsxs("div",{className:"space-y-1",children:[m.jsx(Vl,{as:"h3",children:"Connected Devices"}),m.jsx(Ua,{children:"Manage, connect and disconnect devices"})]})}),m.jsx(Tc,{}),m.jsx("div",{className:"flex h-[450px] rounded-md border border-dashed border-slate-200 p-3 dark:border-slate-700",children:s.length?m.jsx("ul",{className:"grow divide-y divide-slate-200",children:s.map(l=>{var o,u,d,f,p;return m.jsx("li",{children:m.jsx("button",{type:"button",className:"w-full px-4 py-4 sm:px-6",onClick:()=>{t(l.id)},children:m.jsxs("div",{className:"flex items-center justify-between",children:[m.jsx("p",{className:"truncate text-sm font-medium text-accent",children:((u=(o=l.nodes.get(l.hardware.myNodeNum))==null?void 0:o.user)==null?void 0:u.longName)??"UNK"}),m.jsxs("div",{className:"inline-flex w-24 justify-center gap-2 rounded-full bg-slate-100 py-1 text-xs font-semibold text-slate-900 transition-colors hover:bg-slate-700 hover:text-slate-50",children:[((d=l.connection)==null?void 0:d.connType)==="ble"&&m.jsxs(m.Fragment,{children:[m.jsx(tV,{size:16}),"BLE"]}),((f=l.connection)==null?void 0:f.connType)==="serial"&&m.jsxs(m.Fragment,{children:[m.jsx(UO,{size:16}),"Serial"]}),((p=l.connection)==null?void 0:p.connType)==="http"&&m.jsxs(m.Fragment,{children:[m.jsx(sO,{size:16}),"Network"]})]}),m.jsx("div",{className:"mt-2 sm:flex sm:justify-between",children:m.jsxs("div",{className:"flex gap-2 text-sm text-slate-500",children:[m.jsx(i0,{size:20,className:"text-slate-400","aria-hidden":"true"}),l.nodes.size===0?0:l.nodes.size-1]})})]})})},l.id)})}):m.jsxs("div",{className:"m-auto flex flex-col gap-3 text-center",children:[m.jsx(YV,{size:48,className:"mx-auto text-text-secondary"}),m.jsx(Vl,{as:"h3",children:"No Devices"}),m.jsx(Ua,{children:"Connect at least one device to get started"}),m.jsxs(pt,{className:"gap-2 dark:bg-white dark:text-slate-900 dark:hover:text-slate-100",variant:"default",onClick:()=>e(!0),children:[m.jsx(r0,{size:16}),"New Connection"]})]})})]})})},zF=()=>{const{getDevice:e}=Cs(),{selectedDevice:t,setConnectDialogOpen:a,connectDialogOpen:s}=In(),l=e(t);return m.jsxs(N0,{FallbackComponent:R0,children:[m.jsx(gF,{open:s,onOpenChange:o=>{a(o)}}),m.jsx(XF,{}),m.jsx(Z_,{device:l,children:m.jsx("div",{className:"flex h-screen flex-col overflow-hidden bg-background-primary text-text-primary",children:m.jsxs("div",{className:"flex grow",children:[m.jsx(fG,{}),m.jsx("div",{className:"flex grow flex-col",children:l?m.jsxs("div",{className:"flex h-screen w-full",children:[m.jsx(nF,{}),m.jsx(NF,{}),m.jsx(oG,{}),m.jsx(t5,{children:m.jsx(B9,{})})]}):m.jsxs(m.Fragment,{children:[m.jsx(WF,{}),m.jsx(S0,{})]})})]})})})]})},QF=document.getElementById("root"),HF=OD.createRoot(QF);TD();HF.render(m.jsx(y.StrictMode,{children:m.jsx(zF,{})}));export{Xx as g};
+`}return te.substring(0,te.length-1)},K.renderTo2dContext=function(W,ee){ee=ee||2;for(var Q=K.getModuleCount(),se=0;se<Q;se++)for(var ce=0;ce<Q;ce++)W.fillStyle=K.isDark(se,ce)?"black":"white",W.fillRect(se*ee,ce*ee,ee,ee)},K};s.stringToBytesFuncs={default:function(C){for(var V=[],L=0;L<C.length;L+=1){var X=C.charCodeAt(L);V.push(X&255)}return V}},s.stringToBytes=s.stringToBytesFuncs.default,s.createStringToBytes=function(C,V){var L=function(){for(var M=T(C),Z=function(){var me=M.read();if(me==-1)throw"eof";return me},U=0,D={};;){var J=M.read();if(J==-1)break;var O=Z(),K=Z(),P=Z(),q=String.fromCharCode(J<<8|O),le=K<<8|P;D[q]=le,U+=1}if(U!=V)throw U+" != "+V;return D}(),X=63;return function(M){for(var Z=[],U=0;U<M.length;U+=1){var D=M.charCodeAt(U);if(D<128)Z.push(D);else{var J=L[M.charAt(U)];typeof J=="number"?(J&255)==J?Z.push(J):(Z.push(J>>>8),Z.push(J&255)):Z.push(X)}}return Z}};var l={MODE_NUMBER:1,MODE_ALPHA_NUM:2,MODE_8BIT_BYTE:4,MODE_KANJI:8},o={L:1,M:0,Q:3,H:2},u={PATTERN000:0,PATTERN001:1,PATTERN010:2,PATTERN011:3,PATTERN100:4,PATTERN101:5,PATTERN110:6,PATTERN111:7},d=function(){var C=[[],[6,18],[6,22],[6,26],[6,30],[6,34],[6,22,38],[6,24,42],[6,26,46],[6,28,50],[6,30,54],[6,32,58],[6,34,62],[6,26,46,66],[6,26,48,70],[6,26,50,74],[6,30,54,78],[6,30,56,82],[6,30,58,86],[6,34,62,90],[6,28,50,72,94],[6,26,50,74,98],[6,30,54,78,102],[6,28,54,80,106],[6,32,58,84,110],[6,30,58,86,114],[6,34,62,90,118],[6,26,50,74,98,122],[6,30,54,78,102,126],[6,26,52,78,104,130],[6,30,56,82,108,134],[6,34,60,86,112,138],[6,30,58,86,114,142],[6,34,62,90,118,146],[6,30,54,78,102,126,150],[6,24,50,76,102,128,154],[6,28,54,80,106,132,158],[6,32,58,84,110,136,162],[6,26,54,82,110,138,166],[6,30,58,86,114,142,170]],V=1335,L=7973,X=21522,M={},Z=function(U){for(var D=0;U!=0;)D+=1,U>>>=1;return D};return M.getBCHTypeInfo=function(U){for(var D=U<<10;Z(D)-Z(V)>=0;)D^=V<<Z(D)-Z(V);return(U<<10|D)^X},M.getBCHTypeNumber=function(U){for(var D=U<<12;Z(D)-Z(L)>=0;)D^=L<<Z(D)-Z(L);return U<<12|D},M.getPatternPosition=function(U){return C[U-1]},M.getMaskFunction=function(U){switch(U){case u.PATTERN000:return function(D,J){return(D+J)%2==0};case u.PATTERN001:return function(D,J){return D%2==0};case u.PATTERN010:return function(D,J){return J%3==0};case u.PATTERN011:return function(D,J){return(D+J)%3==0};case u.PATTERN100:return function(D,J){return(Math.floor(D/2)+Math.floor(J/3))%2==0};case u.PATTERN101:return function(D,J){return D*J%2+D*J%3==0};case u.PATTERN110:return function(D,J){return(D*J%2+D*J%3)%2==0};case u.PATTERN111:return function(D,J){return(D*J%3+(D+J)%2)%2==0};default:throw"bad maskPattern:"+U}},M.getErrorCorrectPolynomial=function(U){for(var D=p([1],0),J=0;J<U;J+=1)D=D.multiply(p([1,f.gexp(J)],0));return D},M.getLengthInBits=function(U,D){if(1<=D&&D<10)switch(U){case l.MODE_NUMBER:return 10;case l.MODE_ALPHA_NUM:return 9;case l.MODE_8BIT_BYTE:return 8;case l.MODE_KANJI:return 8;default:throw"mode:"+U}else if(D<27)switch(U){case l.MODE_NUMBER:return 12;case l.MODE_ALPHA_NUM:return 11;case l.MODE_8BIT_BYTE:return 16;case l.MODE_KANJI:return 10;default:throw"mode:"+U}else if(D<41)switch(U){case l.MODE_NUMBER:return 14;case l.MODE_ALPHA_NUM:return 13;case l.MODE_8BIT_BYTE:return 16;case l.MODE_KANJI:return 12;default:throw"mode:"+U}else throw"type:"+D},M.getLostPoint=function(U){for(var D=U.getModuleCount(),J=0,O=0;O<D;O+=1)for(var K=0;K<D;K+=1){for(var P=0,q=U.isDark(O,K),le=-1;le<=1;le+=1)if(!(O+le<0||D<=O+le))for(var me=-1;me<=1;me+=1)K+me<0||D<=K+me||le==0&&me==0||q==U.isDark(O+le,K+me)&&(P+=1);P>5&&(J+=3+P-5)}for(var O=0;O<D-1;O+=1)for(var K=0;K<D-1;K+=1){var F=0;U.isDark(O,K)&&(F+=1),U.isDark(O+1,K)&&(F+=1),U.isDark(O,K+1)&&(F+=1),U.isDark(O+1,K+1)&&(F+=1),(F==0||F==4)&&(J+=3)}for(var O=0;O<D;O+=1)for(var K=0;K<D-6;K+=1)U.isDark(O,K)&&!U.isDark(O,K+1)&&U.isDark(O,K+2)&&U.isDark(O,K+3)&&U.isDark(O,K+4)&&!U.isDark(O,K+5)&&U.isDark(O,K+6)&&(J+=40);for(var K=0;K<D;K+=1)for(var O=0;O<D-6;O+=1)U.isDark(O,K)&&!U.isDark(O+1,K)&&U.isDark(O+2,K)&&U.isDark(O+3,K)&&U.isDark(O+4,K)&&!U.isDark(O+5,K)&&U.isDark(O+6,K)&&(J+=40);for(var fe=0,K=0;K<D;K+=1)for(var O=0;O<D;O+=1)U.isDark(O,K)&&(fe+=1);var Y=Math.abs(100*fe/D/D-50)/5;return J+=Y*10,J},M}(),f=function(){for(var C=new Array(256),V=new Array(256),L=0;L<8;L+=1)C[L]=1<<L;for(var L=8;L<256;L+=1)C[L]=C[L-4]^C[L-5]^C[L-6]^C[L-8];for(var L=0;L<255;L+=1)V[C[L]]=L;var X={};return X.glog=function(M){if(M<1)throw"glog("+M+")";return V[M]},X.gexp=function(M){for(;M<0;)M+=255;for(;M>=256;)M-=255;return C[M]},X}();function p(C,V){if(typeof C.length>"u")throw C.length+"/"+V;var L=function(){for(var M=0;M<C.length&&C[M]==0;)M+=1;for(var Z=new Array(C.length-M+V),U=0;U<C.length-M;U+=1)Z[U]=C[U+M];return Z}(),X={};return X.getAt=function(M){return L[M]},X.getLength=function(){return L.length},X.multiply=function(M){for(var Z=new Array(X.getLength()+M.getLength()-1),U=0;U<X.getLength();U+=1)for(var D=0;D<M.getLength();D+=1)Z[U+D]^=f.gexp(f.glog(X.getAt(U))+f.glog(M.getAt(D)));return p(Z,0)},X.mod=function(M){if(X.getLength()-M.getLength()<0)return X;for(var Z=f.glog(X.getAt(0))-f.glog(M.getAt(0)),U=new Array(X.getLength()),D=0;D<X.getLength();D+=1)U[D]=X.getAt(D);for(var D=0;D<M.getLength();D+=1)U[D]^=f.gexp(f.glog(M.getAt(D))+Z);return p(U,0).mod(M)},X}var b=function(){var C=[[1,26,19],[1,26,16],[1,26,13],[1,26,9],[1,44,34],[1,44,28],[1,44,22],[1,44,16],[1,70,55],[1,70,44],[2,35,17],[2,35,13],[1,100,80],[2,50,32],[2,50,24],[4,25,9],[1,134,108],[2,67,43],[2,33,15,2,34,16],[2,33,11,2,34,12],[2,86,68],[4,43,27],[4,43,19],[4,43,15],[2,98,78],[4,49,31],[2,32,14,4,33,15],[4,39,13,1,40,14],[2,121,97],[2,60,38,2,61,39],[4,40,18,2,41,19],[4,40,14,2,41,15],[2,146,116],[3,58,36,2,59,37],[4,36,16,4,37,17],[4,36,12,4,37,13],[2,86,68,2,87,69],[4,69,43,1,70,44],[6,43,19,2,44,20],[6,43,15,2,44,16],[4,101,81],[1,80,50,4,81,51],[4,50,22,4,51,23],[3,36,12,8,37,13],[2,116,92,2,117,93],[6,58,36,2,59,37],[4,46,20,6,47,21],[7,42,14,4,43,15],[4,133,107],[8,59,37,1,60,38],[8,44,20,4,45,21],[12,33,11,4,34,12],[3,145,115,1,146,116],[4,64,40,5,65,41],[11,36,16,5,37,17],[11,36,12,5,37,13],[5,109,87,1,110,88],[5,65,41,5,66,42],[5,54,24,7,55,25],[11,36,12,7,37,13],[5,122,98,1,123,99],[7,73,45,3,74,46],[15,43,19,2,44,20],[3,45,15,13,46,16],[1,135,107,5,136,108],[10,74,46,1,75,47],[1,50,22,15,51,23],[2,42,14,17,43,15],[5,150,120,1,151,121],[9,69,43,4,70,44],[17,50,22,1,51,23],[2,42,14,19,43,15],[3,141,113,4,142,114],[3,70,44,11,71,45],[17,47,21,4,48,22],[9,39,13,16,40,14],[3,135,107,5,136,108],[3,67,41,13,68,42],[15,54,24,5,55,25],[15,43,15,10,44,16],[4,144,116,4,145,117],[17,68,42],[17,50,22,6,51,23],[19,46,16,6,47,17],[2,139,111,7,140,112],[17,74,46],[7,54,24,16,55,25],[34,37,13],[4,151,121,5,152,122],[4,75,47,14,76,48],[11,54,24,14,55,25],[16,45,15,14,46,16],[6,147,117,4,148,118],[6,73,45,14,74,46],[11,54,24,16,55,25],[30,46,16,2,47,17],[8,132,106,4,133,107],[8,75,47,13,76,48],[7,54,24,22,55,25],[22,45,15,13,46,16],[10,142,114,2,143,115],[19,74,46,4,75,47],[28,50,22,6,51,23],[33,46,16,4,47,17],[8,152,122,4,153,123],[22,73,45,3,74,46],[8,53,23,26,54,24],[12,45,15,28,46,16],[3,147,117,10,148,118],[3,73,45,23,74,46],[4,54,24,31,55,25],[11,45,15,31,46,16],[7,146,116,7,147,117],[21,73,45,7,74,46],[1,53,23,37,54,24],[19,45,15,26,46,16],[5,145,115,10,146,116],[19,75,47,10,76,48],[15,54,24,25,55,25],[23,45,15,25,46,16],[13,145,115,3,146,116],[2,74,46,29,75,47],[42,54,24,1,55,25],[23,45,15,28,46,16],[17,145,115],[10,74,46,23,75,47],[10,54,24,35,55,25],[19,45,15,35,46,16],[17,145,115,1,146,116],[14,74,46,21,75,47],[29,54,24,19,55,25],[11,45,15,46,46,16],[13,145,115,6,146,116],[14,74,46,23,75,47],[44,54,24,7,55,25],[59,46,16,1,47,17],[12,151,121,7,152,122],[12,75,47,26,76,48],[39,54,24,14,55,25],[22,45,15,41,46,16],[6,151,121,14,152,122],[6,75,47,34,76,48],[46,54,24,10,55,25],[2,45,15,64,46,16],[17,152,122,4,153,123],[29,74,46,14,75,47],[49,54,24,10,55,25],[24,45,15,46,46,16],[4,152,122,18,153,123],[13,74,46,32,75,47],[48,54,24,14,55,25],[42,45,15,32,46,16],[20,147,117,4,148,118],[40,75,47,7,76,48],[43,54,24,22,55,25],[10,45,15,67,46,16],[19,148,118,6,149,119],[18,75,47,31,76,48],[34,54,24,34,55,25],[20,45,15,61,46,16]],V=function(M,Z){var U={};return U.totalCount=M,U.dataCount=Z,U},L={},X=function(M,Z){switch(Z){case o.L:return C[(M-1)*4+0];case o.M:return C[(M-1)*4+1];case o.Q:return C[(M-1)*4+2];case o.H:return C[(M-1)*4+3];default:return}};return L.getRSBlocks=function(M,Z){var U=X(M,Z);if(typeof U>"u")throw"bad rs block @ typeNumber:"+M+"/errorCorrectionLevel:"+Z;for(var D=U.length/3,J=[],O=0;O<D;O+=1)for(var K=U[O*3+0],P=U[O*3+1],q=U[O*3+2],le=0;le<K;le+=1)J.push(V(P,q));return J},L}(),v=function(){var C=[],V=0,L={};return L.getBuffer=function(){return C},L.getAt=function(X){var M=Math.floor(X/8);return(C[M]>>>7-X%8&1)==1},L.put=function(X,M){for(var Z=0;Z<M;Z+=1)L.putBit((X>>>M-Z-1&1)==1)},L.getLengthInBits=function(){return V},L.putBit=function(X){var M=Math.floor(V/8);C.length<=M&&C.push(0),X&&(C[M]|=128>>>V%8),V+=1},L},A=function(C){var V=l.MODE_NUMBER,L=C,X={};X.getMode=function(){return V},X.getLength=function(U){return L.length},X.write=function(U){for(var D=L,J=0;J+2<D.length;)U.put(M(D.substring(J,J+3)),10),J+=3;J<D.length&&(D.length-J==1?U.put(M(D.substring(J,J+1)),4):D.length-J==2&&U.put(M(D.substring(J,J+2)),7))};var M=function(U){for(var D=0,J=0;J<U.length;J+=1)D=D*10+Z(U.charAt(J));return D},Z=function(U){if("0"<=U&&U<="9")return U.charCodeAt(0)-48;throw"illegal char :"+U};return X},x=function(C){var V=l.MODE_ALPHA_NUM,L=C,X={};X.getMode=function(){return V},X.getLength=function(Z){return L.length},X.write=function(Z){for(var U=L,D=0;D+1<U.length;)Z.put(M(U.charAt(D))*45+M(U.charAt(D+1)),11),D+=2;D<U.length&&Z.put(M(U.charAt(D)),6)};var M=function(Z){if("0"<=Z&&Z<="9")return Z.charCodeAt(0)-48;if("A"<=Z&&Z<="Z")return Z.charCodeAt(0)-65+10;switch(Z){case" ":return 36;case"$":return 37;case"%":return 38;case"*":return 39;case"+":return 40;case"-":return 41;case".":return 42;case"/":return 43;case":":return 44;default:throw"illegal char :"+Z}};return X},N=function(C){var V=l.MODE_8BIT_BYTE,L=s.stringToBytes(C),X={};return X.getMode=function(){return V},X.getLength=function(M){return L.length},X.write=function(M){for(var Z=0;Z<L.length;Z+=1)M.put(L[Z],8)},X},S=function(C){var V=l.MODE_KANJI,L=s.stringToBytesFuncs.SJIS;if(!L)throw"sjis not supported.";(function(Z,U){var D=L(Z);if(D.length!=2||(D[0]<<8|D[1])!=U)throw"sjis not supported."})("友",38726);var X=L(C),M={};return M.getMode=function(){return V},M.getLength=function(Z){return~~(X.length/2)},M.write=function(Z){for(var U=X,D=0;D+1<U.length;){var J=(255&U[D])<<8|255&U[D+1];if(33088<=J&&J<=40956)J-=33088;else if(57408<=J&&J<=60351)J-=49472;else throw"illegal char at "+(D+1)+"/"+J;J=(J>>>8&255)*192+(J&255),Z.put(J,13),D+=2}if(D<U.length)throw"illegal char at "+(D+1)},M},R=function(){var C=[],V={};return V.writeByte=function(L){C.push(L&255)},V.writeShort=function(L){V.writeByte(L),V.writeByte(L>>>8)},V.writeBytes=function(L,X,M){X=X||0,M=M||L.length;for(var Z=0;Z<M;Z+=1)V.writeByte(L[Z+X])},V.writeString=function(L){for(var X=0;X<L.length;X+=1)V.writeByte(L.charCodeAt(X))},V.toByteArray=function(){return C},V.toString=function(){var L="";L+="[";for(var X=0;X<C.length;X+=1)X>0&&(L+=","),L+=C[X];return L+="]",L},V},I=function(){var C=0,V=0,L=0,X="",M={},Z=function(D){X+=String.fromCharCode(U(D&63))},U=function(D){if(!(D<0)){if(D<26)return 65+D;if(D<52)return 97+(D-26);if(D<62)return 48+(D-52);if(D==62)return 43;if(D==63)return 47}throw"n:"+D};return M.writeByte=function(D){for(C=C<<8|D&255,V+=8,L+=1;V>=6;)Z(C>>>V-6),V-=6},M.flush=function(){if(V>0&&(Z(C<<6-V),C=0,V=0),L%3!=0)for(var D=3-L%3,J=0;J<D;J+=1)X+="="},M.toString=function(){return X},M},T=function(C){var V=C,L=0,X=0,M=0,Z={};Z.read=function(){for(;M<8;){if(L>=V.length){if(M==0)return-1;throw"unexpected end of file./"+M}var D=V.charAt(L);if(L+=1,D=="=")return M=0,-1;if(D.match(/^\s$/))continue;X=X<<6|U(D.charCodeAt(0)),M+=6}var J=X>>>M-8&255;return M-=8,J};var U=function(D){if(65<=D&&D<=90)return D-65;if(97<=D&&D<=122)return D-97+26;if(48<=D&&D<=57)return D-48+52;if(D==43)return 62;if(D==47)return 63;throw"c:"+D};return Z},_=function(C,V){var L=C,X=V,M=new Array(C*V),Z={};Z.setPixel=function(O,K,P){M[K*L+O]=P},Z.write=function(O){O.writeString("GIF87a"),O.writeShort(L),O.writeShort(X),O.writeByte(128),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(0),O.writeByte(255),O.writeByte(255),O.writeByte(255),O.writeString(","),O.writeShort(0),O.writeShort(0),O.writeShort(L),O.writeShort(X),O.writeByte(0);var K=2,P=D(K);O.writeByte(K);for(var q=0;P.length-q>255;)O.writeByte(255),O.writeBytes(P,q,255),q+=255;O.writeByte(P.length-q),O.writeBytes(P,q,P.length-q),O.writeByte(0),O.writeString(";")};var U=function(O){var K=O,P=0,q=0,le={};return le.write=function(me,F){if(me>>>F)throw"length over";for(;P+F>=8;)K.writeByte(255&(me<<P|q)),F-=8-P,me>>>=8-P,q=0,P=0;q=me<<P|q,P=P+F},le.flush=function(){P>0&&K.writeByte(q)},le},D=function(O){for(var K=1<<O,P=(1<<O)+1,q=O+1,le=J(),me=0;me<K;me+=1)le.add(String.fromCharCode(me));le.add(String.fromCharCode(K)),le.add(String.fromCharCode(P));var F=R(),fe=U(F);fe.write(K,q);var Y=0,ae=String.fromCharCode(M[Y]);for(Y+=1;Y<M.length;){var ue=String.fromCharCode(M[Y]);Y+=1,le.contains(ae+ue)?ae=ae+ue:(fe.write(le.indexOf(ae),q),le.size()<4095&&(le.size()==1<<q&&(q+=1),le.add(ae+ue)),ae=ue)}return fe.write(le.indexOf(ae),q),fe.write(P,q),fe.flush(),F.toByteArray()},J=function(){var O={},K=0,P={};return P.add=function(q){if(P.contains(q))throw"dup key:"+q;O[q]=K,K+=1},P.size=function(){return K},P.indexOf=function(q){return O[q]},P.contains=function(q){return typeof O[q]<"u"},P};return Z},j=function(C,V,L){for(var X=_(C,V),M=0;M<V;M+=1)for(var Z=0;Z<C;Z+=1)X.setPixel(Z,M,L(Z,M));var U=R();X.write(U);for(var D=I(),J=U.toByteArray(),O=0;O<J.length;O+=1)D.writeByte(J[O]);return D.flush(),"data:image/gif;base64,"+D};return s}();(function(){a.stringToBytesFuncs["UTF-8"]=function(s){function l(o){for(var u=[],d=0;d<o.length;d++){var f=o.charCodeAt(d);f<128?u.push(f):f<2048?u.push(192|f>>6,128|f&63):f<55296||f>=57344?u.push(224|f>>12,128|f>>6&63,128|f&63):(d++,f=65536+((f&1023)<<10|o.charCodeAt(d)&1023),u.push(240|f>>18,128|f>>12&63,128|f>>6&63,128|f&63))}return u}return l(s)}})(),function(s){e.exports=s()}(function(){return a})}(Nm)),Nm.exports}var _x;function yG(){if(_x)return Ir;_x=1;var e=Ir&&Ir.__extends||function(){var u=function(d,f){return u=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(p,b){p.__proto__=b}||function(p,b){for(var v in b)Object.prototype.hasOwnProperty.call(b,v)&&(p[v]=b[v])},u(d,f)};return function(d,f){if(typeof f!="function"&&f!==null)throw new TypeError("Class extends value "+String(f)+" is not a constructor or null");u(d,f);function p(){this.constructor=d}d.prototype=f===null?Object.create(f):(p.prototype=f.prototype,new p)}}(),t=Ir&&Ir.__assign||function(){return t=Object.assign||function(u){for(var d,f=1,p=arguments.length;f<p;f++){d=arguments[f];for(var b in d)Object.prototype.hasOwnProperty.call(d,b)&&(u[b]=d[b])}return u},t.apply(this,arguments)};Object.defineProperty(Ir,"__esModule",{value:!0}),Ir.QRCode=void 0;var a=bG(),s=vG(),l=of(),o=function(u){e(d,u);function d(f){var p=u.call(this,f)||this;return p.canvasRef=l.createRef(),p}return d.prototype.download=function(f,p){if(this.canvasRef.current){var b=void 0;switch(f){case"jpg":b="image/jpeg";break;case"webp":b="image/webp";break;case"png":default:b="image/png";break}var v=this.canvasRef.current.toDataURL(b,1),A=document.createElement("a");A.download=p??"react-qrcode-logo",A.href=v,A.click()}},d.prototype.utf16to8=function(f){var p="",b,v,A=f.length;for(b=0;b<A;b++)v=f.charCodeAt(b),v>=1&&v<=127?p+=f.charAt(b):v>2047?(p+=String.fromCharCode(224|v>>12&15),p+=String.fromCharCode(128|v>>6&63),p+=String.fromCharCode(128|v>>0&63)):(p+=String.fromCharCode(192|v>>6&31),p+=String.fromCharCode(128|v>>0&63));return p},d.prototype.drawRoundedSquare=function(f,p,b,v,A,x,N,S){S.lineWidth=f,S.fillStyle=A,S.strokeStyle=A,b+=f/2,p+=f/2,v-=f,Array.isArray(x)||(x=[x,x,x,x]),x=x.map(function(j){return j=Math.min(j,v/2),j<0?0:j});var R=x[0]||0,I=x[1]||0,T=x[2]||0,_=x[3]||0;S.beginPath(),S.moveTo(p+R,b),S.lineTo(p+v-I,b),I&&S.quadraticCurveTo(p+v,b,p+v,b+I),S.lineTo(p+v,b+v-T),T&&S.quadraticCurveTo(p+v,b+v,p+v-T,b+v),S.lineTo(p+_,b+v),_&&S.quadraticCurveTo(p,b+v,p,b+v-_),S.lineTo(p,b+R),R&&S.quadraticCurveTo(p,b,p+R,b),S.closePath(),S.stroke(),N&&S.fill()},d.prototype.drawPositioningPattern=function(f,p,b,v,A,x,N){N===void 0&&(N=[0,0,0,0]);var S=Math.ceil(p),R,I;typeof N!="number"&&!Array.isArray(N)?(R=N.outer||0,I=N.inner||0):(R=N,I=R);var T,_;typeof x!="string"?(T=x.outer,_=x.inner):(T=x,_=x);var j=v*p+b,C=A*p+b,V=p*7;this.drawRoundedSquare(S,C,j,V,T,R,!1,f),V=p*3,j+=p*2,C+=p*2,this.drawRoundedSquare(S,C,j,V,_,I,!0,f)},d.prototype.isInPositioninZone=function(f,p,b){return b.some(function(v){return p>=v.row&&p<=v.row+7&&f>=v.col&&f<=v.col+7})},d.prototype.transformPixelLengthIntoNumberOfCells=function(f,p){return f/p},d.prototype.isCoordinateInImage=function(f,p,b,v,A,x,N,S){if(S){var R=2,I=this.transformPixelLengthIntoNumberOfCells(A,N),T=this.transformPixelLengthIntoNumberOfCells(x,N),_=this.transformPixelLengthIntoNumberOfCells(b,N)-1,j=this.transformPixelLengthIntoNumberOfCells(v,N)-1;return p>=I-R&&p<=I+_+R&&f>=T-R&&f<=T+j+R}else return!1},d.prototype.shouldComponentUpdate=function(f){return!a(this.props,f)},d.prototype.componentDidMount=function(){this.update()},d.prototype.componentDidUpdate=function(){this.update()},d.prototype.update=function(){var f,p=this.props,b=p.value,v=p.ecLevel,A=p.enableCORS,x=p.bgColor,N=p.fgColor,S=p.logoImage,R=p.logoOpacity,I=p.logoOnLoad,T=p.removeQrCodeBehindLogo,_=p.qrStyle,j=p.eyeRadius,C=p.eyeColor,V=p.logoPaddingStyle,L=+this.props.size,X=+this.props.quietZone,M=this.props.logoWidth?+this.props.logoWidth:0,Z=this.props.logoHeight?+this.props.logoHeight:0,U=this.props.logoPadding?+this.props.logoPadding:0,D=s(0,v);D.addData(this.utf16to8(b)),D.make();var J=(f=this.canvasRef)===null||f===void 0?void 0:f.current,O=J.getContext("2d"),K=L+2*X,P=D.getModuleCount(),q=L/P,le=window.devicePixelRatio||1;J.height=J.width=K*le,O.scale(le,le),O.fillStyle=x,O.fillRect(0,0,K,K);var me=X,F=[{row:0,col:0},{row:0,col:P-7},{row:P-7,col:0}];if(O.strokeStyle=N,_==="dots"){O.fillStyle=N;for(var fe=q/2,Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)&&(O.beginPath(),O.arc(Math.round(ae*q)+fe+me,Math.round(Y*q)+fe+me,fe/100*75,0,2*Math.PI,!1),O.closePath(),O.fill())}else if(_==="fluid"){for(var fe=Math.ceil(q/2),Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)if(D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)){var ue=[!1,!1,!1,!1];Y>0&&!D.isDark(Y-1,ae)&&ae>0&&!D.isDark(Y,ae-1)&&(ue[0]=!0),Y>0&&!D.isDark(Y-1,ae)&&ae<P-1&&!D.isDark(Y,ae+1)&&(ue[1]=!0),Y<P-1&&!D.isDark(Y+1,ae)&&ae<P-1&&!D.isDark(Y,ae+1)&&(ue[2]=!0),Y<P-1&&!D.isDark(Y+1,ae)&&ae>0&&!D.isDark(Y,ae-1)&&(ue[3]=!0);var de=Math.ceil((ae+1)*q)-Math.floor(ae*q),Se=Math.ceil((Y+1)*q)-Math.floor(Y*q);O.fillStyle=N,O.beginPath(),O.arc(Math.round(ae*q)+fe+me,Math.round(Y*q)+fe+me,fe,0,2*Math.PI,!1),O.closePath(),O.fill(),ue[0]||O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me,de/2,Se/2),ue[1]||O.fillRect(Math.round(ae*q)+me+Math.floor(de/2),Math.round(Y*q)+me,de/2,Se/2),ue[2]||O.fillRect(Math.round(ae*q)+me+Math.floor(de/2),Math.round(Y*q)+me+Math.floor(Se/2),de/2,Se/2),ue[3]||O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me+Math.floor(Se/2),de/2,Se/2)}}else for(var Y=0;Y<P;Y++)for(var ae=0;ae<P;ae++)if(D.isDark(Y,ae)&&!this.isInPositioninZone(Y,ae,F)){O.fillStyle=N;var de=Math.ceil((ae+1)*q)-Math.floor(ae*q),Se=Math.ceil((Y+1)*q)-Math.floor(Y*q);O.fillRect(Math.round(ae*q)+me,Math.round(Y*q)+me,de,Se)}for(var Ne=0;Ne<3;Ne++){var W=F[Ne],Y=W.row,ae=W.col,ee=j,Q=void 0;Array.isArray(ee)&&(ee=ee[Ne]),typeof ee=="number"&&(ee=[ee,ee,ee,ee]),C?Array.isArray(C)?Q=C[Ne]:Q=C:Q=N,this.drawPositioningPattern(O,q,me,Y,ae,Q,ee)}if(S){var se=new Image;A&&(se.crossOrigin="Anonymous"),se.onload=function(ce){O.save();var Re=M||L*.2,Oe=Z||Re,Ue=(L-Re)/2,$e=(L-Oe)/2;if(T||U){O.beginPath(),O.strokeStyle=x,O.fillStyle=x;var it=Re+2*U,B=Oe+2*U,te=Ue+me-U,oe=$e+me-U;if(V==="circle"){var ke=te+it/2,Ie=oe+B/2;O.ellipse(ke,Ie,it/2,B/2,0,0,2*Math.PI),O.stroke(),O.fill()}else O.fillRect(te,oe,it,B)}O.globalAlpha=R,O.drawImage(se,Ue+me,$e+me,Re,Oe),O.restore(),I&&I(ce)},se.src=S}},d.prototype.render=function(){var f,p=+this.props.size+2*+this.props.quietZone;return l.createElement("canvas",{id:(f=this.props.id)!==null&&f!==void 0?f:"react-qrcode-logo",height:p,width:p,style:t({height:p+"px",width:p+"px"},this.props.style),ref:this.canvasRef})},d.defaultProps={value:"https://reactjs.org/",ecLevel:"M",enableCORS:!1,size:150,quietZone:10,bgColor:"#FFFFFF",fgColor:"#000000",logoOpacity:1,qrStyle:"squares",eyeRadius:[0,0,0],logoPaddingStyle:"square"},d}(l.Component);return Ir.QRCode=o,Ir}var EG=yG();const AG=({open:e,onOpenChange:t,loraConfig:a,channels:s})=>{const[l,o]=y.useState([0]),[u,d]=y.useState(""),[f,p]=y.useState(),b=y.useMemo(()=>Array.from(s.values()),[s]);return y.useEffect(()=>{const v=b.filter(N=>l.includes(N.index)).map(N=>N.settings).filter(N=>!!N),A=Te(yd,Te(yd,{loraConfig:a,settings:v})),x=Qt.fromByteArray(Ze(yd,A)).replace(/=/g,"").replace(/\+/g,"-").replace(/\//g,"_");d(`https://meshtastic.org/e/${f?"?add=true":""}#${x}`)},[b,l,f,a]),m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Generate QR Code"}),m.jsx($n,{children:"The current LoRa configuration will also be shared."})]}),m.jsxs("div",{className:"grid gap-4 py-4",children:[m.jsxs("div",{className:"flex gap-3 px-4 py-5 sm:p-6",children:[m.jsx("div",{className:"flex w-40 flex-col gap-2",children:b.map(v=>{var A;return m.jsxs("div",{className:"flex justify-between",children:[m.jsx(Hn,{children:(A=v.settings)!=null&&A.name.length?v.settings.name:v.role===Ns.PRIMARY?"Primary":`Channel: ${v.index}`}),m.jsx(rb,{checked:l.includes(v.index),onCheckedChange:()=>{l.includes(v.index)?o(l.filter(x=>x!==v.index)):o([...l,v.index])}},v.index)]},v.index)})}),m.jsx(EG.QRCode,{value:u,size:200,qrStyle:"dots"})]}),m.jsxs("div",{className:"flex justify-center",children:[m.jsx("button",{type:"button",className:`border-slate-900 border-t border-l border-b rounded-l h-10 px-7 py-2 text-sm font-medium focus:outline-hidden focus:ring-2 focus:ring-offset-2 ${f?"focus:ring-green-800 bg-green-800 text-white":"focus:ring-slate-400 bg-slate-400 hover:bg-green-600"}`,onClick:()=>p(!0),children:"Add Channels"}),m.jsx("button",{type:"button",className:`border-slate-900 border-t border-r border-b rounded-r h-10 px-4 py-2 text-sm font-medium focus:outline-hidden focus:ring-2 focus:ring-offset-2 ${f?"focus:ring-slate-400 bg-slate-400 hover:bg-green-600":"focus:ring-green-800 bg-green-800 text-white"}`,onClick:()=>p(!1),children:"Replace Channels"})]})]}),m.jsxs(Pr,{children:[m.jsx(Hn,{children:"Sharable URL"}),m.jsx(Ga,{value:u,disabled:!0,className:"dark:text-slate-900",action:{icon:vV,onClick(){navigator.clipboard.writeText(u)}}})]})]})})},xG=({open:e,onOpenChange:t})=>{const{connection:a}=He(),[s,l]=y.useState(5);return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Schedule Reboot"}),m.jsx($n,{children:"Reboot the connected node after x minutes."})]}),m.jsxs("div",{className:"flex gap-2 p-4",children:[m.jsx(Ga,{type:"number",className:"dark:text-slate-900",value:s,onChange:o=>l(Number.parseInt(o.target.value)),action:{icon:N2,onClick(){a==null||a.reboot(s*60).then(()=>t(!1))}}}),m.jsxs(pt,{className:"w-24",onClick:()=>{a==null||a.reboot(2).then(()=>t(!1))},children:[m.jsx(tg,{className:"mr-2",size:16}),"Now"]})]})]})})},SG=({open:e,onOpenChange:t})=>{const{connection:a}=He(),[s,l]=y.useState(5);return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsxs(Sn,{children:[m.jsx(Nn,{children:"Schedule Shutdown"}),m.jsx($n,{children:"Turn off the connected node after x minutes."})]}),m.jsxs("div",{className:"flex gap-2 p-4",children:[m.jsx(Ga,{type:"number",value:s,onChange:o=>l(Number.parseInt(o.target.value)),className:"dark:text-slate-900",suffix:"Minutes"}),m.jsx(pt,{className:"w-24",onClick:()=>{a==null||a.shutdown(s*60).then(()=>t(!1))},children:m.jsx(N2,{size:16})}),m.jsxs(pt,{className:"w-24",onClick:()=>{a==null||a.shutdown(2).then(()=>()=>t(!1))},children:[m.jsx(D2,{className:"mr-2",size:16}),"Now"]})]})]})})};var sb="Collapsible",[NG,BT]=ba(sb),[RG,ib]=NG(sb),UT=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,open:s,defaultOpen:l,disabled:o,onOpenChange:u,...d}=e,[f=!1,p]=pa({prop:s,defaultProp:l,onChange:u});return m.jsx(RG,{scope:a,disabled:o,contentId:fn(),open:f,onOpenToggle:y.useCallback(()=>p(b=>!b),[p]),children:m.jsx(Ye.div,{"data-state":ob(f),"data-disabled":o?"":void 0,...d,ref:t})})});UT.displayName=sb;var MT="CollapsibleTrigger",GT=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,...s}=e,l=ib(MT,a);return m.jsx(Ye.button,{type:"button","aria-controls":l.contentId,"aria-expanded":l.open||!1,"data-state":ob(l.open),"data-disabled":l.disabled?"":void 0,disabled:l.disabled,...s,ref:t,onClick:We(e.onClick,l.onOpenToggle)})});GT.displayName=MT;var lb="CollapsibleContent",FT=y.forwardRef((e,t)=>{const{forceMount:a,...s}=e,l=ib(lb,e.__scopeCollapsible);return m.jsx(rr,{present:a||l.open,children:({present:o})=>m.jsx(TG,{...s,ref:t,present:o})})});FT.displayName=lb;var TG=y.forwardRef((e,t)=>{const{__scopeCollapsible:a,present:s,children:l,...o}=e,u=ib(lb,a),[d,f]=y.useState(s),p=y.useRef(null),b=gt(t,p),v=y.useRef(0),A=v.current,x=y.useRef(0),N=x.current,S=u.open||d,R=y.useRef(S),I=y.useRef(void 0);return y.useEffect(()=>{const T=requestAnimationFrame(()=>R.current=!1);return()=>cancelAnimationFrame(T)},[]),hn(()=>{const T=p.current;if(T){I.current=I.current||{transitionDuration:T.style.transitionDuration,animationName:T.style.animationName},T.style.transitionDuration="0s",T.style.animationName="none";const _=T.getBoundingClientRect();v.current=_.height,x.current=_.width,R.current||(T.style.transitionDuration=I.current.transitionDuration,T.style.animationName=I.current.animationName),f(s)}},[u.open,s]),m.jsx(Ye.div,{"data-state":ob(u.open),"data-disabled":u.disabled?"":void 0,id:u.contentId,hidden:!S,...o,ref:b,style:{"--radix-collapsible-content-height":A?`${A}px`:void 0,"--radix-collapsible-content-width":N?`${N}px`:void 0,...e.style},children:S&&l})});function ob(e){return e?"open":"closed"}var wG=UT,CG=GT,DG=FT,jr="Accordion",IG=["Home","End","ArrowDown","ArrowUp","ArrowLeft","ArrowRight"],[cb,_G,kG]=xf(jr),[Vf,xL]=ba(jr,[kG,BT]),ub=BT(),LT=ze.forwardRef((e,t)=>{const{type:a,...s}=e,l=s,o=s;return m.jsx(cb.Provider,{scope:e.__scopeAccordion,children:a==="multiple"?m.jsx(UG,{...o,ref:t}):m.jsx(BG,{...l,ref:t})})});LT.displayName=jr;var[PT,VG]=Vf(jr),[jT,OG]=Vf(jr,{collapsible:!1}),BG=ze.forwardRef((e,t)=>{const{value:a,defaultValue:s,onValueChange:l=()=>{},collapsible:o=!1,...u}=e,[d,f]=pa({prop:a,defaultProp:s,onChange:l});return m.jsx(PT,{scope:e.__scopeAccordion,value:d?[d]:[],onItemOpen:f,onItemClose:ze.useCallback(()=>o&&f(""),[o,f]),children:m.jsx(jT,{scope:e.__scopeAccordion,collapsible:o,children:m.jsx(ZT,{...u,ref:t})})})}),UG=ze.forwardRef((e,t)=>{const{value:a,defaultValue:s,onValueChange:l=()=>{},...o}=e,[u=[],d]=pa({prop:a,defaultProp:s,onChange:l}),f=ze.useCallback(b=>d((v=[])=>[...v,b]),[d]),p=ze.useCallback(b=>d((v=[])=>v.filter(A=>A!==b)),[d]);return m.jsx(PT,{scope:e.__scopeAccordion,value:u,onItemOpen:f,onItemClose:p,children:m.jsx(jT,{scope:e.__scopeAccordion,collapsible:!0,children:m.jsx(ZT,{...o,ref:t})})})}),[MG,Of]=Vf(jr),ZT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,disabled:s,dir:l,orientation:o="vertical",...u}=e,d=ze.useRef(null),f=gt(d,t),p=_G(a),v=Sf(l)==="ltr",A=We(e.onKeyDown,x=>{var X;if(!IG.includes(x.key))return;const N=x.target,S=p().filter(M=>{var Z;return!((Z=M.ref.current)!=null&&Z.disabled)}),R=S.findIndex(M=>M.ref.current===N),I=S.length;if(R===-1)return;x.preventDefault();let T=R;const _=0,j=I-1,C=()=>{T=R+1,T>j&&(T=_)},V=()=>{T=R-1,T<_&&(T=j)};switch(x.key){case"Home":T=_;break;case"End":T=j;break;case"ArrowRight":o==="horizontal"&&(v?C():V());break;case"ArrowDown":o==="vertical"&&C();break;case"ArrowLeft":o==="horizontal"&&(v?V():C());break;case"ArrowUp":o==="vertical"&&V();break}const L=T%I;(X=S[L].ref.current)==null||X.focus()});return m.jsx(MG,{scope:a,disabled:s,direction:l,orientation:o,children:m.jsx(cb.Slot,{scope:a,children:m.jsx(Ye.div,{...u,"data-orientation":o,ref:f,onKeyDown:s?void 0:A})})})}),tf="AccordionItem",[GG,db]=Vf(tf),YT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,value:s,...l}=e,o=Of(tf,a),u=VG(tf,a),d=ub(a),f=fn(),p=s&&u.value.includes(s)||!1,b=o.disabled||e.disabled;return m.jsx(GG,{scope:a,open:p,disabled:b,triggerId:f,children:m.jsx(wG,{"data-orientation":o.orientation,"data-state":QT(p),...d,...l,ref:t,disabled:b,open:p,onOpenChange:v=>{v?u.onItemOpen(s):u.onItemClose(s)}})})});YT.displayName=tf;var KT="AccordionHeader",FG=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(KT,a);return m.jsx(Ye.h3,{"data-orientation":l.orientation,"data-state":QT(o.open),"data-disabled":o.disabled?"":void 0,...s,ref:t})});FG.displayName=KT;var Ag="AccordionTrigger",XT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(Ag,a),u=OG(Ag,a),d=ub(a);return m.jsx(cb.ItemSlot,{scope:a,children:m.jsx(CG,{"aria-disabled":o.open&&!u.collapsible||void 0,"data-orientation":l.orientation,id:o.triggerId,...d,...s,ref:t})})});XT.displayName=Ag;var WT="AccordionContent",zT=ze.forwardRef((e,t)=>{const{__scopeAccordion:a,...s}=e,l=Of(jr,a),o=db(WT,a),u=ub(a);return m.jsx(DG,{role:"region","aria-labelledby":o.triggerId,"data-orientation":l.orientation,...u,...s,ref:t,style:{"--radix-accordion-content-height":"var(--radix-collapsible-content-height)","--radix-accordion-content-width":"var(--radix-collapsible-content-width)",...e.style}})});zT.displayName=WT;function QT(e){return e?"open":"closed"}var LG=LT,PG=YT,jG=XT,ZG=zT;const YG=LG,KG=PG,XG=y.forwardRef(({className:e,...t},a)=>m.jsxs(jG,{ref:a,className:Xe("flex justify-between items-center w-full p-4 border-b border-slat-200 dark:border-slat-800 group",e),...t,children:[t.children,m.jsx(t0,{className:"h-5 w-5 transition-transform duration-300 group-data-[state=open]:rotate-180","aria-hidden":!0})]})),WG=y.forwardRef(({className:e,...t},a)=>m.jsx(ZG,{ref:a,className:Xe("p-4 border-b border-slat-200 dark:border-slat-800",e),...t})),zG={DIY_V1:"diy.svg",NANO_G2_ULTRA:"nano-g2-ultra.svg",TBEAM:"tbeam.svg",HELTEC_HT62:"heltec-ht62-esp32c3-sx1262.svg",RPI_PICO:"pico.svg",T_DECK:"t-deck.svg",HELTEC_MESH_NODE_T114:"heltec-mesh-node-t114.svg",HELTEC_MESH_NODE_T114_CASE:"heltec-mesh-node-t114-case.svg",HELTEC_V3:"heltec-v3.svg",HELTEC_V3_CASE:"heltec-v3-case.svg",HELTEC_VISION_MASTER_E213:"heltec-vision-master-e213.svg",HELTEC_VISION_MASTER_E290:"heltec-vision-master-e290.svg",HELTEC_VISION_MASTER_T190:"heltec-vision-master-t190.svg",HELTEC_WIRELESS_PAPER:"heltec-wireless-paper.svg",HELTEC_WIRELESS_PAPER_V1_0:"heltec-wireless-paper-V1_0.svg",HELTEC_WIRELESS_TRACKER:"heltec-wireless-tracker.svg",HELTEC_WIRELESS_TRACKER_V1_0:"heltec-wireless-tracker-V1-0.svg",HELTEC_WSL_V3:"heltec-wsl-v3.svg",TLORA_C6:"tlora-c6.svg",TLORA_T3_S3:"tlora-t3s3-v1.svg",TLORA_T3_S3_EPAPER:"tlora-t3s3-epaper.svg",TLORA_V2:"tlora-v2-1-1_6.svg",TLORA_V2_1_1P6:"tlora-v2-1-1_6.svg",TLORA_V2_1_1P8:"tlora-v2-1-1_8.svg",RAK11310:"rak11310.svg",RAK2560:"rak2560.svg",RAK4631:"rak4631.svg",RAK4631_CASE:"rak4631_case.svg",WIO_WM1110:"wio-tracker-wm1110.svg",WM1110_DEV_KIT:"wm1110_dev_kit.svg",STATION_G2:"station-g2.svg",TBEAM_V0P7:"tbeam-s3-core.svg",T_ECHO:"t-echo.svg",TRACKER_T1000_E:"tracker-t1000-e.svg",T_WATCH_S3:"t-watch-s3.svg",SEEED_XIAO_S3:"seeed-xiao-s3.svg",SENSECAP_INDICATOR:"seeed-sensecap-indicator.svg",PROMICRO:"promicro.svg",RPIPICOW:"rpipicow.svg",UNKNOWN:"unknown.svg"},QG=({deviceType:e,className:t})=>{const a=l=>`/devices/${l}`,s=zG[e]||"unknown.svg";return m.jsx("img",{className:t,src:a(s),alt:s})},HG=e=>{const t=Math.floor(e/86400),a=Math.floor(e%86400/3600),s=Math.floor(e%86400%3600/60),l=Math.floor(e%86400%3600%60);return`${t}d ${a}h ${s}m ${l}s`},JG=({seconds:e})=>m.jsx("span",{children:HG(e)}),$G=({open:e,onOpenChange:t})=>{var u,d,f,p,b,v,A,x,N;const{nodes:a}=He(),{nodeNumDetails:s}=In(),l=a.get(s);if(!l)return null;const o=[{key:"airUtilTx",label:"Air TX utilization",value:(u=l.deviceMetrics)==null?void 0:u.airUtilTx,format:S=>`${S.toFixed(2)}%`},{key:"channelUtilization",label:"Channel utilization",value:(d=l.deviceMetrics)==null?void 0:d.channelUtilization,format:S=>`${S.toFixed(2)}%`},{key:"batteryLevel",label:"Battery level",value:(f=l.deviceMetrics)==null?void 0:f.batteryLevel,format:S=>`${S.toFixed(2)}%`},{key:"voltage",label:"Voltage",value:(p=l.deviceMetrics)==null?void 0:p.voltage,format:S=>`${S.toFixed(2)}V`}];return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsx(Sn,{children:m.jsxs(Nn,{children:["Node Details for ",((b=l.user)==null?void 0:b.longName)??"UNKNOWN"," (",((v=l.user)==null?void 0:v.shortName)??"UNK",")"]})}),m.jsx(Pr,{children:m.jsxs("div",{className:"w-full",children:[m.jsxs("div",{className:"flex flex-col",children:[m.jsx(QG,{className:"w-32 h-32 mx-auto rounded-lg border-4 border-slate-200 dark:border-slate-800",deviceType:_l[((A=l.user)==null?void 0:A.hwModel)??0]}),m.jsxs("div",{className:"bg-slate-100 text-slate-900 dark:text-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold",children:"Details:"}),m.jsxs("p",{children:["Hardware:"," ",_l[((x=l.user)==null?void 0:x.hwModel)??0]]}),m.jsxs("p",{children:["Node Number: ",l.num]}),m.jsxs("p",{children:["Node Hex: !",Cn(l.num)]}),m.jsxs("p",{children:["Role:"," ",Gd[((N=l.user)==null?void 0:N.role)??0]]}),m.jsxs("p",{children:["Last Heard:"," ",l.lastHeard===0?"Never":m.jsx(A0,{timestamp:l.lastHeard*1e3})]})]}),l.position&&m.jsxs("div",{className:"text-slate-900 dark:text-slate-100 bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold",children:"Position:"}),l.position.latitudeI&&l.position.longitudeI&&m.jsxs("p",{children:["Coordinates:"," ",m.jsxs("a",{className:"text-blue-500 dark:text-blue-400",href:`https://www.openstreetmap.org/?mlat=${l.position.latitudeI/1e7}&mlon=${l.position.longitudeI/1e7}&layers=N`,target:"_blank",rel:"noreferrer",children:[l.position.latitudeI/1e7,","," ",l.position.longitudeI/1e7]})]}),l.position.altitude&&m.jsxs("p",{children:["Altitude: ",l.position.altitude,"m"]})]}),l.deviceMetrics&&m.jsxs("div",{className:"text-slate-900 dark:text-slate-100 bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:[m.jsx("p",{className:"text-lg font-semibold text-slate-900 dark:text-slate-50",children:"Device Metrics:"}),o.map(S=>S.value!==void 0&&m.jsxs("p",{children:[S.label,": ",S.format(S.value)]},S.key)),l.deviceMetrics.uptimeSeconds&&m.jsxs("p",{children:["Uptime:"," ",m.jsx(JG,{seconds:l.deviceMetrics.uptimeSeconds})]})]})]}),m.jsx("div",{className:"text-slate-900 dark:text-slate-100 w-full max-w-[464px] bg-slate-100 dark:bg-slate-800 p-3 rounded-lg mt-3",children:m.jsx(YG,{className:"AccordionRoot",type:"single",collapsible:!0,children:m.jsxs(KG,{className:"AccordionItem",value:"item-1",children:[m.jsx(XG,{children:m.jsx("p",{className:"text-lg font-semibold text-slate-900 dark:text-slate-50",children:"All Raw Metrics:"})}),m.jsx(WG,{className:"overflow-x-scroll",children:m.jsx("pre",{className:"text-xs w-full",children:JSON.stringify(l,null,2)})})]})})})]})})]})})},qG=({open:e,onOpenChange:t})=>{const[a,s]=y.useState(!1),{setDialogOpen:l}=He(),o="https://meshtastic.org/docs/configuration/radio/device/",u="https://meshtastic.org/blog/choosing-the-right-device-role/",d=f=>{l("unsafeRoles",!1),s(!1),gg.emit("dialog:unsafeRoles",{action:f})};return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{className:"max-w-8 flex flex-col",children:[m.jsx(Dn,{onClick:()=>d("dismiss")}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Are you sure?"})}),m.jsxs($n,{className:"text-md",children:["I have read the ",m.jsx(Ul,{href:o,className:"",children:"Device Role Documentation"})," ","and the blog post about ",m.jsx(Ul,{href:u,children:"Choosing The Right Device Role"})," and understand the implications of changing the role."]}),m.jsx("div",{className:"flex items-center gap-2",children:m.jsx(rb,{id:"routerRole",checked:a,onChange:()=>s(!a),children:"Yes, I know what I'm doing"})}),m.jsxs(Pr,{className:"mt-6",children:[m.jsx(pt,{variant:"default",name:"dismiss",onClick:()=>d("dismiss"),children:" Dismiss"}),m.jsx(pt,{variant:"default",name:"confirm",disabled:!a,onClick:()=>d("confirm"),children:" Confirm"})]})]})})};function eF(){const{removeNode:e,setDialogOpen:t,clearNodeError:a,getNodeError:s}=He(),{activeChat:l}=In(),o=y.useCallback(()=>{const d=s(l);if(d)return a(l),u(),e(d==null?void 0:d.node)},[l,a,t,e]),u=y.useCallback(()=>{t("refreshKeys",!1)},[t]);return{handleCloseDialog:u,handleNodeRemove:o}}const tF=({open:e,onOpenChange:t})=>{const{handleCloseDialog:a,handleNodeRemove:s}=eF();return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{className:"max-w-8 flex flex-col gap-2",children:[m.jsx(Dn,{onClick:a}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Keys Mismatch"})}),"Your node is unable to send a direct message to this node. This is due to the remote node's current public key not matching the previously stored key for this node.",m.jsx("ul",{className:"mt-2",children:m.jsxs("li",{className:"flex place-items-center gap-2 items-start",children:[m.jsx("div",{className:"p-2 bg-slate-500 rounded-lg mt-1",children:m.jsx(T2,{size:30,className:"text-white justify-center"})}),m.jsxs("div",{className:"flex flex-col gap-2",children:[m.jsxs("div",{children:[m.jsx("p",{className:"font-bold mb-0.5",children:"Accept New Keys"}),m.jsx("p",{children:"This will remove the node from device and request new keys."})]}),m.jsx(pt,{variant:"default",onClick:s,className:"",children:"Request New Keys"}),m.jsx(pt,{variant:"outline",onClick:a,className:"",children:"Dismiss"})]})]})})]})})},nF=()=>{const{channels:e,config:t,dialog:a,setDialogOpen:s}=He();return m.jsxs(m.Fragment,{children:[m.jsx(AG,{open:a.QR,onOpenChange:l=>{s("QR",l)},channels:e,loraConfig:t.lora}),m.jsx(mG,{open:a.import,onOpenChange:l=>{s("import",l)},loraConfig:t.lora}),m.jsx(SG,{open:a.shutdown,onOpenChange:()=>{s("shutdown",!1)}}),m.jsx(xG,{open:a.reboot,onOpenChange:()=>{s("reboot",!1)}}),m.jsx(pG,{open:a.deviceName,onOpenChange:l=>{s("deviceName",l)}}),m.jsx(hG,{open:a.nodeRemoval,onOpenChange:l=>{s("nodeRemoval",l)}}),m.jsx(gG,{open:a.pkiBackup,onOpenChange:l=>{s("pkiBackup",l)}}),m.jsx($G,{open:a.nodeDetails,onOpenChange:l=>{s("nodeDetails",l)}}),m.jsx(qG,{open:a.unsafeRoles,onOpenChange:l=>{s("unsafeRoles",l)}}),m.jsx(tF,{open:a.refreshKeys,onOpenChange:l=>{s("refreshKeys",l)}})]})};function aF(){return y.useMemo(()=>[["Web Bluetooth",!!(navigator!=null&&navigator.bluetooth)],["Web Serial",!!(navigator!=null&&navigator.serial)],["Secure Context",globalThis.location.protocol==="https:"||globalThis.location.hostname==="localhost"]].reduce((a,[s,l])=>((l?a.supported:a.unsupported).push(s),a),{supported:[],unsupported:[]}),[])}const fb=(e,t)=>{let a=0;t.events.onDeviceMetadataPacket.subscribe(s=>{e.addMetadata(s.from,s.data)}),t.events.onRoutingPacket.subscribe(s=>{switch(s.data.variant.case){case"errorReason":{if(s.data.variant.value===zn.NONE)return;console.info(`Routing Error: ${s.data.variant.value}`);break}case"routeReply":{console.info(`Route Reply: ${s.data.variant.value}`);break}case"routeRequest":{console.info(`Route Request: ${s.data.variant.value}`);break}}}),t.events.onTelemetryPacket.subscribe(()=>{}),t.events.onDeviceStatus.subscribe(s=>{e.setStatus(s)}),t.events.onWaypointPacket.subscribe(s=>{const{data:l}=s;e.addWaypoint(l)}),t.events.onMyNodeInfo.subscribe(s=>{e.setHardware(s),a=s.myNodeNum}),t.events.onUserPacket.subscribe(s=>{e.addUser(s)}),t.events.onPositionPacket.subscribe(s=>{e.addPosition(s)}),t.events.onNodeInfoPacket.subscribe(s=>{e.addNodeInfo(s)}),t.events.onChannelPacket.subscribe(s=>{e.addChannel(s)}),t.events.onConfigPacket.subscribe(s=>{e.setConfig(s)}),t.events.onModuleConfigPacket.subscribe(s=>{e.setModuleConfig(s)}),t.events.onMessagePacket.subscribe(s=>{e.addMessage({...s,state:s.from!==a?"ack":"waiting"})}),t.events.onTraceRoutePacket.subscribe(s=>{e.addTraceRoute({...s})}),t.events.onPendingSettingsChange.subscribe(s=>{e.setPendingSettingsChanges(s)}),t.events.onMeshPacket.subscribe(s=>{e.processPacket({from:s.from,snr:s.rxSnr,time:s.rxTime})}),t.events.onQueueStatus.subscribe(s=>{e.setQueueStatus(s)}),t.events.onRoutingPacket.subscribe(s=>{var l,o,u,d;if(s.data.variant.case==="errorReason")switch(s.data.variant.value){case zn.NO_CHANNEL:console.error(`Routing Error: ${s.data.variant.value}`),e.setNodeError(s.from,zn[(o=(l=s==null?void 0:s.data)==null?void 0:l.variant)==null?void 0:o.value]),e.setDialogOpen("refreshKeys",!0);break;case zn.PKI_UNKNOWN_PUBKEY:console.error(`Routing Error: ${s.data.variant.value}`),e.setNodeError(s.from,zn[(d=(u=s==null?void 0:s.data)==null?void 0:u.variant)==null?void 0:d.value]),e.setDialogOpen("refreshKeys",!0);break}})},hb=()=>Math.floor(Math.random()*1e9),kx="f75c76d2-129e-4dad-a1dd-7866124401e7",Vx="2c55e69e-4993-11ed-b878-0242ac120002",Ox="ed9da18c-a800-4f66-a670-aa7547e34453",xg="6ba1b218-15a8-461f-9fa8-5dcae273eafd",Bx=4294967295,Ux=2.2;var ha;(function(e){e[e.DeviceRestarting=1]="DeviceRestarting",e[e.DeviceDisconnected=2]="DeviceDisconnected",e[e.DeviceConnecting=3]="DeviceConnecting",e[e.DeviceReconnecting=4]="DeviceReconnecting",e[e.DeviceConnected=5]="DeviceConnected",e[e.DeviceConfiguring=6]="DeviceConfiguring",e[e.DeviceConfigured=7]="DeviceConfigured"})(ha||(ha={}));var Mx;(function(e){e[e.MeshDevice=1]="MeshDevice",e[e.SerialConnection=2]="SerialConnection",e[e.NodeSerialConnection=3]="NodeSerialConnection",e[e.BleConnection=4]="BleConnection",e[e.HttpConnection=5]="HttpConnection"})(Mx||(Mx={}));var Ae;(function(e){e[e.Constructor=0]="Constructor",e[e.SendText=1]="SendText",e[e.SendWaypoint=2]="SendWaypoint",e[e.SendPacket=3]="SendPacket",e[e.SendRaw=4]="SendRaw",e[e.SetConfig=5]="SetConfig",e[e.SetModuleConfig=6]="SetModuleConfig",e[e.ConfirmSetConfig=7]="ConfirmSetConfig",e[e.SetOwner=8]="SetOwner",e[e.SetChannel=9]="SetChannel",e[e.ConfirmSetChannel=10]="ConfirmSetChannel",e[e.ClearChannel=11]="ClearChannel",e[e.GetChannel=12]="GetChannel",e[e.GetAllChannels=13]="GetAllChannels",e[e.GetConfig=14]="GetConfig",e[e.GetModuleConfig=15]="GetModuleConfig",e[e.GetOwner=16]="GetOwner",e[e.Configure=17]="Configure",e[e.HandleFromRadio=18]="HandleFromRadio",e[e.HandleMeshPacket=19]="HandleMeshPacket",e[e.Connect=20]="Connect",e[e.Ping=21]="Ping",e[e.ReadFromRadio=22]="ReadFromRadio",e[e.WriteToRadio=23]="WriteToRadio",e[e.SetDebugMode=24]="SetDebugMode",e[e.GetMetadata=25]="GetMetadata",e[e.ResetNodes=26]="ResetNodes",e[e.Shutdown=27]="Shutdown",e[e.Reboot=28]="Reboot",e[e.RebootOta=29]="RebootOta",e[e.FactoryReset=30]="FactoryReset",e[e.EnterDfuMode=31]="EnterDfuMode",e[e.RemoveNodeByNum=32]="RemoveNodeByNum",e[e.SetCannedMessages=33]="SetCannedMessages"})(Ae||(Ae={}));var fi;(function(e){e[e.Primary=0]="Primary",e[e.Channel1=1]="Channel1",e[e.Channel2=2]="Channel2",e[e.Channel3=3]="Channel3",e[e.Channel4=4]="Channel4",e[e.Channel5=5]="Channel5",e[e.Channel6=6]="Channel6",e[e.Admin=7]="Admin"})(fi||(fi={}));class rF{constructor(){pe(this,"onLogEvent",new _e.SimpleEventDispatcher);pe(this,"onFromRadio",new _e.SimpleEventDispatcher);pe(this,"onMeshPacket",new _e.SimpleEventDispatcher);pe(this,"onMyNodeInfo",new _e.SimpleEventDispatcher);pe(this,"onNodeInfoPacket",new _e.SimpleEventDispatcher);pe(this,"onChannelPacket",new _e.SimpleEventDispatcher);pe(this,"onConfigPacket",new _e.SimpleEventDispatcher);pe(this,"onModuleConfigPacket",new _e.SimpleEventDispatcher);pe(this,"onAtakPacket",new _e.SimpleEventDispatcher);pe(this,"onMessagePacket",new _e.SimpleEventDispatcher);pe(this,"onRemoteHardwarePacket",new _e.SimpleEventDispatcher);pe(this,"onPositionPacket",new _e.SimpleEventDispatcher);pe(this,"onUserPacket",new _e.SimpleEventDispatcher);pe(this,"onRoutingPacket",new _e.SimpleEventDispatcher);pe(this,"onDeviceMetadataPacket",new _e.SimpleEventDispatcher);pe(this,"onWaypointPacket",new _e.SimpleEventDispatcher);pe(this,"onAudioPacket",new _e.SimpleEventDispatcher);pe(this,"onDetectionSensorPacket",new _e.SimpleEventDispatcher);pe(this,"onPingPacket",new _e.SimpleEventDispatcher);pe(this,"onIpTunnelPacket",new _e.SimpleEventDispatcher);pe(this,"onPaxcounterPacket",new _e.SimpleEventDispatcher);pe(this,"onSerialPacket",new _e.SimpleEventDispatcher);pe(this,"onStoreForwardPacket",new _e.SimpleEventDispatcher);pe(this,"onRangeTestPacket",new _e.SimpleEventDispatcher);pe(this,"onTelemetryPacket",new _e.SimpleEventDispatcher);pe(this,"onZpsPacket",new _e.SimpleEventDispatcher);pe(this,"onSimulatorPacket",new _e.SimpleEventDispatcher);pe(this,"onTraceRoutePacket",new _e.SimpleEventDispatcher);pe(this,"onNeighborInfoPacket",new _e.SimpleEventDispatcher);pe(this,"onAtakPluginPacket",new _e.SimpleEventDispatcher);pe(this,"onMapReportPacket",new _e.SimpleEventDispatcher);pe(this,"onPrivatePacket",new _e.SimpleEventDispatcher);pe(this,"onAtakForwarderPacket",new _e.SimpleEventDispatcher);pe(this,"onDeviceStatus",new _e.SimpleEventDispatcher);pe(this,"onLogRecord",new _e.SimpleEventDispatcher);pe(this,"onMeshHeartbeat",new _e.SimpleEventDispatcher);pe(this,"onDeviceDebugLog",new _e.SimpleEventDispatcher);pe(this,"onPendingSettingsChange",new _e.SimpleEventDispatcher);pe(this,"onQueueStatus",new _e.SimpleEventDispatcher)}}const sF=e=>{if(!(e instanceof Uint8Array))throw new TypeError("Input must be a Uint8Array");if(e.byteLength===0)return new ArrayBuffer(0);if(e.buffer instanceof SharedArrayBuffer){const t=new ArrayBuffer(e.byteLength);return new Uint8Array(t).set(e),t}return e.byteOffset===0&&e.byteLength===e.buffer.byteLength?e.buffer:e.buffer.slice(e.byteOffset,e.byteOffset+e.byteLength)};class iF{constructor(){pe(this,"queue",[]);pe(this,"lock",!1);pe(this,"ackNotifier",new _e.SimpleEventDispatcher);pe(this,"errorNotifier",new _e.SimpleEventDispatcher);pe(this,"timeout");this.timeout=6e4}getState(){return this.queue}clear(){this.queue=[]}push(t){const a={...t,sent:!1,added:new Date,promise:new Promise((s,l)=>{this.ackNotifier.subscribe(o=>{t.id===o&&(this.remove(t.id),s(o))}),this.errorNotifier.subscribe(o=>{t.id===o.id&&(this.remove(t.id),l(o))}),setTimeout(()=>{if(this.queue.findIndex(o=>o.id===t.id)!==-1){this.remove(t.id);const o=Tt(rn,t.data);console.warn(`Packet ${t.id} of type ${o.payloadVariant.case} timed out`),l({id:t.id,error:zn.TIMEOUT})}},this.timeout)})};this.queue.push(a)}remove(t){if(this.lock){setTimeout(()=>this.remove(t),100);return}this.queue=this.queue.filter(a=>a.id!==t)}processAck(t){this.ackNotifier.dispatch(t)}processError(t){console.error(`Error received for packet ${t.id}: ${zn[t.error]}`),this.errorNotifier.dispatch(t)}wait(t){const a=this.queue.find(s=>s.id===t);if(!a)throw new Error("Packet does not exist");return a.promise}async processQueue(t){if(!this.lock){for(this.lock=!0;this.queue.filter(a=>!a.sent).length>0;){const a=this.queue.filter(s=>!s.sent)[0];if(a){await new Promise(s=>setTimeout(s,200));try{await t(a.data),a.sent=!0}catch(s){console.error(`Error sending packet ${a.id}`,s)}}}this.lock=!1}}}class lF{constructor(t){pe(this,"sendRaw");pe(this,"rxBuffer");pe(this,"txBuffer");pe(this,"textEncoder");pe(this,"counter");this.sendRaw=t,this.rxBuffer=[],this.txBuffer=[],this.textEncoder=new TextEncoder,this.counter=0}async downloadFile(t){return await this.sendCommand(ft.STX,this.textEncoder.encode(t),0)}async uploadFile(t,a){for(let s=0;s<a.length;s+=128)this.txBuffer.push(a.slice(s,s+128));return await this.sendCommand(ft.SOH,this.textEncoder.encode(t),0)}async sendCommand(t,a,s,l){const o=Te(rn,{payloadVariant:{case:"xmodemPacket",value:{buffer:a,control:t,seq:s,crc16:l}}});return await this.sendRaw(Ze(rn,o))}async handlePacket(t){switch(await new Promise(a=>setTimeout(a,100)),t.control){case ft.NUL:break;case ft.SOH:return this.counter=t.seq,this.validateCrc16(t)?(this.rxBuffer[this.counter]=t.buffer,this.sendCommand(ft.ACK)):await this.sendCommand(ft.NAK,void 0,t.seq);case ft.STX:break;case ft.EOT:break;case ft.ACK:{if(this.counter++,this.txBuffer[this.counter-1])return this.sendCommand(ft.SOH,this.txBuffer[this.counter-1],this.counter,Sl(this.txBuffer[this.counter-1]??new Uint8Array));if(this.counter===this.txBuffer.length+1)return this.sendCommand(ft.EOT);this.clear();break}case ft.NAK:return this.sendCommand(ft.SOH,this.txBuffer[this.counter],this.counter,Sl(this.txBuffer[this.counter-1]??new Uint8Array));case ft.CAN:{this.clear();break}case ft.CTRLZ:break}return Promise.resolve(0)}validateCrc16(t){return Sl(t.buffer)===t.crc16}clear(){this.counter=0,this.rxBuffer=[],this.txBuffer=[]}}class oF{constructor(t){pe(this,"log");pe(this,"deviceStatus");pe(this,"isConfigured");pe(this,"pendingSettingsChanges");pe(this,"myNodeInfo");pe(this,"configId");pe(this,"queue");pe(this,"events");pe(this,"xModem");this.log=new jS({name:"iMeshDevice",prettyLogTemplate:"{{hh}}:{{MM}}:{{ss}}:{{ms}}	{{logLevelName}}	[{{name}}]	"}),this.deviceStatus=ha.DeviceDisconnected,this.isConfigured=!1,this.pendingSettingsChanges=!1,this.myNodeInfo=Te(zg),this.configId=t??this.generateRandId(),this.queue=new iF,this.events=new rF,this.xModem=new lF(this.sendRaw.bind(this)),this.events.onDeviceStatus.subscribe(a=>{this.deviceStatus=a,a===ha.DeviceConfigured?this.isConfigured=!0:a===ha.DeviceConfiguring&&(this.isConfigured=!1)}),this.events.onMyNodeInfo.subscribe(a=>{this.myNodeInfo=a}),this.events.onPendingSettingsChange.subscribe(a=>{this.pendingSettingsChanges=a})}async sendText(t,a,s,l){this.log.debug(Ae[Ae.SendText],`📤 Sending message to ${a??"broadcast"} on channel ${(l==null?void 0:l.toString())??0}`);const o=new TextEncoder;return await this.sendPacket(o.encode(t),Ee.TEXT_MESSAGE_APP,a??"broadcast",l,s,!1,!0)}sendWaypoint(t,a,s){return this.log.debug(Ae[Ae.SendWaypoint],`📤 Sending waypoint to ${a} on channel ${(s==null?void 0:s.toString())??0}`),t.id=this.generateRandId(),this.sendPacket(Ze(Pd,t),Ee.WAYPOINT_APP,a,s,!0,!1)}async sendPacket(t,a,s,l=fi.Primary,o=!0,u=!0,d=!1,f,p){this.log.trace(Ae[Ae.SendPacket],`📤 Sending ${Ee[a]} to ${s}`);const b=Te(XS,{payloadVariant:{case:"decoded",value:{payload:t,portnum:a,wantResponse:u,emoji:p,replyId:f,dest:0,requestId:0,source:0}},from:this.myNodeInfo.myNodeNum,to:s==="broadcast"?Bx:s==="self"?this.myNodeInfo.myNodeNum:s,id:this.generateRandId(),wantAck:o,channel:l}),v=Te(rn,{payloadVariant:{case:"packet",value:b}});return d&&(b.rxTime=Math.trunc(new Date().getTime()/1e3),this.handleMeshPacket(b)),await this.sendRaw(Ze(rn,v),b.id)}async sendRaw(t,a=this.generateRandId()){if(t.length>512)throw new Error("Message longer than 512 bytes, it will not be sent!");return this.queue.push({id:a,data:t}),await this.queue.processQueue(async s=>{await this.writeToRadio(s)}),this.queue.wait(a)}async setConfig(t){this.log.debug(Ae[Ae.SetConfig],`⚙️ Setting config, Variant: ${t.payloadVariant.case??"Unknown"}`),this.pendingSettingsChanges||await this.beginEditSettings();const a=Te(De,{payloadVariant:{case:"setConfig",value:t}});return this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setModuleConfig(t){this.log.debug(Ae[Ae.SetModuleConfig],"⚙️ Setting module config");const a=Te(De,{payloadVariant:{case:"setModuleConfig",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setCannedMessages(t){this.log.debug(Ae[Ae.SetCannedMessages],"⚙️ Setting CannedMessages");const a=Te(De,{payloadVariant:{case:"setCannedMessageModuleMessages",value:t.messages}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setOwner(t){this.log.debug(Ae[Ae.SetOwner],"👤 Setting owner");const a=Te(De,{payloadVariant:{case:"setOwner",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async setChannel(t){this.log.debug(Ae[Ae.SetChannel],`📻 Setting Channel: ${t.index}`);const a=Te(De,{payloadVariant:{case:"setChannel",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async enterDfuMode(){this.log.debug(Ae[Ae.EnterDfuMode],"🔌 Entering DFU mode");const t=Te(De,{payloadVariant:{case:"enterDfuModeRequest",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async setPosition(t){return await this.sendPacket(Ze(Ld,t),Ee.POSITION_APP,"self")}async getChannel(t){this.log.debug(Ae[Ae.GetChannel],`📻 Requesting Channel: ${t}`);const a=Te(De,{payloadVariant:{case:"getChannelRequest",value:t+1}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getConfig(t){this.log.debug(Ae[Ae.GetConfig],"⚙️ Requesting config");const a=Te(De,{payloadVariant:{case:"getConfigRequest",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getModuleConfig(t){this.log.debug(Ae[Ae.GetModuleConfig],"⚙️ Requesting module config");const a=Te(De,{payloadVariant:{case:"getModuleConfigRequest",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async getOwner(){this.log.debug(Ae[Ae.GetOwner],"👤 Requesting owner");const t=Te(De,{payloadVariant:{case:"getOwnerRequest",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async getMetadata(t){this.log.debug(Ae[Ae.GetMetadata],`🏷️ Requesting metadata from ${t}`);const a=Te(De,{payloadVariant:{case:"getDeviceMetadataRequest",value:!0}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,t,fi.Admin)}async clearChannel(t){this.log.debug(Ae[Ae.ClearChannel],`📻 Clearing Channel ${t}`);const a=Te(hf,{index:t,role:Ns.DISABLED}),s=Te(De,{payloadVariant:{case:"setChannel",value:a}});return await this.sendPacket(Ze(De,s),Ee.ADMIN_APP,"self")}async beginEditSettings(){this.events.onPendingSettingsChange.dispatch(!0);const t=Te(De,{payloadVariant:{case:"beginEditSettings",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async commitEditSettings(){this.events.onPendingSettingsChange.dispatch(!1);const t=Te(De,{payloadVariant:{case:"commitEditSettings",value:!0}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async resetNodes(){this.log.debug(Ae[Ae.ResetNodes],"📻 Resetting NodeDB");const t=Te(De,{payloadVariant:{case:"nodedbReset",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async removeNodeByNum(t){this.log.debug(Ae[Ae.RemoveNodeByNum],`📻 Removing Node ${t} from NodeDB`);const a=Te(De,{payloadVariant:{case:"removeByNodenum",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async shutdown(t){this.log.debug(Ae[Ae.Shutdown],`🔌 Shutting down ${t>2?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"shutdownSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async reboot(t){this.log.debug(Ae[Ae.Reboot],`🔌 Rebooting node ${t>0?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"rebootSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async rebootOta(t){this.log.debug(Ae[Ae.RebootOta],`🔌 Rebooting into OTA mode ${t>0?"now":`in ${t} seconds`}`);const a=Te(De,{payloadVariant:{case:"rebootOtaSeconds",value:t}});return await this.sendPacket(Ze(De,a),Ee.ADMIN_APP,"self")}async factoryResetDevice(){this.log.debug(Ae[Ae.FactoryReset],"♻️ Factory resetting device");const t=Te(De,{payloadVariant:{case:"factoryResetDevice",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}async factoryResetConfig(){this.log.debug(Ae[Ae.FactoryReset],"♻️ Factory resetting config");const t=Te(De,{payloadVariant:{case:"factoryResetConfig",value:1}});return await this.sendPacket(Ze(De,t),Ee.ADMIN_APP,"self")}configure(){this.log.debug(Ae[Ae.Configure],"⚙️ Requesting device configuration"),this.updateDeviceStatus(ha.DeviceConfiguring);const t=Te(rn,{payloadVariant:{case:"wantConfigId",value:this.configId}});return this.sendRaw(Ze(rn,t))}heartbeat(){this.log.debug(Ae[Ae.Ping],"❤️ Send heartbeat ping to radio");const t=Te(rn,{payloadVariant:{case:"heartbeat",value:{}}});return this.sendRaw(Ze(rn,t))}async traceRoute(t){const a=Te(xl,{route:[]});return await this.sendPacket(Ze(xl,a),Ee.TRACEROUTE_APP,t)}async requestPosition(t){return await this.sendPacket(new Uint8Array,Ee.POSITION_APP,t)}updateDeviceStatus(t){t!==this.deviceStatus&&this.events.onDeviceStatus.dispatch(t)}generateRandId(){const t=crypto.getRandomValues(new Uint32Array(1));if(!t[0])throw new Error("Cannot generate CSPRN");return Math.floor(t[0]*2**-32*1e9)}handleFromRadio(t){const a=Tt(WS,t);switch(this.events.onFromRadio.dispatch(a),a.payloadVariant.case){case"packet":{this.handleMeshPacket(a.payloadVariant.value);break}case"myInfo":{this.events.onMyNodeInfo.dispatch(a.payloadVariant.value),this.log.info(Ae[Ae.HandleFromRadio],"📱 Received Node info for this device");break}case"nodeInfo":{this.log.info(Ae[Ae.HandleFromRadio],`📱 Received Node Info packet for node: ${a.payloadVariant.value.num}`),this.events.onNodeInfoPacket.dispatch(a.payloadVariant.value),a.payloadVariant.value.position&&this.events.onPositionPacket.dispatch({id:a.id,rxTime:new Date,from:a.payloadVariant.value.num,to:a.payloadVariant.value.num,type:"direct",channel:fi.Primary,data:a.payloadVariant.value.position}),a.payloadVariant.value.user&&this.events.onUserPacket.dispatch({id:a.id,rxTime:new Date,from:a.payloadVariant.value.num,to:a.payloadVariant.value.num,type:"direct",channel:fi.Primary,data:a.payloadVariant.value.user});break}case"config":{a.payloadVariant.value.payloadVariant.case?this.log.trace(Ae[Ae.HandleFromRadio],`💾 Received Config packet of variant: ${a.payloadVariant.value.payloadVariant.case}`):this.log.warn(Ae[Ae.HandleFromRadio],"⚠️ Received Config packet of variant: UNK"),this.events.onConfigPacket.dispatch(a.payloadVariant.value);break}case"logRecord":{this.log.trace(Ae[Ae.HandleFromRadio],"Received onLogRecord"),this.events.onLogRecord.dispatch(a.payloadVariant.value);break}case"configCompleteId":{a.payloadVariant.value!==this.configId&&this.log.error(Ae[Ae.HandleFromRadio],`❌ Invalid config id received from device, expected ${this.configId} but received ${a.payloadVariant.value}`),this.log.info(Ae[Ae.HandleFromRadio],`⚙️ Valid config id received from device: ${this.configId}`),this.updateDeviceStatus(ha.DeviceConfigured);break}case"rebooted":{this.configure().catch(()=>{});break}case"moduleConfig":{a.payloadVariant.value.payloadVariant.case?this.log.trace(Ae[Ae.HandleFromRadio],`💾 Received Module Config packet of variant: ${a.payloadVariant.value.payloadVariant.case}`):this.log.warn(Ae[Ae.HandleFromRadio],"⚠️ Received Module Config packet of variant: UNK"),this.events.onModuleConfigPacket.dispatch(a.payloadVariant.value);break}case"channel":{this.log.trace(Ae[Ae.HandleFromRadio],`🔐 Received Channel: ${a.payloadVariant.value.index}`),this.events.onChannelPacket.dispatch(a.payloadVariant.value);break}case"queueStatus":{this.log.trace(Ae[Ae.HandleFromRadio],`🚧 Received Queue Status: ${a.payloadVariant.value}`),this.events.onQueueStatus.dispatch(a.payloadVariant.value);break}case"xmodemPacket":{this.xModem.handlePacket(a.payloadVariant.value);break}case"metadata":{Number.parseFloat(a.payloadVariant.value.firmwareVersion)<Ux&&this.log.fatal(Ae[Ae.HandleFromRadio],`Device firmware outdated. Min supported: ${Ux} got : ${a.payloadVariant.value.firmwareVersion}`),this.log.debug(Ae[Ae.GetMetadata],"🏷️ Received metadata packet"),this.events.onDeviceMetadataPacket.dispatch({id:a.id,rxTime:new Date,from:0,to:0,type:"direct",channel:fi.Primary,data:a.payloadVariant.value});break}case"mqttClientProxyMessage":break;default:this.log.warn(Ae[Ae.HandleFromRadio],`⚠️ Unhandled payload variant: ${a.payloadVariant.case}`)}}complete(){this.queue.clear()}handleMeshPacket(t){switch(this.events.onMeshPacket.dispatch(t),t.from!==this.myNodeInfo.myNodeNum&&this.events.onMeshHeartbeat.dispatch(new Date),t.payloadVariant.case){case"decoded":{this.handleDecodedPacket(t.payloadVariant.value,t);break}case"encrypted":{this.log.debug(Ae[Ae.HandleMeshPacket],"🔐 Device received encrypted data packet, ignoring.");break}default:throw new Error(`Unhandled case ${t.payloadVariant.case}`)}}handleDecodedPacket(t,a){let s,l;const o={id:a.id,rxTime:new Date(a.rxTime*1e3),type:a.to===Bx?"broadcast":"direct",from:a.from,to:a.to,channel:a.channel};switch(this.log.trace(Ae[Ae.HandleMeshPacket],`📦 Received ${Ee[t.portnum]} packet`),t.portnum){case Ee.TEXT_MESSAGE_APP:{this.events.onMessagePacket.dispatch({...o,data:new TextDecoder().decode(t.payload)});break}case Ee.REMOTE_HARDWARE_APP:{this.events.onRemoteHardwarePacket.dispatch({...o,data:Tt(JS,t.payload)});break}case Ee.POSITION_APP:{this.events.onPositionPacket.dispatch({...o,data:Tt(Ld,t.payload)});break}case Ee.NODEINFO_APP:{this.events.onUserPacket.dispatch({...o,data:Tt(Wg,t.payload)});break}case Ee.ROUTING_APP:{switch(l=Tt(KS,t.payload),this.events.onRoutingPacket.dispatch({...o,data:l}),l.variant.case){case"errorReason":{l.variant.value===zn.NONE?this.queue.processAck(t.requestId):this.queue.processError({id:t.requestId,error:l.variant.value});break}case"routeReply":break;case"routeRequest":break;default:throw new Error(`Unhandled case ${l.variant.case}`)}break}case Ee.ADMIN_APP:{switch(s=Tt(De,t.payload),s.payloadVariant.case){case"getChannelResponse":{this.events.onChannelPacket.dispatch(s.payloadVariant.value);break}case"getOwnerResponse":{this.events.onUserPacket.dispatch({...o,data:s.payloadVariant.value});break}case"getConfigResponse":{this.events.onConfigPacket.dispatch(s.payloadVariant.value);break}case"getModuleConfigResponse":{this.events.onModuleConfigPacket.dispatch(s.payloadVariant.value);break}case"getDeviceMetadataResponse":{this.log.debug(Ae[Ae.GetMetadata],`🏷️ Received metadata packet from ${t.source}`),this.events.onDeviceMetadataPacket.dispatch({...o,data:s.payloadVariant.value});break}default:this.log.error(Ae[Ae.HandleMeshPacket],`⚠️ Received unhandled AdminMessage, type ${s.payloadVariant.case??"undefined"}`,t.payload)}break}case Ee.WAYPOINT_APP:{this.events.onWaypointPacket.dispatch({...o,data:Tt(Pd,t.payload)});break}case Ee.AUDIO_APP:{this.events.onAudioPacket.dispatch({...o,data:t.payload});break}case Ee.DETECTION_SENSOR_APP:{this.events.onDetectionSensorPacket.dispatch({...o,data:t.payload});break}case Ee.REPLY_APP:{this.events.onPingPacket.dispatch({...o,data:t.payload});break}case Ee.IP_TUNNEL_APP:{this.events.onIpTunnelPacket.dispatch({...o,data:t.payload});break}case Ee.PAXCOUNTER_APP:{this.events.onPaxcounterPacket.dispatch({...o,data:Tt(HS,t.payload)});break}case Ee.SERIAL_APP:{this.events.onSerialPacket.dispatch({...o,data:t.payload});break}case Ee.STORE_FORWARD_APP:{this.events.onStoreForwardPacket.dispatch({...o,data:t.payload});break}case Ee.RANGE_TEST_APP:{this.events.onRangeTestPacket.dispatch({...o,data:t.payload});break}case Ee.TELEMETRY_APP:{this.events.onTelemetryPacket.dispatch({...o,data:Tt(YS,t.payload)});break}case Ee.ZPS_APP:{this.events.onZpsPacket.dispatch({...o,data:t.payload});break}case Ee.SIMULATOR_APP:{this.events.onSimulatorPacket.dispatch({...o,data:t.payload});break}case Ee.TRACEROUTE_APP:{this.events.onTraceRoutePacket.dispatch({...o,data:Tt(xl,t.payload)});break}case Ee.NEIGHBORINFO_APP:{this.events.onNeighborInfoPacket.dispatch({...o,data:Tt(zS,t.payload)});break}case Ee.ATAK_PLUGIN:{this.events.onAtakPluginPacket.dispatch({...o,data:t.payload});break}case Ee.MAP_REPORT_APP:{this.events.onMapReportPacket.dispatch({...o,data:t.payload});break}case Ee.PRIVATE_APP:{this.events.onPrivatePacket.dispatch({...o,data:t.payload});break}case Ee.ATAK_FORWARDER:{this.events.onAtakForwarderPacket.dispatch({...o,data:t.payload});break}default:throw new Error(`Unhandled case ${t.portnum}`)}}}class cF extends oF{constructor(a){super(a);pe(this,"connType");pe(this,"portId");pe(this,"device");pe(this,"gattServer");pe(this,"service");pe(this,"toRadioCharacteristic");pe(this,"fromRadioCharacteristic");pe(this,"fromNumCharacteristic");pe(this,"timerUpdateFromRadio");this.log=this.log.getSubLogger({name:"HttpConnection"}),this.connType="ble",this.portId="",this.device=void 0,this.service=void 0,this.gattServer=void 0,this.toRadioCharacteristic=void 0,this.fromRadioCharacteristic=void 0,this.fromNumCharacteristic=void 0,this.log.debug(Ae[Ae.Constructor],"🔷 BleConnection instantiated")}supported(){return navigator.bluetooth.getAvailability()}getDevices(){return navigator.bluetooth.getDevices()}getDevice(a){return navigator.bluetooth.requestDevice(a??{filters:[{services:[xg]}]})}async connect({device:a,deviceFilter:s}){var l,o,u,d;this.updateDeviceStatus(ha.DeviceConnecting),this.device=a??await this.getDevice(s),this.portId=this.device.id,this.device.addEventListener("gattserverdisconnected",()=>{this.log.info(Ae[Ae.Connect],"Device disconnected"),this.updateDeviceStatus(ha.DeviceDisconnected),this.complete()}),await((l=this.device.gatt)==null?void 0:l.connect().then(f=>{this.log.info(Ae[Ae.Connect],`✅ Got GATT Server for device: ${f.device.id}`),this.gattServer=f}).catch(f=>{this.log.error(Ae[Ae.Connect],`❌ Failed to connect: ${f.message}`)})),await((o=this.gattServer)==null?void 0:o.getPrimaryService(xg).then(f=>{this.log.info(Ae[Ae.Connect],`✅ Got GATT Service for device: ${f.device.id}`),this.service=f}).catch(f=>{this.log.error(Ae[Ae.Connect],`❌ Failed to get primary service: q${f.message}`)})),[kx,Vx,Ox].map(async f=>{var p;await((p=this.service)==null?void 0:p.getCharacteristic(f).then(b=>{switch(this.log.info(Ae[Ae.Connect],`✅ Got Characteristic ${b.uuid} for device: ${b.uuid}`),f){case kx:{this.toRadioCharacteristic=b;break}case Vx:{this.fromRadioCharacteristic=b;break}case Ox:{this.fromNumCharacteristic=b;break}}}).catch(b=>{this.log.error(Ae[Ae.Connect],`❌ Failed to get toRadio characteristic: q${b.message}`)}))}),await((u=this.fromNumCharacteristic)==null?void 0:u.startNotifications()),(d=this.fromNumCharacteristic)==null||d.addEventListener("characteristicvaluechanged",()=>{this.readFromRadio()}),this.updateDeviceStatus(ha.DeviceConnected),this.configure().catch(()=>{}),this.timerUpdateFromRadio=setInterval(()=>this.readFromRadio(),1e3)}disconnect(){var a,s;(s=(a=this.device)==null?void 0:a.gatt)==null||s.disconnect(),this.updateDeviceStatus(ha.DeviceDisconnected),this.complete(),this.timerUpdateFromRadio&&clearInterval(this.timerUpdateFromRadio),this.timerUpdateFromRadio=void 0}async ping(){return await Promise.resolve(!0)}async readFromRadio(){try{let a=!0;for(;a&&this.fromRadioCharacteristic;){const s=await this.fromRadioCharacteristic.readValue();if(s.byteLength===0){a=!1;continue}await this.handleFromRadio(new Uint8Array(s.buffer)),this.updateDeviceStatus(ha.DeviceConnected)}}catch(a){throw this.log.error(Ae[Ae.ReadFromRadio],`❌ ${a instanceof Error?a.message:"Unknown error"}`),a}finally{}}async writeToRadio(a){var s;await((s=this.toRadioCharacteristic)==null?void 0:s.writeValue(sF(a))),await this.readFromRadio()}}const uF=({closeDialog:e})=>{const[t,a]=y.useState([]),{addDevice:s}=Cs(),{setSelectedDevice:l}=In(),o=y.useCallback(async()=>{a(await navigator.bluetooth.getDevices())},[]);y.useEffect(()=>{o()},[o]);const u=async d=>{const f=hb(),p=s(f);l(f);const b=new cF(f);await b.connect({device:d}),p.addConnection(b),fb(p,b),e()};return m.jsxs("div",{className:"flex w-full flex-col gap-2 p-4",children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2 overflow-y-auto",children:[t.map(d=>m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:()=>{u(d)},children:d.name},d.id)),t.length===0&&m.jsx(Oa,{className:"m-auto select-none",children:"No devices paired yet."})]}),m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await navigator.bluetooth.requestDevice({filters:[{services:[xg]}]}).then(d=>{t.findIndex(p=>p.id===d.id)===-1&&a(t.concat(d))})},children:m.jsx("span",{children:"New device"})})]})};class pb{constructor(t,a){pe(this,"_toDevice");pe(this,"_fromDevice");pe(this,"url");pe(this,"receiveBatchRequests");pe(this,"fetchInterval");pe(this,"batchSize");pe(this,"socket");this.url=t,this.receiveBatchRequests=!1,this.fetchInterval=3e3,this.batchSize=64,this.socket=a??null,this._toDevice=new WritableStream({write:async l=>{await this.writeToRadio(l)}});let s;this._fromDevice=new ReadableStream({start:l=>{s=l}});const l=()=>{setInterval(async()=>{await this.readFromRadio(s)},this.fetchInterval)};this.socket?(this.socket.binaryType="arraybuffer",this.socket.onmessage=o=>{this.enqueueFrames(s,new Uint8Array(o.data))},this.socket.onclose=()=>{this.socket=null,l()}):l()}static async create(t,a){const s=`${a?"https":"http"}://${t}`;await fetch(`${s}/json/report`);const l=await new Promise(o=>{try{const u=new WebSocket(`${a?"wss":"ws"}://${t}/api/v1/ws`);u.onopen=()=>o(u),u.onerror=()=>o(null)}catch{o(null)}});return new pb(s,l)}enqueueFrames(t,a){for(let s=0;s+4<=a.byteLength;){const l=a[s+2]<<8|a[s+3];s+=4,t.enqueue({type:"packet",data:a.slice(s,s+l)}),s+=l}}async readFromRadio(t){let a=new ArrayBuffer(1);for(;a.byteLength>0;)a=await(await fetch(`${this.url}/api/v1/fromradio?all=${this.receiveBatchRequests?"true":"false"}&batch=${this.batchSize}`,{method:"GET",headers:{Accept:"application/x-protobuf"}})).arrayBuffer(),this.enqueueFrames(t,new Uint8Array(a))}async writeToRadio(t){if(this.socket&&this.socket.readyState===WebSocket.OPEN){const a=new Uint8Array(t.byteLength+4);a.set([148,195,t.byteLength>>8&255,t.byteLength&255]),a.set(t,4),this.socket.send(a);return}await fetch(`${this.url}/api/v1/toradio`,{method:"PUT",headers:{"Content-Type":"application/x-protobuf"},body:t})}get toDevice(){return this._toDevice}get fromDevice(){return this._fromDevice}}const dF=({closeDialog:e})=>{const t=location.protocol==="https:",{addDevice:a}=Cs(),{setSelectedDevice:s}=In(),{control:l,handleSubmit:o,register:u}=L0({defaultValues:{ip:window.location.host+(new URLSearchParams(window.location.search).get("path")||"/meshtastic/web"),tls:!!t}}),{field:{value:d,onChange:f}}=U0({name:"tls",control:l}),[p,b]=y.useState(!1),v=o(async A=>{b(!0);const x=hb(),N=a(x),S=await pb.create(A.ip,A.tls),R=new r2(S,x);R.configure(),s(x),N.addConnection(R),fb(N,R),e()});return m.jsxs("form",{className:"flex w-full flex-col gap-2 p-4",onSubmit:v,children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2",children:[m.jsxs("div",{children:[m.jsx(Hn,{children:"IP Address/Hostname"}),m.jsx(Ga,{prefix:d?"https://":"http://",placeholder:"000.000.000.000 / meshtastic.local",className:"text-slate-900 dark:text-slate-900",disabled:p,...u("ip")})]}),m.jsxs("div",{className:"flex items-center gap-2 mt-2",children:[m.jsx(_f,{onCheckedChange:f,disabled:t||p,checked:t||d,...u("tls")}),m.jsx(Hn,{children:"Use HTTPS"})]})]}),m.jsx(pt,{type:"submit",disabled:p,className:"dark:bg-slate-900 dark:text-white",children:m.jsx("span",{children:p?"Connecting...":"Connect"})})]})},Gx=new TransformStream({transform(e,t){const a=e.length,s=new Uint8Array([148,195,a>>8&255,a&255]);t.enqueue(new Uint8Array([...s,...e]))}}),fF=()=>{let e=new Uint8Array([]);const t=new TextDecoder;return new TransformStream({transform(a,s){e=new Uint8Array([...e,...a]);let l=!1;for(;e.length!==0&&!l;){const o=e.findIndex(d=>d===148);if(e[o+1]===195){e.subarray(0,o).length&&(s.enqueue({type:"debug",data:t.decode(e.subarray(0,o))}),e=e.subarray(o));const d=e[2],f=e[3];if(d!==void 0&&f!==void 0&&e.length>=4+(d<<8)+f){const p=e.subarray(4,4+(d<<8)+f),b=p.findIndex(v=>v===148);b!==-1&&p[b+1]===195?(console.warn(`⚠️ Malformed packet found, discarding: ${e.subarray(0,b-1).toString()}`),e=e.subarray(b)):(e=e.subarray(3+(d<<8)+f+1),s.enqueue({type:"packet",data:p}))}else l=!0}else l=!0}}})};var Fx;(function(e){e[e.DeviceRestarting=1]="DeviceRestarting",e[e.DeviceDisconnected=2]="DeviceDisconnected",e[e.DeviceConnecting=3]="DeviceConnecting",e[e.DeviceReconnecting=4]="DeviceReconnecting",e[e.DeviceConnected=5]="DeviceConnected",e[e.DeviceConfiguring=6]="DeviceConfiguring",e[e.DeviceConfigured=7]="DeviceConfigured"})(Fx||(Fx={}));var Lx;(function(e){e[e.MeshDevice=1]="MeshDevice",e[e.SerialConnection=2]="SerialConnection",e[e.NodeSerialConnection=3]="NodeSerialConnection",e[e.BleConnection=4]="BleConnection",e[e.HttpConnection=5]="HttpConnection"})(Lx||(Lx={}));var Px;(function(e){e[e.Constructor=0]="Constructor",e[e.SendText=1]="SendText",e[e.SendWaypoint=2]="SendWaypoint",e[e.SendPacket=3]="SendPacket",e[e.SendRaw=4]="SendRaw",e[e.SetConfig=5]="SetConfig",e[e.SetModuleConfig=6]="SetModuleConfig",e[e.ConfirmSetConfig=7]="ConfirmSetConfig",e[e.SetOwner=8]="SetOwner",e[e.SetChannel=9]="SetChannel",e[e.ConfirmSetChannel=10]="ConfirmSetChannel",e[e.ClearChannel=11]="ClearChannel",e[e.GetChannel=12]="GetChannel",e[e.GetAllChannels=13]="GetAllChannels",e[e.GetConfig=14]="GetConfig",e[e.GetModuleConfig=15]="GetModuleConfig",e[e.GetOwner=16]="GetOwner",e[e.Configure=17]="Configure",e[e.HandleFromRadio=18]="HandleFromRadio",e[e.HandleMeshPacket=19]="HandleMeshPacket",e[e.Connect=20]="Connect",e[e.Ping=21]="Ping",e[e.ReadFromRadio=22]="ReadFromRadio",e[e.WriteToRadio=23]="WriteToRadio",e[e.SetDebugMode=24]="SetDebugMode",e[e.GetMetadata=25]="GetMetadata",e[e.ResetNodes=26]="ResetNodes",e[e.Shutdown=27]="Shutdown",e[e.Reboot=28]="Reboot",e[e.RebootOta=29]="RebootOta",e[e.FactoryReset=30]="FactoryReset",e[e.EnterDfuMode=31]="EnterDfuMode",e[e.RemoveNodeByNum=32]="RemoveNodeByNum",e[e.SetCannedMessages=33]="SetCannedMessages"})(Px||(Px={}));var jx;(function(e){e[e.Primary=0]="Primary",e[e.Channel1=1]="Channel1",e[e.Channel2=2]="Channel2",e[e.Channel3=3]="Channel3",e[e.Channel4=4]="Channel4",e[e.Channel5=5]="Channel5",e[e.Channel6=6]="Channel6",e[e.Admin=7]="Admin"})(jx||(jx={}));class nf{constructor(t){pe(this,"_toDevice");pe(this,"_fromDevice");if(!t.readable||!t.writable)throw new Error("Stream not accessible");Gx.readable.pipeTo(t.writable),this._toDevice=Gx.writable,this._fromDevice=t.readable.pipeThrough(fF())}static async create(t){const a=await navigator.serial.requestPort();return await a.open({baudRate:t||115200}),new nf(a)}static async createFromPort(t,a){return await t.open({baudRate:a||115200}),new nf(t)}get toDevice(){return this._toDevice}get fromDevice(){return this._fromDevice}}const hF=({closeDialog:e})=>{var d,f;const[t,a]=y.useState([]),{addDevice:s}=Cs(),{setSelectedDevice:l}=In(),o=y.useCallback(async()=>{a(await(navigator==null?void 0:navigator.serial.getPorts()))},[]);(d=navigator==null?void 0:navigator.serial)==null||d.addEventListener("connect",()=>{o()}),(f=navigator==null?void 0:navigator.serial)==null||f.addEventListener("disconnect",()=>{o()}),y.useEffect(()=>{o()},[o]);const u=async p=>{const b=hb(),v=s(b);l(b);const A=await nf.createFromPort(p),x=new r2(A,b);x.configure(),v.addConnection(x),fb(v,x),e()};return m.jsxs("div",{className:"flex w-full flex-col gap-2 p-4",children:[m.jsxs("div",{className:"flex h-48 flex-col gap-2 overflow-y-auto",children:[t.map((p,b)=>{const{usbProductId:v,usbVendorId:A}=p.getInfo();return m.jsx(pt,{disabled:p.readable!==null,className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await u(p)},children:`# ${b} - ${A??"UNK"} - ${v??"UNK"}`},`${A??"UNK"}-${v??"UNK"}-${b}`)}),t.length===0&&m.jsx(Oa,{className:"m-auto select-none",children:"No devices paired yet."})]}),m.jsx(pt,{className:"dark:bg-slate-900 dark:text-white",onClick:async()=>{await navigator.serial.requestPort().then(p=>{a(t.concat(p))})},children:m.jsx("span",{children:"New device"})})]})},Zx={"Web Bluetooth":"https://developer.mozilla.org/en-US/docs/Web/API/Web_Bluetooth_API#browser_compatibility","Web Serial":"https://developer.mozilla.org/en-US/docs/Web/API/Web_Serial_API#browser_compatibility","Secure Context":"https://developer.mozilla.org/en-US/docs/Web/Security/Secure_Contexts"},pF=new Intl.ListFormat("en",{style:"long",type:"disjunction"}),mF=({missingFeatures:e})=>{if(e.length===0)return null;const t=e.filter(l=>l!=="Secure Context"),a=e.includes("Secure Context"),s=l=>pF.formatToParts(l).map(u=>u.type==="element"?m.jsx(Ul,{href:Zx[u.value],children:u.value},u.value):m.jsx(m.Fragment,{children:u.value},u.value));return m.jsx(Ua,{className:"flex flex-col items-start gap-2 bg-red-500 p-4 rounded-md",children:m.jsxs("div",{className:"flex items-center gap-2 w-full",children:[m.jsx(S2,{size:40,className:"mr-2 shrink-0 text-white"}),m.jsx("div",{className:"flex flex-col gap-3",children:m.jsxs("p",{className:"text-sm text-white",children:[t.length>0&&m.jsxs(m.Fragment,{children:["This connection type requires"," ",s(t),". Please use a supported browser, like Chrome or Edge."]}),a&&m.jsxs(m.Fragment,{children:[t.length>0&&" Additionally, it",t.length===0&&"This application"," requires a"," ",m.jsx(Ul,{href:Zx["Secure Context"],children:"secure context"}),". Please connect using HTTPS or localhost."]})]})})]})})},gF=({open:e,onOpenChange:t})=>{const{unsupported:a}=aF(),s=[{label:"HTTP",element:dF,isDisabled:!1},{label:"Bluetooth",element:uF,isDisabled:a.includes("Web Bluetooth")||a.includes("Secure Context")},{label:"Serial",element:hF,isDisabled:a.includes("Web Serial")||a.includes("Secure Context")}];return m.jsx(xn,{open:e,onOpenChange:t,children:m.jsxs(pn,{children:[m.jsx(Dn,{}),m.jsx(Sn,{children:m.jsx(Nn,{children:"Connect New Device"})}),m.jsxs(Rf,{defaultValue:"HTTP",children:[m.jsx(Gc,{children:s.map(l=>m.jsx(Fc,{value:l.label,children:l.label},l.label))}),s.map(l=>m.jsx(Lc,{value:l.label,children:m.jsxs("fieldset",{disabled:l.isDisabled,children:[l.isDisabled?m.jsx(mF,{missingFeatures:a}):null,m.jsx(l.element,{closeDialog:()=>t(!1)})]})},l.label))]})]})})};/*! js-cookie v3.0.5 | MIT */function md(e){for(var t=1;t<arguments.length;t++){var a=arguments[t];for(var s in a)e[s]=a[s]}return e}var bF={read:function(e){return e[0]==='"'&&(e=e.slice(1,-1)),e.replace(/(%[\dA-F]{2})+/gi,decodeURIComponent)},write:function(e){return encodeURIComponent(e).replace(/%(2[346BF]|3[AC-F]|40|5[BDE]|60|7[BCD])/g,decodeURIComponent)}};function Sg(e,t){function a(l,o,u){if(!(typeof document>"u")){u=md({},t,u),typeof u.expires=="number"&&(u.expires=new Date(Date.now()+u.expires*864e5)),u.expires&&(u.expires=u.expires.toUTCString()),l=encodeURIComponent(l).replace(/%(2[346B]|5E|60|7C)/g,decodeURIComponent).replace(/[()]/g,escape);var d="";for(var f in u)u[f]&&(d+="; "+f,u[f]!==!0&&(d+="="+u[f].split(";")[0]));return document.cookie=l+"="+e.write(o,l)+d}}function s(l){if(!(typeof document>"u"||arguments.length&&!l)){for(var o=document.cookie?document.cookie.split("; "):[],u={},d=0;d<o.length;d++){var f=o[d].split("="),p=f.slice(1).join("=");try{var b=decodeURIComponent(f[0]);if(u[b]=e.read(p,b),l===b)break}catch{}}return l?u[l]:u}}return Object.create({set:a,get:s,remove:function(l,o){a(l,"",md({},o,{expires:-1}))},withAttributes:function(l){return Sg(this.converter,md({},this.attributes,l))},withConverter:function(l){return Sg(md({},this.converter,l),this.attributes)}},{attributes:{value:Object.freeze(t)},converter:{value:Object.freeze(e)}})}var Rm=Sg(bF,{path:"/"});function vF(e,t){const[a,s]=y.useState(()=>{try{const u=Rm.get(e);return u?JSON.parse(u):t}catch(u){return console.error(`Error parsing cookie ${e}:`,u),t}}),l=y.useCallback((u,d)=>{try{Rm.set(e,JSON.stringify(u),d),s(u)}catch(f){console.error(`Error setting cookie ${e}:`,f)}},[e]),o=y.useCallback(()=>{try{Rm.remove(e),s(void 0)}catch(u){console.error(`Error removing cookie ${e}:`,u)}},[e]);return{value:a,setCookie:l,removeCookie:o}}const yF=1e4,EF=3e4,AF=365;function xF(e){const t=new Date(e);return(new Date().getTime()-t.getTime())/(1e3*60*60*24)>=7}function SF({reminderInDays:e=7,enabled:t,message:a,onAccept:s=()=>{},cookieOptions:l}){const{toast:o}=Zc(),u=y.useRef(!1),{value:d,setCookie:f}=vF("key_backup_reminder"),p=y.useCallback(b=>{const v=new Date;v.setDate(v.getDate()+b),f({suppressed:!0,lastShown:new Date().toISOString()},{...l,expires:v})},[f,l]);y.useEffect(()=>{if(u.current||!(!(d!=null&&d.suppressed)||xF(d.lastShown)))return;u.current=!0;const{dismiss:v}=o({title:"Backup Reminder",duration:EF,delay:yF,description:a,action:m.jsxs("div",{className:"flex gap-2",children:[m.jsx(pt,{type:"button",variant:"default",onClick:()=>{s(),v(),p(AF)},children:"Back up now"}),m.jsxs(pt,{type:"button",variant:"outline",onClick:()=>{v(),p(e)},children:["Remind me in ",e," days"]})]})});return()=>{u.current||v()}},[t,a,s,e,p,o,d])}const NF=()=>{const{setDialogOpen:e}=He();return SF({reminderInDays:7,message:"We recommend backing up your key data regularly. Would you like to back up now?",onAccept:()=>e("pkiBackup",!0),enabled:!0,cookieOptions:{secure:!0,sameSite:"strict"}}),m.jsx(m.Fragment,{})};var mb="ToastProvider",[gb,RF,TF]=xf("Toast"),[HT,SL]=ba("Toast",[TF]),[wF,Bf]=HT(mb),JT=e=>{const{__scopeToast:t,label:a="Notification",duration:s=5e3,swipeDirection:l="right",swipeThreshold:o=50,children:u}=e,[d,f]=y.useState(null),[p,b]=y.useState(0),v=y.useRef(!1),A=y.useRef(!1);return a.trim()||console.error(`Invalid prop \`label\` supplied to \`${mb}\`. Expected non-empty \`string\`.`),m.jsx(gb.Provider,{scope:t,children:m.jsx(wF,{scope:t,label:a,duration:s,swipeDirection:l,swipeThreshold:o,toastCount:p,viewport:d,onViewportChange:f,onToastAdd:y.useCallback(()=>b(x=>x+1),[]),onToastRemove:y.useCallback(()=>b(x=>x-1),[]),isFocusedToastEscapeKeyDownRef:v,isClosePausedRef:A,children:u})})};JT.displayName=mb;var $T="ToastViewport",CF=["F8"],Ng="toast.viewportPause",Rg="toast.viewportResume",qT=y.forwardRef((e,t)=>{const{__scopeToast:a,hotkey:s=CF,label:l="Notifications ({hotkey})",...o}=e,u=Bf($T,a),d=RF(a),f=y.useRef(null),p=y.useRef(null),b=y.useRef(null),v=y.useRef(null),A=gt(t,v,u.onViewportChange),x=s.join("+").replace(/Key/g,"").replace(/Digit/g,""),N=u.toastCount>0;y.useEffect(()=>{const R=I=>{var _;s.length!==0&&s.every(j=>I[j]||I.code===j)&&((_=v.current)==null||_.focus())};return document.addEventListener("keydown",R),()=>document.removeEventListener("keydown",R)},[s]),y.useEffect(()=>{const R=f.current,I=v.current;if(N&&R&&I){const T=()=>{if(!u.isClosePausedRef.current){const V=new CustomEvent(Ng);I.dispatchEvent(V),u.isClosePausedRef.current=!0}},_=()=>{if(u.isClosePausedRef.current){const V=new CustomEvent(Rg);I.dispatchEvent(V),u.isClosePausedRef.current=!1}},j=V=>{!R.contains(V.relatedTarget)&&_()},C=()=>{R.contains(document.activeElement)||_()};return R.addEventListener("focusin",T),R.addEventListener("focusout",j),R.addEventListener("pointermove",T),R.addEventListener("pointerleave",C),window.addEventListener("blur",T),window.addEventListener("focus",_),()=>{R.removeEventListener("focusin",T),R.removeEventListener("focusout",j),R.removeEventListener("pointermove",T),R.removeEventListener("pointerleave",C),window.removeEventListener("blur",T),window.removeEventListener("focus",_)}}},[N,u.isClosePausedRef]);const S=y.useCallback(({tabbingDirection:R})=>{const T=d().map(_=>{const j=_.ref.current,C=[j,...PF(j)];return R==="forwards"?C:C.reverse()});return(R==="forwards"?T.reverse():T).flat()},[d]);return y.useEffect(()=>{const R=v.current;if(R){const I=T=>{var C,V,L;const _=T.altKey||T.ctrlKey||T.metaKey;if(T.key==="Tab"&&!_){const X=document.activeElement,M=T.shiftKey;if(T.target===R&&M){(C=p.current)==null||C.focus();return}const D=S({tabbingDirection:M?"backwards":"forwards"}),J=D.findIndex(O=>O===X);Tm(D.slice(J+1))?T.preventDefault():M?(V=p.current)==null||V.focus():(L=b.current)==null||L.focus()}};return R.addEventListener("keydown",I),()=>R.removeEventListener("keydown",I)}},[d,S]),m.jsxs($O,{ref:f,role:"region","aria-label":l.replace("{hotkey}",x),tabIndex:-1,style:{pointerEvents:N?void 0:"none"},children:[N&&m.jsx(Tg,{ref:p,onFocusFromOutsideViewport:()=>{const R=S({tabbingDirection:"forwards"});Tm(R)}}),m.jsx(gb.Slot,{scope:a,children:m.jsx(Ye.ol,{tabIndex:-1,...o,ref:A})}),N&&m.jsx(Tg,{ref:b,onFocusFromOutsideViewport:()=>{const R=S({tabbingDirection:"backwards"});Tm(R)}})]})});qT.displayName=$T;var ew="ToastFocusProxy",Tg=y.forwardRef((e,t)=>{const{__scopeToast:a,onFocusFromOutsideViewport:s,...l}=e,o=Bf(ew,a);return m.jsx(Oc,{"aria-hidden":!0,tabIndex:0,...l,ref:t,style:{position:"fixed"},onFocus:u=>{var p;const d=u.relatedTarget;!((p=o.viewport)!=null&&p.contains(d))&&s()}})});Tg.displayName=ew;var Uf="Toast",DF="toast.swipeStart",IF="toast.swipeMove",_F="toast.swipeCancel",kF="toast.swipeEnd",tw=y.forwardRef((e,t)=>{const{forceMount:a,open:s,defaultOpen:l,onOpenChange:o,...u}=e,[d=!0,f]=pa({prop:s,defaultProp:l,onChange:o});return m.jsx(rr,{present:a||d,children:m.jsx(BF,{open:d,...u,ref:t,onClose:()=>f(!1),onPause:Mn(e.onPause),onResume:Mn(e.onResume),onSwipeStart:We(e.onSwipeStart,p=>{p.currentTarget.setAttribute("data-swipe","start")}),onSwipeMove:We(e.onSwipeMove,p=>{const{x:b,y:v}=p.detail.delta;p.currentTarget.setAttribute("data-swipe","move"),p.currentTarget.style.setProperty("--radix-toast-swipe-move-x",`${b}px`),p.currentTarget.style.setProperty("--radix-toast-swipe-move-y",`${v}px`)}),onSwipeCancel:We(e.onSwipeCancel,p=>{p.currentTarget.setAttribute("data-swipe","cancel"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),p.currentTarget.style.removeProperty("--radix-toast-swipe-end-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-end-y")}),onSwipeEnd:We(e.onSwipeEnd,p=>{const{x:b,y:v}=p.detail.delta;p.currentTarget.setAttribute("data-swipe","end"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),p.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),p.currentTarget.style.setProperty("--radix-toast-swipe-end-x",`${b}px`),p.currentTarget.style.setProperty("--radix-toast-swipe-end-y",`${v}px`),f(!1)})})})});tw.displayName=Uf;var[VF,OF]=HT(Uf,{onClose(){}}),BF=y.forwardRef((e,t)=>{const{__scopeToast:a,type:s="foreground",duration:l,open:o,onClose:u,onEscapeKeyDown:d,onPause:f,onResume:p,onSwipeStart:b,onSwipeMove:v,onSwipeCancel:A,onSwipeEnd:x,...N}=e,S=Bf(Uf,a),[R,I]=y.useState(null),T=gt(t,O=>I(O)),_=y.useRef(null),j=y.useRef(null),C=l||S.duration,V=y.useRef(0),L=y.useRef(C),X=y.useRef(0),{onToastAdd:M,onToastRemove:Z}=S,U=Mn(()=>{var K;(R==null?void 0:R.contains(document.activeElement))&&((K=S.viewport)==null||K.focus()),u()}),D=y.useCallback(O=>{!O||O===1/0||(window.clearTimeout(X.current),V.current=new Date().getTime(),X.current=window.setTimeout(U,O))},[U]);y.useEffect(()=>{const O=S.viewport;if(O){const K=()=>{D(L.current),p==null||p()},P=()=>{const q=new Date().getTime()-V.current;L.current=L.current-q,window.clearTimeout(X.current),f==null||f()};return O.addEventListener(Ng,P),O.addEventListener(Rg,K),()=>{O.removeEventListener(Ng,P),O.removeEventListener(Rg,K)}}},[S.viewport,C,f,p,D]),y.useEffect(()=>{o&&!S.isClosePausedRef.current&&D(C)},[o,C,S.isClosePausedRef,D]),y.useEffect(()=>(M(),()=>Z()),[M,Z]);const J=y.useMemo(()=>R?ow(R):null,[R]);return S.viewport?m.jsxs(m.Fragment,{children:[J&&m.jsx(UF,{__scopeToast:a,role:"status","aria-live":s==="foreground"?"assertive":"polite","aria-atomic":!0,children:J}),m.jsx(VF,{scope:a,onClose:U,children:Ds.createPortal(m.jsx(gb.ItemSlot,{scope:a,children:m.jsx(JO,{asChild:!0,onEscapeKeyDown:We(d,()=>{S.isFocusedToastEscapeKeyDownRef.current||U(),S.isFocusedToastEscapeKeyDownRef.current=!1}),children:m.jsx(Ye.li,{role:"status","aria-live":"off","aria-atomic":!0,tabIndex:0,"data-state":o?"open":"closed","data-swipe-direction":S.swipeDirection,...N,ref:T,style:{userSelect:"none",touchAction:"none",...e.style},onKeyDown:We(e.onKeyDown,O=>{O.key==="Escape"&&(d==null||d(O.nativeEvent),O.nativeEvent.defaultPrevented||(S.isFocusedToastEscapeKeyDownRef.current=!0,U()))}),onPointerDown:We(e.onPointerDown,O=>{O.button===0&&(_.current={x:O.clientX,y:O.clientY})}),onPointerMove:We(e.onPointerMove,O=>{if(!_.current)return;const K=O.clientX-_.current.x,P=O.clientY-_.current.y,q=!!j.current,le=["left","right"].includes(S.swipeDirection),me=["left","up"].includes(S.swipeDirection)?Math.min:Math.max,F=le?me(0,K):0,fe=le?0:me(0,P),Y=O.pointerType==="touch"?10:2,ae={x:F,y:fe},ue={originalEvent:O,delta:ae};q?(j.current=ae,gd(IF,v,ue,{discrete:!1})):Yx(ae,S.swipeDirection,Y)?(j.current=ae,gd(DF,b,ue,{discrete:!1}),O.target.setPointerCapture(O.pointerId)):(Math.abs(K)>Y||Math.abs(P)>Y)&&(_.current=null)}),onPointerUp:We(e.onPointerUp,O=>{const K=j.current,P=O.target;if(P.hasPointerCapture(O.pointerId)&&P.releasePointerCapture(O.pointerId),j.current=null,_.current=null,K){const q=O.currentTarget,le={originalEvent:O,delta:K};Yx(K,S.swipeDirection,S.swipeThreshold)?gd(kF,x,le,{discrete:!0}):gd(_F,A,le,{discrete:!0}),q.addEventListener("click",me=>me.preventDefault(),{once:!0})}})})})}),S.viewport)})]}):null}),UF=e=>{const{__scopeToast:t,children:a,...s}=e,l=Bf(Uf,t),[o,u]=y.useState(!1),[d,f]=y.useState(!1);return FF(()=>u(!0)),y.useEffect(()=>{const p=window.setTimeout(()=>f(!0),1e3);return()=>window.clearTimeout(p)},[]),d?null:m.jsx(Vc,{asChild:!0,children:m.jsx(Oc,{...s,children:o&&m.jsxs(m.Fragment,{children:[l.label," ",a]})})})},MF="ToastTitle",nw=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e;return m.jsx(Ye.div,{...s,ref:t})});nw.displayName=MF;var GF="ToastDescription",aw=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e;return m.jsx(Ye.div,{...s,ref:t})});aw.displayName=GF;var rw="ToastAction",sw=y.forwardRef((e,t)=>{const{altText:a,...s}=e;return a.trim()?m.jsx(lw,{altText:a,asChild:!0,children:m.jsx(bb,{...s,ref:t})}):(console.error(`Invalid prop \`altText\` supplied to \`${rw}\`. Expected non-empty \`string\`.`),null)});sw.displayName=rw;var iw="ToastClose",bb=y.forwardRef((e,t)=>{const{__scopeToast:a,...s}=e,l=OF(iw,a);return m.jsx(lw,{asChild:!0,children:m.jsx(Ye.button,{type:"button",...s,ref:t,onClick:We(e.onClick,l.onClose)})})});bb.displayName=iw;var lw=y.forwardRef((e,t)=>{const{__scopeToast:a,altText:s,...l}=e;return m.jsx(Ye.div,{"data-radix-toast-announce-exclude":"","data-radix-toast-announce-alt":s||void 0,...l,ref:t})});function ow(e){const t=[];return Array.from(e.childNodes).forEach(s=>{if(s.nodeType===s.TEXT_NODE&&s.textContent&&t.push(s.textContent),LF(s)){const l=s.ariaHidden||s.hidden||s.style.display==="none",o=s.dataset.radixToastAnnounceExclude==="";if(!l)if(o){const u=s.dataset.radixToastAnnounceAlt;u&&t.push(u)}else t.push(...ow(s))}}),t}function gd(e,t,a,{discrete:s}){const l=a.originalEvent.currentTarget,o=new CustomEvent(e,{bubbles:!0,cancelable:!0,detail:a});t&&l.addEventListener(e,t,{once:!0}),s?o2(l,o):l.dispatchEvent(o)}var Yx=(e,t,a=0)=>{const s=Math.abs(e.x),l=Math.abs(e.y),o=s>l;return t==="left"||t==="right"?o&&s>a:!o&&l>a};function FF(e=()=>{}){const t=Mn(e);hn(()=>{let a=0,s=0;return a=window.requestAnimationFrame(()=>s=window.requestAnimationFrame(t)),()=>{window.cancelAnimationFrame(a),window.cancelAnimationFrame(s)}},[t])}function LF(e){return e.nodeType===e.ELEMENT_NODE}function PF(e){const t=[],a=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:s=>{const l=s.tagName==="INPUT"&&s.type==="hidden";return s.disabled||s.hidden||l?NodeFilter.FILTER_SKIP:s.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;a.nextNode();)t.push(a.currentNode);return t}function Tm(e){const t=document.activeElement;return e.some(a=>a===t?!0:(a.focus(),document.activeElement!==t))}var jF=JT,cw=qT,uw=tw,dw=nw,fw=aw,hw=sw,pw=bb;const ZF=jF,mw=y.forwardRef(({className:e,...t},a)=>m.jsx(cw,{ref:a,className:Xe("fixed top-0 z-100 flex max-h-screen w-full flex-col-reverse p-4 sm:bottom-24 sm:right-6 sm:top-auto sm:flex-col md:max-w-[420px]",e),...t}));mw.displayName=cw.displayName;const YF=T0("group pointer-events-auto relative flex w-full items-center justify-between space-x-4 overflow-hidden rounded-md border p-6 pr-8 shadow-lg transition-all data-[swipe=cancel]:translate-x-0 data-[swipe=end]:translate-x-[var(--radix-toast-swipe-end-x)] data-[swipe=move]:translate-x-[var(--radix-toast-swipe-move-x)] data-[swipe=move]:transition-none data-[state=open]:animate-in data-[state=closed]:animate-out data-[swipe=end]:animate-out data-[state=closed]:fade-out-80 data-[state=closed]:slide-out-to-right-full data-[state=open]:slide-in-from-top-full sm:data-[state=open]:slide-in-from-bottom-full",{variants:{variant:{default:"border bg-backgound-primary text-foreground dark:bg-white dark:border-slate-600 dark:text-slate-900",destructive:"group destructive bg-red-600 text-white dark:border-red-900 dark:bg-red-900 dark:text-red-50"}},defaultVariants:{variant:"default"}}),gw=y.forwardRef(({className:e,variant:t,...a},s)=>m.jsx(uw,{ref:s,className:Xe(YF({variant:t}),e),...a}));gw.displayName=uw.displayName;const KF=y.forwardRef(({className:e,...t},a)=>m.jsx(hw,{ref:a,className:Xe("inline-flex h-8 shrink-0 items-center justify-center rounded-md border bg-transparent px-3 text-sm font-medium ring-offset-background transition-colors hover:bg-secondary focus:outline-hidden focus:ring-2 focus:ring-ring focus:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 group-[.destructive]:border-muted/40 hover:group-[.destructive]:border-destructive/30 hover:group-[.destructive]:bg-destructive hover:group-[.destructive]:text-destructive-foreground focus:group-[.destructive]:ring-destructive",e),...t}));KF.displayName=hw.displayName;const bw=y.forwardRef(({className:e,...t},a)=>m.jsx(pw,{ref:a,className:Xe("absolute right-2 top-2 rounded-md p-1 text-foreground/50 opacity-0 transition-opacity hover:text-foreground focus:opacity-100 focus:outline-hidden focus:ring-2 group-hover:opacity-100 group-[.destructive]:text-red-300 hover:group-[.destructive]:text-red-50 focus:group-[.destructive]:ring-red-400 focus:group-[.destructive]:ring-offset-red-600 text-black",e),"toast-close":"",...t,children:m.jsx(k2,{className:"h-4 w-4"})}));bw.displayName=pw.displayName;const vw=y.forwardRef(({className:e,...t},a)=>m.jsx(dw,{ref:a,className:Xe("text-sm font-semibold",e),...t}));vw.displayName=dw.displayName;const yw=y.forwardRef(({className:e,...t},a)=>m.jsx(fw,{ref:a,className:Xe("text-sm opacity-90",e),...t}));yw.displayName=fw.displayName;function XF(){const{toasts:e}=Zc();return m.jsxs(ZF,{children:[e.map(({id:t,title:a,description:s,action:l,duration:o,...u})=>m.jsxs(gw,{...u,duration:o,className:"flex flex-col gap-4",children:[m.jsxs("div",{className:"grid gap-1",children:[a&&m.jsx(vw,{children:a}),s&&m.jsx(yw,{children:s})]}),l,m.jsx(bw,{})]},t)),m.jsx(mw,{})]})}const WF=()=>{const{setConnectDialogOpen:e,setSelectedDevice:t}=In(),{getDevices:a}=Cs(),s=y.useMemo(()=>a(),[a]);return m.jsx(m.Fragment,{children:m.jsxs("div",{className:"flex flex-col gap-3 p-3",children:[m.jsx("div",{className:"flex items-center justify-between",children:m.jsxs("div",{className:"space-y-1",children:[m.jsx(Vl,{as:"h3",children:"Connected Devices"}),m.jsx(Ua,{children:"Manage, connect and disconnect devices"})]})}),m.jsx(Tc,{}),m.jsx("div",{className:"flex h-[450px] rounded-md border border-dashed border-slate-200 p-3 dark:border-slate-700",children:s.length?m.jsx("ul",{className:"grow divide-y divide-slate-200",children:s.map(l=>{var o,u,d,f,p;return m.jsx("li",{children:m.jsx("button",{type:"button",className:"w-full px-4 py-4 sm:px-6",onClick:()=>{t(l.id)},children:m.jsxs("div",{className:"flex items-center justify-between",children:[m.jsx("p",{className:"truncate text-sm font-medium text-accent",children:((u=(o=l.nodes.get(l.hardware.myNodeNum))==null?void 0:o.user)==null?void 0:u.longName)??"UNK"}),m.jsxs("div",{className:"inline-flex w-24 justify-center gap-2 rounded-full bg-slate-100 py-1 text-xs font-semibold text-slate-900 transition-colors hover:bg-slate-700 hover:text-slate-50",children:[((d=l.connection)==null?void 0:d.connType)==="ble"&&m.jsxs(m.Fragment,{children:[m.jsx(tV,{size:16}),"BLE"]}),((f=l.connection)==null?void 0:f.connType)==="serial"&&m.jsxs(m.Fragment,{children:[m.jsx(UO,{size:16}),"Serial"]}),((p=l.connection)==null?void 0:p.connType)==="http"&&m.jsxs(m.Fragment,{children:[m.jsx(sO,{size:16}),"Network"]})]}),m.jsx("div",{className:"mt-2 sm:flex sm:justify-between",children:m.jsxs("div",{className:"flex gap-2 text-sm text-slate-500",children:[m.jsx(i0,{size:20,className:"text-slate-400","aria-hidden":"true"}),l.nodes.size===0?0:l.nodes.size-1]})})]})})},l.id)})}):m.jsxs("div",{className:"m-auto flex flex-col gap-3 text-center",children:[m.jsx(YV,{size:48,className:"mx-auto text-text-secondary"}),m.jsx(Vl,{as:"h3",children:"No Devices"}),m.jsx(Ua,{children:"Connect at least one device to get started"}),m.jsxs(pt,{className:"gap-2 dark:bg-white dark:text-slate-900 dark:hover:text-slate-100",variant:"default",onClick:()=>e(!0),children:[m.jsx(r0,{size:16}),"New Connection"]})]})})]})})},zF=()=>{const{getDevice:e}=Cs(),{selectedDevice:t,setConnectDialogOpen:a,connectDialogOpen:s}=In(),l=e(t);return m.jsxs(N0,{FallbackComponent:R0,children:[m.jsx(gF,{open:s,onOpenChange:o=>{a(o)}}),m.jsx(XF,{}),m.jsx(Z_,{device:l,children:m.jsx("div",{className:"flex h-screen flex-col overflow-hidden bg-background-primary text-text-primary",children:m.jsxs("div",{className:"flex grow",children:[m.jsx(fG,{}),m.jsx("div",{className:"flex grow flex-col",children:l?m.jsxs("div",{className:"flex h-screen w-full",children:[m.jsx(nF,{}),m.jsx(NF,{}),m.jsx(oG,{}),m.jsx(t5,{children:m.jsx(B9,{})})]}):m.jsxs(m.Fragment,{children:[m.jsx(WF,{}),m.jsx(S0,{})]})})]})})})]})},QF=document.getElementById("root"),HF=OD.createRoot(QF);TD();HF.render(m.jsx(y.StrictMode,{children:m.jsx(zF,{})}));export{Xx as g};
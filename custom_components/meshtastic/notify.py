@@ -7,38 +7,43 @@ from __future__ import annotations
 import base64
 import hashlib
 from copy import deepcopy
+from functools import partial
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.notify import NotifyEntity, NotifyEntityFeature
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers import entity_registry as er
 
 from .api import (
     ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID,
     ATTR_EVENT_MESHTASTIC_API_DATA,
+    ATTR_EVENT_MESHTASTIC_API_DUPLICATE,
     ATTR_EVENT_MESHTASTIC_API_NODE,
     EVENT_MESHTASTIC_API_NODE_UPDATED,
+    MeshtasticApiClientError,
 )
 from .const import (
     ATTR_SERVICE_DATA_ACK,
-    ATTR_SERVICE_DATA_CHANNEL,
-    ATTR_SERVICE_DATA_FROM,
     ATTR_SERVICE_DATA_TO,
     ATTR_SERVICE_SEND_TEXT_DATA_TEXT,
     CONF_OPTION_FILTER_NODES,
     CONF_OPTION_NOTIFY_PLATFORM,
     CONF_OPTION_NOTIFY_PLATFORM_CHANNELS,
     CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_DEFAULT,
+    CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE,
+    CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE_DEFAULT,
     CONF_OPTION_NOTIFY_PLATFORM_NODES,
     CONF_OPTION_NOTIFY_PLATFORM_NODES_DEFAULT,
     DOMAIN,
-    LOGGER,
     SERVICE_SEND_TEXT,
     ConfigOptionNotifyPlatformNodes,
 )
+from .routing import async_get_routing_table
+from .send_strategy import MeshtasticSendTarget, async_get_send_strategy
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
@@ -51,6 +56,8 @@ if TYPE_CHECKING:
 
     from .data import MeshtasticConfigEntry
 
+CHANNEL_NOTIFY_HEDGE_DELAY = 10
+
 
 def _create_node_entity_filter_factory(config_entry: MeshtasticConfigEntry) -> Callable[[int], bool]:
     create_nodes = config_entry.options.get(CONF_OPTION_NOTIFY_PLATFORM, {}).get(
@@ -88,6 +95,9 @@ async def async_setup_entry(
         config_entry_id = event_data.pop(ATTR_EVENT_MESHTASTIC_API_CONFIG_ENTRY_ID, None)
         if config_entry_id != config_entry.entry_id:
             return
+        # node notify entities are shared between gateways
+        if event_data.get(ATTR_EVENT_MESHTASTIC_API_DUPLICATE, False):
+            return
         node_id = event_data.get(ATTR_EVENT_MESHTASTIC_API_NODE, None)
         node_info = event_data.get(ATTR_EVENT_MESHTASTIC_API_DATA, None)
 
@@ -269,26 +279,52 @@ class MeshtasticChannelNotify(NotifyEntity):
         self.add_gateway(gateway_node_id, channel["index"])
 
     async def async_send_message(self, message: str, title: str | None = None) -> None:  # noqa: ARG002
-        if not self.gateways:
+        targets = self._send_targets(message)
+        if not targets:
             msg = "No gateway available"
             raise ServiceValidationError(msg)
 
+        # hedging is enabled when any of the gateways sharing the channel wants it
+        hedge = any(
+            entry.options.get(CONF_OPTION_NOTIFY_PLATFORM, {}).get(
+                CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE, CONF_OPTION_NOTIFY_PLATFORM_CHANNELS_HEDGE_DEFAULT
+            )
+            for entry in (self.hass.config_entries.async_get_entry(t.config_entry_id) for t in targets)
+            if entry is not None
+        )
+        try:
+            await async_get_send_strategy(self.hass).async_send(
+                targets, hedge_delay=CHANNEL_NOTIFY_HEDGE_DELAY if hedge else None
+            )
+        except MeshtasticApiClientError as e:
+            msg = "Could not send to channel"
+            raise ServiceValidationError(msg) from e
+
+    def _send_targets(self, message: str) -> list[MeshtasticSendTarget]:
+        routing_table = async_get_routing_table(self.hass)
+        targets = []
         for gateway_node_id, gateway_node_channel_index in self.gateways.items():
-            service_data = {
-                ATTR_SERVICE_SEND_TEXT_DATA_TEXT: message,
-                ATTR_SERVICE_DATA_FROM: gateway_node_id,
-                ATTR_SERVICE_DATA_CHANNEL: gateway_node_channel_index,
-                ATTR_SERVICE_DATA_ACK: True,
-            }
-            try:
-                await self.hass.services.async_call(DOMAIN, SERVICE_SEND_TEXT, service_data, blocking=True)
-            except HomeAssistantError:
-                LOGGER.info("Failed to send to channel, trying next gateway", exc_info=True)
-            else:
-                return
-
-        msg = "Could not send to channel"
-        raise ServiceValidationError(msg)
+            config_entry_id = routing_table.gateway_config_entry_id(gateway_node_id)
+            entry: MeshtasticConfigEntry | None = (
+                self.hass.config_entries.async_get_entry(config_entry_id) if config_entry_id is not None else None
+            )
+            if entry is None or entry.state != ConfigEntryState.LOADED:
+                continue
+
+            client = entry.runtime_data.client
+            targets.append(
+                MeshtasticSendTarget(
+                    config_entry_id=entry.entry_id,
+                    client=client,
+                    send=partial(
+                        client.send_text,
+                        text=message,
+                        channel_index=gateway_node_channel_index,
+                        want_ack=True,
+                    ),
+                )
+            )
+        return targets
 
     @property
     def suggested_object_id(self) -> str | None:
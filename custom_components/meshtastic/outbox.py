@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+OUTBOX_STORAGE_VERSION = 1
+OUTBOX_SAVE_DELAY = 1
+OUTBOX_SEND_INTERVAL = 5.0
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BACKOFF = 15.0
+OUTBOX_RETRY_BACKOFF_MAX = 300.0
+OUTBOX_MESSAGE_MAX_AGE = timedelta(hours=1)
+
+
+class MeshtasticOutboxMessageStatus(StrEnum):
+    QUEUED = "queued"
+    RETRYING = "retrying"
+    # handed to the radio, for messages without acknowledgement this is as far as can be known
+    SENT = "sent"
+    # acknowledged
+    DELIVERED = "delivered"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+@dataclass
+class MeshtasticOutboxMessage:
+    id: str
+    text: str
+    destination: int | str
+    channel_index: int | None = None
+    want_ack: bool = False
+    reply_id: int = 0
+    emoji: int = 0
+    attempts: int = 0
+    created_at: float = 0.0
+    status: MeshtasticOutboxMessageStatus = MeshtasticOutboxMessageStatus.QUEUED
+    # monotonic time, not persisted, messages restored from storage are due immediately
+    next_attempt: float = dataclasses.field(default=0.0, compare=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        data = dataclasses.asdict(self)
+        del data["next_attempt"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MeshtasticOutboxMessage:
+        return cls(**{**data, "status": MeshtasticOutboxMessageStatus(data["status"])})
+
+
+class MeshtasticOutbox:
+    """
+    Durable queue of outgoing text messages of a gateway.
+
+    Messages are persisted until delivered or given up. Sends are spaced to not overflow the radio, messages that
+    want an acknowledgement are retried with exponential backoff until acknowledged. Messages are given up after
+    max_attempts or once older than max_age.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry_id: str,
+        send: Callable[[MeshtasticOutboxMessage], Awaitable[bool]],
+        on_status: Callable[[MeshtasticOutboxMessage], None],
+        *,
+        max_age: timedelta = OUTBOX_MESSAGE_MAX_AGE,
+    ) -> None:
+        self._max_age = max_age.total_seconds()
+        self._store = self._get_store(hass, config_entry_id)
+        self._send = send
+        self._on_status = on_status
+        self._messages: deque[MeshtasticOutboxMessage] = deque()
+        self._messages_changed = asyncio.Event()
+        self._last_send = 0.0
+        self._worker: asyncio.Task | None = None
+        self._logger = LOGGER.getChild(self.__class__.__name__)
+
+    @staticmethod
+    def _get_store(hass: HomeAssistant, config_entry_id: str) -> Store[dict[str, Any]]:
+        return Store(hass, OUTBOX_STORAGE_VERSION, f"{DOMAIN}.{config_entry_id}.outbox", private=True)
+
+    @classmethod
+    async def async_remove(cls, hass: HomeAssistant, config_entry_id: str) -> None:
+        await cls._get_store(hass, config_entry_id).async_remove()
+
+    @property
+    def messages(self) -> list[MeshtasticOutboxMessage]:
+        return list(self._messages)
+
+    async def async_start(self) -> None:
+        if self._worker is not None:
+            return
+
+        try:
+            stored = await self._store.async_load()
+        except:  # noqa: E722
+            self._logger.warning("Failed to load outbox", exc_info=True)
+            stored = None
+
+        if stored:
+            known_ids = {m.id for m in self._messages}
+            self._messages.extend(
+                message
+                for message in (MeshtasticOutboxMessage.from_dict(m) for m in stored["messages"])
+                if message.id not in known_ids
+            )
+            self._logger.debug("Restored %d queued messages", len(stored["messages"]))
+
+        self._worker = asyncio.create_task(self._process_messages(), name="meshtastic-outbox")
+
+    async def async_stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        await self._store.async_save(self._data_to_save())
+
+    def enqueue(  # noqa: PLR0913
+        self,
+        text: str,
+        destination: int | str,
+        *,
+        channel_index: int | None = None,
+        want_ack: bool = False,
+        reply_id: int = 0,
+        emoji: int = 0,
+    ) -> MeshtasticOutboxMessage:
+        message = MeshtasticOutboxMessage(
+            id=uuid.uuid4().hex,
+            text=text,
+            destination=destination,
+            channel_index=channel_index,
+            want_ack=want_ack,
+            reply_id=reply_id,
+            emoji=emoji,
+            created_at=time.time(),
+        )
+        self._messages.append(message)
+        self._schedule_save()
+        self._notify_status(message)
+        self._messages_changed.set()
+        return message
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"messages": [m.as_dict() for m in self._messages]}
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, OUTBOX_SAVE_DELAY)
+
+    def _notify_status(self, message: MeshtasticOutboxMessage) -> None:
+        try:
+            self._on_status(message)
+        except:  # noqa: E722
+            self._logger.warning("Failed to notify status of message %s", message.id, exc_info=True)
+
+    def _next_due_message(self, now: float) -> MeshtasticOutboxMessage | float | None:
+        """Get first message that is due, or the time until the next message is due."""
+        next_attempt = None
+        for message in self._messages:
+            if message.next_attempt <= now:
+                return message
+            next_attempt = message.next_attempt if next_attempt is None else min(next_attempt, message.next_attempt)
+        return next_attempt - now if next_attempt is not None else None
+
+    async def _process_messages(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._messages_changed.clear()
+            due = self._next_due_message(loop.time())
+            if not isinstance(due, MeshtasticOutboxMessage):
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._messages_changed.wait(), timeout=due)
+                continue
+
+            if self._expires_in(due) <= 0:
+                self._expire(due)
+                continue
+
+            # rate limit, space messages so bursts don't overflow the radio queue and respect duty cycle
+            await asyncio.sleep(max(0.0, self._last_send + OUTBOX_SEND_INTERVAL - loop.time()))
+            await self._attempt(due)
+            self._last_send = loop.time()
+
+    def _expires_in(self, message: MeshtasticOutboxMessage) -> float:
+        # created_at is wall clock time, so the age also counts while home assistant was not running
+        return message.created_at + self._max_age - time.time()
+
+    def _expire(self, message: MeshtasticOutboxMessage) -> None:
+        self._logger.info("Giving up on message %s after %d attempts, it expired", message.id, message.attempts)
+        message.status = MeshtasticOutboxMessageStatus.EXPIRED
+        self._messages.remove(message)
+        self._schedule_save()
+        self._notify_status(message)
+
+    async def _attempt(self, message: MeshtasticOutboxMessage) -> None:
+        message.attempts += 1
+        try:
+            sent = await self._send(message)
+        except HomeAssistantError:
+            self._logger.debug("Failed to send message %s", message.id, exc_info=True)
+            sent = False
+
+        if sent:
+            # send only reports success for messages that want an ack once they are acknowledged
+            message.status = (
+                MeshtasticOutboxMessageStatus.DELIVERED if message.want_ack else MeshtasticOutboxMessageStatus.SENT
+            )
+            self._messages.remove(message)
+        elif message.attempts >= OUTBOX_MAX_ATTEMPTS:
+            self._logger.info("Giving up on message %s after %d attempts", message.id, message.attempts)
+            message.status = MeshtasticOutboxMessageStatus.FAILED
+            self._messages.remove(message)
+        else:
+            message.status = MeshtasticOutboxMessageStatus.RETRYING
+            backoff = min(OUTBOX_RETRY_BACKOFF * 2 ** (message.attempts - 1), OUTBOX_RETRY_BACKOFF_MAX)
+            # retry no later than the expiry, so the message is given up on time
+            message.next_attempt = asyncio.get_running_loop().time() + max(0.0, min(backoff, self._expires_in(message)))
+
+        self._schedule_save()
+        self._notify_status(message)
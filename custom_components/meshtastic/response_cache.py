@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Mapping
+
+RESPONSE_CACHE_TTL_TELEMETRY = 60.0
+RESPONSE_CACHE_TTL_POSITION = 120.0
+RESPONSE_CACHE_TTL_TRACEROUTE = 300.0
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+
+class MeshtasticResponseCache:
+    """
+    Recent responses of mesh requests, keyed by request type and node.
+
+    Concurrent identical requests share one request in flight. Packets a node sends on its own are recorded as well,
+    so they can answer a request just like a response.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Mapping[str, Any]]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task[Mapping[str, Any]]] = {}
+
+    def get(self, key: Hashable, ttl: float) -> Mapping[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        received_at, value = entry
+        if time.monotonic() - received_at > ttl:
+            return None
+        return value
+
+    def update(self, key: Hashable, value: Mapping[str, Any]) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic(), value)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def async_request(
+        self, key: Hashable, ttl: float, request: Callable[[], Awaitable[Mapping[str, Any]]]
+    ) -> Mapping[str, Any]:
+        cached = self.get(key, ttl)
+        if cached is not None:
+            return cached
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = self._in_flight[key] = asyncio.create_task(request(), name="meshtastic-request")
+            in_flight.add_done_callback(partial(self._request_done, key))
+
+        # a caller giving up must not abort the request for other callers
+        return await asyncio.shield(in_flight)
+
+    def _request_done(self, key: Hashable, task: asyncio.Task[Mapping[str, Any]]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.update(key, task.result())
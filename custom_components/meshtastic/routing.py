@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+UNKNOWN_HOPS_AWAY = 99
+# routes not heard within this time rank behind all recently heard routes
+ROUTE_MAX_AGE = 6 * 3600
+
+
+@dataclass(frozen=True)
+class MeshtasticRoute:
+    config_entry_id: str
+    gateway_node_id: int
+    hops_away: int
+    snr: float
+    # host clock, clocks of different radios are not comparable
+    last_heard: float
+
+    def is_stale(self, now: float) -> bool:
+        return now - self.last_heard > ROUTE_MAX_AGE
+
+    def rank(self, now: float) -> tuple[bool, int, float, float]:
+        # recently heard first, then fewer hops, then better signal, then most recently heard
+        return self.is_stale(now), self.hops_away, -self.snr, -self.last_heard
+
+
+class MeshtasticRoutingTable:
+    """
+    Routes from mesh nodes to the gateways (config entries) that can reach them.
+
+    Shared by all config entries. The best route of every node is kept up to date on each update, so looking it up
+    is a single dictionary access. Only when the best route aged out, the routes of the node are ranked again.
+    """
+
+    def __init__(self) -> None:
+        self._routes: dict[int, dict[str, MeshtasticRoute]] = {}
+        self._best_routes: dict[int, MeshtasticRoute] = {}
+        self._gateway_entries: dict[int, str] = {}
+        self._entry_gateways: dict[str, int] = {}
+        self._listeners: list[Callable[[int], None]] = []
+        self._logger = LOGGER.getChild(self.__class__.__name__)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[int], None]) -> Callable[[], None]:
+        """Add listener that is called with the node id whenever the best route of a node changes."""
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_register_gateway(self, config_entry_id: str, gateway_node_id: int) -> None:
+        self.async_unregister_gateway(config_entry_id)
+        self._gateway_entries[gateway_node_id] = config_entry_id
+        self._entry_gateways[config_entry_id] = gateway_node_id
+        # a gateway is always reached best through its own config entry, that route never ages out
+        self.async_update_route(config_entry_id, gateway_node_id, hops_away=-1, snr=0, last_heard=math.inf)
+
+    @callback
+    def async_unregister_gateway(self, config_entry_id: str) -> None:
+        gateway_node_id = self._entry_gateways.pop(config_entry_id, None)
+        if gateway_node_id is not None and self._gateway_entries.get(gateway_node_id) == config_entry_id:
+            del self._gateway_entries[gateway_node_id]
+
+        for node_id in [node_id for node_id, routes in self._routes.items() if config_entry_id in routes]:
+            del self._routes[node_id][config_entry_id]
+            self._update_best_route(node_id)
+
+    @callback
+    def async_update_route(
+        self,
+        config_entry_id: str,
+        node_id: int,
+        *,
+        hops_away: int | None,
+        snr: float,
+        last_heard: float,
+    ) -> None:
+        gateway_node_id = self._entry_gateways.get(config_entry_id)
+        if gateway_node_id is None:
+            return
+
+        routes = self._routes.setdefault(node_id, {})
+        existing = routes.get(config_entry_id)
+        if hops_away is None:
+            hops_away = existing.hops_away if existing is not None else UNKNOWN_HOPS_AWAY
+        if existing is not None and last_heard < existing.last_heard:
+            # out of order information, e.g. node database entry older than last received packet
+            return
+
+        routes[config_entry_id] = MeshtasticRoute(
+            config_entry_id=config_entry_id,
+            gateway_node_id=gateway_node_id,
+            hops_away=hops_away,
+            snr=snr,
+            last_heard=last_heard,
+        )
+        best_route = self._best_routes.get(node_id)
+        if best_route is None or best_route.config_entry_id == config_entry_id:
+            # current best route got worse or better, need to look at all routes
+            self._update_best_route(node_id)
+        else:
+            now = time.time()
+            if routes[config_entry_id].rank(now) < best_route.rank(now):
+                self._set_best_route(node_id, routes[config_entry_id])
+
+    def best_route(self, node_id: int) -> MeshtasticRoute | None:
+        best_route = self._best_routes.get(node_id)
+        if best_route is not None and best_route.is_stale(time.time()):
+            # a route heard more recently by another gateway may be better now
+            self._update_best_route(node_id)
+            best_route = self._best_routes.get(node_id)
+        return best_route
+
+    def routes(self, node_id: int) -> list[MeshtasticRoute]:
+        now = time.time()
+        return sorted(self._routes.get(node_id, {}).values(), key=lambda r: r.rank(now))
+
+    def gateway_config_entry_id(self, gateway_node_id: int) -> str | None:
+        return self._gateway_entries.get(gateway_node_id)
+
+    def _update_best_route(self, node_id: int) -> None:
+        routes = self._routes.get(node_id)
+        if not routes:
+            self._routes.pop(node_id, None)
+            self._set_best_route(node_id, None)
+            return
+
+        now = time.time()
+        self._set_best_route(node_id, min(routes.values(), key=lambda r: r.rank(now)))
+
+    def _set_best_route(self, node_id: int, route: MeshtasticRoute | None) -> None:
+        previous = self._best_routes.get(node_id)
+        if route is None:
+            self._best_routes.pop(node_id, None)
+        else:
+            self._best_routes[node_id] = route
+
+        previous_gateway = previous.gateway_node_id if previous is not None else None
+        gateway = route.gateway_node_id if route is not None else None
+        if previous_gateway == gateway:
+            return
+
+        for listener in list(self._listeners):
+            try:
+                listener(node_id)
+            except:  # noqa: E722
+                self._logger.warning("Routing table listener failed", exc_info=True)
+
+
+_DATA_ROUTING_TABLE: HassKey[MeshtasticRoutingTable] = HassKey(f"{DOMAIN}_routing_table")
+
+
+@callback
+def async_get_routing_table(hass: HomeAssistant) -> MeshtasticRoutingTable:
+    routing_table = hass.data.get(_DATA_ROUTING_TABLE)
+    if routing_table is None:
+        routing_table = hass.data[_DATA_ROUTING_TABLE] = MeshtasticRoutingTable()
+    return routing_table
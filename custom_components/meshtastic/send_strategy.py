@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .api import MeshtasticApiClientError
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import MeshtasticApiClient
+
+GATEWAY_FAILURE_BACKOFF = 60.0
+ACK_LATENCY_SMOOTHING = 0.3
+# assumed latency of gateways without successful send yet, so they rank between fast and slow gateways
+ACK_LATENCY_UNKNOWN = 5.0
+# a missing acknowledgement is treated as failure after this time, instead of waiting for the send timeout of a gateway
+SEND_ATTEMPT_TIMEOUT = 15.0
+
+
+@dataclass
+class MeshtasticGatewayHealth:
+    ack_latency: float | None = None
+    consecutive_failures: int = 0
+    last_failure: float = 0.0
+
+    def record_success(self, latency: float) -> None:
+        self.consecutive_failures = 0
+        if self.ack_latency is None:
+            self.ack_latency = latency
+        else:
+            self.ack_latency += ACK_LATENCY_SMOOTHING * (latency - self.ack_latency)
+
+    def record_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        self.last_failure = now
+
+    def is_degraded(self, now: float) -> bool:
+        return self.consecutive_failures > 0 and now - self.last_failure < GATEWAY_FAILURE_BACKOFF
+
+
+@dataclass(frozen=True)
+class MeshtasticSendTarget:
+    config_entry_id: str
+    client: MeshtasticApiClient
+    send: Callable[[], Awaitable[bool]]
+
+
+class MeshtasticSendStrategy:
+    """
+    Sends a message via one of multiple gateways.
+
+    Gateways are tried healthiest first, ranked by recent failures, send queue depth and acknowledgement latency. On
+    failure, or when a gateway did not confirm within the attempt timeout, the next gateway is tried right away. With a
+    hedge delay, the next gateway is additionally used when the current one did not succeed within that time.
+    """
+
+    def __init__(self) -> None:
+        self._health: dict[str, MeshtasticGatewayHealth] = {}
+        self._logger = LOGGER.getChild(self.__class__.__name__)
+
+    def health(self, config_entry_id: str) -> MeshtasticGatewayHealth:
+        return self._health.setdefault(config_entry_id, MeshtasticGatewayHealth())
+
+    def rank(self, targets: Sequence[MeshtasticSendTarget]) -> list[MeshtasticSendTarget]:
+        now = time.monotonic()
+
+        def score(target: MeshtasticSendTarget) -> tuple[bool, int, float]:
+            health = self.health(target.config_entry_id)
+            queue_depth = target.client.send_queue_statistics.depth
+            ack_latency = health.ack_latency if health.ack_latency is not None else ACK_LATENCY_UNKNOWN
+            return health.is_degraded(now), queue_depth, ack_latency
+
+        return sorted(targets, key=score)
+
+    async def async_send(
+        self,
+        targets: Sequence[MeshtasticSendTarget],
+        *,
+        hedge_delay: float | None = None,
+        attempt_timeout: float = SEND_ATTEMPT_TIMEOUT,
+    ) -> MeshtasticSendTarget:
+        remaining = self.rank(targets)
+        if not remaining:
+            msg = "No gateway available"
+            raise MeshtasticApiClientError(msg)
+
+        in_flight: dict[asyncio.Task[bool], MeshtasticSendTarget] = {}
+
+        def start_next() -> None:
+            target = remaining.pop(0)
+            in_flight[asyncio.create_task(self._send(target, attempt_timeout), name="meshtastic-send")] = target
+
+        start_next()
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self._logger.debug("Gateway did not confirm in time, hedging with next gateway")
+                    start_next()
+                    continue
+
+                for task in done:
+                    target = in_flight.pop(task)
+                    if not task.exception() and task.result():
+                        return target
+
+                    # fail over immediately instead of waiting for other in flight sends
+                    if remaining:
+                        start_next()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        msg = "Could not send via any gateway"
+        raise MeshtasticApiClientError(msg)
+
+    async def _send(self, target: MeshtasticSendTarget, attempt_timeout: float) -> bool:
+        health = self.health(target.config_entry_id)
+        start = time.monotonic()
+        try:
+            success = await asyncio.wait_for(target.send(), timeout=attempt_timeout)
+        except asyncio.CancelledError:
+            # another gateway won the hedge, says nothing about the health of this one
+            raise
+        except TimeoutError:
+            self._logger.debug("Gateway of %s did not confirm within %.0f s", target.config_entry_id, attempt_timeout)
+            success = False
+        except Exception:
+            self._logger.info("Failed to send via gateway of %s", target.config_entry_id, exc_info=True)
+            health.record_failure(time.monotonic())
+            raise
+
+        if success:
+            health.record_success(time.monotonic() - start)
+        else:
+            health.record_failure(time.monotonic())
+        return success
+
+
+_DATA_SEND_STRATEGY: HassKey[MeshtasticSendStrategy] = HassKey(f"{DOMAIN}_send_strategy")
+
+
+@callback
+def async_get_send_strategy(hass: HomeAssistant) -> MeshtasticSendStrategy:
+    send_strategy = hass.data.get(_DATA_SEND_STRATEGY)
+    if send_strategy is None:
+        send_strategy = hass.data[_DATA_SEND_STRATEGY] = MeshtasticSendStrategy()
+    return send_strategy
@@ -26,6 +26,7 @@ from homeassistant.const import (
     LIGHT_LUX,
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfLength,
@@ -46,15 +47,21 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.typing import StateType
 
+    from .aiomeshtastic.link_quality import LinkStatistics
     from .coordinator import MeshtasticDataUpdateCoordinator
     from .data import MeshtasticConfigEntry, MeshtasticData
 
+CHANNEL_LOAD_TOP_SENDERS = 10
+
 
 def _build_sensors(nodes: Mapping[int, Mapping[str, Any]], runtime_data: MeshtasticData) -> Iterable[MeshtasticSensor]:
     entities = []
     entities += _build_node_sensors(nodes, runtime_data)
     entities += _build_device_sensors(nodes, runtime_data)
     entities += _build_local_stats_sensors(nodes, runtime_data)
+    entities += _build_airtime_sensors(nodes, runtime_data)
+    entities += _build_link_quality_sensors(nodes, runtime_data)
+    entities += _build_channel_load_sensors(nodes, runtime_data)
     entities += _build_power_metrics_sensors(nodes, runtime_data)
     entities += _build_environment_metrics_sensors(nodes, runtime_data)
     entities += _build_air_quality_metrics_sensors(nodes, runtime_data)
@@ -80,6 +87,7 @@ async def async_unload_entry(
 class MeshtasticSensorEntityDescription(SensorEntityDescription):
     exists_fn: Callable[[MeshtasticSensor], bool] = lambda _: True
     value_fn: Callable[[MeshtasticSensor], StateType]
+    attributes_fn: Callable[[MeshtasticSensor], Mapping[str, Any] | None] = lambda _: None
 
 
 class MeshtasticSensor(MeshtasticNodeEntity, SensorEntity):
@@ -99,6 +107,11 @@ class MeshtasticSensor(MeshtasticNodeEntity, SensorEntity):
         LOGGER.debug("Updating sensor attributes: %s", self)
         self._attr_native_value = self.entity_description.value_fn(self)
         self._attr_available = self._attr_native_value is not None
+        self._attr_extra_state_attributes = self.entity_description.attributes_fn(self)
+
+    def _throttled_value(self) -> StateType | datetime.datetime:
+        # native value, so deadbands also apply to timestamps
+        return self._attr_native_value
 
 
 def _build_node_sensors(
@@ -483,6 +496,221 @@ def _build_local_stats_sensors(
     return entities
 
 
+def _build_airtime_sensors(
+    nodes: Mapping[int, Mapping[str, Any]], runtime_data: MeshtasticData
+) -> Iterable[MeshtasticSensor]:
+    coordinator = runtime_data.coordinator
+    client = runtime_data.client
+    gateway = client.get_own_node()
+    # airtime is tracked for transmissions of the gateway only
+    if gateway["num"] not in nodes:
+        return []
+
+    return [
+        MeshtasticSensor(
+            coordinator=coordinator,
+            entity_description=MeshtasticSensorEntityDescription(
+                key="airtime_tx",
+                name="Airtime used",
+                icon="mdi:timer-sand",
+                device_class=SensorDeviceClass.DURATION,
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                suggested_display_precision=1,
+                value_fn=lambda _: client.airtime_statistics.airtime,
+            ),
+            gateway=gateway,
+            node_id=gateway["num"],
+        ),
+        MeshtasticSensor(
+            coordinator=coordinator,
+            entity_description=MeshtasticSensorEntityDescription(
+                key="airtime_budget_utilization",
+                name="Airtime budget used",
+                icon="mdi:timer-sand-complete",
+                native_unit_of_measurement=PERCENTAGE,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=0,
+                value_fn=lambda _: client.airtime_statistics.utilization * 100,
+            ),
+            gateway=gateway,
+            node_id=gateway["num"],
+        ),
+    ]
+
+
+def _build_channel_load_sensors(
+    nodes: Mapping[int, Mapping[str, Any]], runtime_data: MeshtasticData
+) -> Iterable[MeshtasticSensor]:
+    coordinator = runtime_data.coordinator
+    client = runtime_data.client
+    gateway = client.get_own_node()
+    # channel load is derived from packets observed by the gateway
+    if gateway["num"] not in nodes:
+        return []
+
+    def utilization_attributes(_: MeshtasticSensor) -> Mapping[str, Any]:
+        statistics = client.channel_load_statistics
+        return {
+            "window": round(statistics.window),
+            "packets": statistics.packets,
+            "bytes": statistics.bytes,
+            "airtime": round(statistics.airtime, 2),
+            "airtime_share_by_sender": {
+                f"!{sender:08x}": round(share * 100, 1)
+                for sender, share in list(statistics.airtime_share_by_sender.items())[:CHANNEL_LOAD_TOP_SENDERS]
+            },
+        }
+
+    def packet_rate_attributes(_: MeshtasticSensor) -> Mapping[str, Any]:
+        statistics = client.channel_load_statistics
+        return {
+            "packets_per_minute_by_port": {
+                port: round(rate, 2) for port, rate in statistics.packets_per_minute_by_port.items()
+            }
+        }
+
+    def busiest_sender_share(_: MeshtasticSensor) -> float:
+        shares = client.channel_load_statistics.airtime_share_by_sender
+        return max(shares.values(), default=0.0) * 100
+
+    return [
+        MeshtasticSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+            gateway=gateway,
+            node_id=gateway["num"],
+        )
+        for entity_description in (
+            MeshtasticSensorEntityDescription(
+                key="channel_load_utilization",
+                name="Observed channel utilization",
+                icon="mdi:access-point-network",
+                native_unit_of_measurement=PERCENTAGE,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+                value_fn=lambda _: client.channel_load_statistics.utilization * 100,
+                attributes_fn=utilization_attributes,
+            ),
+            MeshtasticSensorEntityDescription(
+                key="channel_load_packet_rate",
+                name="Observed packets per minute",
+                icon="mdi:swap-vertical-bold",
+                native_unit_of_measurement="packets/min",
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+                value_fn=lambda _: client.channel_load_statistics.packets_per_minute,
+                attributes_fn=packet_rate_attributes,
+            ),
+            MeshtasticSensorEntityDescription(
+                key="channel_load_busiest_sender",
+                name="Busiest sender airtime share",
+                icon="mdi:account-voice",
+                native_unit_of_measurement=PERCENTAGE,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=0,
+                value_fn=busiest_sender_share,
+            ),
+        )
+    ]
+
+
+def _build_link_quality_sensors(
+    nodes: Mapping[int, Mapping[str, Any]], runtime_data: MeshtasticData
+) -> Iterable[MeshtasticSensor]:
+    coordinator = runtime_data.coordinator
+    client = runtime_data.client
+    gateway = client.get_own_node()
+
+    # the gateway itself shows statistics of all packets it received
+    def link_statistics(device: MeshtasticSensor) -> LinkStatistics | None:
+        if device.node_id == gateway["num"]:
+            return client.gateway_link_statistics
+        return client.link_statistics(device.node_id)
+
+    def statistics_value_fn(fn: Callable[[LinkStatistics], StateType]) -> Callable[[MeshtasticSensor], StateType]:
+        def value_fn(device: MeshtasticSensor) -> StateType:
+            statistics = link_statistics(device)
+            return None if statistics is None else fn(statistics)
+
+        return value_fn
+
+    def rssi_attributes(device: MeshtasticSensor) -> Mapping[str, Any] | None:
+        statistics = link_statistics(device)
+        if statistics is None or statistics.rssi.count == 0:
+            return None
+        return {
+            "mean": round(statistics.rssi.mean, 1),
+            "standard_deviation": round(statistics.rssi.standard_deviation, 1),
+            "median": statistics.rssi_median.value,
+            "percentile_10": statistics.rssi_p10.value,
+            "min": statistics.rssi.minimum,
+            "max": statistics.rssi.maximum,
+            "snr_mean": round(statistics.snr.mean, 2),
+            "snr_standard_deviation": round(statistics.snr.standard_deviation, 2),
+        }
+
+    def hops_attributes(device: MeshtasticSensor) -> Mapping[str, Any] | None:
+        statistics = link_statistics(device)
+        if statistics is None:
+            return None
+        return {f"hops_{hops}": count for hops, count in statistics.hops.items()}
+
+    descriptions = [
+        MeshtasticSensorEntityDescription(
+            key="link_packet_rate",
+            name="Packet rate",
+            icon="mdi:swap-vertical",
+            native_unit_of_measurement="packets/h",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            value_fn=statistics_value_fn(lambda statistics: statistics.packet_rate()),
+        ),
+        MeshtasticSensorEntityDescription(
+            key="link_rssi",
+            name="RSSI",
+            icon="mdi:signal",
+            native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            value_fn=statistics_value_fn(lambda statistics: statistics.rssi_ewma.value),
+            attributes_fn=rssi_attributes,
+        ),
+        MeshtasticSensorEntityDescription(
+            key="link_hops",
+            name="Average hops",
+            icon="mdi:rabbit",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            value_fn=statistics_value_fn(lambda statistics: statistics.hops_mean),
+            attributes_fn=hops_attributes,
+        ),
+        MeshtasticSensorEntityDescription(
+            key="link_duplicate_rate",
+            name="Duplicate rate",
+            icon="mdi:content-duplicate",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            value_fn=statistics_value_fn(
+                lambda statistics: None if statistics.duplicate_rate is None else statistics.duplicate_rate * 100
+            ),
+        ),
+    ]
+
+    return [
+        MeshtasticSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+            gateway=gateway,
+            node_id=node_id,
+        )
+        for node_id in nodes
+        for entity_description in descriptions
+    ]
+
+
 def _build_power_metrics_sensors(
     nodes: Mapping[int, Mapping[str, Any]], runtime_data: MeshtasticData
 ) -> Iterable[MeshtasticSensor]:
@@ -4,6 +4,9 @@
 
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.core import (
@@ -26,9 +29,12 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
 )
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
 
 from .aiomeshtastic import MeshInterface
 from .aiomeshtastic.interface import TelemetryType
+from .aiomeshtastic.timeseries import NodeMetric
 from .api import MeshtasticApiClient
 from .const import (
     ATTR_SERVICE_BROADCAST_CHANNEL_MESSAGE_DATA_CHANNEL,
@@ -37,14 +43,22 @@ from .const import (
     ATTR_SERVICE_DATA_CHANNEL,
     ATTR_SERVICE_DATA_EMOJI,
     ATTR_SERVICE_DATA_FROM,
+    ATTR_SERVICE_DATA_MAX_AGE,
+    ATTR_SERVICE_DATA_QUEUE,
     ATTR_SERVICE_DATA_REPLY_ID,
     ATTR_SERVICE_DATA_TO,
+    ATTR_SERVICE_DUMP_PACKET_CAPTURE_DATA_FILENAME,
+    ATTR_SERVICE_QUERY_METRICS_DATA_METRIC,
+    ATTR_SERVICE_QUERY_METRICS_DATA_PERIOD,
+    ATTR_SERVICE_QUERY_METRICS_DATA_WINDOW,
     ATTR_SERVICE_REQUEST_TELEMETRY_DATA_TYPE,
     ATTR_SERVICE_SEND_DIRECT_MESSAGE_DATA_MESSAGE,
     ATTR_SERVICE_SEND_TEXT_DATA_TEXT,
     DOMAIN,
     LOGGER,
     SERVICE_BROADCAST_CHANNEL_MESSAGE,
+    SERVICE_DUMP_PACKET_CAPTURE,
+    SERVICE_QUERY_METRICS,
     SERVICE_REQUEST_POSITION,
     SERVICE_REQUEST_TELEMETRY,
     SERVICE_REQUEST_TRACEROUTE,
@@ -54,6 +68,7 @@ from .const import (
     STATE_ATTRIBUTE_CHANNEL_NODE,
 )
 from .data import DATA_COMPONENT, MeshtasticConfigEntry
+from .routing import async_get_routing_table
 
 SERVICE_SEND_TEXT_SCHEMA = vol.Schema(
     {
@@ -64,6 +79,7 @@ SERVICE_SEND_TEXT_SCHEMA = vol.Schema(
         vol.Required(ATTR_SERVICE_DATA_ACK, default=False): cv.boolean,
         vol.Required(ATTR_SERVICE_DATA_REPLY_ID, default=0): cv.positive_int,
         vol.Required(ATTR_SERVICE_DATA_EMOJI, default=False): cv.boolean,
+        vol.Optional(ATTR_SERVICE_DATA_QUEUE, default=False): cv.boolean,
     }
 )
 
@@ -74,6 +90,7 @@ SERVICE_SEND_DIRECT_MESSAGE_SCHEMA = vol.Schema(
         vol.Required(ATTR_SERVICE_DATA_ACK, default=True): cv.boolean,
         vol.Required(ATTR_SERVICE_DATA_REPLY_ID, default=0): cv.positive_int,
         vol.Required(ATTR_SERVICE_DATA_EMOJI, default=False): cv.boolean,
+        vol.Optional(ATTR_SERVICE_DATA_QUEUE, default=False): cv.boolean,
     }
 )
 
@@ -84,6 +101,7 @@ SERVICE_BROADCAST_CHANNEL_MESSAGE_SCHEMA = vol.Schema(
         vol.Required(ATTR_SERVICE_DATA_ACK, default=True): cv.boolean,
         vol.Required(ATTR_SERVICE_DATA_REPLY_ID, default=0): cv.positive_int,
         vol.Required(ATTR_SERVICE_DATA_EMOJI, default=False): cv.boolean,
+        vol.Optional(ATTR_SERVICE_DATA_QUEUE, default=False): cv.boolean,
     }
 )
 
@@ -94,7 +112,14 @@ SERVICE_BASE_REQUEST_SCHEMA = vol.Schema(
     }
 )
 
-SERVICE_REQUEST_TELEMETRY_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend(
+# requests answered from recently received packets, unless they are older than max age
+SERVICE_BASE_CACHED_REQUEST_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_SERVICE_DATA_MAX_AGE): vol.All(cv.time_period, cv.positive_timedelta),
+    }
+)
+
+SERVICE_REQUEST_TELEMETRY_SCHEMA = SERVICE_BASE_CACHED_REQUEST_SCHEMA.extend(
     {
         vol.Required(ATTR_SERVICE_REQUEST_TELEMETRY_DATA_TYPE): SelectSelector(
             SelectSelectorConfig(options=[str(v) for v in TelemetryType], translation_key="telemetry_type_selector")
@@ -102,21 +127,45 @@ SERVICE_REQUEST_TELEMETRY_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend(
     }
 )
 
-SERVICE_REQUEST_POSITION_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend({})
-SERVICE_REQUEST_TRACEROUTE_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend({})
+SERVICE_REQUEST_POSITION_SCHEMA = SERVICE_BASE_CACHED_REQUEST_SCHEMA.extend({})
+SERVICE_REQUEST_TRACEROUTE_SCHEMA = SERVICE_BASE_CACHED_REQUEST_SCHEMA.extend({})
+
+SERVICE_QUERY_METRICS_SCHEMA = SERVICE_BASE_REQUEST_SCHEMA.extend(
+    {
+        vol.Required(ATTR_SERVICE_QUERY_METRICS_DATA_METRIC): vol.In([str(v) for v in NodeMetric]),
+        vol.Optional(ATTR_SERVICE_QUERY_METRICS_DATA_PERIOD, default=timedelta(hours=24)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+        vol.Optional(ATTR_SERVICE_QUERY_METRICS_DATA_WINDOW, default=timedelta(minutes=15)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+    }
+)
+
+SERVICE_DUMP_PACKET_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SERVICE_DATA_FROM): cv.string,
+        vol.Optional(ATTR_SERVICE_DUMP_PACKET_CAPTURE_DATA_FILENAME): cv.string,
+    }
+)
 
 _SERVICE_CANT_HANDLE_RESPONSE = object()
 _service_handlers: dict[str, dict[str, Callable[[ServiceCall], Awaitable[ServiceResponse]]]] = defaultdict(dict)
 
 SUPPORTED_SERVICES = {
     SERVICE_SEND_TEXT: SupportsResponse.OPTIONAL,
-    SERVICE_SEND_DIRECT_MESSAGE: SupportsResponse.NONE,
-    SERVICE_BROADCAST_CHANNEL_MESSAGE: SupportsResponse.NONE,
+    SERVICE_SEND_DIRECT_MESSAGE: SupportsResponse.OPTIONAL,
+    SERVICE_BROADCAST_CHANNEL_MESSAGE: SupportsResponse.OPTIONAL,
     SERVICE_REQUEST_TELEMETRY: SupportsResponse.OPTIONAL,
     SERVICE_REQUEST_POSITION: SupportsResponse.OPTIONAL,
     SERVICE_REQUEST_TRACEROUTE: SupportsResponse.OPTIONAL,
+    SERVICE_QUERY_METRICS: SupportsResponse.ONLY,
+    SERVICE_DUMP_PACKET_CAPTURE: SupportsResponse.NONE,
 }
 
+# services touching the file system of the host, only admin users may call them
+ADMIN_SERVICES = {SERVICE_DUMP_PACKET_CAPTURE}
+
 SERVICE_TO_SCHEMA = {
     SERVICE_SEND_TEXT: SERVICE_SEND_TEXT_SCHEMA,
     SERVICE_SEND_DIRECT_MESSAGE: SERVICE_SEND_DIRECT_MESSAGE_SCHEMA,
@@ -124,13 +173,18 @@ SERVICE_TO_SCHEMA = {
     SERVICE_REQUEST_TELEMETRY: SERVICE_REQUEST_TELEMETRY_SCHEMA,
     SERVICE_REQUEST_POSITION: SERVICE_REQUEST_POSITION_SCHEMA,
     SERVICE_REQUEST_TRACEROUTE: SERVICE_REQUEST_TRACEROUTE_SCHEMA,
+    SERVICE_QUERY_METRICS: SERVICE_QUERY_METRICS_SCHEMA,
+    SERVICE_DUMP_PACKET_CAPTURE: SERVICE_DUMP_PACKET_CAPTURE_SCHEMA,
 }
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     # handler that forwards service call to appropriate handler from config entry
     async def handle_service_call(call: ServiceCall) -> ServiceResponse:
-        for handler in [handlers.get(call.service, None) for handlers in _service_handlers.values()]:
+        # dispatch to gateway with best route first, only fall back to asking all gateways if it can't handle it
+        preferred_entry_id = _route_service_call(hass, call)
+        entry_ids = sorted(_service_handlers, key=lambda entry_id: entry_id != preferred_entry_id)
+        for handler in [_service_handlers[entry_id].get(call.service, None) for entry_id in entry_ids]:
             res = await handler(call)
             if res != _SERVICE_CANT_HANDLE_RESPONSE:
                 return res
@@ -141,7 +195,11 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     services = hass.services.async_services_for_domain(DOMAIN)
 
     for service, supports_response in SUPPORTED_SERVICES.items():
-        if service not in services:
+        if service in services:
+            continue
+        if service in ADMIN_SERVICES:
+            async_register_admin_service(hass, DOMAIN, service, handle_service_call, schema=SERVICE_TO_SCHEMA[service])
+        else:
             hass.services.async_register(
                 DOMAIN,
                 service,
@@ -151,6 +209,46 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             )
 
 
+def _resolve_node_id(hass: HomeAssistant, value: str | int) -> int | None:
+    if isinstance(value, int):
+        return value
+    if value.startswith("!"):
+        try:
+            return int(value[1:], 16)
+        except ValueError:
+            return None
+    if value.isnumeric():
+        return int(value)
+
+    device = dr.async_get(hass).async_get(value)
+    if device is None:
+        return None
+    return next((int(i[1]) for i in device.identifiers if i[0] == DOMAIN), None)
+
+
+def _route_service_call(hass: HomeAssistant, call: ServiceCall) -> str | None:
+    routing_table = async_get_routing_table(hass)
+    if ATTR_SERVICE_DATA_FROM in call.data:
+        from_node_id = _resolve_node_id(hass, call.data[ATTR_SERVICE_DATA_FROM])
+        return routing_table.gateway_config_entry_id(from_node_id) if from_node_id is not None else None
+
+    if call.service == SERVICE_BROADCAST_CHANNEL_MESSAGE:
+        entity_entry = er.async_get(hass).async_get(call.data[ATTR_SERVICE_BROADCAST_CHANNEL_MESSAGE_DATA_CHANNEL])
+        channel_entity = hass.data[DATA_COMPONENT].get_entity(entity_entry.entity_id) if entity_entry else None
+        if channel_entity is None:
+            return None
+        return routing_table.gateway_config_entry_id(
+            channel_entity.extra_state_attributes[STATE_ATTRIBUTE_CHANNEL_NODE]
+        )
+
+    if ATTR_SERVICE_DATA_TO in call.data:
+        to_node_id = _resolve_node_id(hass, call.data[ATTR_SERVICE_DATA_TO])
+        route = routing_table.best_route(to_node_id) if to_node_id is not None else None
+        return route.config_entry_id if route is not None else None
+
+    return None
+
+
 async def async_remove_services(hass: HomeAssistant) -> None:
     active_services = hass.services.async_services_for_domain(DOMAIN)
     for service in SUPPORTED_SERVICES:
@@ -171,6 +269,8 @@ async def async_register_gateway(hass: HomeAssistant, entry: MeshtasticConfigEnt
     await _setup_service_request_telemetry_handler(hass, entry, client)
     await _setup_service_request_position_handler(hass, entry, client)
     await _setup_service_request_traceroute_handler(hass, entry, client)
+    await _setup_service_query_metrics_handler(hass, entry, client)
+    await _setup_service_dump_packet_capture_handler(hass, entry, client)
 
 
 async def async_unregister_gateway(hass: HomeAssistant, entry: MeshtasticConfigEntry) -> None:
@@ -252,10 +352,7 @@ async def _build_default_handler(  # noqa: PLR0915
             if not call.return_response:
                 return None
 
-            service_response = {"sent": {"from": gateway_node["num"], "to": to}}
-            if response:
-                service_response["data"] = response
-            return service_response  # noqa: TRY300
+            return _build_sent_response(gateway_node["num"], to, response)
         except HomeAssistantError:
             raise
         except Exception as e:
@@ -266,10 +363,27 @@ async def _build_default_handler(  # noqa: PLR0915
     return handle_service_call
 
 
+def _build_sent_response(gateway_node_id: int, to: int | str, response: ServiceResponse) -> ServiceResponse:
+    service_response = {"sent": {"from": gateway_node_id, "to": to}}
+    if response:
+        service_response["data"] = response
+    return service_response
+
+
+async def _send_text(client: MeshtasticApiClient, call: ServiceCall, **kwargs: Any) -> str | None:
+    # queued messages are sent in the background with retries, their progress is reported by message status events
+    if call.data.get(ATTR_SERVICE_DATA_QUEUE, False):
+        return client.enqueue_text(**kwargs)
+
+    await client.send_text(**kwargs)
+    return None
+
+
 async def _setup_service_send_direct_message_handler(
     hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
 ) -> None:
     device_registry = dr.async_get(hass)
+    routing_table = async_get_routing_table(hass)
     gateway_node = await client.async_get_own_node()
 
     async def handle_service_call(call: ServiceCall) -> ServiceResponse | object:
@@ -284,21 +398,25 @@ async def _setup_service_send_direct_message_handler(
             msg = "Can't send direct message to oneself"
             raise ServiceValidationError(msg)
 
-        if device_entry.via_device_id:
-            gateway_device_entry = device_registry.async_get(device_entry.via_device_id)
-            gateway_node_id = next((int(i[1]) for i in gateway_device_entry.identifiers if i[0] == DOMAIN), None)
-            if gateway_node_id != gateway_node["num"]:
-                return _SERVICE_CANT_HANDLE_RESPONSE
+        route = routing_table.best_route(to_node_id)
+        if route is not None and route.config_entry_id != entry.entry_id:
+            return _SERVICE_CANT_HANDLE_RESPONSE
 
         text = call.data[ATTR_SERVICE_SEND_DIRECT_MESSAGE_DATA_MESSAGE]
-        await client.send_text(
+        message_id = await _send_text(
+            client,
+            call,
             text=text,
             destination_id=to_node_id,
             want_ack=call.data[ATTR_SERVICE_DATA_ACK],
             reply_id=call.data[ATTR_SERVICE_DATA_REPLY_ID],
             emoji=call.data[ATTR_SERVICE_DATA_EMOJI],
         )
-        return None
+        if not call.return_response:
+            return None
+        return _build_sent_response(
+            gateway_node["num"], to_node_id, {"message_id": message_id} if message_id is not None else None
+        )
 
     _service_handlers[entry.entry_id][SERVICE_SEND_DIRECT_MESSAGE] = handle_service_call
 
@@ -328,14 +446,22 @@ async def _setup_service_broadcast_channel_message_handler(
         text = call.data[ATTR_SERVICE_BROADCAST_CHANNEL_MESSAGE_DATA_MESSAGE]
         channel_index = channel_entity.extra_state_attributes[STATE_ATTRIBUTE_CHANNEL_INDEX]
 
-        await client.send_text(
+        message_id = await _send_text(
+            client,
+            call,
             text=text,
             channel_index=channel_index,
             want_ack=call.data[ATTR_SERVICE_DATA_ACK],
             reply_id=call.data[ATTR_SERVICE_DATA_REPLY_ID],
             emoji=call.data[ATTR_SERVICE_DATA_EMOJI],
         )
-        return None
+        if not call.return_response:
+            return None
+        return _build_sent_response(
+            gateway_node["num"],
+            MeshInterface.BROADCAST_ADDR,
+            {"message_id": message_id} if message_id is not None else None,
+        )
 
     _service_handlers[entry.entry_id][SERVICE_BROADCAST_CHANNEL_MESSAGE] = handle_service_call
 
@@ -345,7 +471,9 @@ async def _setup_service_request_telemetry_handler(
 ) -> None:
     async def handler(call: ServiceCall, to: int, _: int | None) -> ServiceResponse:
         metric_type = next(t for t in TelemetryType if t.value == call.data[ATTR_SERVICE_REQUEST_TELEMETRY_DATA_TYPE])
-        return await entry.runtime_data.client.request_telemetry(to, metric_type)
+        return await entry.runtime_data.client.request_telemetry(
+            to, metric_type, max_age=call.data.get(ATTR_SERVICE_DATA_MAX_AGE)
+        )
 
     _service_handlers[entry.entry_id][SERVICE_REQUEST_TELEMETRY] = await _build_default_handler(hass, client, handler)
 
@@ -354,7 +482,7 @@ async def _setup_service_request_position_handler(
     hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
 ) -> None:
     async def handler(call: ServiceCall, to: int, channel_index: int | None) -> ServiceResponse:  # noqa: ARG001
-        return await entry.runtime_data.client.request_position(to)
+        return await entry.runtime_data.client.request_position(to, max_age=call.data.get(ATTR_SERVICE_DATA_MAX_AGE))
 
     _service_handlers[entry.entry_id][SERVICE_REQUEST_POSITION] = await _build_default_handler(hass, client, handler)
 
@@ -363,16 +491,57 @@ async def _setup_service_request_traceroute_handler(
     hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
 ) -> None:
     async def handler(call: ServiceCall, to: int, channel_index: int | None) -> ServiceResponse:  # noqa: ARG001
-        return await entry.runtime_data.client.request_traceroute(to)
+        return await entry.runtime_data.client.request_traceroute(to, max_age=call.data.get(ATTR_SERVICE_DATA_MAX_AGE))
 
     _service_handlers[entry.entry_id][SERVICE_REQUEST_TRACEROUTE] = await _build_default_handler(hass, client, handler)
 
 
+async def _setup_service_query_metrics_handler(
+    hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
+) -> None:
+    async def handler(call: ServiceCall, to: int, channel_index: int | None) -> ServiceResponse:  # noqa: ARG001
+        return entry.runtime_data.client.query_node_metric(
+            to,
+            NodeMetric(call.data[ATTR_SERVICE_QUERY_METRICS_DATA_METRIC]),
+            period=call.data[ATTR_SERVICE_QUERY_METRICS_DATA_PERIOD],
+            window=call.data[ATTR_SERVICE_QUERY_METRICS_DATA_WINDOW],
+        )
+
+    _service_handlers[entry.entry_id][SERVICE_QUERY_METRICS] = await _build_default_handler(hass, client, handler)
+
+
+async def _setup_service_dump_packet_capture_handler(
+    hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
+) -> None:
+    # captures are always allowed to be written to the meshtastic directory of the configuration directory
+    capture_directory = Path(hass.config.path(DOMAIN)).resolve()
+
+    async def handler(call: ServiceCall, to: int, channel_index: int | None) -> ServiceResponse:  # noqa: ARG001
+        filename = call.data.get(ATTR_SERVICE_DUMP_PACKET_CAPTURE_DATA_FILENAME)
+        if filename is None:
+            gateway_node = entry.runtime_data.gateway_node
+            filename = hass.config.path(
+                DOMAIN, f"capture_{gateway_node['num']:08x}_{dt_util.utcnow().strftime('%Y%m%d%H%M%S')}.mtcap"
+            )
+        path = Path(hass.config.path(filename))
+        if path.resolve().parent != capture_directory and not hass.config.is_allowed_path(str(path)):
+            msg = f"Writing to {path} is not allowed, add its directory to allowlist_external_dirs"
+            raise ServiceValidationError(msg)
+
+        frames = await entry.runtime_data.client.dump_packet_capture(path)
+        LOGGER.info("Wrote %d frames of packet capture to %s", frames, path)
+        return None
+
+    _service_handlers[entry.entry_id][SERVICE_DUMP_PACKET_CAPTURE] = await _build_default_handler(hass, client, handler)
+
+
 async def _setup_service_send_text_handler(
     hass: HomeAssistant, entry: MeshtasticConfigEntry, client: MeshtasticApiClient
 ) -> None:
-    async def handler(call: ServiceCall, to: int, channel_index: int | None) -> None:
-        await client.send_text(
+    async def handler(call: ServiceCall, to: int, channel_index: int | None) -> ServiceResponse:
+        message_id = await _send_text(
+            client,
+            call,
             text=call.data[ATTR_SERVICE_SEND_TEXT_DATA_TEXT],
             destination_id=to,
             channel_index=channel_index,
@@ -380,5 +549,6 @@ async def _setup_service_send_text_handler(
             reply_id=call.data[ATTR_SERVICE_DATA_REPLY_ID],
             emoji=call.data[ATTR_SERVICE_DATA_EMOJI],
         )
+        return {"message_id": message_id} if message_id is not None else None
 
     _service_handlers[entry.entry_id][SERVICE_SEND_TEXT] = await _build_default_handler(hass, client, handler)
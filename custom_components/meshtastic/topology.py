@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from homeassistant.core import HomeAssistant
+
+    from .aiomeshtastic.protobuf import mesh_pb2
+
+TOPOLOGY_LINK_MAX_AGE = 6 * 3600
+TOPOLOGY_EXPIRE_INTERVAL = 60
+
+# links with at least this SNR cost a single hop, worse links cost up to 1 + LINK_COST_MAX_PENALTY hops
+LINK_SNR_GOOD = 5.0
+LINK_SNR_RANGE = 20.0
+LINK_COST_MAX_PENALTY = 2.0
+
+# traceroute placeholders for relays that did not report themselves and for unknown SNR
+_NODENUM_UNKNOWN = 0xFFFFFFFF
+_TRACEROUTE_SNR_UNKNOWN = -128
+_TRACEROUTE_SNR_SCALE = 4
+
+
+class MeshtasticLinkSource(StrEnum):
+    TRACEROUTE = "traceroute"
+    NEIGHBOR_INFO = "neighbor_info"
+    PACKET = "packet"
+
+
+@dataclass(frozen=True)
+class MeshtasticLink:
+    """Radio link on which to_node_id heard from_node_id."""
+
+    from_node_id: int
+    to_node_id: int
+    snr: float | None
+    # host clock, links are aged out against it and radio clocks may be off or unset
+    last_seen: float
+    source: MeshtasticLinkSource
+
+    @property
+    def cost(self) -> float:
+        if self.snr is None:
+            return 1.0
+        return 1.0 + min(max(LINK_SNR_GOOD - self.snr, 0.0) / LINK_SNR_RANGE, LINK_COST_MAX_PENALTY)
+
+
+class MeshtasticTopology:
+    """
+    Graph of radio links between mesh nodes, shared by all config entries.
+
+    Links are learned passively from traceroutes (including the ones of other nodes), neighbor info broadcasts and
+    packets heard directly by a gateway. The adjacency is updated incrementally. Queries ignore links not seen within
+    TOPOLOGY_LINK_MAX_AGE, and such links are dropped from time to time.
+    """
+
+    def __init__(self, max_age: float = TOPOLOGY_LINK_MAX_AGE) -> None:
+        self._max_age = max_age
+        self._outgoing: dict[int, dict[int, MeshtasticLink]] = {}
+        self._incoming: dict[int, set[int]] = {}
+        self._last_expire = 0.0
+        self._version = 0
+        # snapshot with the version it was taken at and the time its oldest link ages out
+        self._snapshot: tuple[int, float, dict[str, Any]] | None = None
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change, e.g. to detect if a snapshot is still current."""
+        return self._version
+
+    @callback
+    def async_add_link(
+        self,
+        from_node_id: int,
+        to_node_id: int,
+        *,
+        snr: float | None,
+        source: MeshtasticLinkSource,
+        last_seen: float | None = None,
+    ) -> None:
+        if from_node_id == to_node_id or _NODENUM_UNKNOWN in (from_node_id, to_node_id):
+            return
+
+        now = time.time()
+        last_seen = now if last_seen is None else last_seen
+        links = self._outgoing.setdefault(from_node_id, {})
+        existing = links.get(to_node_id)
+        if existing is not None and existing.last_seen > last_seen:
+            return
+
+        links[to_node_id] = MeshtasticLink(
+            from_node_id=from_node_id,
+            to_node_id=to_node_id,
+            # keep known snr if the link was seen again without snr information
+            snr=snr if snr is not None or existing is None else existing.snr,
+            last_seen=last_seen,
+            source=source,
+        )
+        self._incoming.setdefault(to_node_id, set()).add(from_node_id)
+        self._version += 1
+
+        if now - self._last_expire > TOPOLOGY_EXPIRE_INTERVAL:
+            self._expire(now)
+
+    @callback
+    def async_add_traceroute(
+        self,
+        from_node_id: int,
+        to_node_id: int,
+        route_discovery: mesh_pb2.RouteDiscovery,
+        *,
+        is_response: bool,
+        last_seen: float | None = None,
+    ) -> None:
+        """Add links of a traceroute request or response, also partial ones heard while being forwarded."""
+        if is_response:
+            # response travels from the traced node back to the requester
+            self._add_route([to_node_id, *route_discovery.route, from_node_id], route_discovery.snr_towards, last_seen)
+            self._add_route(
+                [from_node_id, *route_discovery.route_back, to_node_id], route_discovery.snr_back, last_seen
+            )
+        else:
+            self._add_route([from_node_id, *route_discovery.route, to_node_id], route_discovery.snr_towards, last_seen)
+
+    def _add_route(self, node_ids: Sequence[int], snrs: Sequence[int], last_seen: float | None) -> None:
+        # snr of each hop is recorded by the receiving node, hops without snr were not traversed (yet)
+        for (from_node_id, to_node_id), snr in zip(itertools.pairwise(node_ids), snrs, strict=False):
+            self.async_add_link(
+                from_node_id,
+                to_node_id,
+                snr=snr / _TRACEROUTE_SNR_SCALE if snr != _TRACEROUTE_SNR_UNKNOWN else None,
+                source=MeshtasticLinkSource.TRACEROUTE,
+                last_seen=last_seen,
+            )
+
+    @callback
+    def async_add_neighbor_info(self, neighbor_info: mesh_pb2.NeighborInfo, last_seen: float | None = None) -> None:
+        for neighbor in neighbor_info.neighbors:
+            self.async_add_link(
+                neighbor.node_id,
+                neighbor_info.node_id,
+                snr=neighbor.snr,
+                source=MeshtasticLinkSource.NEIGHBOR_INFO,
+                last_seen=last_seen,
+            )
+
+    def links(self) -> list[MeshtasticLink]:
+        min_last_seen = time.time() - self._max_age
+        return [link for links in self._outgoing.values() for link in links.values() if link.last_seen >= min_last_seen]
+
+    def neighbors(self, node_id: int, *, directed: bool = False) -> dict[int, float]:
+        """Neighbors of node with the cost of the cheapest link to them."""
+        return dict(self._neighbors(node_id, time.time() - self._max_age, directed=directed))
+
+    def shortest_path(self, from_node_id: int, to_node_id: int, *, directed: bool = False) -> list[int] | None:
+        """Cheapest path between two nodes based on link SNR, None if no path is known."""
+        min_last_seen = time.time() - self._max_age
+        costs = {from_node_id: 0.0}
+        previous: dict[int, int] = {}
+        queue = [(0.0, from_node_id)]
+        while queue:
+            cost, node_id = heapq.heappop(queue)
+            if node_id == to_node_id:
+                path = [node_id]
+                while node_id in previous:
+                    node_id = previous[node_id]
+                    path.append(node_id)
+                return path[::-1]
+            if cost > costs[node_id]:
+                continue
+
+            for neighbor_id, link_cost in self._neighbors(node_id, min_last_seen, directed=directed):
+                neighbor_cost = cost + link_cost
+                if neighbor_cost < costs.get(neighbor_id, float("inf")):
+                    costs[neighbor_id] = neighbor_cost
+                    previous[neighbor_id] = node_id
+                    heapq.heappush(queue, (neighbor_cost, neighbor_id))
+        return None
+
+    def reachable(self, from_node_id: int, max_hops: int | None = None, *, directed: bool = False) -> dict[int, int]:
+        """Nodes reachable from a node, with their minimum number of hops."""
+        min_last_seen = time.time() - self._max_age
+        hops = {from_node_id: 0}
+        queue = deque([from_node_id])
+        while queue:
+            node_id = queue.popleft()
+            if max_hops is not None and hops[node_id] >= max_hops:
+                continue
+            for neighbor_id, _ in self._neighbors(node_id, min_last_seen, directed=directed):
+                if neighbor_id not in hops:
+                    hops[neighbor_id] = hops[node_id] + 1
+                    queue.append(neighbor_id)
+        return hops
+
+    def snapshot(self) -> dict[str, Any]:
+        """Compact representation of the current topology, links as [from, to, snr, last seen, source]."""
+        now = time.time()
+        if self._snapshot is not None:
+            version, expires_at, snapshot = self._snapshot
+            if version == self._version and now < expires_at:
+                return snapshot
+
+        links = self.links()
+        snapshot = {
+            "version": self._version,
+            "nodes": sorted({node_id for link in links for node_id in (link.from_node_id, link.to_node_id)}),
+            "links": [
+                [
+                    link.from_node_id,
+                    link.to_node_id,
+                    round(link.snr, 2) if link.snr is not None else None,
+                    int(link.last_seen),
+                    link.source.value,
+                ]
+                for link in links
+            ],
+        }
+        expires_at = min((link.last_seen for link in links), default=now) + self._max_age
+        self._snapshot = (self._version, expires_at, snapshot)
+        return snapshot
+
+    def _neighbors(self, node_id: int, min_last_seen: float, *, directed: bool) -> Iterator[tuple[int, float]]:
+        candidates: Iterable[MeshtasticLink] = self._outgoing.get(node_id, {}).values()
+        if not directed:
+            candidates = [
+                *candidates,
+                *(self._outgoing[from_node_id][node_id] for from_node_id in self._incoming.get(node_id, ())),
+            ]
+
+        neighbors: dict[int, float] = {}
+        for link in candidates:
+            if link.last_seen < min_last_seen:
+                continue
+            neighbor_id = link.to_node_id if link.from_node_id == node_id else link.from_node_id
+            neighbors[neighbor_id] = min(link.cost, neighbors.get(neighbor_id, float("inf")))
+        return iter(neighbors.items())
+
+    def _expire(self, now: float) -> None:
+        self._last_expire = now
+        min_last_seen = now - self._max_age
+        for from_node_id, links in list(self._outgoing.items()):
+            for to_node_id in [to_node_id for to_node_id, link in links.items() if link.last_seen < min_last_seen]:
+                del links[to_node_id]
+                incoming = self._incoming[to_node_id]
+                incoming.discard(from_node_id)
+                if not incoming:
+                    del self._incoming[to_node_id]
+                self._version += 1
+            if not links:
+                del self._outgoing[from_node_id]
+
+
+_DATA_TOPOLOGY: HassKey[MeshtasticTopology] = HassKey(f"{DOMAIN}_topology")
+
+
+@callback
+def async_get_topology(hass: HomeAssistant) -> MeshtasticTopology:
+    topology = hass.data.get(_DATA_TOPOLOGY)
+    if topology is None:
+        topology = hass.data[_DATA_TOPOLOGY] = MeshtasticTopology()
+    return topology
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2024-2025 Pascal Brogle @broglep
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .topology import async_get_topology
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, websocket_topology)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/topology"})
+@websocket_api.require_admin
+@callback
+def websocket_topology(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    connection.send_result(msg["id"], async_get_topology(hass).snapshot())